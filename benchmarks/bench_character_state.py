@@ -0,0 +1,102 @@
+#    Copyright 2024 Sakan Nirattisaykul
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+"""
+Benchmark the slotted Character state against the same state kept in an instance __dict__.
+
+Run it with:
+    python -m benchmarks.bench_character_state
+"""
+
+import argparse
+import sys
+import timeit
+
+from benchmarks.bench_logging import bench_battles
+from hsr_simulation.character import Character
+from hsr_simulation.hunt.seele import Seele
+
+
+class DictState:
+    """Plain object holding a copy of a character's state in its __dict__."""
+
+
+def copy_to_dict_state(character: Character) -> DictState:
+    """
+    Copy every slot of a character to a plain object.
+    :param character: Character to copy.
+    :return: Object with the same attributes, stored in its __dict__.
+    """
+    state = DictState()
+    for cls in type(character).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if hasattr(character, name):
+                setattr(state, name, getattr(character, name))
+    return state
+
+
+def bench_attribute_access(obj, number: int) -> tuple[float, float]:
+    """
+    Time reading and writing the attributes used in the damage hot path.
+    :param obj: Character or state object.
+    :param number: Number of times to repeat 4 reads and 2 writes.
+    :return: Nanoseconds per read and per write.
+    """
+    read_sec = min(
+        timeit.repeat(
+            "obj.speed; obj.crit_rate; obj.current_enemy_toughness; obj.skill_points",
+            globals={"obj": obj},
+            number=number,
+            repeat=5,
+        )
+    )
+    write_sec = min(
+        timeit.repeat(
+            "obj.skill_points = 1; obj.current_enemy_toughness = 100",
+            globals={"obj": obj},
+            number=number,
+            repeat=5,
+        )
+    )
+    return read_sec / number / 4 * 1e9, write_sec / number / 2 * 1e9
+
+
+def get_state_size(obj) -> int:
+    """
+    Get the size of an object's attribute storage, not counting the attribute values.
+    :param obj: Character or state object.
+    :return: Bytes of the object and its __dict__, if it has a non-empty one.
+    """
+    size = sys.getsizeof(obj)
+    if getattr(obj, "__dict__", None):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Character state layout")
+    parser.add_argument("--sim-count", type=int, default=1000)
+    parser.add_argument("--max-cycles", type=int, default=10)
+    args = parser.parse_args()
+
+    character = Seele()
+    dict_state = copy_to_dict_state(character)
+    for label, obj in (("Slotted Seele", character), ("Dict copy", dict_state)):
+        read_ns, write_ns = bench_attribute_access(obj, number=1_000_000)
+        print(f"{label}: {read_ns:.1f} ns per read, {write_ns:.1f} ns per write")
+
+    print(f"Slotted Seele: {get_state_size(character)} bytes of attribute storage")
+    print(f"Dict copy: {get_state_size(dict_state)} bytes of attribute storage")
+
+    for char_name, rate in bench_battles(args.sim_count, args.max_cycles).items():
+        print(f"{char_name}: {rate:.0f} battles/s, {1e6 / rate:.0f} us per battle")
@@ -0,0 +1,210 @@
+#    Copyright 2024 Sakan Nirattisaykul
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+"""
+Benchmark the throughput of the simulation engine and the load step,
+and compare it with a JSON baseline.
+
+Run it with:
+    python -m benchmarks.bench_engine --baseline baseline.json --update-baseline
+    python -m benchmarks.bench_engine --baseline baseline.json
+
+The baseline depends on the machine, so it isn't committed. It is saved with --update-baseline,
+and runs without it exit with status 1 when any throughput is lower than the baseline by more than the threshold.
+A missing baseline is an error rather than a new baseline, so a comparison never passes by accident.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+from hsr_simulation.character import Character
+from hsr_simulation.data_transformer import create_df_from_dict_list
+from hsr_simulation.path_main_func.destruction_main import get_destruction_characters
+from hsr_simulation.path_main_func.erudition_main import get_erudition_characters
+from hsr_simulation.path_main_func.hunt_main import get_hunt_characters
+from hsr_simulation.path_main_func.nihility_main import get_nihility_characters
+from hsr_simulation.path_main_func.remembrance_main import get_remembrance_characters
+from hsr_simulation.result_sink import ParquetSink, ResultSink, SQLiteSink
+from hsr_simulation.simulate_battles import simulate_battles_to_buffer
+from hsr_simulation.simulate_cycles import BattleSimulator
+from hsr_simulation.utils import add_char_name_to_df
+
+PATH_CHARACTERS: dict[str, Callable[[], list[Character]]] = {
+    "Hunt": get_hunt_characters,
+    "Nihility": get_nihility_characters,
+    "Destruction": get_destruction_characters,
+    "Erudition": get_erudition_characters,
+    "Remembrance": get_remembrance_characters,
+}
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """
+    Time a function several times.
+    :param func: Function to time.
+    :param repeat: Number of times to run it.
+    :return: Seconds of the fastest run, which is the least disturbed by other processes.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def bench_characters(
+    max_cycles_list: list[int], battles: int, repeat: int
+) -> dict[str, float]:
+    """
+    Time battles of every character of every Path, except Harmony, which doesn't simulate battles.
+    Battles are simulated with simulate_battles_to_buffer, which simulates each chunk of battles in a run.
+    :param max_cycles_list: Max numbers of cycles to time the battles with.
+    :param battles: Number of battles to time for each character and max cycles.
+    :param repeat: Number of times to repeat the battles.
+    :return: Battles per second, keyed by Path, character and max cycles.
+    """
+    results = {}
+    for path, get_characters in PATH_CHARACTERS.items():
+        for character in get_characters():
+            character.seed = 0
+            summon = BattleSimulator.initialize_summon(character, None)
+            for max_cycles in max_cycles_list:
+                elapsed = best_time(
+                    partial(
+                        simulate_battles_to_buffer,
+                        character,
+                        summon,
+                        max_cycles,
+                        range(battles),
+                    ),
+                    repeat,
+                )
+                key = f"simulate_battles_to_buffer/{path}/{character.__class__.__name__}/max_cycles={max_cycles}"
+                results[key] = battles / elapsed
+    return results
+
+
+def bench_load(battles: int, repeat: int) -> dict[str, float]:
+    """
+    Time creating a DataFrame from a record buffer of battles, and writing it to the local sinks.
+    :param battles: Number of battles whose data is created and written.
+    :param repeat: Number of times to repeat each step.
+    :return: Rows per second of each step.
+    """
+    character = get_hunt_characters()[0]
+    character.seed = 0
+    summon = BattleSimulator.initialize_summon(character, None)
+    record_buffer = simulate_battles_to_buffer(
+        character, summon, max_cycles=10, sim_indices=range(battles)
+    )
+    df = create_df_from_dict_list(record_buffer)
+    add_char_name_to_df(character, df)
+    rows = len(df)
+
+    results = {
+        "create_df_from_dict_list": rows
+        / best_time(lambda: create_df_from_dict_list(record_buffer), repeat)
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sinks: dict[str, ResultSink] = {
+            "sqlite": SQLiteSink(str(Path(tmp_dir) / "bench.db")),
+            "parquet": ParquetSink(str(Path(tmp_dir) / "parquet")),
+        }
+
+        for sink_name, sink in sinks.items():
+
+            def write(sink: ResultSink = sink) -> None:
+                sink.reset("BenchStage")
+                sink.write(df, "BenchStage")
+
+            results[f"load/{sink_name}"] = rows / best_time(write, repeat)
+    return results
+
+
+def find_regressions(
+    results: dict[str, float], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """
+    Find the throughputs that are lower than the baseline by more than the threshold.
+    Throughputs missing from either the results or the baseline are not compared.
+    :param results: Throughput of each benchmark.
+    :param baseline: Baseline throughput of each benchmark.
+    :param threshold: Allowed slowdown as a fraction, e.g., 0.2 for 20%.
+    :return: Description of each regression.
+    """
+    return [
+        f"{name}: {results[name]:.1f}/s, baseline {baseline[name]:.1f}/s "
+        f"({results[name] / baseline[name] - 1:+.0%})"
+        for name in sorted(results.keys() & baseline.keys())
+        if results[name] < baseline[name] * (1 - threshold)
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the simulation engine against a baseline"
+    )
+    parser.add_argument("--max-cycles", type=int, nargs="+", default=[5, 10])
+    parser.add_argument("--battles", type=int, default=50)
+    parser.add_argument("--load-battles", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        required=True,
+        help="JSON baseline to compare with, or to save the results to with --update-baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown against the baseline as a fraction (default: 0.2)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Save the results as the baseline instead of comparing with it",
+    )
+    args = parser.parse_args()
+    if not args.update_baseline and not args.baseline.exists():
+        parser.error(
+            f"baseline {args.baseline} doesn't exist, save one with --update-baseline"
+        )
+
+    results = bench_characters(args.max_cycles, args.battles, args.repeat)
+    results.update(bench_load(args.load_battles, args.repeat))
+    for name, rate in results.items():
+        print(f"{name}: {rate:.1f}/s")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+        sys.exit(0)
+
+    regressions = find_regressions(
+        results, json.loads(args.baseline.read_text()), args.threshold
+    )
+    if regressions:
+        print(f"Throughput regressed by more than {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print(f"No regressions against {args.baseline}")
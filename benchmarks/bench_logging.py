@@ -0,0 +1,125 @@
+#    Copyright 2024 Sakan Nirattisaykul
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+"""
+Benchmark the cost of logging in the damage hot path,
+and the battles per second before and after the log calls were made lazy.
+
+Run it with:
+    python -m benchmarks.bench_logging
+"""
+
+import argparse
+import sys
+import timeit
+from contextlib import ExitStack
+from unittest import mock
+
+from hsr_simulation.character import Character
+from hsr_simulation.configure_logging import main_logger
+from hsr_simulation.erudition.jingyuan import Jingyuan
+from hsr_simulation.hunt.seele import Seele
+from hsr_simulation.hunt.topaz import Topaz
+from hsr_simulation.nihility.kafka import Kafka
+from hsr_simulation.simulate_battles import stream_simulations_for_character
+
+
+def bench_log_call(number: int) -> tuple[float, float]:
+    """
+    Time a disabled log call with an eagerly formatted f-string
+    against the same call with lazily formatted arguments.
+    :param number: Number of log calls to time.
+    :return: Nanoseconds per call for the eager and the lazy call.
+    """
+    character = Character()
+
+    def eager_call() -> None:
+        main_logger.info(f"{character.__class__.__name__}: Calculating damage...")
+
+    def lazy_call() -> None:
+        main_logger.info("%s: Calculating damage...", character.__class__.__name__)
+
+    eager = timeit.timeit(eager_call, number=number)
+    lazy = timeit.timeit(lazy_call, number=number)
+    return eager / number * 1e9, lazy / number * 1e9
+
+
+class EagerLogger:
+    """
+    Logger that formats every message before the level check,
+    the way the f-string log calls did before the calls were made lazy.
+    """
+
+    def isEnabledFor(self, level: int) -> bool:
+        return True
+
+    def info(self, msg: str, *args) -> None:
+        main_logger.info(msg % args if args else msg)
+
+    def debug(self, msg: str, *args) -> None:
+        main_logger.debug(msg % args if args else msg)
+
+
+def eager_logging() -> ExitStack:
+    """
+    Make the simulation modules log with EagerLogger.
+    :return: Context manager that restores main_logger in the modules on exit.
+    """
+    stack = ExitStack()
+    for name, module in list(sys.modules.items()):
+        if name.startswith("hsr_simulation") and hasattr(module, "main_logger"):
+            stack.enter_context(mock.patch.object(module, "main_logger", EagerLogger()))
+    return stack
+
+
+def bench_battles(simulation_num: int, max_cycles: int) -> dict[str, float]:
+    """
+    Time battle simulations for a few characters.
+    :param simulation_num: Number of battles to simulate for each character.
+    :param max_cycles: Max number of cycles to simulate.
+    :return: Battles per second of each character.
+    """
+    battles_per_sec = {}
+    for character in [Seele(), Kafka(), Topaz(), Jingyuan()]:
+        elapsed = timeit.timeit(
+            lambda character=character: list(
+                stream_simulations_for_character(character, max_cycles, simulation_num)
+            ),
+            number=1,
+        )
+        battles_per_sec[character.__class__.__name__] = simulation_num / elapsed
+    return battles_per_sec
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark logging overhead")
+    parser.add_argument("--sim-count", type=int, default=1000)
+    parser.add_argument("--max-cycles", type=int, default=10)
+    args = parser.parse_args()
+
+    eager_ns, lazy_ns = bench_log_call(number=1_000_000)
+    print(f"Disabled log call, eager f-string: {eager_ns:.1f} ns")
+    print(f"Disabled log call, lazy arguments: {lazy_ns:.1f} ns")
+    print(f"Speedup: {eager_ns / lazy_ns:.2f}x")
+
+    # warm up the caches, so the first run isn't slower for that
+    bench_battles(min(args.sim_count, 10), args.max_cycles)
+    with eager_logging():
+        before = bench_battles(args.sim_count, args.max_cycles)
+    after = bench_battles(args.sim_count, args.max_cycles)
+    for char_name, rate in after.items():
+        print(
+            f"{char_name}: {before[char_name]:.0f} battles/s with eager log calls, "
+            f"{rate:.0f} battles/s with lazy log calls "
+            f"({rate / before[char_name]:.2f}x)"
+        )
@@ -0,0 +1,208 @@
+#    Copyright 2024 Sakan Nirattisaykul
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import heapq
+import logging
+
+from hsr_simulation.character import Character
+from hsr_simulation.configure_logging import main_logger
+
+
+class ActionTimeline:
+    """
+    Timeline of a battle with any number of actors, e.g., a character and their summons.
+    Actors are kept in a heap ordered by the action value at which they take their next turn,
+    so each turn costs O(log n) for n actors.
+    Only the actor that took the turn is scheduled again, along with the actors
+    whose speed or Action Forward the turn changed, which tell the timeline with mark_changed.
+    Actors with the same action value take their turns in the order they were added.
+    """
+
+    def __init__(self, cycles_action_val: float) -> None:
+        """
+        :param cycles_action_val: Cycles action value of the battle.
+        """
+        self.cycles_action_val = cycles_action_val
+        self.current_action_val: float = 0.0
+        self.actors: list[Character] = []
+        self.turn_counts: list[int] = []
+        self._indices: dict[Character, int] = {}
+        # Actors that the turn being taken changed
+        self._changed: set[int] = set()
+        self._is_summon: list[bool] = []
+        # Next turn, action value and speed of each actor, as last scheduled
+        self._next_action_vals: list[float] = []
+        self._char_action_vals: list[float] = []
+        self._speeds: list[float] = []
+        # Entries of rescheduled actors are left in the heap, and skipped by their version
+        self._versions: list[int] = []
+        self._heap: list[tuple[float, int, int]] = []
+
+    def add_actor(self, actor: Character, is_summon: bool = False) -> int:
+        """
+        Add an actor, whose first turn comes after its action value.
+        :param actor: Character or summon to add.
+        :param is_summon: Whether the actor is a summon, whose stats are reset after each turn.
+        :return: Index of the actor, which its turn count can be found at.
+        """
+        index = len(self.actors)
+        self.actors.append(actor)
+        self._indices[actor] = index
+        actor.timeline = self
+        self.turn_counts.append(0)
+        self._is_summon.append(is_summon)
+        self._next_action_vals.append(0.0)
+        self._char_action_vals.append(0.0)
+        self._speeds.append(actor.speed)
+        self._versions.append(0)
+        self._schedule(index, self.current_action_val)
+        return index
+
+    def mark_changed(self, actor: Character) -> None:
+        """
+        Mark an actor whose speed or Action Forward another actor's turn changed,
+        so its next turn is moved at the end of the turn.
+        :param actor: Actor that the turn changed.
+        :return: None
+        """
+        self._changed.add(self._indices[actor])
+
+    def _push(self, index: int, action_val: float) -> None:
+        """
+        Move the actor's next turn to an action value.
+        :param index: Index of the actor.
+        :param action_val: Action value of the actor's next turn.
+        :return: None
+        """
+        self._versions[index] += 1
+        self._next_action_vals[index] = action_val
+        heapq.heappush(self._heap, (action_val, index, self._versions[index]))
+
+    def _schedule(self, index: int, action_val: float) -> None:
+        """
+        Schedule the actor's next turn from its current speed.
+        :param index: Index of the actor.
+        :param action_val: Action value the actor's next turn is counted from.
+        :return: None
+        """
+        actor = self.actors[index]
+        char_action_val = actor.calculate_action_value(actor.speed)
+        self._char_action_vals[index] = char_action_val
+        self._speeds[index] = actor.speed
+        self._push(index, action_val + char_action_val)
+
+    def _reschedule(self, index: int) -> None:
+        """
+        Move the next turn of an actor that didn't take the turn,
+        if the turn changed its speed or gave it Action Forward.
+        The rest of the way to its next turn is scaled by the speed change,
+        and Action Forward can bring its next turn up to the current action value.
+        :param index: Index of the actor.
+        :return: None
+        """
+        actor = self.actors[index]
+        action_forward = actor.summon_action_value_for_action_forward
+        if actor.speed == self._speeds[index] and not action_forward:
+            return
+
+        action_val = self._next_action_vals[index]
+        if actor.speed != self._speeds[index]:
+            old_char_action_val = self._char_action_vals[index]
+            char_action_val = actor.calculate_action_value(actor.speed)
+            action_val = self.current_action_val + (
+                action_val - self.current_action_val
+            ) * (char_action_val / old_char_action_val)
+            self._char_action_vals[index] = char_action_val
+            self._speeds[index] = actor.speed
+
+        if action_forward:
+            # the sum is only worth computing when the message is logged
+            if main_logger.isEnabledFor(logging.DEBUG):
+                main_logger.debug(
+                    "%s action value to be added: %s",
+                    actor.__class__.__name__,
+                    sum(action_forward),
+                )
+            action_val = max(
+                self.current_action_val, action_val - float(sum(action_forward))
+            )
+            actor.summon_action_value_for_action_forward = []
+
+        self._push(index, action_val)
+
+    def take_next_turn(self) -> Character | None:
+        """
+        Let the actor whose turn comes next take action.
+        Action Forward that the actor got before the end of its turn brings its next turn forward.
+        Speed changes and Action Forward that the turn gave the actors marked with mark_changed apply right away.
+        :return: Actor that took action, or None if no turns are left in the cycles.
+        """
+        heap = self._heap
+        while heap and heap[0][2] != self._versions[heap[0][1]]:
+            heapq.heappop(heap)
+        if not heap or heap[0][0] > self.cycles_action_val:
+            return None
+
+        action_val, index, _ = heapq.heappop(heap)
+        self.current_action_val = action_val
+        actor = self.actors[index]
+        char_action_val = self._char_action_vals[index]
+        main_logger.debug(
+            "%s takes a turn at action value %s",
+            actor.__class__.__name__,
+            action_val,
+        )
+
+        actor.char_action_value = char_action_val
+        actor.action_count += 1
+        actor.take_action()
+        self.turn_counts[index] += 1
+
+        # simulate Action Forward
+        action_val_to_be_added: float = float(
+            sum(actor.char_action_value_for_action_forward)
+            + sum(actor.summon_action_value_for_action_forward)
+        )
+        actor.summon_action_value_for_action_forward = []
+        main_logger.debug(
+            "%s action value to be added: %s",
+            actor.__class__.__name__,
+            action_val_to_be_added,
+        )
+
+        # the next turn can't come before the turn just taken
+        action_val -= min(action_val_to_be_added, char_action_val)
+
+        if self._is_summon[index]:
+            actor.reset_summon_stat_for_each_turn()
+
+        self._schedule(index, action_val)
+        changed, self._changed = self._changed, set()
+        changed.discard(index)
+        for other_index in changed:
+            self._reschedule(other_index)
+        return actor
+
+    def run(self) -> list[int]:
+        """
+        Take turns until no turns are left in the cycles.
+        :return: Turn count of each actor, in the order they were added.
+        """
+        while self.take_next_turn() is not None:
+            pass
+        return self.turn_counts
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,314 @@
+#    Copyright 2024 Sakan Nirattisaykul
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from hsr_simulation.counters import COUNTER_NAMES, add_counters, create_counters
+
+
+class BattleRecordBuffer:
+    """
+    Columnar buffer of the damage recorded in all battles of one simulation run.
+    Damage is stored as float64, each DMG Type as an interned integer code,
+    and each Simulate Round No. and number of hits of each row as int32.
+    The columns grow geometrically, so appending a battle is amortized O(hits).
+    When aggregate is True, each battle is stored as its total damage and number of hits
+    of each DMG Type instead of the damage of every hit. Characters sum the totals as hits land,
+    and append them with append_battle_totals.
+    The counters of the battles' events are summed as well.
+    """
+
+    DEFAULT_CAPACITY = 1024
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, aggregate: bool = False):
+        capacity = max(capacity, 1)
+        self.aggregate = aggregate
+        self.dmg = np.empty(capacity, dtype=np.float64)
+        self.dmg_type_code = np.empty(capacity, dtype=np.int16)
+        self.simulate_round = np.empty(capacity, dtype=np.int32)
+        # number of hits of each row, which is 1 unless the row is a battle's total of a DMG Type
+        self.hit_count = np.empty(capacity, dtype=np.int32)
+        self.size = 0
+        self.battle_count = 0
+        # counters summed over every battle
+        self.counters = create_counters()
+
+        # DMG Types by their code
+        self.dmg_types: list[str] = []
+        self._dmg_type_codes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def capacity(self) -> int:
+        return len(self.dmg)
+
+    def intern_dmg_type(self, dmg_type: str) -> int:
+        """
+        Get the code of a DMG Type, assigning the next code if it is new.
+        :param dmg_type: DMG Type, e.g., Skill, Ultimate, etc.
+        :return: Code of the DMG Type.
+        """
+        code = self._dmg_type_codes.get(dmg_type)
+        if code is None:
+            code = len(self.dmg_types)
+            self._dmg_type_codes[dmg_type] = code
+            self.dmg_types.append(dmg_type)
+        return code
+
+    def _reserve(self, row_num: int) -> None:
+        """
+        Make room for the given number of rows, at least doubling the capacity when it grows.
+        :param row_num: Number of rows to be appended.
+        :return: None
+        """
+        required = self.size + row_num
+        if required <= self.capacity:
+            return
+
+        new_capacity = max(self.capacity * 2, required)
+        for column in ("dmg", "dmg_type_code", "simulate_round", "hit_count"):
+            old = getattr(self, column)
+            new = np.empty(new_capacity, dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, column, new)
+
+    @staticmethod
+    def sum_by_dmg_type(
+        dmg: list[float], dmg_types: list[str]
+    ) -> tuple[list[float], list[str], list[int]]:
+        """
+        Sum the damage and count the hits of each DMG Type, in the order the DMG Types first appear.
+        :param dmg: Damage of each hit.
+        :param dmg_types: DMG Type of each hit.
+        :return: Total damage of each DMG Type, the DMG Types, and the number of hits of each DMG Type.
+        """
+        totals: dict[str, float] = {}
+        hit_counts: dict[str, int] = {}
+        for hit_dmg, dmg_type in zip(dmg, dmg_types, strict=True):
+            totals[dmg_type] = totals.get(dmg_type, 0.0) + hit_dmg
+            hit_counts[dmg_type] = hit_counts.get(dmg_type, 0) + 1
+        return list(totals.values()), list(totals.keys()), list(hit_counts.values())
+
+    def append_battle(
+        self,
+        dmg: list[float],
+        dmg_types: list[str],
+        simulate_round: int,
+        counters: dict[str, int] | None = None,
+    ) -> None:
+        """
+        Append the damage recorded in one battle.
+        If the buffer aggregates, only the battle's total damage and number of hits
+        of each DMG Type are appended.
+        :param dmg: Damage of each hit.
+        :param dmg_types: DMG Type of each hit.
+        :param simulate_round: Simulate Round No. of the battle.
+        :param counters: Counters of the battle's events.
+        :return: None
+        """
+        hit_counts = 1
+        if self.aggregate:
+            dmg, dmg_types, hit_counts = self.sum_by_dmg_type(dmg, dmg_types)
+        self._append_rows(dmg, dmg_types, hit_counts, simulate_round, counters)
+
+    def append_battle_totals(
+        self,
+        dmg_totals: dict[str, float],
+        hit_counts: dict[str, int],
+        simulate_round: int,
+        counters: dict[str, int] | None = None,
+    ) -> None:
+        """
+        Append the total damage and number of hits of each DMG Type of one battle,
+        counted by the character as the battle's hits landed.
+        :param dmg_totals: Total damage by DMG Type, in the order the DMG Types first appeared.
+        :param hit_counts: Number of hits by DMG Type.
+        :param simulate_round: Simulate Round No. of the battle.
+        :param counters: Counters of the battle's events.
+        :return: None
+        """
+        self._append_rows(
+            list(dmg_totals.values()),
+            list(dmg_totals.keys()),
+            [hit_counts[dmg_type] for dmg_type in dmg_totals],
+            simulate_round,
+            counters,
+        )
+
+    def _append_rows(
+        self,
+        dmg: list[float],
+        dmg_types: list[str],
+        hit_counts: list[int] | int,
+        simulate_round: int,
+        counters: dict[str, int] | None,
+    ) -> None:
+        """
+        Append the rows of one battle.
+        :param dmg: Damage of each row.
+        :param dmg_types: DMG Type of each row.
+        :param hit_counts: Number of hits of each row, or one number for every row.
+        :param simulate_round: Simulate Round No. of the battle.
+        :param counters: Counters of the battle's events.
+        :return: None
+        """
+        if counters is not None:
+            add_counters(self.counters, counters)
+
+        row_num = len(dmg)
+        self._reserve(row_num)
+
+        start, end = self.size, self.size + row_num
+        self.dmg[start:end] = dmg
+        self.dmg_type_code[start:end] = [
+            self.intern_dmg_type(dmg_type) for dmg_type in dmg_types
+        ]
+        self.simulate_round[start:end] = simulate_round
+        self.hit_count[start:end] = hit_counts
+        self.size = end
+        self.battle_count += 1
+
+    def extend(self, other: "BattleRecordBuffer") -> None:
+        """
+        Append every battle of another buffer, e.g., one filled by a worker process.
+        :param other: Buffer to append.
+        :return: None
+        """
+        self._reserve(other.size)
+
+        # map the other buffer's codes to this buffer's codes
+        code_map = np.array(
+            [self.intern_dmg_type(dmg_type) for dmg_type in other.dmg_types],
+            dtype=np.int16,
+        )
+
+        start, end = self.size, self.size + other.size
+        self.dmg[start:end] = other.dmg[: other.size]
+        if other.size:
+            self.dmg_type_code[start:end] = code_map[other.dmg_type_code[: other.size]]
+        self.simulate_round[start:end] = other.simulate_round[: other.size]
+        self.hit_count[start:end] = other.hit_count[: other.size]
+        self.size = end
+        self.battle_count += other.battle_count
+        add_counters(self.counters, other.counters)
+
+    @classmethod
+    def concat(cls, buffers: Iterable["BattleRecordBuffer"]) -> "BattleRecordBuffer":
+        """
+        Concatenate buffers in the given order.
+        :param buffers: Buffers to concatenate.
+        :return: New buffer containing every battle of the given buffers.
+        """
+        buffers = list(buffers)
+        result = cls(
+            capacity=sum(buffer.size for buffer in buffers),
+            aggregate=any(buffer.aggregate for buffer in buffers),
+        )
+        for buffer in buffers:
+            result.extend(buffer)
+        return result
+
+    def save(self, path: Path) -> None:
+        """
+        Save the buffer as an uncompressed NumPy .npz file.
+        :param path: File to write.
+        :return: None
+        """
+        with open(path, "wb") as file:
+            np.savez(
+                file,
+                dmg=self.dmg[: self.size],
+                dmg_type_code=self.dmg_type_code[: self.size],
+                simulate_round=self.simulate_round[: self.size],
+                hit_count=self.hit_count[: self.size],
+                dmg_types=np.array(self.dmg_types, dtype=np.str_),
+                battle_count=np.int64(self.battle_count),
+                aggregate=np.bool_(self.aggregate),
+                counters=np.array(
+                    [self.counters.get(name, 0) for name in COUNTER_NAMES],
+                    dtype=np.int64,
+                ),
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> "BattleRecordBuffer":
+        """
+        Load a buffer saved by save.
+        :param path: File to read.
+        :return: Buffer with the saved battles.
+        """
+        with np.load(path, allow_pickle=False) as arrays:
+            buffer = cls(
+                capacity=len(arrays["dmg"]), aggregate=bool(arrays["aggregate"])
+            )
+            buffer.size = len(arrays["dmg"])
+            buffer.dmg[: buffer.size] = arrays["dmg"]
+            buffer.dmg_type_code[: buffer.size] = arrays["dmg_type_code"]
+            buffer.simulate_round[: buffer.size] = arrays["simulate_round"]
+            buffer.hit_count[: buffer.size] = arrays["hit_count"]
+            for dmg_type in arrays["dmg_types"].tolist():
+                buffer.intern_dmg_type(dmg_type)
+            buffer.battle_count = int(arrays["battle_count"])
+            buffer.counters = dict(
+                zip(COUNTER_NAMES, arrays["counters"].tolist(), strict=True)
+            )
+        return buffer
+
+    def to_battle_data(self, simulate_rounds: Iterable[int]) -> list[dict[str, list]]:
+        """
+        Split the rows into the data of each battle, like a character's data after a battle.
+        Rows must be in the order of their Simulate Round No., as they are when battles are appended in order.
+        :param simulate_rounds: Simulate Round No. of each battle, in order.
+        :return: DMG, DMG_Type and Simulate Round No. of each battle as a dictionary,
+        with empty lists for a battle without any hits.
+        """
+        rounds = self.simulate_round[: self.size]
+        simulate_rounds = np.fromiter(simulate_rounds, dtype=np.int64)
+        starts = np.searchsorted(rounds, simulate_rounds, side="left")
+        ends = np.searchsorted(rounds, simulate_rounds, side="right")
+
+        dmg = self.dmg[: self.size].tolist()
+        dmg_types = [self.dmg_types[code] for code in self.dmg_type_code[: self.size]]
+        return [
+            {
+                "DMG": dmg[start:end],
+                "DMG_Type": dmg_types[start:end],
+                "Simulate Round No.": [int(simulate_round)] * (end - start),
+            }
+            for simulate_round, start, end in zip(
+                simulate_rounds, starts.tolist(), ends.tolist(), strict=True
+            )
+        ]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Create a dataframe straight from the columns, with DMG_Type as a categorical column.
+        :return: Dataframe with DMG, DMG_Type and Simulate Round No. columns,
+        and a HitCount column if the buffer aggregates.
+        """
+        columns = {
+            "DMG": self.dmg[: self.size].copy(),
+            "DMG_Type": pd.Categorical.from_codes(
+                self.dmg_type_code[: self.size].copy(), categories=self.dmg_types
+            ),
+            "Simulate Round No.": self.simulate_round[: self.size].copy(),
+        }
+        if self.aggregate:
+            columns["HitCount"] = self.hit_count[: self.size].copy()
+        return pd.DataFrame(columns)
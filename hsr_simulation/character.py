@@ -12,9 +12,12 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-import random
+from functools import cache
 
+from hsr_simulation.battle_record import BattleRecordBuffer
 from hsr_simulation.configure_logging import main_logger
+from hsr_simulation.counters import COUNTER_NAMES
+from hsr_simulation.rng import BufferedRandom
 from hsr_simulation.dmg_calculator import (
     calculate_base_dmg,
     calculate_dmg_multipliers,
@@ -26,8 +29,47 @@ from hsr_simulation.dmg_calculator import (
     calculate_super_break_dmg,
 )
 
+# slots that snapshot_state leaves out: the random number generator is set for each battle,
+# restore_state starts new dictionaries for the character's actions,
+# and the run settings are kept across the battles of a simulation run
+NON_STATE_SLOTS = frozenset(
+    {
+        "_initial_state",
+        "rng",
+        "data",
+        "dmg_totals",
+        "dmg_type_hit_counts",
+        "record_buffer",
+        "seed",
+    }
+)
+
+
+@cache
+def get_state_slots(cls: type) -> tuple[str, ...]:
+    """
+    Get the slots of a character class that hold battle state.
+    :param cls: Character class.
+    :return: Slot names declared by the class and its bases.
+    """
+    return tuple(
+        name
+        for base in reversed(cls.__mro__)
+        for name in base.__dict__.get("__slots__", ())
+        if name not in NON_STATE_SLOTS
+    )
 
-class Character:
+
+class CharacterMeta(type):
+    """Metaclass that takes a snapshot of each character's state once it is initialized."""
+
+    def __call__(cls, *args, **kwargs):
+        character = super().__call__(*args, **kwargs)
+        character.snapshot_state()
+        return character
+
+
+class Character(metaclass=CharacterMeta):
     """
     Base Character class.
     Provide methods for taking actions, e.g., Skill, Basic ATK, Ultimate, etc.
@@ -35,6 +77,46 @@ class Character:
     and handling various battle-related states.
     """
 
+    # Battle state and run settings live in slots, and each subclass declares slots for the attributes it adds.
+    __slots__ = (
+        "atk",
+        "battle_start",
+        "break_effect",
+        "char_action_value",
+        "char_action_value_for_action_forward",
+        "crit_dmg",
+        "crit_rate",
+        "current_enemy_toughness",
+        "current_ult_energy",
+        "data",
+        "default_atk",
+        "default_break_effect",
+        "default_crit_dmg",
+        "default_crit_rate",
+        "default_effect_hit_rate",
+        "default_enemy_toughness",
+        "default_enemy_weakness_broken",
+        "default_skill_points",
+        "default_speed",
+        "default_ult_energy",
+        "dmg_totals",
+        "dmg_type_hit_counts",
+        "effect_hit_rate",
+        "enemy_toughness",
+        "enemy_turn_delayed_duration_weakness_broken",
+        "enemy_weakness_broken",
+        "record_buffer",
+        "rng",
+        "seed",
+        "skill_points",
+        "speed",
+        "summon_action_value_for_action_forward",
+        "timeline",
+        "ult_energy",
+        "_initial_state",
+        *COUNTER_NAMES,
+    )
+
     # Constants for default values
     DEFAULT_ENEMY_TOUGHNESS = 100
     DEFAULT_SKILL_POINTS = 1
@@ -63,6 +145,14 @@ class Character:
         speed: float = 90,
         ult_energy: int = 140,
     ):
+        # Random number source, replaced with the battle's own source at the start of each battle
+        self.rng = BufferedRandom()
+        # Buffer that every battle's data is appended to at the end of the battle.
+        # It is shared across all battles of one simulation run, so it is not reset for each battle.
+        self.record_buffer: BattleRecordBuffer | None = None
+        # Master seed of the simulation run. Each battle's random number generator is derived from it,
+        # so a seeded run reproduces regardless of how its battles are split across workers.
+        self.seed: int | None = None
         # Initialize default stats
         self._init_default_stats(atk, crit_rate, crit_dmg, speed, ult_energy)
         # Initialize current stats
@@ -71,6 +161,8 @@ class Character:
         self._init_enemy_stats()
         # Initialize battle data
         self._init_battle_data()
+        # Initialize counters
+        self._init_counters()
 
     def _init_default_stats(self, atk, crit_rate, crit_dmg, speed, ult_energy) -> None:
         """Initialize default character statistics"""
@@ -112,12 +204,59 @@ class Character:
             "DMG_Type": [],
             "Simulate Round No.": [],
         }
+        # Total damage and number of hits of each DMG Type, summed as hits land
+        # when the record buffer aggregates, instead of recording every hit in data
+        self.dmg_totals: dict[str, float] | None = None
+        self.dmg_type_hit_counts: dict[str, int] | None = None
         self.battle_start: bool = True
         self.char_action_value_for_action_forward: list[float] = []
         self.char_action_value: float = 0.0
+        # Action timeline of the battle that the character takes turns on along with other actors
+        self.timeline = None
+
+    def _init_counters(self) -> None:
+        """
+        Initialize the counters of the battle's events.
+        They are part of the snapshot, so they start from 0 in each battle.
+        """
+        for name in COUNTER_NAMES:
+            setattr(self, name, 0)
+
+    def get_counters(self) -> dict[str, int]:
+        """
+        Get the counters of the battle's events so far.
+        :return: Counter value by counter name.
+        """
+        return {name: getattr(self, name) for name in COUNTER_NAMES}
+
+    def add_counters(self, other: "Character") -> None:
+        """
+        Add another character's counters to the character's, e.g., the counters of its summon.
+        :param other: Character whose counters are added.
+        :return: None
+        """
+        for name in COUNTER_NAMES:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def collect_counters(self, other: "Character") -> None:
+        """
+        Move another character's counters to the character's,
+        e.g., before a companion the character created is reset or removed in the battle.
+        :param other: Character whose counters are moved.
+        :return: None
+        """
+        self.add_counters(other)
+        other._init_counters()
 
     def _record_damage(self, dmg: float, dmg_type: str) -> None:
-        """Record damage and its type in battle data"""
+        """Record damage and its type in battle data, or add it to the total of its type"""
+        self.hit_count += 1
+        dmg_totals = self.dmg_totals
+        if dmg_totals is not None:
+            dmg_totals[dmg_type] = dmg_totals.get(dmg_type, 0.0) + dmg
+            hit_counts = self.dmg_type_hit_counts
+            hit_counts[dmg_type] = hit_counts.get(dmg_type, 0) + 1
+            return
         self.data["DMG"].append(dmg)
         self.data["DMG_Type"].append(dmg_type)
 
@@ -126,53 +265,73 @@ class Character:
         Reset Summon stats for each turn.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} stats ...")
+        main_logger.info("Resetting %s stats ...", self.__class__.__name__)
         self.summon_action_value_for_action_forward = []
 
-    def reset_character_data_for_each_battle(self) -> None:
+    def snapshot_state(self) -> None:
         """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data,
-        to ensure the character starts with default stats and battle-related data,
-        in each battle simulation.
+        Take a snapshot of the character's state, which restore_state goes back to.
+        It is taken once the character is initialized.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        # character stats
-        self.atk = self.default_atk
-        self.crit_rate = self.default_crit_rate
-        self.crit_dmg = self.default_crit_dmg
-        self.speed = self.default_speed
-        self.skill_points = self.default_skill_points
-        self.ult_energy = self.default_ult_energy
-        self.current_ult_energy = 0
-        self.break_effect = 1
-        self.effect_hit_rate = 0
+        shared_values = []
+        copied_values = []
+        for name in get_state_slots(type(self)):
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                # not set by the character's __init__
+                continue
+            if isinstance(value, (list, dict, set)):
+                copied_values.append((name, value.copy()))
+            else:
+                shared_values.append((name, value))
+        self._initial_state = (tuple(shared_values), tuple(copied_values))
 
-        # enemy-related stats
-        self.enemy_toughness = self.default_enemy_toughness
-        self.current_enemy_toughness = self.enemy_toughness
-        self.enemy_turn_delayed_duration_weakness_broken = 0
-        self.enemy_weakness_broken = self.default_enemy_weakness_broken
+    def restore_state(self) -> None:
+        """
+        Restore every slot of the character's state to the snapshot,
+        and start new dictionaries for storing the character's actions.
+        When the record buffer aggregates, the damage and hits are summed by DMG Type as hits land.
+        :return: None
+        """
+        shared_values, copied_values = self._initial_state
+        for name, value in shared_values:
+            setattr(self, name, value)
+        for name, value in copied_values:
+            setattr(self, name, value.copy())
 
-        # dictionary for storing character actions
-        self.data: dict[str, list[float | str | int]] = {
+        self.data = {
             "DMG": [],
             "DMG_Type": [],
             "Simulate Round No.": [],
         }
+        record_buffer = self.record_buffer
+        if record_buffer is not None and record_buffer.aggregate:
+            self.dmg_totals = {}
+            self.dmg_type_hit_counts = {}
+        else:
+            self.dmg_totals = None
+            self.dmg_type_hit_counts = None
 
-        # other stats
-        self.battle_start: bool = True
-        self.char_action_value_for_action_forward: list[float] = []
-        self.char_action_value: float = 0.0
+    def reset_character_data_for_each_battle(self) -> None:
+        """
+        Reset character's stats, along with all battle-related data,
+        and the dictionary that store the character's actions' data,
+        to ensure the character starts with default stats and battle-related data,
+        in each battle simulation.
+        Subclasses extend it for the state that isn't the same in every battle, e.g., random draws.
+        :return: None
+        """
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
+        self.restore_state()
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
         self._simulate_enemy_weakness_broken()
 
         if self.skill_points > 0:
@@ -185,7 +344,7 @@ class Character:
 
     def _use_basic_atk(self) -> None:
         """Simulate basic attack damage."""
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(
             skill_multiplier=self.BASIC_ATK_MULTIPLIER,
             break_amount=self.BASIC_ATK_BREAK_AMOUNT,
@@ -195,7 +354,7 @@ class Character:
 
     def _use_skill(self) -> None:
         """Simulate skill damage."""
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg = self._calculate_damage(
             skill_multiplier=self.SKILL_MULTIPLIER, break_amount=self.SKILL_BREAK_AMOUNT
         )
@@ -204,7 +363,7 @@ class Character:
 
     def _use_ult(self) -> None:
         """Simulate ultimate damage."""
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         dmg = self._calculate_damage(
             skill_multiplier=self.ULT_MULTIPLIER, break_amount=self.ULT_BREAK_AMOUNT
         )
@@ -216,18 +375,20 @@ class Character:
         Check whether enemy is weakness broken.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Checking Enemy Toughness...")
+        main_logger.info("%s: Checking Enemy Toughness...", self.__class__.__name__)
         if self.current_enemy_toughness <= 0 and not self.enemy_weakness_broken:
             self.enemy_turn_delayed_duration_weakness_broken = 1
             self.enemy_weakness_broken = True
-            main_logger.debug(f"{self.__class__.__name__}: Enemy is Weakness Broken")
+            self.weakness_break_count += 1
+            main_logger.debug("%s: Enemy is Weakness Broken", self.__class__.__name__)
 
     def regenerate_enemy_toughness(self) -> None:
         """
         Regenerate enemy toughness after it was weakness-broken
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Regenerate enemy toughness...")
+        main_logger.info("%s: Regenerate enemy toughness...", self.__class__.__name__)
+        self.toughness_regen_count += 1
         self.current_enemy_toughness = self.enemy_toughness
         self.enemy_weakness_broken = False
 
@@ -237,7 +398,7 @@ class Character:
         :param break_type: Break type, e.g., Physical, Fire, etc.
         :return: Break damage.
         """
-        main_logger.info(f"{self.__class__.__name__}: Doing break damage...")
+        main_logger.info("%s: Doing break damage...", self.__class__.__name__)
         break_dmg = calculate_break_damage(
             break_type=break_type, target_max_toughness=self.enemy_toughness
         )
@@ -246,6 +407,23 @@ class Character:
 
         return break_dmg
 
+    def _roll_crit(self, can_crit: bool) -> bool:
+        """
+        Roll whether a hit is a CRIT hit, counting the roll if the hit can CRIT
+        and the CRIT hit if it lands.
+        The random number is drawn even when the hit can't CRIT,
+        so the battle's later draws don't depend on which hits can CRIT.
+        :param can_crit: Whether the hit can CRIT.
+        :return: Whether the hit is a CRIT hit.
+        """
+        is_crit = self.rng.random() < self.crit_rate
+        if not can_crit:
+            return False
+        self.crit_roll_count += 1
+        if is_crit:
+            self.crit_count += 1
+        return is_crit
+
     def _calculate_damage(
         self,
         skill_multiplier: float,
@@ -267,7 +445,7 @@ class Character:
         :param can_crit: Whether the DMG can CRIT.
         :return: Damage.
         """
-        main_logger.info(f"{self.__class__.__name__}: Calculating damage...")
+        main_logger.info("%s: Calculating damage...", self.__class__.__name__)
         # reduce enemy toughness
         self.current_enemy_toughness -= break_amount
 
@@ -275,7 +453,7 @@ class Character:
 
         base_dmg = calculate_base_dmg(atk=self.atk, skill_multiplier=skill_multiplier)
 
-        if random.random() < self.crit_rate and can_crit:
+        if self._roll_crit(can_crit):
             dmg_multiplier = calculate_dmg_multipliers(
                 crit_dmg=self.crit_dmg, dmg_multipliers=dmg_multipliers
             )
@@ -313,7 +491,8 @@ class Character:
         :return: None
         """
         main_logger.info(
-            f"{self.__class__.__name__}: Updating skill points and ultimate energy..."
+            "%s: Updating skill points and ultimate energy...",
+            self.__class__.__name__,
         )
         self.skill_points += skill_points
         self.current_ult_energy += ult_energy
@@ -325,16 +504,31 @@ class Character:
         :param max_break: Max break effect.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Setting break effect...")
-        break_effect = random.choice([min_break, max_break])
+        main_logger.info("%s: Setting break effect...", self.__class__.__name__)
+        break_effect = self.rng.choice([min_break, max_break])
         self.break_effect = break_effect
 
+    def on_battle_init(self) -> None:
+        """
+        Set up the character's stats at the start of each battle, after the character is reset.
+        Characters whose stats are drawn for each battle override it.
+        :return: None
+        """
+
+    def create_summon(self) -> "Character | None":
+        """
+        Create the character's summon for a battle.
+        Characters with a summon override it.
+        :return: Summon, or None if the character has no summon.
+        """
+        return None
+
     def start_battle(self) -> None:
         """
         Indicate that the battle starts.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Battle starts...")
+        main_logger.info("%s: Battle starts...", self.__class__.__name__)
         self.battle_start = True
 
     def set_effect_hit_rate(self, min_effect_hit_rate, max_effect_hit_rate) -> None:
@@ -342,8 +536,8 @@ class Character:
         Set effect hit rate for the character.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Set effect hit rate...")
-        effect_hit_rate = random.choice([min_effect_hit_rate, max_effect_hit_rate])
+        main_logger.info("%s: Set effect hit rate...", self.__class__.__name__)
+        effect_hit_rate = self.rng.choice([min_effect_hit_rate, max_effect_hit_rate])
         self.effect_hit_rate = effect_hit_rate
 
     def simulate_action_forward(self, action_forward_percent: float) -> float:
@@ -353,14 +547,38 @@ class Character:
         :return: Action value to be added back to the total cycles action value to simulate
                 character's action forward.
         """
-        main_logger.info(f"Simulate action forward {action_forward_percent * 100}%...")
-        main_logger.debug(f"{self.__class__.__name__} current speed: {self.speed}")
+        main_logger.info(
+            "Simulate action forward %s%%...", action_forward_percent * 100
+        )
+        main_logger.debug("%s current speed: %s", self.__class__.__name__, self.speed)
         main_logger.debug(
-            f"{self.__class__.__name__} action value before taking action: {self.char_action_value}"
+            "%s action value before taking action: %s",
+            self.__class__.__name__,
+            self.char_action_value,
         )
+        self.action_forward_count += 1
         current_char_action_value: float = self.char_action_value
         return current_char_action_value * action_forward_percent
 
+    def receive_action_forward(self, action_value: float) -> None:
+        """
+        Bring the character's next turn forward on another actor's turn,
+        e.g., when Topaz's attack gives Numby Action Forward.
+        :param action_value: Action value to bring the next turn forward by.
+        :return: None
+        """
+        self.summon_action_value_for_action_forward.append(action_value)
+        self.mark_timeline_changed()
+
+    def mark_timeline_changed(self) -> None:
+        """
+        Tell the character's action timeline that another actor's turn changed
+        the character's speed or Action Forward, so its next turn is moved.
+        :return: None
+        """
+        if self.timeline is not None:
+            self.timeline.mark_changed(self)
+
     def calculate_action_value(self, speed: float) -> float:
         """Calculate action value based on speed"""
         main_logger.info("Calculating action value...")
@@ -375,7 +593,7 @@ class Character:
         :return: None
         """
         main_logger.info(
-            f"{self.__class__.__name__}: Simulate when enemy is weakness broken..."
+            "%s: Simulate when enemy is weakness broken...", self.__class__.__name__
         )
         if self.enemy_weakness_broken:
             if self.enemy_turn_delayed_duration_weakness_broken > 0:
@@ -392,5 +610,5 @@ class Character:
         :param break_effect: Break Effect
         :return: Super Break DMG
         """
-        main_logger.info(f"{self.__class__.__name__}: Dealing super break damage...")
+        main_logger.info("%s: Dealing super break damage...", self.__class__.__name__)
         return calculate_super_break_dmg(enemy_toughness_reduction, break_effect)
@@ -1,67 +1,119 @@
 import logging
+import multiprocessing
 import os
+from logging.handlers import QueueHandler, QueueListener
 
+LOG_FILE_ENV_VAR = "HSR_LOG_FILE"
+LOG_LEVEL_ENV_VAR = "HSR_LOG_LEVEL"
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
-def configure_logging_with_file(
-    log_dir: str, log_file: str, logger_name: str, level: str = "DEBUG"
+# Define a custom log format
+LOG_FORMAT = "%(asctime)s | %(processName)s | %(filename)s | line:%(lineno)d | %(funcName)s | %(levelname)s | %(message)s"
+
+# Queue that worker processes send their log records to, and the listener that writes them.
+# Both are only set once logging is configured.
+_log_queue = None
+_queue_listener: QueueListener | None = None
+_queue_logger: logging.Logger | None = None
+
+
+def configure_logging(
+    log_file: str | None = None, level: str = "WARNING", logger_name: str = "main"
 ) -> logging.Logger:
     """
-    Configure logging.
-    :param log_dir: Directory for log file.
-    :param log_file: Log file name.
-    :param logger_name: Name of the logger.
+    Configure logging on demand.
+    Log records are written to the terminal, and to the log file if one is given.
+    Records go through a queue to a single listener,
+    so worker processes configured with configure_worker_logging don't write to the file themselves.
+    :param log_file: Log file path. No log file is created if it is None.
     :param level: Set log level.
+    :param logger_name: Name of the logger.
     :return: Logger object.
     """
-    # Ensure the log directory exists
-    os.makedirs(log_dir, exist_ok=True)
+    global _log_queue, _queue_listener, _queue_logger
+
+    shutdown_logging()
+
+    formatter = logging.Formatter(LOG_FORMAT)
 
-    # Full path to the log file
-    log_file_path = os.path.join(log_dir, log_file)
+    # Create a StreamHandler to output logs to the terminal
+    handlers: list[logging.Handler] = [logging.StreamHandler()]
+
+    if log_file:
+        # Ensure the log directory exists
+        log_dir = os.path.dirname(log_file)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+
+        # Append, so that a job logging to the same file is not truncated
+        handlers.append(logging.FileHandler(log_file, mode="a"))
+
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    _log_queue = multiprocessing.Queue(-1)
+    _queue_listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
 
-    # Get the specified logger
     logger = logging.getLogger(logger_name)
+    logger.handlers.clear()
+    logger.addHandler(QueueHandler(_log_queue))
+    logger.setLevel(level)
+    _queue_logger = logger
+
+    return logger
+
 
-    # Remove any existing handlers
+def configure_worker_logging(
+    log_queue, level: str | int, logger_name: str = "main"
+) -> None:
+    """
+    Configure logging in a worker process.
+    Log records are sent to the parent process's listener through the given queue.
+    :param log_queue: Log queue from get_log_queue, or None if logging was not configured.
+    :param level: Set log level.
+    :param logger_name: Name of the logger.
+    :return: None
+    """
+    logger = logging.getLogger(logger_name)
     logger.handlers.clear()
+    if log_queue is not None:
+        logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(level)
 
-    # Set the logging level
-    if level == "DEBUG":
-        logger.setLevel(logging.DEBUG)
-    elif level == "INFO":
-        logger.setLevel(logging.INFO)
-    elif level == "WARNING":
-        logger.setLevel(logging.WARNING)
-    elif level == "ERROR":
-        logger.setLevel(logging.ERROR)
-    elif level == "CRITICAL":
-        logger.setLevel(logging.CRITICAL)
-
-    # Define a custom log format
-    log_format = "%(asctime)s | %(filename)s | line:%(lineno)d | %(funcName)s | %(levelname)s | %(message)s"
-
-    # Create a FileHandler to write logs to the specified file in overwrite mode
-    file_handler = logging.FileHandler(
-        log_file_path, mode="w"
-    )  # 'w' for write mode (overwrite)
 
-    # Create a StreamHandler to output logs to the terminal
-    stream_handler = logging.StreamHandler()
+def get_log_queue():
+    """
+    Get the queue that worker processes send their log records to.
+    :return: Log queue, or None if logging was not configured.
+    """
+    return _log_queue
 
-    # Create a Formatter with the custom log format
-    formatter = logging.Formatter(log_format)
 
-    # Set the Formatter for both the FileHandler and StreamHandler
-    file_handler.setFormatter(formatter)
-    stream_handler.setFormatter(formatter)
+def shutdown_logging() -> None:
+    """
+    Flush the queued log records and close the log handlers.
+    :return: None
+    """
+    global _log_queue, _queue_listener, _queue_logger
 
-    # Add both the FileHandler and StreamHandler to the logger
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+    if _queue_logger is not None:
+        _queue_logger.handlers.clear()
+        _queue_logger = None
 
-    return logger
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+    if _log_queue is not None:
+        _log_queue.close()
+        _log_queue.join_thread()
+        _log_queue = None
 
 
-main_logger = configure_logging_with_file(
-    log_dir="logs", log_file="main.log", logger_name="main", level="WARNING"
-)
+# Nothing is written until logging is configured,
+# apart from warnings and errors that reach Python's last resort handler.
+main_logger = logging.getLogger("main")
+main_logger.setLevel(logging.WARNING)
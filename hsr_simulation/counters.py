@@ -0,0 +1,175 @@
+#    Copyright 2024 Sakan Nirattisaykul
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+import json
+import os
+from pathlib import Path
+
+from hsr_simulation.configure_logging import main_logger
+
+# Events each character counts in every battle
+COUNTER_NAMES = (
+    "action_count",
+    "hit_count",
+    "crit_roll_count",
+    "crit_count",
+    "weakness_break_count",
+    "toughness_regen_count",
+    "action_forward_count",
+)
+
+COUNTER_DESCRIPTIONS = {
+    "action_count": "Turns taken",
+    "hit_count": "Hits recorded",
+    "crit_roll_count": "CRIT rolls of hits that can CRIT",
+    "crit_count": "CRIT Hits",
+    "weakness_break_count": "Enemy Weakness Breaks",
+    "toughness_regen_count": "Enemy Toughness regenerations",
+    "action_forward_count": "Action Forward events",
+}
+
+METRIC_PREFIX = "hsr_simulation"
+
+
+def create_counters() -> dict[str, int]:
+    """
+    Create counters that are all 0.
+    :return: Counter value by counter name
+    """
+    return dict.fromkeys(COUNTER_NAMES, 0)
+
+
+def add_counters(totals: dict[str, int], counters: dict[str, int]) -> None:
+    """
+    Add counters to the totals in place.
+    :param totals: Counter totals
+    :param counters: Counters to add
+    :return: None
+    """
+    for name, value in counters.items():
+        totals[name] = totals.get(name, 0) + value
+
+
+def get_metric_name(counter_name: str) -> str:
+    """
+    Get the Prometheus metric name of a counter, e.g., hsr_simulation_hits_total for hit_count.
+    :param counter_name: Counter name, one of COUNTER_NAMES
+    :return: Metric name
+    """
+    return f"{METRIC_PREFIX}_{counter_name.removesuffix('_count')}s_total"
+
+
+class RunCounters:
+    """
+    Counters of every battle of a run, per character.
+    """
+
+    def __init__(self):
+        self.battles: dict[str, int] = {}
+        self.totals: dict[str, dict[str, int]] = {}
+
+    def reset(self) -> None:
+        """
+        Forget the counters of every character.
+        :return: None
+        """
+        self.battles.clear()
+        self.totals.clear()
+
+    def add(self, character: str, counters: dict[str, int], battle_count: int) -> None:
+        """
+        Add the counters of some battles of a character.
+        :param character: Character name
+        :param counters: Counters summed over the battles
+        :param battle_count: Number of battles
+        :return: None
+        """
+        self.battles[character] = self.battles.get(character, 0) + battle_count
+        add_counters(self.totals.setdefault(character, create_counters()), counters)
+
+    def summary(self) -> dict:
+        """
+        Summarize the counters of each character, in total and per battle.
+        :return: Summary that can be serialized to JSON
+        """
+        summary = {}
+        for character, totals in self.totals.items():
+            battles = self.battles[character]
+            summary[character] = {
+                "battles": battles,
+                "totals": dict(totals),
+                "per_battle": {
+                    name: value / battles if battles else 0.0
+                    for name, value in totals.items()
+                },
+            }
+        return summary
+
+    def to_prometheus(self) -> str:
+        """
+        Format the counters in the Prometheus text exposition format.
+        :return: One counter metric per event, with a sample per character
+        """
+        metrics = [
+            (
+                f"{METRIC_PREFIX}_battles_total",
+                "Battles simulated",
+                self.battles,
+            )
+        ]
+        for name in COUNTER_NAMES:
+            metrics.append(
+                (
+                    get_metric_name(name),
+                    COUNTER_DESCRIPTIONS[name],
+                    {
+                        character: totals.get(name, 0)
+                        for character, totals in self.totals.items()
+                    },
+                )
+            )
+
+        lines = []
+        for metric_name, description, values in metrics:
+            lines.append(f"# HELP {metric_name} {description}.")
+            lines.append(f"# TYPE {metric_name} counter")
+            for character, value in sorted(values.items()):
+                lines.append(f'{metric_name}{{character="{character}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def write_summary(self, path: Path) -> None:
+        """
+        Write the summary of the counters as JSON.
+        :param path: JSON file to write
+        :return: None
+        """
+        main_logger.info("Writing counters summary to %s...", path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(), indent=2) + "\n")
+
+    def write_prometheus(self, path: Path) -> None:
+        """
+        Write the counters as a Prometheus text file.
+        The file is replaced atomically, so a collector never reads a partial file.
+        :param path: Text file to write, e.g., in the directory of the node exporter's textfile collector
+        :return: None
+        """
+        main_logger.info("Writing counters to %s...", path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.tmp")
+        temp_path.write_text(self.to_prometheus())
+        os.replace(temp_path, path)
+
+
+# Counters of the current run, which the scheduler adds every chunk of battles to
+run_counters = RunCounters()
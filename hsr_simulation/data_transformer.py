@@ -11,30 +11,54 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
+from itertools import chain
+
+import numpy as np
 import pandas as pd
 
+from hsr_simulation.battle_record import BattleRecordBuffer
 from hsr_simulation.configure_logging import main_logger
 
+DF_COLUMNS = ["DMG", "DMG_Type", "Simulate Round No."]
+
 
-def create_df_from_dict_list(dict_list: list[dict]) -> pd.DataFrame:
+def create_df_from_dict_list(
+    dict_list: list[dict] | BattleRecordBuffer,
+) -> pd.DataFrame:
     """
-    Create a dataframe from a list of dictionaries.
-    :param dict_list: Dictionaries to create the dataframe from.
+    Create a dataframe from a list of dictionaries, or from a record buffer.
+    Every battle's data is flattened into contiguous arrays in one pass,
+    and the dataframe is built once, with DMG_Type as a categorical column.
+    :param dict_list: Dictionaries to create the dataframe from, or a record buffer.
     :return: Dataframe created from a list of dictionaries.
     """
     main_logger.info("Creating dataframe from a list of dictionary...")
+    if isinstance(dict_list, BattleRecordBuffer):
+        return dict_list.to_dataframe()
+
     if not dict_list:
-        return pd.DataFrame(columns=["DMG", "DMG_Type", "Simulate Round No."])
-
-    df_list = []
-    for entry in dict_list:
-        df = pd.DataFrame(
-            {
-                "DMG": entry["DMG"],
-                "DMG_Type": entry["DMG_Type"],
-                "Simulate Round No.": entry["Simulate Round No."],
-            }
-        )
-        df_list.append(df)
-
-    return pd.concat(df_list)
+        return pd.DataFrame(columns=DF_COLUMNS)
+
+    row_num = sum(len(entry["DMG"]) for entry in dict_list)
+
+    dmg = np.fromiter(
+        chain.from_iterable(entry["DMG"] for entry in dict_list),
+        dtype=np.float64,
+        count=row_num,
+    )
+    dmg_type = pd.Categorical(
+        list(chain.from_iterable(entry["DMG_Type"] for entry in dict_list))
+    )
+    simulate_round = np.fromiter(
+        chain.from_iterable(entry["Simulate Round No."] for entry in dict_list),
+        dtype=np.int32,
+        count=row_num,
+    )
+
+    return pd.DataFrame(
+        {
+            "DMG": dmg,
+            "DMG_Type": dmg_type,
+            "Simulate Round No.": simulate_round,
+        }
+    )
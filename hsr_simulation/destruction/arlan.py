@@ -17,29 +17,19 @@ from hsr_simulation.configure_logging import main_logger
 
 
 class Arlan(Character):
+    __slots__ = ("current_hp", "default_hp")
+
     def __init__(self, speed: float = 102, ult_energy: int = 110):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.default_hp: int = 3600
         self.current_hp: int = self.default_hp
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data,
-        to ensure the character starts with default stats and battle-related data,
-        in each battle simulation.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.default_hp: int = 3600
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
@@ -58,20 +48,19 @@ class Arlan(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_skill(self) -> None:
         """
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         hp_cost = self.default_atk * 0.15
         if self.current_hp > hp_cost:
             self.current_hp -= hp_cost
@@ -80,21 +69,19 @@ class Arlan(Character):
         dmg = self._calculate_damage(skill_multiplier=2.4, break_amount=20)
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
     def _use_ult(self) -> None:
         """
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         single_target_dmg = self._calculate_damage(
             skill_multiplier=3.2, break_amount=20
         )
 
-        self.data["DMG"].append(single_target_dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(single_target_dmg, "Ultimate")
 
     def _apply_talent_effect(self) -> None:
         """
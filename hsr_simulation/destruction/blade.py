@@ -11,13 +11,20 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Blade(Character):
+    __slots__ = (
+        "charge_stacks",
+        "default_hp",
+        "hellscape_active",
+        "hellscape_turns",
+        "hp_loss_tally",
+    )
+
     def __init__(self, speed: float = 97, ult_energy: int = 130):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.default_hp = 7000  # Initialize default_hp
@@ -26,32 +33,17 @@ class Blade(Character):
         self.hellscape_active = False
         self.hellscape_turns = 0
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data,
-        to ensure the character starts with default stats and battle-related data,
-        in each battle simulation.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.hp_loss_tally = 0  # Initialize HP loss tally for Ultimate
-        self.charge_stacks = 0  # Initialize Charge stacks for Talent
-        self.hellscape_active = False
-        self.hellscape_turns = 0
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
         # simulate being hit by an enemy
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self.charge_stacks += 1
             self._apply_talent_effect()
 
@@ -77,20 +69,21 @@ class Blade(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_enhanced_basic_atk(self) -> None:
         """
         Simulate enhanced basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using enhanced basic attack...")
+        main_logger.info(
+            "%s is using enhanced basic attack...", self.__class__.__name__
+        )
         hp_cost = self.default_hp * 0.10
 
         self.hp_loss_tally += hp_cost
@@ -104,8 +97,7 @@ class Blade(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=0, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Enhanced Basic ATK")
+        self._record_damage(dmg, "Enhanced Basic ATK")
 
         self.charge_stacks += 1
         self._apply_talent_effect()
@@ -115,7 +107,7 @@ class Blade(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         hp_cost = self.default_hp * 0.30
 
         self.hp_loss_tally += hp_cost
@@ -134,7 +126,7 @@ class Blade(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         dmg_from_atk = self.atk * 0.4
         dmg_from_max_hp = self.default_hp
         skill_multiplier: float = (
@@ -143,8 +135,7 @@ class Blade(Character):
 
         dmg = self._calculate_damage(skill_multiplier=skill_multiplier, break_amount=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
         self.hp_loss_tally = 0  # Reset HP loss tally after Ultimate
 
@@ -165,7 +156,6 @@ class Blade(Character):
             # simulate A6 trace
             dmg *= 1.2
 
-            self.data["DMG"].append(dmg)
-            self.data["DMG_Type"].append("Talent")
+            self._record_damage(dmg, "Talent")
 
             self.charge_stacks = 0  # Reset Charge stacks after follow-up attack
@@ -17,30 +17,26 @@ from hsr_simulation.configure_logging import main_logger
 
 
 class FireFly(Character):
+    __slots__ = ("complete_combustion_state", "complete_combustion_state_duration")
+
     def __init__(self, speed: float = 104, ult_energy: int = 240):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.complete_combustion_state = False
         self.complete_combustion_state_duration = 0
 
-    def reset_character_data_for_each_battle(self) -> None:
+    def on_battle_init(self) -> None:
         """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data,
-        to ensure the character starts with default stats and battle-related data,
-        in each battle simulation.
+        Set Firefly's Break Effect for the battle.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.complete_combustion_state = False
-        self.complete_combustion_state_duration = 0
+        self.set_break_effect(1, 3.6)
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
@@ -80,7 +76,7 @@ class FireFly(Character):
         Simulate A6 trace effect.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is simulating A6 trace...")
+        main_logger.info("%s is simulating A6 trace...", self.__class__.__name__)
         multiplier = (self.atk - 1800) / 10
         self.break_effect *= 1 + (0.008 * multiplier)
 
@@ -89,21 +85,22 @@ class FireFly(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         break_amount = int(10 * self.break_effect)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=break_amount)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_enhanced_basic_atk(self) -> None:
         """
         Simulate enhanced basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using enhanced basic attack...")
+        main_logger.info(
+            "%s is using enhanced basic attack...", self.__class__.__name__
+        )
         base_break_amount = 15
         break_effect = self.break_effect + 0.5
         break_amount = int(base_break_amount * break_effect)
@@ -111,8 +108,7 @@ class FireFly(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=0)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Enhanced Basic ATK")
+        self._record_damage(dmg, "Enhanced Basic ATK")
 
         self._simulate_a4_trace(break_amount)
 
@@ -122,7 +118,7 @@ class FireFly(Character):
         :param break_amount: Amount of toughness reduction from an attack
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is simulating A4 trace...")
+        main_logger.info("%s is simulating A4 trace...", self.__class__.__name__)
         if self.enemy_weakness_broken:
             super_break_dmg = self._deal_super_break_dmg(
                 enemy_toughness_reduction=break_amount, break_effect=self.break_effect
@@ -137,30 +133,28 @@ class FireFly(Character):
             # simulate Ult effect
             super_break_dmg *= 1.2
 
-            self.data["DMG"].append(super_break_dmg)
-            self.data["DMG_Type"].append("Super Break DMG")
+            self._record_damage(super_break_dmg, "Super Break DMG")
 
     def _use_skill(self) -> None:
         """
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         break_amount = int(20 * self.break_effect)
         dmg = self._calculate_damage(skill_multiplier=2, break_amount=break_amount)
 
         ult_energy = int(self.ult_energy * 0.6)
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=ult_energy)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
     def _use_enhanced_skill(self) -> None:
         """
         Simulate enhanced skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using enhanced skill...")
+        main_logger.info("%s is using enhanced skill...", self.__class__.__name__)
         skill_multiplier = (0.2 * self.break_effect) + 2
         base_break_amount = 30
         break_effect = self.break_effect + 0.5
@@ -171,8 +165,7 @@ class FireFly(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=0)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Enhanced Skill")
+        self._record_damage(dmg, "Enhanced Skill")
 
         self._simulate_a4_trace(break_amount)
 
@@ -181,7 +174,7 @@ class FireFly(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         self.char_action_value_for_action_forward.append(
             self.simulate_action_forward(1)
         )
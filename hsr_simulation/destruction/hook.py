@@ -17,30 +17,19 @@ from hsr_simulation.configure_logging import main_logger
 
 
 class Hook(Character):
+    __slots__ = ("burn", "can_use_enhanced_skill")
+
     def __init__(self, speed: float = 94, ult_energy: int = 120):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.burn: int = 0
         self.can_use_enhanced_skill: bool = False
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data,
-        to ensure the character starts with default stats and battle-related data,
-        in each battle simulation.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.burn: int = 0
-        self.can_use_enhanced_skill: bool = False
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
@@ -68,13 +57,12 @@ class Hook(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
         if self.burn > 0:
             self._apply_talent_dmg()
@@ -84,13 +72,12 @@ class Hook(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=2.4, break_amount=20)
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
         if self.burn > 0:
             self._apply_talent_dmg()
@@ -102,13 +89,12 @@ class Hook(Character):
         Simulate enhanced skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using enhanced skill...")
+        main_logger.info("%s is using enhanced skill...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=2.8, break_amount=20)
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Enhanced Skill")
+        self._record_damage(dmg, "Enhanced Skill")
 
         if self.burn > 0:
             self._apply_talent_dmg()
@@ -120,11 +106,10 @@ class Hook(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=4, break_amount=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
         if self.burn > 0:
             self._apply_talent_dmg()
@@ -143,23 +128,21 @@ class Hook(Character):
         Apply burn damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is applying burn damage...")
+        main_logger.info("%s is applying burn damage...", self.__class__.__name__)
         dmg = self._calculate_damage(
             skill_multiplier=0.65, break_amount=0, can_crit=False
         )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("DoT")
+        self._record_damage(dmg, "DoT")
 
     def _apply_talent_dmg(self) -> None:
         """
         Apply talent damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is applying talent damage...")
+        main_logger.info("%s is applying talent damage...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=0)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Talent")
+        self._record_damage(dmg, "Talent")
 
         self.current_ult_energy += 5
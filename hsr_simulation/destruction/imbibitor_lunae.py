@@ -11,13 +11,21 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class ImbibitorLunae(Character):
+    __slots__ = (
+        "divine_spear",
+        "fulgurant_leap",
+        "outroar",
+        "righteous_heart",
+        "squama_sacrosancta",
+        "transcendence",
+    )
+
     def __init__(self, speed: float = 102, ult_energy: int = 140):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.transcendence = False
@@ -27,29 +35,12 @@ class ImbibitorLunae(Character):
         self.righteous_heart = 0
         self.squama_sacrosancta = 0
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data,
-        to ensure the character starts with default stats and battle-related data,
-        in each battle simulation.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.transcendence = False
-        self.divine_spear = False
-        self.fulgurant_leap = False
-        self.outroar = 0
-        self.righteous_heart = 0
-        self.squama_sacrosancta = 0
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
@@ -95,31 +86,30 @@ class ImbibitorLunae(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
 
         # simulate A6 trace
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self.crit_dmg += 0.24
 
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_skill(self) -> None:
         """
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
 
         # simulate A6 trace
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self.crit_dmg += 0.24
 
-        skill_point_used = random.choice([1, 2, 3])
+        skill_point_used = self.rng.choice([1, 2, 3])
 
         if skill_point_used == 1:
             self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
@@ -136,14 +126,14 @@ class ImbibitorLunae(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         hit_num = 3
         skill_multiplier = 3
         skill_multiplier_for_each_hit = skill_multiplier / hit_num
         break_amount_for_each_hit = 20 // hit_num
 
         # simulate A6 trace
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self.crit_dmg += 0.24
 
         for _ in range(hit_num):
@@ -155,8 +145,7 @@ class ImbibitorLunae(Character):
                 dmg_multipliers=[dmg_multiplier],
             )
 
-            self.data["DMG"].append(dmg)
-            self.data["DMG_Type"].append("Ultimate")
+            self._record_damage(dmg, "Ultimate")
 
         self.squama_sacrosancta = 2
         self.skill_points += self.squama_sacrosancta
@@ -172,7 +161,9 @@ class ImbibitorLunae(Character):
         :param break_amount: Break amount.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using enhanced basic attack...")
+        main_logger.info(
+            "%s is using enhanced basic attack...", self.__class__.__name__
+        )
         skill_multiplier_for_each_hit = skill_multiplier / number_of_hits
         break_amount_for_each_hit = break_amount // number_of_hits
 
@@ -187,8 +178,7 @@ class ImbibitorLunae(Character):
                 break_amount=break_amount_for_each_hit,
                 dmg_multipliers=[dmg_multiplier],
             )
-            self.data["DMG"].append(dmg)
-            self.data["DMG_Type"].append("Enhanced Basic ATK")
+            self._record_damage(dmg, "Enhanced Basic ATK")
 
         self._update_skill_point_and_ult_energy(skill_points=0, ult_energy=40)
 
@@ -197,7 +187,7 @@ class ImbibitorLunae(Character):
         Gain Outroar buffs to the character.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is gaining Outroar buffs...")
+        main_logger.info("%s is gaining Outroar buffs...", self.__class__.__name__)
         self.outroar += 1
         self.outroar = min(self.outroar, 4)
 
@@ -210,7 +200,7 @@ class ImbibitorLunae(Character):
         :return: DMG multiplier.
         """
         main_logger.info(
-            f"{self.__class__.__name__} is gaining Righteous Heart buffs..."
+            "%s is gaining Righteous Heart buffs...", self.__class__.__name__
         )
 
         self.righteous_heart += 1
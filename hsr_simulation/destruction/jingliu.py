@@ -11,13 +11,14 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Jingliu(Character):
+    __slots__ = ("atk_multiplier", "spectral_transmigration", "syzygy")
+
     ATK_MULTIPLIER_OPTIONS: list[float] = [0.6, 1.8]
     MAX_SYZYGY: int = 3
     CRIT_RATE_BONUS: float = 0.5
@@ -29,33 +30,19 @@ class Jingliu(Character):
         self.atk_multiplier: float = 0
         self.spectral_transmigration: bool = False
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data,
-        to ensure the character starts with default stats and battle-related data,
-        in each battle simulation.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.syzygy: int = 0
-        self.atk_multiplier: float = 0
-        self.spectral_transmigration: bool = False
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
         # simulate ATK to be increased when using enhanced Skill
         if self.battle_start:
             self.battle_start = False
-            self.atk_multiplier = 1 + random.choice(self.ATK_MULTIPLIER_OPTIONS)
+            self.atk_multiplier = 1 + self.rng.choice(self.ATK_MULTIPLIER_OPTIONS)
 
         # reset stats for each action
         self.char_action_value_for_action_forward = []
@@ -83,26 +70,24 @@ class Jingliu(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_skill(self) -> None:
         """
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=2, break_amount=20)
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
         if self.syzygy < self.MAX_SYZYGY:
             self.syzygy += 1
@@ -118,7 +103,7 @@ class Jingliu(Character):
         Simulate enhanced skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         self.atk = self.default_atk * self.atk_multiplier
         self.syzygy -= 1
 
@@ -126,8 +111,7 @@ class Jingliu(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=0, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Enhanced Skill")
+        self._record_damage(dmg, "Enhanced Skill")
 
         self.atk = self.default_atk
 
@@ -136,7 +120,7 @@ class Jingliu(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         if self.spectral_transmigration:
             self.atk = self.default_atk * self.atk_multiplier
             dmg_multiplier = 0.2
@@ -147,8 +131,7 @@ class Jingliu(Character):
             skill_multiplier=3, break_amount=20, dmg_multipliers=[dmg_multiplier]
         )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
         if self.syzygy < self.MAX_SYZYGY:
             self.syzygy += 1
@@ -163,7 +146,7 @@ class Jingliu(Character):
         :return: None
         """
         main_logger.info(
-            f"{self.__class__.__name__} is entering Spectral Transmigration state..."
+            "%s is entering Spectral Transmigration state...", self.__class__.__name__
         )
         action_value: float = self.simulate_action_forward(action_forward_percent=1)
         self.char_action_value_for_action_forward.append(action_value)
@@ -11,42 +11,30 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Misha(Character):
+    __slots__ = ("enemy_frozen", "hit_per_action")
+
     def __init__(self, speed: float = 96, ult_energy: int = 100):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.hit_per_action = 3
         self.enemy_frozen = False
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data,
-        to ensure the character starts with default stats and battle-related data,
-        in each battle simulation.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.hit_per_action = 3
-        self.enemy_frozen = False
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
         # simulate ally using skill points
-        skill_point_used = random.choice([0, 3])
+        skill_point_used = self.rng.choice([0, 3])
         self.hit_per_action += skill_point_used
 
         # simulate Talent
@@ -68,26 +56,24 @@ class Misha(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_skill(self) -> None:
         """
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=2, break_amount=20)
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
         self.hit_per_action += 1
         self.hit_per_action = min(self.hit_per_action, 10)
@@ -97,7 +83,7 @@ class Misha(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
 
         hit_num = self.hit_per_action
 
@@ -115,7 +101,7 @@ class Misha(Character):
 
             # attempt to freeze enemy
             if not self.enemy_frozen:
-                if random.random() < freeze_enemy_chance:
+                if self.rng.random() < freeze_enemy_chance:
                     self.enemy_frozen = True
 
             # simulate A6 trace
@@ -124,8 +110,7 @@ class Misha(Character):
 
             dmg = self._calculate_damage(skill_multiplier=0.6, break_amount=10)
 
-            self.data["DMG"].append(dmg)
-            self.data["DMG_Type"].append("Ultimate")
+            self._record_damage(dmg, "Ultimate")
 
         self.hit_per_action = 3
         self.crit_dmg = self.default_crit_dmg
@@ -135,7 +120,7 @@ class Misha(Character):
         Simulate enemy's turn.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is simulating enemy turn...")
+        main_logger.info("%s is simulating enemy turn...", self.__class__.__name__)
         # simulate enemy turn
         self.check_if_enemy_weakness_broken()
         if self.enemy_frozen:
@@ -143,5 +128,4 @@ class Misha(Character):
 
             dmg = self._calculate_damage(skill_multiplier=0.3, break_amount=0)
 
-            self.data["DMG"].append(dmg)
-            self.data["DMG_Type"].append("Freeze DMG")
+            self._record_damage(dmg, "Freeze DMG")
@@ -12,7 +12,6 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-import random
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 from hsr_simulation.dmg_calculator import (
@@ -25,6 +24,17 @@ from hsr_simulation.dmg_calculator import (
 
 
 class Mydei(Character):
+    __slots__ = (
+        "a2_revival_count",
+        "bloodied_chiton_bonus",
+        "charge",
+        "current_hp",
+        "default_hp",
+        "initial_default_hp",
+        "max_charge",
+        "vendetta_active",
+    )
+
     def __init__(self, speed: float = 102, ult_energy: int = 160):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.initial_default_hp = 8000  # Store the initial HP value
@@ -37,37 +47,20 @@ class Mydei(Character):
         self.a2_revival_count = 3  # A2 trace - Earth and Water - prevents exit from Vendetta on killing blow 3 times
         self._apply_bloodied_chiton()  # Apply A6 trace at battle start
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data,
-        to ensure the character starts with default stats and battle-related data,
-        in each battle simulation.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.default_hp = self.initial_default_hp  # Reset to initial HP value
-        self.current_hp = self.default_hp
-        self.charge = 0
-        self.vendetta_active = False
-        self.a2_revival_count = 3  # Reset A2 trace revival count
-        self._apply_bloodied_chiton()  # Apply A6 trace at battle start
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
-        
+
         # Simulate HP lost from enemy's attack
-        enemy_attack = random.randint(1000, 4000)
+        enemy_attack = self.rng.randint(1000, 4000)
         self._check_for_killing_blow(enemy_attack)
         self._gain_charge(enemy_attack)
-        
+
         # reset action forward
         self.char_action_value_for_action_forward = []
 
@@ -75,7 +68,7 @@ class Mydei(Character):
         if self.vendetta_active and self.charge >= 150:
             self._use_godslayer_be_god()
             self.charge = 0
-            
+
             # After using Godslayer, Mydei still gets to take his normal action
             # This simulates the "extra turn" mentioned in the documentation
             if self.skill_points > 0:
@@ -101,7 +94,7 @@ class Mydei(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(
             skill_multiplier=0.5, break_amount=10
         )  # 50% of Max HP
@@ -115,7 +108,7 @@ class Mydei(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
 
         # Consume HP
         hp_cost = self.current_hp * 0.5
@@ -138,7 +131,7 @@ class Mydei(Character):
         Simulate Kingslayer Be King damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using Kingslayer Be King...")
+        main_logger.info("%s is using Kingslayer Be King...", self.__class__.__name__)
 
         # Consume HP
         hp_cost = self.current_hp * 0.35
@@ -161,13 +154,13 @@ class Mydei(Character):
         Simulate Godslayer Be God damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using Godslayer Be God...")
+        main_logger.info("%s is using Godslayer Be God...", self.__class__.__name__)
 
         # Handle the action forward (extra turn) for Godslayer Be God
         # This simulates Mydei getting an extra turn to use this ability
         action_value = self.simulate_action_forward(action_forward_percent=1)
         self.char_action_value_for_action_forward.append(action_value)
-            
+
         # Calculate damage
         dmg = self._calculate_damage(
             skill_multiplier=2.8, break_amount=30
@@ -182,7 +175,7 @@ class Mydei(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
 
         # Calculate damage
         dmg = self._calculate_damage(
@@ -213,17 +206,17 @@ class Mydei(Character):
         Enter Vendetta state.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is entering Vendetta state...")
+        main_logger.info("%s is entering Vendetta state...", self.__class__.__name__)
         self.vendetta_active = True
         self.charge = 0
-        
+
         # Store original HP and increase it for Vendetta state
         vendetta_hp_multiplier = 1.5
         self.default_hp *= vendetta_hp_multiplier  # Max HP increases by 50%
-        
+
         # Heal 25% of new max HP
         self.current_hp = min(self.default_hp, self.current_hp + self.default_hp * 0.25)
-        
+
         # Action forward
         action_value = self.simulate_action_forward(action_forward_percent=1)
         self.char_action_value_for_action_forward.append(action_value)
@@ -249,24 +242,34 @@ class Mydei(Character):
             if self.vendetta_active:
                 if self.a2_revival_count > 0:
                     # A2 trace effect: prevent exit from Vendetta state
-                    main_logger.info(f"{self.__class__.__name__} A2 trace prevents death in Vendetta state! Remaining uses: {self.a2_revival_count-1}")
+                    main_logger.info(
+                        "%s A2 trace prevents death in Vendetta state! Remaining uses: %s",
+                        self.__class__.__name__,
+                        self.a2_revival_count - 1,
+                    )
                     self.a2_revival_count -= 1
-                    
+
                     # Restore 50% of max HP (per talent description)
                     self.current_hp = self.default_hp * 0.5
                 else:
                     # Normal Vendetta death prevention (after A2 uses exhausted)
-                    main_logger.info(f"{self.__class__.__name__} prevents death by exiting Vendetta state!")
+                    main_logger.info(
+                        "%s prevents death by exiting Vendetta state!",
+                        self.__class__.__name__,
+                    )
                     self.vendetta_active = False
                     self.charge = 0
                     self.current_hp = self.default_hp * 0.5  # Restore 50% of max HP
-                    
+
                     # Reset HP back to pre-Vendetta value
                     self.default_hp = self.initial_default_hp
                     self._apply_bloodied_chiton()  # Reapply A6 trace after resetting HP
             else:
                 # If not in Vendetta, Mydei dies - reset all stats for simulation purposes
-                main_logger.info(f"{self.__class__.__name__} has died! Resetting all stats for simulation...")
+                main_logger.info(
+                    "%s has died! Resetting all stats for simulation...",
+                    self.__class__.__name__,
+                )
                 self.reset_character_data_for_each_battle()
         else:
             # Normal damage taking
@@ -294,7 +297,7 @@ class Mydei(Character):
         :param can_crit: Whether the DMG can CRIT.
         :return: Damage.
         """
-        main_logger.info(f"{self.__class__.__name__}: Calculating HP-based damage...")
+        main_logger.info("%s: Calculating HP-based damage...", self.__class__.__name__)
         # reduce enemy toughness
         self.current_enemy_toughness -= break_amount
 
@@ -303,7 +306,7 @@ class Mydei(Character):
         # Calculate base damage using HP instead of ATK
         base_dmg = self.default_hp * skill_multiplier
 
-        if random.random() < self.crit_rate and can_crit:
+        if self._roll_crit(can_crit):
             dmg_multiplier = calculate_dmg_multipliers(
                 crit_dmg=self.crit_dmg, dmg_multipliers=dmg_multipliers
             )
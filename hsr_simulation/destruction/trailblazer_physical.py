@@ -11,35 +11,24 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class TrailblazerPhysical(Character):
+    __slots__ = ("talent_buff",)
+
     def __init__(self, speed: float = 100, ult_energy: int = 120):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.talent_buff = 0
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data,
-        to ensure the character starts with default stats and battle-related data,
-        in each battle simulation.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.talent_buff = 0
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
@@ -66,7 +55,7 @@ class TrailblazerPhysical(Character):
         Simulate talent.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is simulating talent...")
+        main_logger.info("%s is simulating talent...", self.__class__.__name__)
         self.talent_buff += 1
         self.talent_buff = min(self.talent_buff, 2)
 
@@ -77,7 +66,7 @@ class TrailblazerPhysical(Character):
         Increase attack power from Talent.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is increasing attack power...")
+        main_logger.info("%s is increasing attack power...", self.__class__.__name__)
         if self.talent_buff > 0:
             self.atk = self.default_atk * (1 + (0.2 + self.talent_buff))
 
@@ -86,55 +75,53 @@ class TrailblazerPhysical(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_skill(self) -> None:
         """
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1.25, break_amount=20)
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
     def _use_ult(self) -> None:
         """
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         # simulate A6 trace
         dmg_multiplier = 0.25
 
         # randomize between 2 ultimate attack modes
-        skill_multiplier = random.choice([4.5, 2.7])
+        skill_multiplier = self.rng.choice([4.5, 2.7])
         dmg = self._calculate_damage(
             skill_multiplier=skill_multiplier,
             break_amount=20,
             dmg_multipliers=[dmg_multiplier],
         )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
     def check_if_enemy_weakness_broken(self) -> None:
         """
         Check whether enemy is weakness broken.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Checking Enemy Toughness...")
+        main_logger.info("%s: Checking Enemy Toughness...", self.__class__.__name__)
         if self.current_enemy_toughness <= 0 and not self.enemy_weakness_broken:
             self.enemy_turn_delayed_duration_weakness_broken = 1
             self.enemy_weakness_broken = True
-            main_logger.debug(f"{self.__class__.__name__}: Enemy is Weakness Broken")
+            self.weakness_break_count += 1
+            main_logger.debug("%s: Enemy is Weakness Broken", self.__class__.__name__)
             self._simulate_talent()
@@ -11,42 +11,37 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Xueyi(Character):
+    __slots__ = ("a2_trace_dmg_multiplier", "karma_stack")
+
     def __init__(self, speed: float = 103, ult_energy: int = 120):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.karma_stack = 0
         self.a2_trace_dmg_multiplier = self.break_effect
 
-    def reset_character_data_for_each_battle(self) -> None:
+    def on_battle_init(self) -> None:
         """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data,
-        to ensure the character starts with default stats and battle-related data,
-        in each battle simulation.
+        Set Xueyi's Break Effect for the battle.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.karma_stack = 0
-        self.a2_trace_dmg_multiplier = self.break_effect
+        self.set_break_effect(1, 2.4)
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
         # simulate enemy toughness reduction from allies
-        self.karma_stack += random.choice([0, 3])
+        self.karma_stack += self.rng.choice([0, 3])
 
         if self.skill_points > 0:
             self._use_skill()
@@ -63,7 +58,7 @@ class Xueyi(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(
             skill_multiplier=1,
             break_amount=10,
@@ -72,8 +67,7 @@ class Xueyi(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
         self._gain_karma_stack()
         if self.karma_stack >= 8:
@@ -84,7 +78,7 @@ class Xueyi(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg = self._calculate_damage(
             skill_multiplier=1.4,
             break_amount=20,
@@ -93,8 +87,7 @@ class Xueyi(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
         self._gain_karma_stack()
         if self.karma_stack >= 8:
@@ -105,7 +98,7 @@ class Xueyi(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         base_break_amount = 40
 
         break_amount = base_break_amount * self.break_effect
@@ -129,8 +122,7 @@ class Xueyi(Character):
             ],
         )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
         self._gain_karma_stack()
         if self.karma_stack >= 8:
@@ -141,7 +133,7 @@ class Xueyi(Character):
         Gain karma stack.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is gaining karma stack...")
+        main_logger.info("%s is gaining karma stack...", self.__class__.__name__)
         self.karma_stack += 1
         base_max_karma_stack = 8
 
@@ -156,14 +148,13 @@ class Xueyi(Character):
         Simulate follow-up attack damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using follow-up attack...")
+        main_logger.info("%s is using follow-up attack...", self.__class__.__name__)
         num_hit = 3
 
         for _ in range(num_hit):
             dmg = self._calculate_damage(skill_multiplier=0.9, break_amount=5)
 
-            self.data["DMG"].append(dmg)
-            self.data["DMG_Type"].append("Talent")
+            self._record_damage(dmg, "Talent")
 
             self.current_ult_energy += 2
 
@@ -11,37 +11,25 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Yunli(Character):
+    __slots__ = ("is_parry", "parry_missed")
+
     def __init__(self, speed: float = 94, ult_energy: int = 240):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.is_parry = False
         self.parry_missed = False
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data,
-        to ensure the character starts with default stats and battle-related data,
-        in each battle simulation.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.is_parry = False
-        self.parry_missed = False
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
@@ -51,7 +39,7 @@ class Yunli(Character):
 
         # simulate Parry from Ultimate
         if self.is_parry:
-            parry_success = random.choices([True, False])
+            parry_success = self.rng.choices([True, False])
             if parry_success:
                 self._parry(is_being_attacked=True)
             else:
@@ -73,33 +61,31 @@ class Yunli(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_skill(self) -> None:
         """
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1.2, break_amount=20)
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
     def _use_ult(self) -> None:
         """
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         self.is_parry = True
 
     def _can_use_ult(self) -> bool:
@@ -110,14 +96,13 @@ class Yunli(Character):
         Simulate follow-up attack damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using follow-up attack...")
+        main_logger.info("%s is using follow-up attack...", self.__class__.__name__)
         # simulate A6 trace
         self.atk = self.default_atk * 1.3
 
         dmg = self._calculate_damage(skill_multiplier=1.2, break_amount=10)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Talent")
+        self._record_damage(dmg, "Talent")
 
         self.current_ult_energy += 10
 
@@ -129,7 +114,7 @@ class Yunli(Character):
         :param is_being_attacked: Whether the character is being attacked.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is parrying...")
+        main_logger.info("%s is parrying...", self.__class__.__name__)
         # simulate A6 trace
         self.atk = self.default_atk * 1.3
 
@@ -147,8 +132,7 @@ class Yunli(Character):
             # simulate A2 trace
             self.parry_missed = True
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
         # reset stats after attack
         self.crit_dmg = self.default_crit_dmg
@@ -12,6 +12,10 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+
+import numpy as np
+import numpy.typing as npt
+
 from hsr_simulation.configure_logging import main_logger
 
 
@@ -137,6 +141,58 @@ def calculate_total_damage(
     )
 
 
+def calculate_total_damage_batch(
+    skill_multiplier: npt.ArrayLike,
+    atk: npt.ArrayLike,
+    is_crit: npt.ArrayLike = False,
+    crit_dmg: npt.ArrayLike = 0,
+    dmg_multipliers_sum: npt.ArrayLike = 0,
+    dot_dmg_sum: npt.ArrayLike = 0,
+    res_pen_sum: npt.ArrayLike = 0,
+    def_reduction_sum: npt.ArrayLike = 0,
+    weakness_broken: npt.ArrayLike = False,
+    extra_multipliers_sum: npt.ArrayLike = 0,
+    extra_dmg: npt.ArrayLike = 0,
+) -> np.ndarray:
+    """
+    Calculates the total damage of many hits at once,
+    e.g., for tools that re-price recorded hits after the simulation.
+    It gives the same damage as calculate_base_dmg, calculate_dmg_multipliers,
+    calculate_def_multipliers, calculate_res_multipliers, calculate_universal_dmg_reduction
+    and calculate_total_damage applied to each hit,
+    with each list of multipliers passed as its sum.
+    Every argument is a scalar or an array, broadcast against each other.
+    :param skill_multiplier: Skill multiplier of each hit.
+    :param atk: Attack of the character of each hit.
+    :param is_crit: Whether each hit is a critical hit.
+    :param crit_dmg: Critical damage multiplier, applied to critical hits only.
+    :param dmg_multipliers_sum: Sum of the damage multipliers of each hit.
+    :param dot_dmg_sum: Sum of the DoT damage multipliers of each hit.
+    :param res_pen_sum: Sum of the resistance penetration multipliers of each hit.
+    :param def_reduction_sum: Sum of the DEF reduction multipliers of each hit.
+    :param weakness_broken: Whether the enemy's weakness is broken at each hit.
+    :param extra_multipliers_sum: Sum of the additional skill multipliers of each hit.
+    :param extra_dmg: Flat additional damage of each hit.
+    :return: Total damage of each hit.
+    """
+    main_logger.info("Calculating total damage of a batch...")
+    base_dmg = (
+        np.add(skill_multiplier, extra_multipliers_sum) * np.asarray(atk) + extra_dmg
+    )
+    dmg_multipliers = (1 + np.where(is_crit, crit_dmg, 0)) * (
+        1 + np.add(dot_dmg_sum, dmg_multipliers_sum)
+    )
+    dmg_reduction = np.where(weakness_broken, 1, 0.9)
+
+    return (
+        base_dmg
+        * dmg_multipliers
+        * (1 + np.asarray(def_reduction_sum))
+        * (1 + np.asarray(res_pen_sum))
+        * dmg_reduction
+    )
+
+
 def calculate_break_damage(break_type: str, target_max_toughness: int) -> float:
     """
     Calculates break damage
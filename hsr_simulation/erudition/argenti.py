@@ -11,18 +11,19 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Argenti(Character):
+    __slots__ = ("apotheosis", "enemy_on_field", "ult_energy_to_consume")
+
     def __init__(self, speed: float = 103, ult_energy: int = 180):
         super().__init__(speed=speed, ult_energy=ult_energy)
-        self.ult_energy_to_consume = random.choices([90, 180], weights=[0.2, 0.8])[0]
+        self.ult_energy_to_consume = self.rng.choices([90, 180], weights=[0.2, 0.8])[0]
         self.apotheosis = 0
-        self.enemy_on_field = random.choice([1, 2, 3, 4, 5])
+        self.enemy_on_field = self.rng.choice([1, 2, 3, 4, 5])
 
     def reset_character_data_for_each_battle(self) -> None:
         """
@@ -32,18 +33,17 @@ class Argenti(Character):
         in each battle simulation.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.ult_energy_to_consume = random.choices([90, 180], weights=[0.2, 0.8])[0]
-        self.apotheosis = 0
-        self.enemy_on_field = random.choice([1, 2, 3, 4, 5])
+        self.ult_energy_to_consume = self.rng.choices([90, 180], weights=[0.2, 0.8])[0]
+        self.enemy_on_field = self.rng.choice([1, 2, 3, 4, 5])
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
@@ -69,7 +69,7 @@ class Argenti(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg_multiplier = self._simulate_a6_trace()
 
         self._simulate_num_enemy_hits()
@@ -80,15 +80,14 @@ class Argenti(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(single_target_dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(single_target_dmg, "Basic ATK")
 
     def _use_skill(self) -> None:
         """
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg_multiplier = self._simulate_a6_trace()
 
         self._simulate_num_enemy_hits()
@@ -105,15 +104,14 @@ class Argenti(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
     def _use_ult(self) -> None:
         """
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         dmg_multiplier = self._simulate_a6_trace()
 
         self._simulate_num_enemy_hits()
@@ -153,8 +151,7 @@ class Argenti(Character):
                     dmg_multipliers=[dmg_multiplier],
                 )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
     def _can_use_ult(self) -> bool:
         return self.current_ult_energy >= self.ult_energy_to_consume
@@ -165,7 +162,8 @@ class Argenti(Character):
         :return: None
         """
         main_logger.info(
-            f"{self.__class__.__name__}: simulate number of enemy being hit by this character..."
+            "%s: simulate number of enemy being hit by this character...",
+            self.__class__.__name__,
         )
         num_hits = self.enemy_on_field
         self.current_ult_energy += 3 * num_hits
@@ -180,8 +178,8 @@ class Argenti(Character):
         Simulate A6 Trace.
         :return: DMG Multiplier
         """
-        main_logger.info(f"{self.__class__.__name__}: simulate A6 Trace...")
-        current_enemy_hp = random.choice([True, False])
+        main_logger.info("%s: simulate A6 Trace...", self.__class__.__name__)
+        current_enemy_hp = self.rng.choice([True, False])
         if current_enemy_hp:
             return 0.15
         else:
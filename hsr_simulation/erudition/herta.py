@@ -11,19 +11,25 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Herta(Character):
+    __slots__ = (
+        "can_use_follow_up",
+        "enemy_current_hp_less_than_50_percent",
+        "enemy_is_frozen",
+        "enemy_on_field",
+    )
+
     def __init__(self, speed: float = 100, ult_energy: int = 110):
         super().__init__(speed=speed, ult_energy=ult_energy)
-        self.enemy_on_field = random.choice([1, 2, 3, 4, 5])
-        self.enemy_is_frozen = random.choice([True, False])
-        self.can_use_follow_up = random.choice([True, False])
-        self.enemy_current_hp_less_than_50_percent = random.choice([True, False])
+        self.enemy_on_field = self.rng.choice([1, 2, 3, 4, 5])
+        self.enemy_is_frozen = self.rng.choice([True, False])
+        self.can_use_follow_up = self.rng.choice([True, False])
+        self.enemy_current_hp_less_than_50_percent = self.rng.choice([True, False])
 
     def reset_character_data_for_each_battle(self) -> None:
         """
@@ -33,19 +39,19 @@ class Herta(Character):
         in each battle simulation.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.enemy_on_field = random.choice([1, 2, 3, 4, 5])
-        self.enemy_is_frozen = random.choice([True, False])
-        self.can_use_follow_up = random.choice([True, False])
-        self.enemy_current_hp_less_than_50_percent = random.choice([True, False])
+        self.enemy_on_field = self.rng.choice([1, 2, 3, 4, 5])
+        self.enemy_is_frozen = self.rng.choice([True, False])
+        self.can_use_follow_up = self.rng.choice([True, False])
+        self.enemy_current_hp_less_than_50_percent = self.rng.choice([True, False])
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
@@ -69,20 +75,19 @@ class Herta(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_skill(self) -> None:
         """
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg_multiplier = 0
 
         # simulate enemy current HP
@@ -104,15 +109,14 @@ class Herta(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
     def _use_ult(self) -> None:
         """
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         dmg_multiplier = 0
 
         # simulate A6 trace
@@ -129,15 +133,14 @@ class Herta(Character):
                 skill_multiplier=2, break_amount=20, dmg_multipliers=[dmg_multiplier]
             )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
     def _simulate_follow_up_atk(self) -> None:
         """
         Simulate follow-up attack.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using follow-up attack...")
+        main_logger.info("%s is using follow-up attack...", self.__class__.__name__)
         if self.can_use_follow_up:
             num_enemy_current_hp_less_than_50_percent = self.enemy_on_field
 
@@ -148,5 +151,4 @@ class Herta(Character):
                 for _ in range(num_enemy_current_hp_less_than_50_percent - 1):
                     dmg += self._calculate_damage(skill_multiplier=0.4, break_amount=5)
 
-                self.data["DMG"].append(dmg)
-                self.data["DMG_Type"].append("Talent")
+                self._record_damage(dmg, "Talent")
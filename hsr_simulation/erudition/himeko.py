@@ -11,22 +11,30 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Himeko(Character):
+    __slots__ = (
+        "burn",
+        "charge",
+        "enemy_defeated",
+        "enemy_on_field",
+        "enemy_weakness_broken_num",
+        "ult_is_used",
+    )
+
     def __init__(self, speed: float = 96, ult_energy: int = 120):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.charge = 0
         self.burn = 0
-        self.enemy_on_field: int = random.choice([1, 2, 3, 4, 5])
-        self.enemy_defeated: int = random.choice(
+        self.enemy_on_field: int = self.rng.choice([1, 2, 3, 4, 5])
+        self.enemy_defeated: int = self.rng.choice(
             [i for i in range(0, self.enemy_on_field + 1)]
         )
-        self.enemy_weakness_broken_num: int = random.choice(
+        self.enemy_weakness_broken_num: int = self.rng.choice(
             [i for i in range(0, self.enemy_on_field + 1)]
         )
         self.ult_is_used = False
@@ -39,25 +47,22 @@ class Himeko(Character):
         in each battle simulation.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.charge = 0
-        self.burn = 0
-        self.enemy_on_field: int = random.choice([1, 2, 3, 4, 5])
-        self.enemy_defeated: int = random.choice(
+        self.enemy_on_field: int = self.rng.choice([1, 2, 3, 4, 5])
+        self.enemy_defeated: int = self.rng.choice(
             [i for i in range(0, self.enemy_on_field + 1)]
         )
-        self.enemy_weakness_broken_num: int = random.choice(
+        self.enemy_weakness_broken_num: int = self.rng.choice(
             [i for i in range(0, self.enemy_on_field + 1)]
         )
-        self.ult_is_used = False
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
@@ -103,7 +108,7 @@ class Himeko(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg_multiplier = self._simulate_a4_trace()
 
         dmg = self._calculate_damage(
@@ -112,8 +117,7 @@ class Himeko(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
         self._simulate_a2_trace()
 
@@ -122,7 +126,7 @@ class Himeko(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg_multiplier = self._simulate_a4_trace()
 
         dmg = self._calculate_damage(
@@ -138,8 +142,7 @@ class Himeko(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
         self._simulate_a2_trace()
 
@@ -148,7 +151,7 @@ class Himeko(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         dmg_multiplier = self._simulate_a4_trace()
 
         dmg = self._calculate_damage(
@@ -161,8 +164,7 @@ class Himeko(Character):
                 skill_multiplier=2.3, break_amount=20, dmg_multipliers=[dmg_multiplier]
             )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
         self._simulate_a2_trace()
 
@@ -173,7 +175,7 @@ class Himeko(Character):
         Simulate follow-up attack damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using follow-up attack...")
+        main_logger.info("%s is using follow-up attack...", self.__class__.__name__)
         dmg_multiplier = self._simulate_a4_trace()
 
         dmg = self._calculate_damage(
@@ -188,8 +190,7 @@ class Himeko(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=0, ult_energy=10)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Talent")
+        self._record_damage(dmg, "Talent")
 
         self.charge = 0
 
@@ -200,11 +201,12 @@ class Himeko(Character):
         Check whether enemy is weakness broken.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Checking Enemy Toughness...")
+        main_logger.info("%s: Checking Enemy Toughness...", self.__class__.__name__)
         if self.current_enemy_toughness <= 0 and not self.enemy_weakness_broken:
             self.enemy_turn_delayed_duration_weakness_broken = 1
             self.enemy_weakness_broken = True
-            main_logger.debug(f"{self.__class__.__name__}: Enemy is Weakness Broken")
+            self.weakness_break_count += 1
+            main_logger.debug("%s: Enemy is Weakness Broken", self.__class__.__name__)
 
             self.charge += self.enemy_weakness_broken_num
             self.charge = min(self.charge, 3)
@@ -214,7 +216,7 @@ class Himeko(Character):
         Apply burn damage to the enemy.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Applying Burn Damage...")
+        main_logger.info("%s: Applying Burn Damage...", self.__class__.__name__)
         dmg = 0
         max_targets = 5 if self.ult_is_used else 3
         enemy_on_field = min(self.enemy_on_field, max_targets)
@@ -223,16 +225,15 @@ class Himeko(Character):
                 skill_multiplier=0.3, break_amount=0, can_crit=False
             )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("DoT")
+        self._record_damage(dmg, "DoT")
 
     def _simulate_a2_trace(self) -> None:
         """
         Simulate A2 Trace.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Simulating A2 Trace...")
-        if random.random() < 0.5:
+        main_logger.info("%s: Simulating A2 Trace...", self.__class__.__name__)
+        if self.rng.random() < 0.5:
             self.burn = 2
 
     def _simulate_a4_trace(self) -> float:
@@ -240,7 +241,7 @@ class Himeko(Character):
         Simulate A4 Trace.
         :return: DMG Multiplier
         """
-        main_logger.info(f"{self.__class__.__name__}: Simulating A4 Trace...")
+        main_logger.info("%s: Simulating A4 Trace...", self.__class__.__name__)
         if self.burn > 0:
             dmg_multiplier = 0.2
         else:
@@ -252,6 +253,6 @@ class Himeko(Character):
         Simulate A6 Trace.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Simulating A6 Trace...")
-        if random.random() < 0.5:
+        main_logger.info("%s: Simulating A6 Trace...", self.__class__.__name__)
+        if self.rng.random() < 0.5:
             self.crit_rate += self.default_crit_rate + 0.15
@@ -11,22 +11,31 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Jade(Character):
+    __slots__ = (
+        "charge",
+        "debt_collector",
+        "enemy_enter_battle",
+        "enemy_on_field",
+        "num_of_enemy_being_hit",
+        "pawned_asset",
+        "ult_buff",
+    )
+
     def __init__(self, speed: float = 103, ult_energy: int = 140):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.debt_collector = 0
         self.ult_buff = 0
         self.charge = 0
         self.pawned_asset = 0
-        self.enemy_on_field = random.choice([1, 2, 3, 4, 5])
-        self.enemy_enter_battle = random.choice([0, 1, 2, 3, 4, 5])
-        self.num_of_enemy_being_hit = random.choice([1, 2, 3, 4, 5])
+        self.enemy_on_field = self.rng.choice([1, 2, 3, 4, 5])
+        self.enemy_enter_battle = self.rng.choice([0, 1, 2, 3, 4, 5])
+        self.num_of_enemy_being_hit = self.rng.choice([1, 2, 3, 4, 5])
 
     def reset_character_data_for_each_battle(self) -> None:
         """
@@ -36,22 +45,18 @@ class Jade(Character):
         in each battle simulation.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.debt_collector = 0
-        self.ult_buff = 0
-        self.charge = 0
-        self.pawned_asset = 0
-        self.enemy_on_field = random.choice([1, 2, 3, 4, 5])
-        self.enemy_enter_battle = random.choice([0, 1, 2, 3, 4, 5])
-        self.num_of_enemy_being_hit = random.choice([1, 2, 3, 4, 5])
+        self.enemy_on_field = self.rng.choice([1, 2, 3, 4, 5])
+        self.enemy_enter_battle = self.rng.choice([0, 1, 2, 3, 4, 5])
+        self.num_of_enemy_being_hit = self.rng.choice([1, 2, 3, 4, 5])
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # reset stats for each action
         self.char_action_value_for_action_forward = []
@@ -102,7 +107,7 @@ class Jade(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         self._gain_crit_dmg_buff()
 
         dmg = self._calculate_damage(skill_multiplier=0.9, break_amount=10)
@@ -114,8 +119,7 @@ class Jade(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
         self._gain_charge(target_num=3)
 
@@ -124,7 +128,7 @@ class Jade(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
         self.debt_collector = 3
 
@@ -133,15 +137,14 @@ class Jade(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         self._gain_crit_dmg_buff()
 
         dmg = self._calculate_damage(skill_multiplier=2.4, break_amount=20)
         for _ in range(self.enemy_on_field - 1):
             dmg += self._calculate_damage(skill_multiplier=2.4, break_amount=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
         self.ult_buff = 2
 
@@ -152,16 +155,15 @@ class Jade(Character):
         Simulate Debt Collector damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using Debt Collector...")
+        main_logger.info("%s is using Debt Collector...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=0.25, break_amount=0)
 
         # simulate AoE attack from Debt Collector
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             for _ in range(self.enemy_on_field - 1):
                 dmg += self._calculate_damage(skill_multiplier=0.25, break_amount=0)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
         self._gain_charge(target_num=self.num_of_enemy_being_hit)
 
@@ -170,7 +172,7 @@ class Jade(Character):
         Simulate Follow-up attack damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using Follow-up attack...")
+        main_logger.info("%s is using Follow-up attack...", self.__class__.__name__)
         self._gain_crit_dmg_buff()
 
         skill_multiplier = 1.2
@@ -189,8 +191,7 @@ class Jade(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=0, ult_energy=10)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Talent")
+        self._record_damage(dmg, "Talent")
 
         self.pawned_asset += 5
         self.pawned_asset = min(self.pawned_asset, 50)
@@ -203,7 +204,7 @@ class Jade(Character):
         :return: None
         """
         main_logger.info(
-            f"{self.__class__.__name__} is gaining Critical Damage buff..."
+            "%s is gaining Critical Damage buff...", self.__class__.__name__
         )
         self.crit_dmg = self.default_crit_dmg + (0.024 * self.pawned_asset)
 
@@ -213,7 +214,7 @@ class Jade(Character):
         :param target_num: Number of targets being hit.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is gaining Charge...")
+        main_logger.info("%s is gaining Charge...", self.__class__.__name__)
         self.charge += target_num
         self.charge = min(self.charge, 8)
 
@@ -222,5 +223,5 @@ class Jade(Character):
         Simulate gaining ATK buff.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is gaining ATK buff...")
+        main_logger.info("%s is gaining ATK buff...", self.__class__.__name__)
         self.atk = self.default_atk + (0.005 * self.pawned_asset)
@@ -11,7 +11,6 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
@@ -26,11 +25,18 @@ from hsr_simulation.dmg_calculator import (
 
 
 class Jingyuan(Character):
+    __slots__ = (
+        "enemy_on_field",
+        "lighting_lord_hit_per_action",
+        "lightning_lord",
+        "skill_buff",
+    )
+
     def __init__(self, speed: float = 99, ult_energy: int = 130):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.lightning_lord = None
         self.lighting_lord_hit_per_action = 3
-        self.enemy_on_field = random.choice([1, 2, 3])
+        self.enemy_on_field = self.rng.choice([1, 2, 3])
         self.skill_buff = 0
 
     def reset_character_data_for_each_battle(self) -> None:
@@ -41,19 +47,23 @@ class Jingyuan(Character):
         in each battle simulation.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.lightning_lord = None
-        self.lighting_lord_hit_per_action = 3
-        self.enemy_on_field = random.choice([1, 2, 3])
-        self.skill_buff = 0
+        self.enemy_on_field = self.rng.choice([1, 2, 3])
+
+    def create_summon(self) -> "LightingLord":
+        """
+        Summon Lightning Lord for the battle.
+        :return: Lightning Lord object.
+        """
+        return self.summon_lightning_lord(self)
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
@@ -83,7 +93,7 @@ class Jingyuan(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
@@ -95,7 +105,7 @@ class Jingyuan(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         # other target DMG
@@ -119,7 +129,7 @@ class Jingyuan(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=2, break_amount=20)
 
         # other target DMG
@@ -146,6 +156,8 @@ class Jingyuan(Character):
 
 
 class LightingLord(Character):
+    __slots__ = ("is_test", "jingyuan")
+
     def __init__(self, jingyuan: Jingyuan, speed: float = 60, ult_energy: int = 0):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.jingyuan = jingyuan
@@ -164,7 +176,7 @@ class LightingLord(Character):
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # reset stats for each action
         self.speed = self.default_speed
@@ -193,7 +205,9 @@ class LightingLord(Character):
         Simulate Lighting Lord atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using Hit per Action attack...")
+        main_logger.info(
+            "%s is using Hit per Action attack...", self.__class__.__name__
+        )
 
         for _ in range(self.jingyuan.lighting_lord_hit_per_action):
             dmg = self._calculate_damage(skill_multiplier=0.66, break_amount=5)
@@ -202,14 +216,14 @@ class LightingLord(Character):
             for _ in range(self.jingyuan.enemy_on_field - 1):
                 dmg += self._calculate_damage(skill_multiplier=0.25, break_amount=5)
 
-            self._record_damage(dmg, "Lightning Lord")
+            self.jingyuan._record_damage(dmg, "Lightning Lord")
 
     def reset_summon_stat_for_each_turn(self) -> None:
         """
         Reset Numby stats
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} stats ...")
+        main_logger.info("Resetting %s stats ...", self.__class__.__name__)
         super().reset_summon_stat_for_each_turn()
         self.jingyuan.lighting_lord_hit_per_action = 3
         self.crit_dmg = self.default_crit_dmg
@@ -235,7 +249,7 @@ class LightingLord(Character):
         :param can_crit: Whether the DMG can CRIT.
         :return: Damage.
         """
-        main_logger.info(f"{self.__class__.__name__}: Calculating damage...")
+        main_logger.info("%s: Calculating damage...", self.__class__.__name__)
         # reduce enemy toughness
         self.jingyuan.current_enemy_toughness -= break_amount
 
@@ -243,7 +257,7 @@ class LightingLord(Character):
 
         base_dmg = calculate_base_dmg(atk=self.atk, skill_multiplier=skill_multiplier)
 
-        if random.random() < self.crit_rate and can_crit:
+        if self._roll_crit(can_crit):
             dmg_multiplier = calculate_dmg_multipliers(
                 crit_dmg=self.crit_dmg, dmg_multipliers=dmg_multipliers
             )
@@ -11,13 +11,23 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Qingque(Character):
+    __slots__ = (
+        "a2_trace_buff",
+        "a4_trace_buff",
+        "enemy_on_field",
+        "hand",
+        "hidden_hand",
+        "past_ally_turn",
+        "skill_buff",
+        "tile_suit",
+    )
+
     def __init__(self, speed: float = 98, ult_energy: int = 140):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.skill_buff = 0
@@ -26,8 +36,8 @@ class Qingque(Character):
         self.hidden_hand = False
         self.a2_trace_buff = True
         self.a4_trace_buff = False
-        self.enemy_on_field = random.choice([0, 1, 2, 3, 4, 5])
-        self.past_ally_turn: int = random.choice([1, 2, 3])
+        self.enemy_on_field = self.rng.choice([0, 1, 2, 3, 4, 5])
+        self.past_ally_turn: int = self.rng.choice([1, 2, 3])
 
     def reset_character_data_for_each_battle(self) -> None:
         """
@@ -37,23 +47,17 @@ class Qingque(Character):
         in each battle simulation.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.skill_buff = 0
-        self.tile_suit = [0, 1, 2]
-        self.hand = [0]
-        self.hidden_hand = False
-        self.a2_trace_buff = True
-        self.a4_trace_buff = False
-        self.enemy_on_field = random.choice([0, 1, 2, 3, 4, 5])
-        self.past_ally_turn: int = random.choice([1, 2, 3])
+        self.enemy_on_field = self.rng.choice([0, 1, 2, 3, 4, 5])
+        self.past_ally_turn: int = self.rng.choice([1, 2, 3])
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
 
@@ -88,7 +92,7 @@ class Qingque(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg_multiplier = 0
         if self.a4_trace_buff:
             dmg_multiplier = 0.1
@@ -99,15 +103,16 @@ class Qingque(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_enhanced_basic_atk(self) -> None:
         """
         Simulate enhanced basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using enhanced basic attack...")
+        main_logger.info(
+            "%s is using enhanced basic attack...", self.__class__.__name__
+        )
         dmg_multiplier = 0
         if self.a4_trace_buff:
             dmg_multiplier = 0.1
@@ -125,8 +130,7 @@ class Qingque(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=0, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Enhanced Basic ATK")
+        self._record_damage(dmg, "Enhanced Basic ATK")
 
         # simulate A6 trace buff
         self.speed *= 1.1
@@ -140,7 +144,7 @@ class Qingque(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         self._draw_tiles(draw_num=2)
 
         self.crit_dmg += 0.28
@@ -158,9 +162,9 @@ class Qingque(Character):
         :param draw_num: Number of tiles to draw.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is drawing tiles...")
+        main_logger.info("%s is drawing tiles...", self.__class__.__name__)
         for _ in range(draw_num):
-            tile = random.choice(self.tile_suit)
+            tile = self.rng.choice(self.tile_suit)
             if tile == self.hand[0] and len(self.hand) < 4:
                 self.hand.append(tile)
 
@@ -169,7 +173,7 @@ class Qingque(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         dmg_multiplier = 0
         if self.a4_trace_buff:
             dmg_multiplier = 0.1
@@ -184,8 +188,7 @@ class Qingque(Character):
                 skill_multiplier=2, break_amount=20, dmg_multipliers=[dmg_multiplier]
             )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
         self.hand = [0, 0, 0, 0]
 
@@ -11,16 +11,17 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Rappa(Character):
+    __slots__ = ("a6_trace_buff", "charge", "chroma_ink", "enemy_on_field", "sealform")
+
     def __init__(self, speed: float = 96, ult_energy: int = 140):
         super().__init__(speed=speed, ult_energy=ult_energy)
-        self.enemy_on_field = random.choice([1, 2, 3, 4, 5])
+        self.enemy_on_field = self.rng.choice([1, 2, 3, 4, 5])
         self.sealform = False
         self.chroma_ink = 0
         self.charge = 0
@@ -34,20 +35,23 @@ class Rappa(Character):
         in each battle simulation.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.enemy_on_field = random.choice([1, 2, 3, 4, 5])
-        self.sealform = False
-        self.chroma_ink = 0
-        self.charge = 0
-        self.a6_trace_buff = 0
+        self.enemy_on_field = self.rng.choice([1, 2, 3, 4, 5])
+
+    def on_battle_init(self) -> None:
+        """
+        Pick Rappa's ATK for the battle.
+        :return: None
+        """
+        self.atk = self.rng.choice([2400, 3200])
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
         self._simulate_enemy_weakness_broken()
 
         if self.a6_trace_buff > 0:
@@ -77,20 +81,21 @@ class Rappa(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_enhanced_basic_atk(self) -> None:
         """
         Simulate enhanced basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using enhanced basic attack...")
+        main_logger.info(
+            "%s is using enhanced basic attack...", self.__class__.__name__
+        )
         self.chroma_ink -= 1
 
         dmg = 0
@@ -115,8 +120,7 @@ class Rappa(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=0, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Enhanced Basic ATK")
+        self._record_damage(dmg, "Enhanced Basic ATK")
 
         self._simulate_talent_dmg()
 
@@ -125,7 +129,7 @@ class Rappa(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1.2, break_amount=10)
 
         # other target DMG
@@ -134,15 +138,14 @@ class Rappa(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
     def _use_ult(self) -> None:
         """
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         self.sealform = True
         self.chroma_ink = 3
         self.break_effect += 0.3
@@ -155,29 +158,30 @@ class Rappa(Character):
         Check whether enemy is weakness broken.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Checking Enemy Toughness...")
+        main_logger.info("%s: Checking Enemy Toughness...", self.__class__.__name__)
         if self.current_enemy_toughness <= 0 and not self.enemy_weakness_broken:
             self.enemy_turn_delayed_duration_weakness_broken = 1
             self.enemy_weakness_broken = True
+            self.weakness_break_count += 1
 
             # simulate Talent
             self.charge += 1
 
             # simulate A2 trace
-            if random.random() < 0.5:
+            if self.rng.random() < 0.5:
                 self.charge += 1
                 self.current_ult_energy += 10
 
             self.charge = min(self.charge, 10)
 
-            main_logger.debug(f"{self.__class__.__name__}: Enemy is Weakness Broken")
+            main_logger.debug("%s: Enemy is Weakness Broken", self.__class__.__name__)
 
     def _simulate_talent_dmg(self) -> None:
         """
         Simulate talent damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Simulating talent damage...")
+        main_logger.info("%s: Simulating talent damage...", self.__class__.__name__)
         dmg = self.do_break_dmg(break_type="Imaginary") * 0.6
         dmg *= 1 + (0.5 * self.charge)
 
@@ -200,8 +204,7 @@ class Rappa(Character):
 
         self._calculate_damage(skill_multiplier=0, break_amount=toughness_reduction)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Talent")
+        self._record_damage(dmg, "Talent")
 
         self.charge = 0
 
@@ -212,7 +215,7 @@ class Rappa(Character):
         :return: None
         """
         main_logger.info(
-            f"{self.__class__.__name__}: Simulate when enemy is weakness broken..."
+            "%s: Simulate when enemy is weakness broken...", self.__class__.__name__
         )
         if self.enemy_weakness_broken:
             if self.enemy_turn_delayed_duration_weakness_broken > 0:
@@ -226,7 +229,7 @@ class Rappa(Character):
         :param enemy_toughness_reduction: Enemy toughness reduction from an attack
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Simulating A4 trace...")
+        main_logger.info("%s: Simulating A4 trace...", self.__class__.__name__)
         if self.enemy_weakness_broken:
             dmg = self._deal_super_break_dmg(
                 enemy_toughness_reduction=enemy_toughness_reduction,
@@ -234,5 +237,4 @@ class Rappa(Character):
             )
             dmg *= 0.6
 
-            self.data["DMG"].append(dmg)
-            self.data["DMG_Type"].append("Super Break DMG")
+            self._record_damage(dmg, "Super Break DMG")
@@ -11,19 +11,20 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Serval(Character):
+    __slots__ = ("a6_trace_buff", "enemy_defeated", "enemy_on_field", "shock")
+
     def __init__(self, speed: float = 104, ult_energy: int = 100):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.shock = 0
         self.a6_trace_buff = 0
-        self.enemy_on_field = random.choice([1, 2, 3, 4, 5])
-        self.enemy_defeated = random.choice([True, False])
+        self.enemy_on_field = self.rng.choice([1, 2, 3, 4, 5])
+        self.enemy_defeated = self.rng.choice([True, False])
 
     def reset_character_data_for_each_battle(self) -> None:
         """
@@ -33,19 +34,17 @@ class Serval(Character):
         in each battle simulation.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.shock = 0
-        self.a6_trace_buff = 0
-        self.enemy_on_field = random.choice([1, 2, 3, 4, 5])
-        self.enemy_defeated = random.choice([True, False])
+        self.enemy_on_field = self.rng.choice([1, 2, 3, 4, 5])
+        self.enemy_defeated = self.rng.choice([True, False])
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
@@ -81,13 +80,12 @@ class Serval(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
         if self.shock > 0:
             self._apply_talent_dmg(target_num=1)
@@ -97,7 +95,7 @@ class Serval(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1.4, break_amount=20)
 
         # adjacent target DMG
@@ -107,15 +105,14 @@ class Serval(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
         base_chance = 0.8
 
         # simulate A2 trace
         shock_inflicting_chance = base_chance + 0.2
 
-        if random.random() < shock_inflicting_chance:
+        if self.rng.random() < shock_inflicting_chance:
             self.shock = 2
 
         if self.shock > 0:
@@ -126,15 +123,14 @@ class Serval(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1.8, break_amount=20)
 
         # other target DMG
         for _ in range(self.enemy_on_field - 1):
             dmg += self._calculate_damage(skill_multiplier=1.8, break_amount=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
         if self.shock > 0:
             self.shock += 2
@@ -145,7 +141,7 @@ class Serval(Character):
         Simulate applying shock damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is applying shock damage...")
+        main_logger.info("%s is applying shock damage...", self.__class__.__name__)
         dmg = 0
 
         # only up to 3 targets can be affected by shock
@@ -156,8 +152,7 @@ class Serval(Character):
                 skill_multiplier=1.04, break_amount=0, can_crit=False
             )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("DoT")
+        self._record_damage(dmg, "DoT")
 
     def _apply_talent_dmg(self, target_num: int) -> None:
         """
@@ -165,20 +160,19 @@ class Serval(Character):
         :param target_num: Number of targets to apply talent damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is applying talent damage...")
+        main_logger.info("%s is applying talent damage...", self.__class__.__name__)
         dmg = 0
         for _ in range(target_num):
             dmg += self._calculate_damage(skill_multiplier=0.72, break_amount=0)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Talent")
+        self._record_damage(dmg, "Talent")
 
     def _simulate_defeating_enemy(self) -> None:
         """
         Simulate defeating the enemy.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is defeating enemy...")
+        main_logger.info("%s is defeating enemy...", self.__class__.__name__)
         if self.enemy_defeated:
             self.a6_trace_buff = 2
             self.atk = self.default_atk * 1.2
@@ -11,7 +11,6 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
@@ -19,6 +18,19 @@ from hsr_simulation.configure_logging import main_logger
 
 class TheHerta(Character):
     # Skill constants - Normal
+    __slots__ = (
+        "answer_stacks",
+        "atk_boost_turns_remaining",
+        "elite_enemy_id",
+        "enemy_interpretation_stacks",
+        "enemy_on_field",
+        "erudition_chars_in_team",
+        "has_elite_enemy",
+        "ice_dmg_boost_active",
+        "inspiration",
+        "interpretation",
+    )
+
     SKILL_MULTIPLIER = 0.7
     SKILL_BREAK_AMOUNT = 15
     SKILL_ADJACENT_BREAK = 5
@@ -62,11 +74,11 @@ class TheHerta(Character):
 
     def __init__(self, speed: float = 99, ult_energy: int = ULT_ENERGY_COST):
         super().__init__(speed=speed, ult_energy=ult_energy)
-        self.enemy_on_field = random.choice([1, 2, 3, 4, 5])
+        self.enemy_on_field = self.rng.choice([1, 2, 3, 4, 5])
         self.inspiration = 0
         self.interpretation = 0
         self.atk_boost_turns_remaining = 0
-        self.erudition_chars_in_team = random.choice([1, 2])
+        self.erudition_chars_in_team = self.rng.choice([1, 2])
         self.enemy_interpretation_stacks = {}  # Dictionary to track interpretation stacks per enemy
         self.elite_enemy_id = None  # Will be set when wave starts if elite enemy exists
         self.has_elite_enemy = False
@@ -78,18 +90,10 @@ class TheHerta(Character):
         Reset character's stats and battle-related data.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.enemy_on_field = random.choice([1, 2, 3, 4, 5])
-        self.erudition_chars_in_team = random.choice([1, 2])
-        self.inspiration = 0
-        self.interpretation = 0
-        self.atk_boost_turns_remaining = 0
-        self.enemy_interpretation_stacks = {}
-        self.elite_enemy_id = None
-        self.has_elite_enemy = False
-        self.ice_dmg_boost_active = False
-        self.answer_stacks = 0
+        self.enemy_on_field = self.rng.choice([1, 2, 3, 4, 5])
+        self.erudition_chars_in_team = self.rng.choice([1, 2])
 
     def start_wave(self) -> None:
         """
@@ -100,7 +104,7 @@ class TheHerta(Character):
         All previous enemies are considered defeated when starting a new wave.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} starting wave...")
+        main_logger.info("%s starting wave...", self.__class__.__name__)
 
         # Store total existing stacks before clearing
         total_existing_stacks = sum(self.enemy_interpretation_stacks.values())
@@ -111,7 +115,7 @@ class TheHerta(Character):
         self.has_elite_enemy = False
 
         # Determine if there's an elite enemy (50% chance)
-        self.has_elite_enemy = random.random() < 0.5
+        self.has_elite_enemy = self.rng.random() < 0.5
         if self.has_elite_enemy and self.enemy_on_field > 0:
             self.elite_enemy_id = 0  # First enemy is elite if exists
             main_logger.debug("Elite enemy present in new wave")
@@ -127,7 +131,7 @@ class TheHerta(Character):
         if self.enemy_on_field > 0:
             if self.has_elite_enemy:
                 target_enemy = self.elite_enemy_id
-                main_logger.debug(f"Applying stacks to elite enemy {target_enemy}")
+                main_logger.debug("Applying stacks to elite enemy %s", target_enemy)
                 # Transfer existing stacks if any, otherwise use initial stacks
                 final_stacks = (
                     min(
@@ -138,13 +142,15 @@ class TheHerta(Character):
                     else self.INITIAL_WAVE_INTERPRETATION_STACKS
                 )
             else:
-                target_enemy = random.randint(0, self.enemy_on_field - 1)
-                main_logger.debug(f"Applying stacks to random enemy {target_enemy}")
+                target_enemy = self.rng.randint(0, self.enemy_on_field - 1)
+                main_logger.debug("Applying stacks to random enemy %s", target_enemy)
                 final_stacks = self.INITIAL_WAVE_INTERPRETATION_STACKS
 
             self.enemy_interpretation_stacks[target_enemy] = final_stacks
             main_logger.debug(
-                f"Applied {final_stacks} interpretation stacks to enemy {target_enemy}"
+                "Applied %s interpretation stacks to enemy %s",
+                final_stacks,
+                target_enemy,
             )
 
     def _get_priority_target(self) -> int:
@@ -159,7 +165,9 @@ class TheHerta(Character):
         ):
             return self.elite_enemy_id
         return (
-            random.randint(0, self.enemy_on_field - 1) if self.enemy_on_field > 0 else 0
+            self.rng.randint(0, self.enemy_on_field - 1)
+            if self.enemy_on_field > 0
+            else 0
         )
 
     def _calculate_interpretation_multiplier(
@@ -193,9 +201,9 @@ class TheHerta(Character):
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self.start_wave()
 
         # simulate enemy turn
@@ -229,7 +237,7 @@ class TheHerta(Character):
         Deals Ice DMG equal to 100% of The Herta's ATK to one designated enemy.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         # Basic attack is single target, 100% ATK ratio
         dmg = self._calculate_damage(skill_multiplier=1.0, break_amount=10)
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
@@ -241,7 +249,7 @@ class TheHerta(Character):
         otherwise uses normal skill.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
 
         if self.inspiration > 0:
             self._use_enhanced_skill()
@@ -258,7 +266,7 @@ class TheHerta(Character):
         repeating 2 times.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} using normal skill...")
+        main_logger.info("%s using normal skill...", self.__class__.__name__)
         total_dmg = 0
         primary_target = self._get_priority_target()
         hit_enemies = set()
@@ -276,7 +284,7 @@ class TheHerta(Character):
             # Adjacent targets (up to 2)
             adjacent_count = min(self.enemy_on_field - 1, 2)
             for _ in range(adjacent_count):
-                adjacent_target = random.randint(0, self.enemy_on_field - 1)
+                adjacent_target = self.rng.randint(0, self.enemy_on_field - 1)
                 if adjacent_target != primary_target:
                     total_dmg += self._calculate_damage(
                         skill_multiplier=self.SKILL_MULTIPLIER,
@@ -303,7 +311,7 @@ class TheHerta(Character):
         then 40% ATK to all enemies.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} using enhanced skill...")
+        main_logger.info("%s using enhanced skill...", self.__class__.__name__)
         total_dmg = 0
         primary_target = self._get_priority_target()
         hit_enemies = set()
@@ -333,7 +341,7 @@ class TheHerta(Character):
             # Adjacent targets
             adjacent_count = min(self.enemy_on_field - 1, 2)
             for _ in range(adjacent_count):
-                adjacent_target = random.randint(0, self.enemy_on_field - 1)
+                adjacent_target = self.rng.randint(0, self.enemy_on_field - 1)
                 if adjacent_target != primary_target:
                     other_multiplier = self._calculate_interpretation_multiplier(
                         adjacent_target, False
@@ -390,7 +398,7 @@ class TheHerta(Character):
         boosts ATK by 80% for 3 turns, gains Inspiration, and takes another action.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} using ultimate...")
+        main_logger.info("%s using ultimate...", self.__class__.__name__)
 
         # Rearrange Interpretation stacks
         self._rearrange_interpretation_stacks()
@@ -401,7 +409,7 @@ class TheHerta(Character):
         # Calculate A6 damage boost from Answer stacks (returns only the additional multiplier)
         answer_multiplier = self.answer_stacks * self.ANSWER_DMG_BOOST_PER_STACK
         main_logger.debug(
-            f"A6: Ultimate boosted by {self.answer_stacks}% from Answer stacks"
+            "A6: Ultimate boosted by %s%% from Answer stacks", self.answer_stacks
         )
 
         # Deal AoE damage to all enemies (200% ATK)
@@ -421,7 +429,7 @@ class TheHerta(Character):
         # Add Inspiration stack (capped at 4)
         self.inspiration = min(self.inspiration + 1, self.MAX_INSPIRATION_STACKS)
         main_logger.debug(
-            f"Added Inspiration stack, current stacks: {self.inspiration}"
+            "Added Inspiration stack, current stacks: %s", self.inspiration
         )
 
         # Set energy after ultimate
@@ -434,7 +442,7 @@ class TheHerta(Character):
         If used while boost is active, refreshes the duration.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} applying ATK boost...")
+        main_logger.info("%s applying ATK boost...", self.__class__.__name__)
         # Reset ATK to base value before applying boost
         self.atk = self.default_atk
         # Apply 80% ATK boost
@@ -442,7 +450,7 @@ class TheHerta(Character):
         # Set/refresh duration
         self.atk_boost_turns_remaining = self.ULT_ATK_BOOST_DURATION
         main_logger.debug(
-            f"ATK boosted to {self.atk} for {self.atk_boost_turns_remaining} turns"
+            "ATK boosted to %s for %s turns", self.atk, self.atk_boost_turns_remaining
         )
 
     def _rearrange_interpretation_stacks(self) -> None:
@@ -452,7 +460,7 @@ class TheHerta(Character):
         :return: None
         """
         main_logger.info(
-            f"{self.__class__.__name__} rearranging interpretation stacks..."
+            "%s rearranging interpretation stacks...", self.__class__.__name__
         )
 
         if not self.enemy_interpretation_stacks:
@@ -470,18 +478,22 @@ class TheHerta(Character):
             and self.elite_enemy_id in self.enemy_interpretation_stacks
         ):
             target_enemy = self.elite_enemy_id
-            main_logger.debug(f"Transferring stacks to elite enemy {target_enemy}")
+            main_logger.debug("Transferring stacks to elite enemy %s", target_enemy)
         else:
             # If no elite enemy, choose random target
-            target_enemy = random.choice(list(self.enemy_interpretation_stacks.keys()))
-            main_logger.debug(f"Transferring stacks to random enemy {target_enemy}")
+            target_enemy = self.rng.choice(
+                list(self.enemy_interpretation_stacks.keys())
+            )
+            main_logger.debug("Transferring stacks to random enemy %s", target_enemy)
 
         # Transfer stacks to target (capped at max)
         self.enemy_interpretation_stacks[target_enemy] = min(
             total_stacks, self.MAX_INTERPRETATION_STACKS
         )
         main_logger.debug(
-            f"Transferred {self.enemy_interpretation_stacks[target_enemy]} interpretation stacks to enemy {target_enemy}"
+            "Transferred %s interpretation stacks to enemy %s",
+            self.enemy_interpretation_stacks[target_enemy],
+            target_enemy,
         )
 
     def end_turn(self) -> None:
@@ -491,16 +503,16 @@ class TheHerta(Character):
         Also resets per-turn attributes.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} ending turn...")
+        main_logger.info("%s ending turn...", self.__class__.__name__)
         # Handle ATK boost duration
         if self.atk_boost_turns_remaining > 0:
             self.atk_boost_turns_remaining -= 1
             main_logger.debug(
-                f"ATK boost remaining turns: {self.atk_boost_turns_remaining}"
+                "ATK boost remaining turns: %s", self.atk_boost_turns_remaining
             )
             if self.atk_boost_turns_remaining == 0:
                 self.atk = self.default_atk
-                main_logger.debug(f"ATK boost expired, reset to {self.atk}")
+                main_logger.debug("ATK boost expired, reset to %s", self.atk)
 
     def _apply_a2_energy_regen(self, targets_hit: int) -> None:
         """
@@ -517,7 +529,9 @@ class TheHerta(Character):
         energy_gain = energy_targets * self.A2_ENERGY_PER_TARGET
         self.current_ult_energy += energy_gain
         main_logger.debug(
-            f"A2: Regenerated {energy_gain} energy from hitting {energy_targets} targets"
+            "A2: Regenerated %s energy from hitting %s targets",
+            energy_gain,
+            energy_targets,
         )
 
     def _apply_a4_interpretation_stacks(
@@ -556,7 +570,9 @@ class TheHerta(Character):
                 current_stacks + extra_stacks, self.MAX_INTERPRETATION_STACKS
             )
             main_logger.debug(
-                f"A4: Applied {extra_stacks} interpretation stacks to enemy {target_enemy}"
+                "A4: Applied %s interpretation stacks to enemy %s",
+                extra_stacks,
+                target_enemy,
             )
 
             # Add Answer stacks for each Interpretation stack
@@ -575,7 +591,7 @@ class TheHerta(Character):
             self.enemy_interpretation_stacks[enemy_id] = min(
                 current_stacks + 1, self.MAX_INTERPRETATION_STACKS
             )
-            main_logger.debug(f"A2: Applied interpretation stack to enemy {enemy_id}")
+            main_logger.debug("A2: Applied interpretation stack to enemy %s", enemy_id)
             self._add_answer_stack()  # Add Answer stack from A6
 
     def _check_and_apply_ice_dmg_boost(self, primary_target: int) -> None:
@@ -601,5 +617,5 @@ class TheHerta(Character):
         if self.answer_stacks < self.MAX_ANSWER_STACKS:
             self.answer_stacks += 1
             main_logger.debug(
-                f"A6: Added Answer stack, current stacks: {self.answer_stacks}"
+                "A6: Added Answer stack, current stacks: %s", self.answer_stacks
             )
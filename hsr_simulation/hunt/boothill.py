@@ -18,6 +18,8 @@ from hsr_simulation.dmg_calculator import calculate_break_damage
 
 
 class Boothill(Character):
+    __slots__ = ("is_in_standoff", "pocket_trickshot", "standoff_turns", "win_battle")
+
     def __init__(self, speed: float = 107, ult_energy: int = 115):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.pocket_trickshot = 0
@@ -25,25 +27,19 @@ class Boothill(Character):
         self.win_battle = False
         self.is_in_standoff = False
 
-    def reset_character_data_for_each_battle(self) -> None:
+    def on_battle_init(self) -> None:
         """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
+        Set Boothill's Break Effect for the battle.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.pocket_trickshot = 0
-        self.standoff_turns = 0
-        self.win_battle = False
-        self.is_in_standoff = False
+        self.set_break_effect(1, 3)
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
@@ -90,16 +86,16 @@ class Boothill(Character):
         if self.current_enemy_toughness <= 0 and not self.enemy_weakness_broken:
             self.enemy_turn_delayed_duration_weakness_broken = 1
             self.enemy_weakness_broken = True
+            self.weakness_break_count += 1
             self._end_standoff()
-            main_logger.debug(f"{self.__class__.__name__}: Enemy is Weakness Broken")
+            main_logger.debug("%s: Enemy is Weakness Broken", self.__class__.__name__)
 
     def _use_basic_atk(self) -> None:
         main_logger.info("Using Basic ATK...")
         break_amount = int(10 * self.break_effect)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=break_amount)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
@@ -120,8 +116,7 @@ class Boothill(Character):
             dmg_multipliers=[dmg_multiplier],
         )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Enhanced Basic ATK")
+        self._record_damage(dmg, "Enhanced Basic ATK")
 
         self._update_skill_point_and_ult_energy(skill_points=0, ult_energy=30)
 
@@ -134,8 +129,7 @@ class Boothill(Character):
         break_dmg = break_dmg_multiplier * calculate_break_damage(
             break_type="Physical", target_max_toughness=target_toughness
         )
-        self.data["DMG"].append(break_dmg)
-        self.data["DMG_Type"].append("Talent")
+        self._record_damage(break_dmg, "Talent")
 
     def _use_skill(self) -> None:
         main_logger.info("Using Skill...")
@@ -161,8 +155,7 @@ class Boothill(Character):
             dmg_multipliers=[dmg_multiplier],
         )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
     def _update_skill_point_and_ult_energy(
         self, skill_points: int, ult_energy: int
@@ -13,13 +13,13 @@
 #    limitations under the License.
 
 
-import random
-
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class DanHeng(Character):
+    __slots__ = ("a4_trace_buff", "can_get_talent", "talent_buff")
+
     def __init__(self, speed=110, ult_energy=100):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.default_speed = speed
@@ -27,21 +27,8 @@ class DanHeng(Character):
         self.talent_buff = 0
         self.a4_trace_buff = 0
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.speed = self.default_speed
-        self.can_get_talent = True
-        self.talent_buff = 0
-        self.a4_trace_buff = 0
-
     def take_action(self) -> None:
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
 
@@ -59,8 +46,7 @@ class DanHeng(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_skill(self) -> None:
         main_logger.info("Using skill...")
@@ -68,16 +54,14 @@ class DanHeng(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
     def _use_ult(self) -> None:
         main_logger.info("Using ult...")
         multiplier = 5.2 if self._is_enemy_slowed() else 4
         dmg = self._calculate_damage(multiplier, 30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
     def _apply_talent(self) -> None:
         """
@@ -85,7 +69,7 @@ class DanHeng(Character):
         :return: None
         """
         main_logger.info("Simulating talent...")
-        if self.can_get_talent and random.random() < 0.5:
+        if self.can_get_talent and self.rng.random() < 0.5:
             self.talent_buff = 2
             self.can_get_talent = False
 
@@ -102,10 +86,9 @@ class DanHeng(Character):
             self.can_get_talent = True
 
     def _handle_a4_trace(self):
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self.speed = self.default_speed * 1.2
             self.a4_trace_buff = 2
 
-    @staticmethod
-    def _is_enemy_slowed() -> bool:
-        return random.random() < 0.5
+    def _is_enemy_slowed(self) -> bool:
+        return self.rng.random() < 0.5
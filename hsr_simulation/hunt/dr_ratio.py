@@ -11,40 +11,31 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class DrRatio(Character):
+    __slots__ = ("debuff_on_enemy",)
+
     def __init__(self, speed=103, ult_energy=140):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.debuff_on_enemy = []
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.debuff_on_enemy: list[str] = []
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # reset stats
         self.crit_rate = 0.5
         self.crit_dmg = 1
 
         # simulate applying debuff on an enemy by allies
-        debuff_num: int = random.choice([0, 3])
+        debuff_num: int = self.rng.choice([0, 3])
         for _ in range(debuff_num):
             self.debuff_on_enemy.append("debuff")
 
@@ -68,7 +59,7 @@ class DrRatio(Character):
         # simulate ult debuff
         if "wiseman_folly" in self.debuff_on_enemy:
             self.debuff_on_enemy.remove("wiseman_folly")
-            ally_atk_num = random.choice([1, 2])
+            ally_atk_num = self.rng.choice([1, 2])
             for _ in range(ally_atk_num):
                 self._follow_up_atk()
 
@@ -81,8 +72,7 @@ class DrRatio(Character):
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_skill(self) -> None:
         """
@@ -112,8 +102,7 @@ class DrRatio(Character):
         )
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
     def _use_ult(self) -> None:
         """
@@ -127,8 +116,7 @@ class DrRatio(Character):
 
         ult_dmg = self._calculate_damage(skill_multiplier=2.4, break_amount=30)
 
-        self.data["DMG"].append(ult_dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(ult_dmg, "Ultimate")
 
     def _follow_up_atk(self) -> None:
         """
@@ -139,8 +127,7 @@ class DrRatio(Character):
         dmg = self._calculate_damage(skill_multiplier=2.7, break_amount=10)
         self._update_skill_point_and_ult_energy(skill_points=0, ult_energy=5)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Talent")
+        self._record_damage(dmg, "Talent")
 
     def _simulate_talent(self) -> None:
         """
@@ -150,7 +137,7 @@ class DrRatio(Character):
         main_logger.info("Simulating talent...")
         follow_up_chance = 0.4 + (0.2 * len(self.debuff_on_enemy))
         final_follow_up_chance = min(1.0, follow_up_chance)
-        if random.random() < final_follow_up_chance:
+        if self.rng.random() < final_follow_up_chance:
             self._follow_up_atk()
 
     def check_if_enemy_weakness_broken(self, break_type: str = "None") -> None:
@@ -159,9 +146,10 @@ class DrRatio(Character):
         :param break_type: Break DMG type, e.g., Physical, Fire, etc.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Checking Enemy Toughness...")
+        main_logger.info("%s: Checking Enemy Toughness...", self.__class__.__name__)
         if self.current_enemy_toughness <= 0 and not self.enemy_weakness_broken:
             self.enemy_turn_delayed_duration_weakness_broken = 1
             self.enemy_weakness_broken = True
+            self.weakness_break_count += 1
             self.debuff_on_enemy.append("debuff")
-            main_logger.debug(f"{self.__class__.__name__}: Enemy is Weakness Broken")
+            main_logger.debug("%s: Enemy is Weakness Broken", self.__class__.__name__)
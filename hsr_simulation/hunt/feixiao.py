@@ -11,13 +11,21 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Feixiao(Character):
+    __slots__ = (
+        "a6_trace_buff",
+        "ally_atk_num",
+        "can_use_talent",
+        "flying_aureus",
+        "talent_buff",
+        "talent_is_used",
+    )
+
     def __init__(self, speed: float = 112, ult_energy: int = 0):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.flying_aureus = 0
@@ -25,7 +33,7 @@ class Feixiao(Character):
         self.talent_buff = 0
         self.a6_trace_buff = 0
         self.talent_is_used = False
-        self.ally_atk_num: int = random.choices([0, 1, 2, 3], [0.1, 0.6, 0.2, 0.1])[0]
+        self.ally_atk_num: int = self.rng.choices([0, 1, 2, 3], [0.1, 0.6, 0.2, 0.1])[0]
 
     def reset_character_data_for_each_battle(self) -> None:
         """
@@ -35,21 +43,16 @@ class Feixiao(Character):
         in each battle simulation.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.flying_aureus = 0
-        self.can_use_talent = True
-        self.talent_buff = 0
-        self.a6_trace_buff = 0
-        self.talent_is_used = False
-        self.ally_atk_num: int = random.choices([0, 1, 2, 3], [0.1, 0.6, 0.2, 0.1])[0]
+        self.ally_atk_num: int = self.rng.choices([0, 1, 2, 3], [0.1, 0.6, 0.2, 0.1])[0]
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
         self._simulate_enemy_weakness_broken()
 
         # simulate A2 Trace
@@ -91,7 +94,7 @@ class Feixiao(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg_multiplier = 0
         if self.talent_buff > 0:
             dmg_multiplier = 0.6
@@ -102,8 +105,7 @@ class Feixiao(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=0)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
         self._gain_flying_aureus_stack()
 
@@ -112,7 +114,7 @@ class Feixiao(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         # simulate A6 trace
         if self.a6_trace_buff <= 0:
             self.a6_trace_buff = 3
@@ -128,8 +130,7 @@ class Feixiao(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=0)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
         self._use_follow_up_atk()
 
@@ -140,7 +141,7 @@ class Feixiao(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
 
         # simulate A4 trace
         self.crit_dmg += 0.36
@@ -152,14 +153,13 @@ class Feixiao(Character):
         if self.talent_buff > 0:
             dmg_multiplier += 0.6
 
-        skill_multiplier = random.choice([5.2, 7])
+        skill_multiplier = self.rng.choice([5.2, 7])
         dmg = self._calculate_damage(
             skill_multiplier=skill_multiplier,
             break_amount=int(30 * self.break_effect),
             dmg_multipliers=[dmg_multiplier],
         )
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
         # reset stats after Ultimate
         self.break_effect = self.default_break_effect
@@ -173,7 +173,7 @@ class Feixiao(Character):
         Simulate follow-up attack damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using follow-up attack...")
+        main_logger.info("%s is using follow-up attack...", self.__class__.__name__)
         dmg_multiplier = 0
         if self.talent_buff > 0:
             dmg_multiplier = 0.6
@@ -182,8 +182,7 @@ class Feixiao(Character):
             skill_multiplier=1.1, break_amount=5, dmg_multipliers=[dmg_multiplier]
         )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Talent")
+        self._record_damage(dmg, "Talent")
 
         self.talent_buff = 2
 
@@ -196,6 +195,8 @@ class Feixiao(Character):
         Gain a stack of Flying Aureus.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is gaining Flying Aureus stack...")
+        main_logger.info(
+            "%s is gaining Flying Aureus stack...", self.__class__.__name__
+        )
         self.flying_aureus += 0.5
         self.flying_aureus = min(self.flying_aureus, 12)
@@ -11,13 +11,14 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class March7thHunt(Character):
+    __slots__ = ("charge", "has_shifu", "shifu", "talent_buff", "ult_buff")
+
     def __init__(self, speed: float = 102, ult_energy: int = 110):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.has_shifu = False
@@ -27,27 +28,19 @@ class March7thHunt(Character):
         self.battle_start = True
         self.shifu = None
 
-    def reset_character_data_for_each_battle(self) -> None:
+    def on_battle_init(self) -> None:
         """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
+        Pick March 7th's Shifu for the battle.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.has_shifu = False
-        self.charge = 0
-        self.ult_buff = False
-        self.talent_buff = False
-        self.battle_start = True
-        self.shifu = None
+        self.set_shifu()
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
 
@@ -105,8 +98,7 @@ class March7thHunt(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
         self.charge += 1
         # ensure Charge not exceed 10
@@ -135,8 +127,7 @@ class March7thHunt(Character):
         else:
             dmg = self._calculate_damage(skill_multiplier=2.4, break_amount=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
         self.ult_buff = True
 
@@ -147,8 +138,7 @@ class March7thHunt(Character):
         """
         main_logger.info("Simulating additional damage from skill...")
         dmg = self._calculate_damage(skill_multiplier=0.2, break_amount=0)
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Additional DMG")
+        self._record_damage(dmg, "Additional DMG")
 
     def _enhanced_basic_atk(self) -> None:
         """
@@ -176,22 +166,20 @@ class March7thHunt(Character):
                 skill_multiplier=0.8, break_amount=break_amount, dmg_multipliers=[0.8]
             )
 
-            self.data["DMG"].append(dmg)
-            self.data["DMG_Type"].append("Enhanced Basic ATK")
+            self._record_damage(dmg, "Enhanced Basic ATK")
 
         # Attempt to deal extra hits
         max_extra_hits = 3
         extra_hits = 0
         while extra_hits < max_extra_hits:
-            if random.random() < extra_hit_chance:
+            if self.rng.random() < extra_hit_chance:
                 dmg = self._calculate_damage(
                     skill_multiplier=0.8,
                     break_amount=break_amount,
                     dmg_multipliers=[0.8],
                 )
 
-                self.data["DMG"].append(dmg)
-                self.data["DMG_Type"].append("Enhanced Basic ATK")
+                self._record_damage(dmg, "Enhanced Basic ATK")
 
                 extra_hits += 1
             else:
@@ -210,11 +198,11 @@ class March7thHunt(Character):
         self.charge = min(10, self.charge)
 
         # random break amount
-        break_amount = random.choice([10, 20])
+        break_amount = self.rng.choice([10, 20])
         self.current_enemy_toughness -= break_amount
 
         # simulate Shifu using Ultimate
-        if random.random() < 0.25:
+        if self.rng.random() < 0.25:
             self.charge += 1
             # ensure Charge not exceed 10
             self.charge = min(10, self.charge)
@@ -226,6 +214,6 @@ class March7thHunt(Character):
         :return: None
         """
         main_logger.info("Setting Shifu...")
-        choice = random.choice(["DMG", "SUPPORT"])
+        choice = self.rng.choice(["DMG", "SUPPORT"])
         self.shifu = choice
-        main_logger.debug(f"Current Shifu is {self.shifu} Type")
+        main_logger.debug("Current Shifu is %s Type", self.shifu)
@@ -11,20 +11,27 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Moze(Character):
+    __slots__ = (
+        "a2_trace_buff_cooldown",
+        "ally_atk_num",
+        "charge",
+        "charge_consumed",
+        "prey_exist",
+    )
+
     def __init__(self, speed: float = 111, ult_energy: int = 120):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.prey_exist = False
         self.charge = 0
         self.charge_consumed = 0
         self.a2_trace_buff_cooldown = 0
-        self.ally_atk_num: int = random.choices([0, 1, 2, 3], [0.1, 0.6, 0.2, 0.1])[0]
+        self.ally_atk_num: int = self.rng.choices([0, 1, 2, 3], [0.1, 0.6, 0.2, 0.1])[0]
 
     def reset_character_data_for_each_battle(self) -> None:
         """
@@ -34,20 +41,16 @@ class Moze(Character):
         in each battle simulation.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.prey_exist = False
-        self.charge = 0
-        self.charge_consumed = 0
-        self.a2_trace_buff_cooldown = 0
-        self.ally_atk_num: int = random.choices([0, 1, 2, 3], [0.1, 0.6, 0.2, 0.1])[0]
+        self.ally_atk_num: int = self.rng.choices([0, 1, 2, 3], [0.1, 0.6, 0.2, 0.1])[0]
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
         self._simulate_enemy_weakness_broken()
 
         # reset stats for each turn
@@ -81,13 +84,12 @@ class Moze(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
         self._consume_charge()
 
@@ -96,13 +98,12 @@ class Moze(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1.5, break_amount=20)
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
         self.charge = 9
         self.prey_exist = True
@@ -112,7 +113,7 @@ class Moze(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         # simulate A6 trace
         dmg_multiplier = 0.25
 
@@ -120,8 +121,7 @@ class Moze(Character):
             skill_multiplier=2.7, break_amount=30, dmg_multipliers=[dmg_multiplier]
         )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
         self._use_follow_up_atk()
 
@@ -132,11 +132,10 @@ class Moze(Character):
         Simulate follow-up attack damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using follow-up attack...")
+        main_logger.info("%s is using follow-up attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1.6, break_amount=10)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Talent")
+        self._record_damage(dmg, "Talent")
 
         # simulate A2 trace
         if self.a2_trace_buff_cooldown <= 0:
@@ -151,12 +150,11 @@ class Moze(Character):
         :return: None
         """
         main_logger.info(
-            f"{self.__class__.__name__} is dealing talent additional DMG..."
+            "%s is dealing talent additional DMG...", self.__class__.__name__
         )
         dmg = self._calculate_damage(skill_multiplier=0.3, break_amount=0)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Talent Additional DMG")
+        self._record_damage(dmg, "Talent Additional DMG")
 
         self._consume_charge()
 
@@ -165,7 +163,7 @@ class Moze(Character):
         Consume charge to use follow-up attack.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is consuming Charge...")
+        main_logger.info("%s is consuming Charge...", self.__class__.__name__)
         self.charge_consumed += 1
         if self.charge_consumed == 3:
             self._use_follow_up_atk()
@@ -13,20 +13,25 @@
 #    limitations under the License.
 
 
-import random
-
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Seele(Character):
+    __slots__ = (
+        "buff_state",
+        "can_resurgence",
+        "current_normal_enemy",
+        "sheathed_blade",
+    )
+
     def __init__(self, speed=115, ult_energy=120):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.sheathed_blade = 0
         self.default_speed = speed
         self.can_resurgence = True
         self.buff_state = False
-        self.current_normal_enemy: int = random.choice(
+        self.current_normal_enemy: int = self.rng.choice(
             [2, 4]
         )  # simulate the number of non-boss enemies
 
@@ -36,18 +41,14 @@ class Seele(Character):
         and the dictionary that store the character's actions' data.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.sheathed_blade = 0
-        self.speed = self.default_speed
-        self.can_resurgence = True
-        self.buff_state = False
-        self.current_normal_enemy: int = random.choice(
+        self.current_normal_enemy: int = self.rng.choice(
             [2, 4]
         )  # simulate the number of non-boss enemies
 
     def take_action(self) -> None:
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
@@ -88,8 +89,7 @@ class Seele(Character):
             self.simulate_action_forward(action_forward_percent=0.2)
         )
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_skill(self) -> None:
         main_logger.info("Using skill...")
@@ -101,8 +101,7 @@ class Seele(Character):
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
         self._apply_sheathed_blade_buff()
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
     def _use_ult(self) -> None:
         main_logger.info("Using ultimate...")
@@ -111,17 +110,16 @@ class Seele(Character):
             skill_multiplier=4.25, break_amount=30, res_multipliers=[res_pen]
         )
 
-        self.data["DMG"].append(ult_dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(ult_dmg, "Ultimate")
 
     def _apply_sheathed_blade_buff(self):
         if self.sheathed_blade > 0:
             self.speed *= 1.25
-            main_logger.debug(f"Speed after Sheathed Blade Buff: {self.speed}")
+            main_logger.debug("Speed after Sheathed Blade Buff: %s", self.speed)
             self.sheathed_blade -= 1
         else:
             self.sheathed_blade = 2
-        main_logger.debug(f"Sheathed Blade: {self.sheathed_blade}")
+        main_logger.debug("Sheathed Blade: %s", self.sheathed_blade)
 
     def _handle_resurgence_action_forward(self, is_resurgence: bool) -> None:
         main_logger.info("Handling resurgence action forward...")
@@ -138,14 +136,14 @@ class Seele(Character):
     def _random_resurgence(self) -> bool:
         main_logger.info("Random resurgence...")
         resurgence_chance = 0.5 if self.can_resurgence else 0
-        return random.random() < resurgence_chance
+        return self.rng.random() < resurgence_chance
 
     def _simulate_a4_trace(self) -> float:
         """
         Simulate A4 trace.
         :return: Quantum RES PEN.
         """
-        main_logger.info(f"{self.__class__.__name__}: Simulating A4 trace...")
+        main_logger.info("%s: Simulating A4 trace...", self.__class__.__name__)
         if self.buff_state:
             return 0.2
         else:
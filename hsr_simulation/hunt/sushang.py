@@ -11,7 +11,6 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
@@ -26,6 +25,8 @@ from hsr_simulation.dmg_calculator import (
 
 
 class Sushang(Character):
+    __slots__ = ("a4_trace_buff", "talent_spd_buff", "ult_buff")
+
     def __init__(self, speed=107, ult_energy=120):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.talent_spd_buff = 0
@@ -33,25 +34,12 @@ class Sushang(Character):
         self.ult_buff = 0
         self.a4_trace_buff = 0
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.talent_spd_buff = 0
-        self.speed = self.default_speed
-        self.ult_buff = 0
-        self.a4_trace_buff = 0
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
@@ -116,8 +104,7 @@ class Sushang(Character):
         )
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
     def _use_skill(self) -> None:
         """
@@ -130,8 +117,7 @@ class Sushang(Character):
         )
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
     def _use_ult(self) -> None:
         """
@@ -141,8 +127,7 @@ class Sushang(Character):
         main_logger.info("Using ultimate...")
         ult_dmg = self._calculate_damage(skill_multiplier=3.2, break_amount=30)
 
-        self.data["DMG"].append(ult_dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(ult_dmg, "Ultimate")
 
     def _handle_sword_stance(self, is_extra: bool = False) -> None:
         """
@@ -155,7 +140,7 @@ class Sushang(Character):
             dmg = self._calculate_damage(skill_multiplier=1, break_amount=0)
             sword_stance_dmg = self._handle_a4_trace(dmg)
         else:
-            if random.random() < 0.33:
+            if self.rng.random() < 0.33:
                 if is_extra:
                     dmg = self._calculate_damage(skill_multiplier=0.5, break_amount=0)
                     sword_stance_dmg = self._handle_a4_trace(dmg)
@@ -165,8 +150,7 @@ class Sushang(Character):
             else:
                 sword_stance_dmg = 0
 
-        self.data["DMG"].append(sword_stance_dmg)
-        self.data["DMG_Type"].append("Talent")
+        self._record_damage(sword_stance_dmg, "Talent")
 
     def _calculate_damage(
         self,
@@ -189,7 +173,7 @@ class Sushang(Character):
         :param can_crit: Whether the DMG can CRIT.
         :return: Damage.
         """
-        main_logger.info(f"{self.__class__.__name__}: Calculating damage...")
+        main_logger.info("%s: Calculating damage...", self.__class__.__name__)
         self.current_enemy_toughness -= break_amount
         self.check_if_enemy_weakness_broken()
 
@@ -205,7 +189,7 @@ class Sushang(Character):
                     self.simulate_action_forward(action_forward_percent=0.15)
                 )
 
-        if random.random() < self.crit_rate and can_crit:
+        if self._roll_crit(can_crit):
             base_dmg = calculate_base_dmg(
                 atk=self.atk, skill_multiplier=skill_multiplier
             )
@@ -11,8 +11,6 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
-
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 from hsr_simulation.dmg_calculator import (
@@ -23,24 +21,23 @@ from hsr_simulation.dmg_calculator import (
     calculate_res_multipliers,
     calculate_total_damage,
 )
+from hsr_simulation.rng import BufferedRandom
 
 
 class Topaz(Character):
+    __slots__ = ("numby", "windfall_bonanza")
+
     def __init__(self, speed: float = 110, ult_energy: int = 130):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.windfall_bonanza = 0
         self.numby = None
 
-    def reset_character_data_for_each_battle(self) -> None:
+    def create_summon(self) -> "Numby":
         """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
+        Summon Numby for the battle.
+        :return: Numby object.
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.numby = None
-        self.windfall_bonanza = 0
+        return self.summon_numby(self)
 
     def summon_numby(self, topaz: "Topaz", speed: int = 80) -> "Numby":
         """
@@ -53,10 +50,9 @@ class Topaz(Character):
         self.numby = Numby(topaz=topaz, speed=speed, ult_energy=0)
         return self.numby
 
-    @staticmethod
-    def enemy_has_fire_weakness() -> bool:
+    def enemy_has_fire_weakness(self) -> bool:
         main_logger.info("Whether the enemy has fire weakness...")
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             return True
         else:
             return False
@@ -66,7 +62,7 @@ class Topaz(Character):
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
@@ -99,7 +95,7 @@ class Topaz(Character):
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
         # Numby action forward
-        self.numby.summon_action_value_for_action_forward.append(
+        self.numby.receive_action_forward(
             self.numby.simulate_action_forward(action_forward_percent=0.5)
         )
 
@@ -122,7 +118,7 @@ class Topaz(Character):
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
 
         # Numby action forward
-        self.numby.summon_action_value_for_action_forward.append(
+        self.numby.receive_action_forward(
             self.numby.simulate_action_forward(action_forward_percent=0.5)
         )
 
@@ -137,16 +133,17 @@ class Topaz(Character):
         self.windfall_bonanza = 2
 
 
-def random_ally_follow_up_atk() -> bool:
+def random_ally_follow_up_atk(rng: BufferedRandom) -> bool:
     """
     Simulate random follow-up atk from ally.
+    :param rng: Random number source of the battle
     :return: Whether an ally does follow-up attack
     """
     main_logger.info("Random ally follow-up atk...")
     # random number of allies that can do follow up attack
-    follow_up_atk_ally_num = random.choice([0, 1])
+    follow_up_atk_ally_num = rng.choice([0, 1])
 
-    if random.random() < (0.33 * follow_up_atk_ally_num):
+    if rng.random() < (0.33 * follow_up_atk_ally_num):
         main_logger.debug("Ally does follow-up atk")
         return True
     else:
@@ -154,6 +151,8 @@ def random_ally_follow_up_atk() -> bool:
 
 
 class Numby(Character):
+    __slots__ = ("is_test", "topaz", "windfall_bonanza_attacks")
+
     def __init__(self, topaz: Topaz, speed: float = 80, ult_energy: int = 0):
         super().__init__(
             atk=topaz.atk,
@@ -189,7 +188,7 @@ class Numby(Character):
 
                 dmg = self._calculate_damage(skill_multiplier=3, break_amount=20)
 
-                self._record_damage(dmg, "Numby with Ult Buff")
+                self.topaz._record_damage(dmg, "Numby with Ult Buff")
         else:
             main_logger.info("Numby attacking...")
             if self.topaz.enemy_has_fire_weakness():
@@ -197,14 +196,14 @@ class Numby(Character):
                     skill_multiplier=1.5, break_amount=20, dmg_multipliers=[0.15]
                 )
 
-                self._record_damage(dmg, "Numby")
+                self.topaz._record_damage(dmg, "Numby")
             else:
                 dmg = self._calculate_damage(skill_multiplier=1.5, break_amount=20)
 
-                self._record_damage(dmg, "Numby")
+                self.topaz._record_damage(dmg, "Numby")
 
     def take_action(self) -> None:
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         if self.topaz.windfall_bonanza > 0:
             self.crit_dmg += 0.25
@@ -221,7 +220,7 @@ class Numby(Character):
         # Simulate ally's follow-up attacks
         if self.topaz.windfall_bonanza > 0:
             # random number of allies to attack
-            follow_up_atk_ally_num = random.choice([1, 2])
+            follow_up_atk_ally_num = self.rng.choice([1, 2])
 
             # Numby action forward
             self.summon_action_value_for_action_forward.append(
@@ -230,7 +229,7 @@ class Numby(Character):
                 )
             )
         else:
-            if random_ally_follow_up_atk():
+            if random_ally_follow_up_atk(self.rng):
                 # Numby action forward
                 self.summon_action_value_for_action_forward.append(
                     self.simulate_action_forward(action_forward_percent=0.5)
@@ -245,7 +244,7 @@ class Numby(Character):
         Reset Numby stats
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} stats ...")
+        main_logger.info("Resetting %s stats ...", self.__class__.__name__)
         super().reset_summon_stat_for_each_turn()
         self.crit_dmg = 1
 
@@ -270,7 +269,7 @@ class Numby(Character):
         :param can_crit: Whether the DMG can CRIT.
         :return: Damage.
         """
-        main_logger.info(f"{self.__class__.__name__}: Calculating damage...")
+        main_logger.info("%s: Calculating damage...", self.__class__.__name__)
         # reduce enemy toughness
         self.topaz.current_enemy_toughness -= break_amount
 
@@ -278,7 +277,7 @@ class Numby(Character):
 
         base_dmg = calculate_base_dmg(atk=self.atk, skill_multiplier=skill_multiplier)
 
-        if random.random() < self.crit_rate and can_crit:
+        if self._roll_crit(can_crit):
             dmg_multiplier = calculate_dmg_multipliers(
                 crit_dmg=self.crit_dmg, dmg_multipliers=dmg_multipliers
             )
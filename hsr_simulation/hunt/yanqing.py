@@ -13,8 +13,6 @@
 #    limitations under the License.
 
 
-import random
-
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 from hsr_simulation.dmg_calculator import (
@@ -28,6 +26,8 @@ from hsr_simulation.dmg_calculator import (
 
 
 class YanQing(Character):
+    __slots__ = ("a6_spd_buff", "soulsteel_sync", "ult_buff")
+
     def __init__(self, speed=109, ult_energy=140):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.default_speed = speed
@@ -36,23 +36,8 @@ class YanQing(Character):
         self.ult_buff = 0
         self.soulsteel_sync = 0
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.a6_spd_buff = 0
-        self.ult_buff = 0
-        self.soulsteel_sync = 0
-        self.speed = self.default_speed
-        self.crit_rate = self.default_crit_rate
-        self.crit_dmg = self.default_crit_dmg
-
     def take_action(self) -> None:
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
@@ -113,8 +98,7 @@ class YanQing(Character):
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
         self.soulsteel_sync = 1
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Skill")
+        self._record_damage(dmg, "Skill")
 
         self._handle_a2_trace()
 
@@ -123,8 +107,7 @@ class YanQing(Character):
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Basic ATK")
+        self._record_damage(dmg, "Basic ATK")
 
         self._handle_a2_trace()
 
@@ -137,8 +120,7 @@ class YanQing(Character):
         dmg = self._calculate_damage(skill_multiplier=3.5, break_amount=30)
         self.current_ult_energy = 5
 
-        self.data["DMG"].append(dmg)
-        self.data["DMG_Type"].append("Ultimate")
+        self._record_damage(dmg, "Ultimate")
 
         self._handle_a2_trace()
 
@@ -163,7 +145,7 @@ class YanQing(Character):
         :param can_crit: Whether the DMG can CRIT.
         :return: Damage.
         """
-        main_logger.info(f"{self.__class__.__name__}: Calculating damage...")
+        main_logger.info("%s: Calculating damage...", self.__class__.__name__)
         # reduce enemy toughness
         self.current_enemy_toughness -= break_amount
 
@@ -171,7 +153,7 @@ class YanQing(Character):
 
         base_dmg = calculate_base_dmg(atk=self.atk, skill_multiplier=skill_multiplier)
 
-        if random.random() < self.crit_rate and can_crit:
+        if self._roll_crit(can_crit):
             dmg_multiplier = calculate_dmg_multipliers(
                 crit_dmg=self.crit_dmg, dmg_multipliers=dmg_multipliers
             )
@@ -202,18 +184,16 @@ class YanQing(Character):
         self.speed = self.default_speed * 1.1
         self.a6_spd_buff = 2
 
-    @staticmethod
-    def _random_hit_by_enemy() -> bool:
+    def _random_hit_by_enemy(self) -> bool:
         main_logger.info("Randomizing being hit by an enemy...")
-        return random.random() < 0.5
+        return self.rng.random() < 0.5
 
     def _handle_soulsteel_sync_follow_up(self) -> None:
         main_logger.info("Handling Soulsteel Sync follow-up ATK...")
-        if random.random() < 0.6:
+        if self.rng.random() < 0.6:
             dmg, freeze_dmg = self._attack_with_freeze_chance(skill_multiplier=0.5)
             total_dmg = dmg + freeze_dmg
-            self.data["DMG"].append(total_dmg)
-            self.data["DMG_Type"].append("Talent")
+            self._record_damage(total_dmg, "Talent")
             self._handle_a2_trace()
 
     def _attack_with_freeze_chance(self, skill_multiplier) -> tuple[float, float]:
@@ -222,13 +202,12 @@ class YanQing(Character):
 
         self._update_skill_point_and_ult_energy(skill_points=0, ult_energy=10)
 
-        freeze_dmg = 0.5 * self.atk if random.random() < 0.65 else 0
+        freeze_dmg = 0.5 * self.atk if self.rng.random() < 0.65 else 0
         return dmg, freeze_dmg
 
     def _handle_a2_trace(self) -> None:
         main_logger.info("Handling A2 Trace...")
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             dmg = self._calculate_damage(skill_multiplier=0.3, break_amount=0)
 
-            self.data["DMG"].append(dmg)
-            self.data["DMG_Type"].append("Trace")
+            self._record_damage(dmg, "Trace")
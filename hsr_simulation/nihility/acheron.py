@@ -11,13 +11,21 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Acheron(Character):
+    __slots__ = (
+        "a4_dmg_multiplier",
+        "a6_buff",
+        "a6_dmg_multiplier",
+        "crimson_knot",
+        "nihility_teammate_num",
+        "slash_dream",
+    )
+
     def __init__(self, speed: float = 101, ult_energy: int = 0):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.slash_dream = 0
@@ -27,12 +35,19 @@ class Acheron(Character):
         self.a6_buff = 0
         self.nihility_teammate_num = 0
 
+    def on_battle_init(self) -> None:
+        """
+        Pick Acheron's Nihility teammates for the battle.
+        :return: None
+        """
+        self.random_nihility_teammate()
+
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
@@ -45,15 +60,15 @@ class Acheron(Character):
             self._update_skill_point_and_ult_energy(
                 skill_points=0, slash_dream=1 * self.nihility_teammate_num
             )
-        main_logger.debug(f"Current Crimson Knot: {self.crimson_knot}")
+        main_logger.debug("Current Crimson Knot: %s", self.crimson_knot)
 
         if self.a6_buff > 0:
             self.a6_buff -= 1
-        main_logger.debug(f"Current A6 Buff: {self.a6_buff}")
+        main_logger.debug("Current A6 Buff: %s", self.a6_buff)
 
         if self.a6_buff <= 0:
             self.a6_dmg_multiplier = 0
-        main_logger.debug(f"Current A6 Dmg Multiplier: {self.a6_dmg_multiplier}")
+        main_logger.debug("Current A6 Dmg Multiplier: %s", self.a6_dmg_multiplier)
 
         # Simulate A2 Trace
         if self.battle_start:
@@ -67,7 +82,7 @@ class Acheron(Character):
         else:
             self._use_basic_atk()
 
-        main_logger.debug(f"Current Slash Dream: {self.slash_dream}")
+        main_logger.debug("Current Slash Dream: %s", self.slash_dream)
 
         if self._can_use_ult():
             self._use_ult()
@@ -225,36 +240,22 @@ class Acheron(Character):
         :return: None
         """
         main_logger.info("Random Nihility teammate...")
-        self.nihility_teammate_num = random.choice([1, 2])
+        self.nihility_teammate_num = self.rng.choice([1, 2])
         if self.nihility_teammate_num == 1:
             self.a4_dmg_multiplier = 0.15
         elif self.nihility_teammate_num == 2:
             self.a4_dmg_multiplier = 0.6
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.slash_dream = 0
-        self.crimson_knot = 0
-        self.a4_dmg_multiplier = 0
-        self.a6_dmg_multiplier = 0
-        self.a6_buff = 0
-        self.nihility_teammate_num = 0
-
     def check_if_enemy_weakness_broken(self, break_type: str = "None") -> None:
         """
         Check whether enemy is weakness broken.
         :param break_type: Break DMG type, e.g., Physical, Fire, etc.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Checking Enemy Toughness...")
+        main_logger.info("%s: Checking Enemy Toughness...", self.__class__.__name__)
         if self.current_enemy_toughness <= 0 and not self.enemy_weakness_broken:
             self.enemy_turn_delayed_duration_weakness_broken = 1
             self.enemy_weakness_broken = True
+            self.weakness_break_count += 1
             self._update_skill_point_and_ult_energy(skill_points=0, slash_dream=1)
-            main_logger.debug(f"{self.__class__.__name__}: Enemy is Weakness Broken")
+            main_logger.debug("%s: Enemy is Weakness Broken", self.__class__.__name__)
@@ -11,13 +11,14 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class BlackSwan(Character):
+    __slots__ = ("a6_dmg_multiplier", "arcana", "enemy_def_reduced", "epiphany")
+
     def __init__(self, speed: float = 102, ult_energy: int = 120):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.arcana = 0
@@ -31,19 +32,23 @@ class BlackSwan(Character):
         and the dictionary that store the character's actions' data.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.arcana = 0
-        self.epiphany = 0
-        self.enemy_def_reduced = 0
         self.a6_dmg_multiplier = min(0.72, 0.6 * self.break_effect)
 
+    def on_battle_init(self) -> None:
+        """
+        Set Black Swan's Effect Hit Rate for the battle.
+        :return: None
+        """
+        self.set_effect_hit_rate(0, 1.2)
+
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
@@ -68,7 +73,7 @@ class BlackSwan(Character):
 
         # simulate A4 Trace br randomizing ally's DoT attack
         main_logger.debug("Randomizing ally DoT attack...")
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self._apply_arcana()
 
     def _apply_arcana(self) -> None:
@@ -78,7 +83,7 @@ class BlackSwan(Character):
         """
         main_logger.info("Apply Arcana stack...")
         base_chance = 0.65 * (1 + self.effect_hit_rate)
-        if random.random() < base_chance:
+        if self.rng.random() < base_chance:
             self.arcana += 1
 
     def _use_basic_atk(self) -> None:
@@ -171,8 +176,8 @@ class BlackSwan(Character):
         :return: None
         """
         main_logger.info("Simulating enemy turn...")
-        main_logger.debug(f"Arcana stack on enemy: {self.arcana}")
-        main_logger.debug(f"Epiphany stack on enemy: {self.epiphany}")
+        main_logger.debug("Arcana stack on enemy: %s", self.arcana)
+        main_logger.debug("Epiphany stack on enemy: %s", self.epiphany)
         self._apply_talent_dmg()
 
         if self.epiphany > 0:
@@ -11,13 +11,20 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Fugue(Character):
+    __slots__ = (
+        "cloudflame_luster",
+        "cloudflame_luster_active",
+        "foxian_player",
+        "foxian_player_def_reduce_turn",
+        "last_break_amount",
+    )
+
     DEF_REDUCTION = 0.18  # Define DEF reduction as a class constant
 
     def __init__(self, speed: float = 102, ult_energy: int = 130):
@@ -28,19 +35,12 @@ class Fugue(Character):
         self.cloudflame_luster = 0
         self.cloudflame_luster_active = False
 
-    def reset_character_data_for_each_battle(self) -> None:
+    def on_battle_init(self) -> None:
         """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
+        Set Fugue's Break Effect for the battle.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.foxian_player = 0
-        self.foxian_player_def_reduce_turn = 0
-        # Reset Cloudflame Luster
-        self.cloudflame_luster = 0
-        self.cloudflame_luster_active = False
+        self.set_break_effect(1, 3)
 
     def _apply_cloudflame_luster(self) -> None:
         """
@@ -54,7 +54,7 @@ class Fugue(Character):
         """
         Override to handle Cloudflame Luster mechanics
         """
-        main_logger.info(f"{self.__class__.__name__}: Checking Enemy Toughness...")
+        main_logger.info("%s: Checking Enemy Toughness...", self.__class__.__name__)
         if self.current_enemy_toughness <= 0:
             excess_break = abs(
                 self.current_enemy_toughness
@@ -62,8 +62,9 @@ class Fugue(Character):
             if not self.enemy_weakness_broken:
                 self.enemy_turn_delayed_duration_weakness_broken = 1
                 self.enemy_weakness_broken = True
+                self.weakness_break_count += 1
                 main_logger.debug(
-                    f"{self.__class__.__name__}: Enemy is Weakness Broken"
+                    "%s: Enemy is Weakness Broken", self.__class__.__name__
                 )
                 self._apply_cloudflame_luster()
                 # Apply excess break to Cloudflame Luster if any
@@ -133,8 +134,7 @@ class Fugue(Character):
                 enemy_toughness_reduction=self.last_break_amount,
                 break_effect=self.break_effect,
             )
-            self.data["DMG"].append(super_break_dmg)
-            self.data["DMG_Type"].append("Super Break DMG")
+            self._record_damage(super_break_dmg, "Super Break DMG")
 
             # Clear the stored break amount after processing
             self.last_break_amount = 0
@@ -144,7 +144,7 @@ class Fugue(Character):
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_weakness_broken()
         self._apply_talent_dmg()  # Process any pending super break damage
@@ -188,7 +188,7 @@ class Fugue(Character):
         :return: None
         """
         main_logger.info("Using enhance basic attack...")
-        did_foxian_player_attack = random.choice([True, False])
+        did_foxian_player_attack = self.rng.choice([True, False])
 
         def_reduce = self.DEF_REDUCTION if did_foxian_player_attack else 0
         if did_foxian_player_attack:
@@ -11,43 +11,32 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Guinanfei(Character):
+    __slots__ = ("a6_dmg_multiplier", "burn", "firekiss")
+
     def __init__(self, speed: float = 106, ult_energy: int = 120):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.burn = 0
         self.firekiss = []
         self.a6_dmg_multiplier = 0
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.burn = 0
-        self.firekiss = []
-        self.a6_dmg_multiplier = 0
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         main_logger.info("Simulate enemy turn")
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
 
-        main_logger.info(f"{self.__class__.__name__}: apply Burn DMG on enemy...")
+        main_logger.info("%s: apply Burn DMG on enemy...", self.__class__.__name__)
         if self.burn > 0:
             self.burn -= 1
             self._apply_dot()
@@ -83,7 +72,7 @@ class Guinanfei(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         if len(self.firekiss) > 0:
             dmg = self._calculate_damage(
                 skill_multiplier=1,
@@ -102,7 +91,7 @@ class Guinanfei(Character):
         self._record_damage(dmg, "Basic ATK")
 
         # simulate A2 Trace
-        if random.random() < 0.8:
+        if self.rng.random() < 0.8:
             main_logger.debug("Apply Burn from A2 trace effect")
             self.burn = 2
 
@@ -111,7 +100,7 @@ class Guinanfei(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         if len(self.firekiss) > 0:
             dmg = self._calculate_damage(
                 skill_multiplier=1.2,
@@ -136,7 +125,7 @@ class Guinanfei(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
 
         if len(self.firekiss) > 0:
             dmg = self._calculate_damage(
@@ -162,7 +151,7 @@ class Guinanfei(Character):
         :param ult_trigger: Whether the DoT is triggered by Ultimate
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is applying dot...")
+        main_logger.info("%s is applying dot...", self.__class__.__name__)
         if len(self.firekiss) > 0:
             dmg = self._calculate_damage(
                 skill_multiplier=2.182,
@@ -11,55 +11,50 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Jiaoqiu(Character):
+    __slots__ = ("ashen_roast", "zone")
+
     def __init__(self, speed: float = 98, ult_energy: int = 100):
         super().__init__(speed=speed, ult_energy=ult_energy)
 
         self.ashen_roast = []
         self.zone = 0
 
-    def reset_character_data_for_each_battle(self) -> None:
+    def on_battle_init(self) -> None:
         """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data,
-        to ensure the character starts with default stats and battle-related data,
-        in each battle simulation.
+        Set Jiaoqiu's Effect Hit Rate for the battle.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.ashen_roast = []
-        self.zone = 0
+        self.set_effect_hit_rate(0, 1.4)
 
     def _simulate_a4_trace(self) -> None:
         """
         Simulate A4 trace
         """
-        main_logger.info(f"{self.__class__.__name__}: Simulate A4 trace...")
+        main_logger.info("%s: Simulate A4 trace...", self.__class__.__name__)
         if self.effect_hit_rate < 0.8:
             effect_hit_rate = 0
         else:
             effect_hit_rate = self.effect_hit_rate - 0.8
-        main_logger.debug(f"Effect hit rate: {effect_hit_rate}")
+        main_logger.debug("Effect hit rate: %s", effect_hit_rate)
 
         multiplier: float = effect_hit_rate // 0.15
         atk_increase: float = min(0.6 * multiplier, 2.4)
         self.atk = self.default_atk * (1 + atk_increase)
 
-        main_logger.debug(f"Atk: {self.atk}")
+        main_logger.debug("Atk: %s", self.atk)
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         self._simulate_enemy_turn()
 
@@ -86,7 +81,7 @@ class Jiaoqiu(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg_multiplier = self._apply_talent()
         dmg = self._calculate_damage(
             skill_multiplier=1, break_amount=10, dmg_multipliers=[dmg_multiplier]
@@ -103,7 +98,7 @@ class Jiaoqiu(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg_multiplier = self._apply_talent()
         dmg = self._calculate_damage(
             skill_multiplier=1.5, break_amount=20, dmg_multipliers=[dmg_multiplier]
@@ -120,7 +115,7 @@ class Jiaoqiu(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         dmg_multiplier = self._apply_talent()
         if self.zone > 0:
             dmg_multiplier += 0.15
@@ -136,7 +131,7 @@ class Jiaoqiu(Character):
         """
         Inflict ashen roast stack.
         """
-        main_logger.info(f"{self.__class__.__name__} is inflict Ashen Roast...")
+        main_logger.info("%s is inflict Ashen Roast...", self.__class__.__name__)
         if len(self.ashen_roast) < 5:
             self.ashen_roast.append(2)
 
@@ -145,7 +140,7 @@ class Jiaoqiu(Character):
         Simulate talent effect.
         :return: DMG multiplier.
         """
-        main_logger.info(f"{self.__class__.__name__} is applying talent...")
+        main_logger.info("%s is applying talent...", self.__class__.__name__)
         if len(self.ashen_roast) > 0:
             if len(self.ashen_roast) == 1:
                 return 0.15
@@ -158,7 +153,7 @@ class Jiaoqiu(Character):
         """
         Simulate burn damage.
         """
-        main_logger.info(f"{self.__class__.__name__} is applying burn damage...")
+        main_logger.info("%s is applying burn damage...", self.__class__.__name__)
         if len(self.ashen_roast) > 0:
             dmg_multiplier = self._apply_talent()
             dmg = self._calculate_damage(
@@ -174,10 +169,10 @@ class Jiaoqiu(Character):
         """
         Simulate enemy turn
         """
-        main_logger.info(f"{self.__class__.__name__}: simulating enemy turn...")
+        main_logger.info("%s: simulating enemy turn...", self.__class__.__name__)
 
         main_logger.debug(
-            f"Current Ashen Roast stack on enemy: {len(self.ashen_roast)}"
+            "Current Ashen Roast stack on enemy: %s", len(self.ashen_roast)
         )
         self._simulate_enemy_weakness_broken()
 
@@ -189,5 +184,5 @@ class Jiaoqiu(Character):
 
         # simulate Ult effect
         if self.zone > 0:
-            if random.random() < 0.6 * (1 + self.effect_hit_rate):
+            if self.rng.random() < 0.6 * (1 + self.effect_hit_rate):
                 self._inflict_ashen_roast()
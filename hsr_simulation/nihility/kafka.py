@@ -11,35 +11,25 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Kafka(Character):
+    __slots__ = ("shock", "talent_cooldown")
+
     def __init__(self, speed: float = 100, ult_energy: int = 120):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.shock = 0
         self.talent_cooldown = False
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.shock = 0
-        self.talent_cooldown = False
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
@@ -88,7 +78,7 @@ class Kafka(Character):
 
         if self.shock > 0:
             # simulate DoT debuffs on enemy
-            dot_num = random.choice([1, 3])
+            dot_num = self.rng.choice([1, 3])
             for _ in range(dot_num):
                 self._use_shock(skill_trigger=True)
 
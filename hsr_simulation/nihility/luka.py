@@ -11,7 +11,6 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
@@ -26,6 +25,8 @@ from hsr_simulation.dmg_calculator import (
 
 
 class Luka(Character):
+    __slots__ = ("bleed", "enemy_hp", "fighting_will", "ult_buff")
+
     def __init__(self, speed: float = 103, ult_energy: int = 130):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.bleed = 0
@@ -33,24 +34,19 @@ class Luka(Character):
         self.ult_buff = 0
         self.enemy_hp = 0
 
-    def reset_character_data_for_each_battle(self) -> None:
+    def on_battle_init(self) -> None:
         """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
+        Pick the enemy's HP for the battle.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.bleed = 0
-        self.fighting_will = 0
-        self.ult_buff = 0
+        self.random_enemy_hp()
 
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # simulate applying Bleed on enemy turn
         if self.bleed > 0:
@@ -86,7 +82,7 @@ class Luka(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         if self.ult_buff > 0:
             dmg = self._calculate_damage(
                 skill_multiplier=1, break_amount=10, dmg_multipliers=[0.2]
@@ -105,7 +101,7 @@ class Luka(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1.2, break_amount=20)
 
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=30)
@@ -120,7 +116,7 @@ class Luka(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         if self.ult_buff > 0:
             dmg = self._calculate_damage(
                 skill_multiplier=3.3, break_amount=30, dmg_multipliers=[0.2]
@@ -139,7 +135,7 @@ class Luka(Character):
         :param talent_trigger: True if talent triggers this Bleed, False otherwise.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is applying bleed...")
+        main_logger.info("%s is applying bleed...", self.__class__.__name__)
         # simulate Bleed Multiplier that comes from enemy HP
         if self.ult_buff > 0:
             dmg = self._calculate_damage(
@@ -158,7 +154,7 @@ class Luka(Character):
         Simulate enhanced basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using enhanced basic atk...")
+        main_logger.info("%s is using enhanced basic atk...", self.__class__.__name__)
         if self.ult_buff > 0:
             dmg_multiplier = [0.2]
         else:
@@ -171,7 +167,7 @@ class Luka(Character):
             )
 
             # simulate A6 trace
-            if random.random() < 0.5:
+            if self.rng.random() < 0.5:
                 additional_dmg = self._calculate_damage(
                     skill_multiplier=0.2,
                     break_amount=20,
@@ -202,23 +198,25 @@ class Luka(Character):
         :fighting_will_amount: Amount of fighting will to get.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is getting fighting_will stack...")
+        main_logger.info(
+            "%s is getting fighting_will stack...", self.__class__.__name__
+        )
         self.fighting_will += fighting_will_amount
         # simulate A4 trace
         self.current_ult_energy += 3
         # ensure Fighting Will stacks not exceed 4
         self.fighting_will = min(4, self.fighting_will)
         main_logger.debug(
-            f"{self.__class__.__name__} current fighting_will: {self.fighting_will}"
+            "%s current fighting_will: %s", self.__class__.__name__, self.fighting_will
         )
 
     def random_enemy_hp(self) -> None:
         """
         Random enemy's HP
         """
-        main_logger.info(f"{self.__class__.__name__} is randomizing enemy HP")
-        self.enemy_hp = random.choice([480, 28166])
-        main_logger.info(f"Enemy HP: {self.enemy_hp}")
+        main_logger.info("%s is randomizing enemy HP", self.__class__.__name__)
+        self.enemy_hp = self.rng.choice([480, 28166])
+        main_logger.info("Enemy HP: %s", self.enemy_hp)
 
     def _calculate_damage(
         self,
@@ -243,7 +241,7 @@ class Luka(Character):
         :param is_bleed: Whether the DMG is Bleed DMG.
         :return: Damage.
         """
-        main_logger.info(f"{self.__class__.__name__}: Calculating damage...")
+        main_logger.info("%s: Calculating damage...", self.__class__.__name__)
         # reduce enemy toughness
         self.current_enemy_toughness -= break_amount
 
@@ -257,7 +255,7 @@ class Luka(Character):
                 atk=self.atk, skill_multiplier=skill_multiplier
             )
 
-        if random.random() < self.crit_rate and can_crit:
+        if self._roll_crit(can_crit):
             dmg_multiplier = calculate_dmg_multipliers(
                 crit_dmg=self.crit_dmg, dmg_multipliers=dmg_multipliers
             )
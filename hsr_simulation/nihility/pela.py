@@ -11,13 +11,14 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Pela(Character):
+    __slots__ = ("a2_multiplier", "a6_buff", "enemy_has_buff", "exposed")
+
     def __init__(self, speed: float = 105, ult_energy: int = 110):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.enemy_has_buff = False
@@ -25,28 +26,15 @@ class Pela(Character):
         self.exposed = 0
         self.a2_multiplier = 0.2
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.enemy_has_buff = False
-        self.a6_buff = False
-        self.exposed = 0
-        self.a2_multiplier = 0.2
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # random debuff on enemy
-        self.enemy_has_buff = random.choice([True, False])
+        self.enemy_has_buff = self.rng.choice([True, False])
 
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
@@ -68,7 +56,7 @@ class Pela(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg_multipler = 0
         if self.exposed > 0:
             dmg_multipler += 0.4 + self.a2_multiplier
@@ -91,7 +79,7 @@ class Pela(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg_multipler = 0
         if self.exposed > 0:
             dmg_multipler += 0.4 + self.a2_multiplier
@@ -118,7 +106,7 @@ class Pela(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         self.current_ult_energy = 5
 
         dmg_multipler = 0
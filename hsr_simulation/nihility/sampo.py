@@ -11,35 +11,25 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class Sampo(Character):
+    __slots__ = ("ult_buff", "wind_shear")
+
     def __init__(self, speed: float = 102, ult_energy: int = 120):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.ult_buff = 0
         self.wind_shear = []
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.wind_shear = []
-        self.ult_buff = 0
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # simulate applying Wind Shear on enemy turn
         self._apply_wind_shear_dmg()
@@ -73,7 +63,7 @@ class Sampo(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1, break_amount=10)
 
         self._update_skill_point_and_ult_energy(skill_points=1, ult_energy=20)
@@ -87,7 +77,7 @@ class Sampo(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         self._update_skill_point_and_ult_energy(skill_points=-1, ult_energy=0)
         hit_num = 5
         for _ in range(hit_num):
@@ -104,7 +94,7 @@ class Sampo(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         dmg = self._calculate_damage(skill_multiplier=1.6, break_amount=20)
 
         self._record_damage(dmg, "Ultimate")
@@ -118,8 +108,8 @@ class Sampo(Character):
         Inflict Wind Shear DoT stack
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is inflicting Wind Shear...")
-        if random.random() < 0.65:
+        main_logger.info("%s is inflicting Wind Shear...", self.__class__.__name__)
+        if self.rng.random() < 0.65:
             # ensure Wind Shear stacks not exceed 5
             if len(self.wind_shear) < 5:
                 base_wind_shear_duration = 3
@@ -134,7 +124,7 @@ class Sampo(Character):
         Apply Wind Shear DoT damage
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Wind Shear is dealing damage...")
+        main_logger.info("%s: Wind Shear is dealing damage...", self.__class__.__name__)
         hit_num = len(self.wind_shear)
         # apply Wind Shear DMG by the number of Wind Shear stacks
         for _ in range(hit_num):
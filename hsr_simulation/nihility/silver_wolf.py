@@ -11,13 +11,19 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
 
 class SilverWolf(Character):
+    __slots__ = (
+        "bug",
+        "def_reduce",
+        "general_weakness_res_reduce",
+        "specific_weakness_res_reduce",
+    )
+
     def __init__(self, speed: float = 107, ult_energy: int = 110):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.specific_weakness_res_reduce = 0
@@ -25,25 +31,12 @@ class SilverWolf(Character):
         self.def_reduce = 0
         self.bug = 0
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.specific_weakness_res_reduce = 0
-        self.general_weakness_res_reduce = 0
-        self.def_reduce = 0
-        self.bug = 0
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
         # simulate debuff duration on enemy turn
         if self.def_reduce > 0:
             self.def_reduce -= 1
@@ -72,7 +65,7 @@ class SilverWolf(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         def_reduce_multiplier = [0]
         res_reduce_multiplier = [0]
 
@@ -106,7 +99,7 @@ class SilverWolf(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         # simulate Talent
         def_reduce_multiplier = [0]
         if self.bug > 0:
@@ -118,7 +111,7 @@ class SilverWolf(Character):
 
         # simulate RES reduction to a Quantum element
         res_reduction_multiplier = [0]
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             res_reduction_multiplier = [0.2]
             self.specific_weakness_res_reduce = 2
 
@@ -155,10 +148,10 @@ class SilverWolf(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         # simulate DMG Res reduction to a weakness type
         res_reduction_multiplier = [0]
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             res_reduction_multiplier = [0.2]
             self.specific_weakness_res_reduce = 2
 
@@ -185,7 +178,7 @@ class SilverWolf(Character):
         :param a2_trace_trigger: Whether A2 trace triggers Bug
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is applying Bugs...")
+        main_logger.info("%s is applying Bugs...", self.__class__.__name__)
         base_chance = 0.72
 
         # simulate A2 trace inflicting chance
@@ -193,7 +186,7 @@ class SilverWolf(Character):
             base_chance = 0.65
 
         # only simulate DEF reduction bug
-        if random.random() < base_chance:
+        if self.rng.random() < base_chance:
             self.bug = 3
 
             # simulate A2 trace
@@ -205,9 +198,10 @@ class SilverWolf(Character):
         :param break_type: Break DMG type, e.g., Physical, Fire, etc.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__}: Checking Enemy Toughness...")
+        main_logger.info("%s: Checking Enemy Toughness...", self.__class__.__name__)
         if self.current_enemy_toughness <= 0 and not self.enemy_weakness_broken:
             self.enemy_turn_delayed_duration_weakness_broken = 1
             self.enemy_weakness_broken = True
+            self.weakness_break_count += 1
             self._apply_bugs()
-            main_logger.debug(f"{self.__class__.__name__}: Enemy is Weakness Broken")
+            main_logger.debug("%s: Enemy is Weakness Broken", self.__class__.__name__)
@@ -11,7 +11,6 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
@@ -26,30 +25,20 @@ from hsr_simulation.dmg_calculator import (
 
 
 class Welt(Character):
+    __slots__ = ("a2_buff", "enemy_slowed", "imprisoned")
+
     def __init__(self, speed: float = 102, ult_energy: int = 120):
         super().__init__(speed=speed, ult_energy=ult_energy)
         self.enemy_slowed = 0
         self.imprisoned = 0
         self.a2_buff = 0
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.enemy_slowed = 0
-        self.imprisoned = 0
-        self.a2_buff = 0
-
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # simulate enemy turn
         self._simulate_enemy_weakness_broken()
@@ -72,7 +61,7 @@ class Welt(Character):
         Simulate basic atk damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg_multiplier = self._apply_a2_trace()
         dmg = self._calculate_damage(
             skill_multiplier=1, break_amount=10, dmg_multipliers=dmg_multiplier
@@ -87,7 +76,7 @@ class Welt(Character):
         Simulate skill damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         num_hit = 3
         for _ in range(num_hit):
             dmg_multiplier = self._apply_a2_trace()
@@ -99,7 +88,7 @@ class Welt(Character):
             self._record_damage(dmg, "Skill")
 
             # simulate Talent
-            if random.random() < 0.75:
+            if self.rng.random() < 0.75:
                 self.enemy_slowed = 2
 
     def _use_ult(self) -> None:
@@ -107,7 +96,7 @@ class Welt(Character):
         Simulate ultimate damage.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         dmg_multiplier = self._apply_a2_trace()
 
         dmg = self._calculate_damage(
@@ -124,7 +113,7 @@ class Welt(Character):
         """
         Simulate a2 trace damage buff.
         """
-        main_logger.info(f"{self.__class__.__name__} is applying a2 trace...")
+        main_logger.info("%s is applying a2 trace...", self.__class__.__name__)
         dmg_multiplier = [0]
         if self.a2_buff > 0:
             dmg_multiplier.append(0.12)
@@ -135,7 +124,7 @@ class Welt(Character):
         Apply Talent DMG
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is applying Talent DMG...")
+        main_logger.info("%s is applying Talent DMG...", self.__class__.__name__)
         if self.enemy_slowed > 0 or self.imprisoned > 0:
             dmg_multiplier = self._apply_a2_trace()
             dmg = self._calculate_damage(
@@ -164,7 +153,7 @@ class Welt(Character):
         :param can_crit: Whether the DMG can CRIT.
         :return: Damage.
         """
-        main_logger.info(f"{self.__class__.__name__}: Calculating damage...")
+        main_logger.info("%s: Calculating damage...", self.__class__.__name__)
         # reduce enemy toughness
         self.current_enemy_toughness -= break_amount
 
@@ -176,7 +165,7 @@ class Welt(Character):
 
         base_dmg = calculate_base_dmg(atk=self.atk, skill_multiplier=skill_multiplier)
 
-        if random.random() < self.crit_rate and can_crit:
+        if self._roll_crit(can_crit):
             dmg_multiplier = calculate_dmg_multipliers(
                 crit_dmg=self.crit_dmg, dmg_multipliers=dmg_multipliers
             )
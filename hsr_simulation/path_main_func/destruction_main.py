@@ -13,7 +13,6 @@
 #    limitations under the License.
 
 from hsr_simulation.character import Character
-from hsr_simulation.configure_logging import main_logger
 from hsr_simulation.destruction.arlan import Arlan
 from hsr_simulation.destruction.blade import Blade
 from hsr_simulation.destruction.clara import Clara
@@ -26,26 +25,14 @@ from hsr_simulation.destruction.mydei import Mydei
 from hsr_simulation.destruction.trailblazer_physical import TrailblazerPhysical
 from hsr_simulation.destruction.xueyi import Xueyi
 from hsr_simulation.destruction.yunli import Yunli
-from hsr_simulation.postgre import generate_dmg_view_query
-from hsr_simulation.simulate_battles import start_simulations
-from hsr_simulation.utils import process_result_list
-from hsr_simulation.postgre import PostgresOperations
 
 
-def start_sim_destruction(simulation_num: int, max_cycles: int) -> None:
-    """Start simulations for Destruction characters"""
-    main_logger.info("Starting Destruction characters simulations...")
-
-    db = PostgresOperations()
-
-    # Setup database tables
-    stage_table_name = "DestructionStage"
-    view_name = "Destruction"
-    db.drop_stage_table(stage_table_name)
-    db.drop_view(view_name)
-
-    # Destruction characters list
-    destruction_char_list: list[Character] = [
+def get_destruction_characters() -> list[Character]:
+    """
+    Get the Destruction characters to simulate
+    :return: New instance of each Destruction character
+    """
+    return [
         Jingliu(),
         Hook(),
         Arlan(),
@@ -59,10 +46,3 @@ def start_sim_destruction(simulation_num: int, max_cycles: int) -> None:
         Yunli(),
         Mydei(),
     ]
-
-    for destruction_char in destruction_char_list:
-        dict_list = start_simulations(destruction_char, max_cycles, simulation_num)
-        process_result_list(destruction_char, dict_list, stage_table_name)
-
-    query = generate_dmg_view_query(view_name, stage_table_name)
-    db.create_view(view_name, query)
@@ -28,23 +28,20 @@ from hsr_simulation.harmony.sunday import Sunday
 from hsr_simulation.harmony.tingyun import Tingyun
 from hsr_simulation.harmony.tribbie import Tribbie
 from hsr_simulation.harmony.yukong import Yukong
-from hsr_simulation.postgre import PostgresOperations
+from hsr_simulation.path_main_func.path_simulation import (
+    SimulationSettings,
+    start_sim_path,
+)
+from hsr_simulation.profiling import profile_phase
+from hsr_simulation.result_sink import ResultSink
 
 
-def start_sim_harmony() -> None:
-    """Start simulations for Harmony characters"""
-    main_logger.info("Starting Harmony characters simulations...")
-
-    db = PostgresOperations()
-
-    # Setup database tables
-    stage_table_name = "HarmonyStage"
-    view_name = "Harmony"
-    db.drop_stage_table(stage_table_name)
-    db.drop_view(view_name)
-
-    # Harmony characters list
-    harmony_char_list: list[HarmonyCharacter] = [
+def get_harmony_characters() -> list[HarmonyCharacter]:
+    """
+    Get the Harmony characters to simulate
+    :return: New instance of each Harmony character
+    """
+    return [
         Sunday(),
         Asta(),
         Bronya(),
@@ -58,25 +55,75 @@ def start_sim_harmony() -> None:
         Tribbie(),
     ]
 
+
+def simulate_potential_buffs(
+    char_list: list[HarmonyCharacter],
+    stage_table_name: str,
+    sink: ResultSink,
+    settings: SimulationSettings,
+) -> None:
+    """
+    Calculate the potential damage increase of the Harmony characters and load it to the stage table.
+    Harmony characters don't simulate battles, so the simulation settings other than the sink
+    and the selected characters are not used.
+    :param char_list: Selected Harmony characters
+    :param stage_table_name: Stage table name
+    :param sink: Where the results are stored
+    :param settings: Simulation settings
+    :return: None
+    """
     # Collect results
-    results = [
-        {
-            "Character": harmony_char.__class__.__name__,
-            "PotentialDMGIncreased": harmony_char.potential_buff(),
-        }
-        for harmony_char in harmony_char_list
-    ]
+    results = []
+    for harmony_char in char_list:
+        char_name = harmony_char.__class__.__name__
+        with profile_phase("battle_simulation", char_name):
+            results.append(
+                {
+                    "Character": char_name,
+                    "PotentialDMGIncreased": harmony_char.potential_buff(),
+                }
+            )
 
     if results:
-        results_df = pd.DataFrame(results)
+        with profile_phase("transform"):
+            results_df = pd.DataFrame(results)
         main_logger.info(
-            f"Storing Harmony simulation results into {stage_table_name}..."
+            "Storing Harmony simulation results into %s...", stage_table_name
         )
-        db.load_dataframe(results_df, stage_table_name)
+        with profile_phase("load"):
+            sink.write(results_df, stage_table_name)
+
+
+def create_potential_buff_ranking(
+    sink: ResultSink,
+    view_name: str,
+    stage_table_name: str,
+    settings: SimulationSettings,
+) -> None:
+    """
+    Rank the Harmony characters by their potential damage increase.
+    The ranking is a view of the stage table, so it already reads replaced rows
+    and is only created when every character is simulated.
+    :param sink: Where the results are stored
+    :param view_name: View name
+    :param stage_table_name: Stage table name
+    :param settings: Simulation settings
+    :return: None
+    """
+    if settings.characters is None:
+        sink.create_ranking(view_name, stage_table_name, "PotentialDMGIncreased")
+
 
-    query = f'''
-    CREATE OR REPLACE VIEW public."{view_name}" AS
-    SELECT * FROM public."{stage_table_name}"
-    ORDER BY "PotentialDMGIncreased" DESC;
-    '''
-    db.create_view(view_name, query)
+def start_sim_harmony(settings: SimulationSettings) -> None:
+    """
+    Start simulations for Harmony characters
+    :param settings: Simulation settings. Only the sink and the selected characters are used.
+    :return: None
+    """
+    start_sim_path(
+        "Harmony",
+        get_harmony_characters(),
+        settings,
+        simulate=simulate_potential_buffs,
+        summarize=create_potential_buff_ranking,
+    )
@@ -13,7 +13,6 @@
 #    limitations under the License.
 
 from hsr_simulation.character import Character
-from hsr_simulation.configure_logging import main_logger
 from hsr_simulation.nihility.acheron import Acheron
 from hsr_simulation.nihility.black_swan import BlackSwan
 from hsr_simulation.nihility.fugue import Fugue
@@ -25,26 +24,14 @@ from hsr_simulation.nihility.pela import Pela
 from hsr_simulation.nihility.sampo import Sampo
 from hsr_simulation.nihility.silver_wolf import SilverWolf
 from hsr_simulation.nihility.welt import Welt
-from hsr_simulation.postgre import generate_dmg_view_query
-from hsr_simulation.simulate_battles import start_simulations
-from hsr_simulation.utils import process_result_list
-from hsr_simulation.postgre import PostgresOperations
 
 
-def start_sim_nihility(simulation_num: int, max_cycles: int) -> None:
-    """Start simulations for Nihility characters"""
-    main_logger.info("Starting Nihility characters simulations...")
-
-    db = PostgresOperations()
-
-    # Setup database tables
-    stage_table_name = "NihilityStage"
-    view_name = "Nihility"
-    db.drop_stage_table(stage_table_name)
-    db.drop_view(view_name)
-
-    # Nihility characters list
-    nihility_char_list: list[Character] = [
+def get_nihility_characters() -> list[Character]:
+    """
+    Get the Nihility characters to simulate
+    :return: New instance of each Nihility character
+    """
+    return [
         Kafka(),
         BlackSwan(),
         Acheron(),
@@ -57,10 +44,3 @@ def start_sim_nihility(simulation_num: int, max_cycles: int) -> None:
         Jiaoqiu(),
         Fugue(),
     ]
-
-    for nihility_char in nihility_char_list:
-        dict_list = start_simulations(nihility_char, max_cycles, simulation_num)
-        process_result_list(nihility_char, dict_list, stage_table_name)
-
-    query = generate_dmg_view_query(view_name, stage_table_name)
-    db.create_view(view_name, query)
@@ -0,0 +1,153 @@
+#    Copyright 2024 Sakan Nirattisaykul
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import Callable, NamedTuple, TypeVar
+
+from hsr_simulation.character import Character
+from hsr_simulation.configure_logging import main_logger
+from hsr_simulation.profiling import profile_phase
+from hsr_simulation.result_cache import ResultCache
+from hsr_simulation.result_sink import PostgresSink, ResultSink
+from hsr_simulation.scheduler import run_character_simulations
+from hsr_simulation.simulate_battles import DEFAULT_CHUNK_SIZE
+from hsr_simulation.utils import open_stage_table, select_characters
+
+
+class SimulationSettings(NamedTuple):
+    """
+    Settings shared by the simulations of every Path
+    :param simulation_num: Number of simulations
+    :param max_cycles: Maximum number of cycles to simulate
+    :param workers: Number of worker processes to run simulations on
+    :param chunk_size: Max number of battles loaded to the stage table at once
+    :param aggregate_only: Whether to load each battle's total damage of each DMG Type only
+    :param seed: Master seed that makes the battles reproducible
+    :param sink: Where the results are stored, PostgreSQL if not provided
+    :param cache: Cache of each character's results, or None to always simulate
+    :param characters: Names of the characters to simulate, or None for every character.
+                       Only the rows of the selected characters are replaced.
+    """
+
+    simulation_num: int
+    max_cycles: int
+    workers: int = 1
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    aggregate_only: bool = False
+    seed: int | None = None
+    sink: ResultSink | None = None
+    cache: ResultCache | None = None
+    characters: list[str] | None = None
+
+
+T = TypeVar("T")
+
+# Hook that fills the stage table with the results of the selected characters
+SimulateHook = Callable[[list[T], str, ResultSink, SimulationSettings], None]
+
+# Hook that creates or refreshes the view of the stage table
+SummarizeHook = Callable[[ResultSink, str, str, SimulationSettings], None]
+
+
+def simulate_battles(
+    char_list: list[Character],
+    stage_table_name: str,
+    sink: ResultSink,
+    settings: SimulationSettings,
+) -> None:
+    """
+    Simulate the battles of the characters and load them to the stage table.
+    :param char_list: Selected characters
+    :param stage_table_name: Stage table name
+    :param sink: Where the results are stored
+    :param settings: Simulation settings
+    :return: None
+    """
+    run_character_simulations(
+        char_list,
+        settings.simulation_num,
+        settings.max_cycles,
+        stage_table_name,
+        settings.workers,
+        settings.chunk_size,
+        settings.aggregate_only,
+        settings.seed,
+        sink,
+        settings.cache,
+    )
+
+
+def summarize_dmg(
+    sink: ResultSink,
+    view_name: str,
+    stage_table_name: str,
+    settings: SimulationSettings,
+) -> None:
+    """
+    Summarize the damage of the stage table into a view.
+    The view is created when every character is simulated, otherwise it is refreshed.
+    :param sink: Where the results are stored
+    :param view_name: View name
+    :param stage_table_name: Stage table name
+    :param settings: Simulation settings
+    :return: None
+    """
+    if settings.characters is None:
+        sink.create_dmg_summary(view_name, stage_table_name)
+    else:
+        sink.refresh_dmg_summary(view_name, stage_table_name)
+
+
+def start_sim_path(
+    path: str,
+    char_list: list[T],
+    settings: SimulationSettings,
+    simulate: SimulateHook[T] = simulate_battles,
+    summarize: SummarizeHook = summarize_dmg,
+) -> None:
+    """
+    Start simulations for the characters of a Path.
+    The results are loaded to the "<Path>Stage" table and summarized into a view named after the Path.
+    :param path: Path name, e.g., Hunt
+    :param char_list: Every character of the Path
+    :param settings: Simulation settings
+    :param simulate: Hook that loads the results of the selected characters to the stage table,
+                     simulate_battles by default
+    :param summarize: Hook that creates or refreshes the view, summarize_dmg by default
+    :return: None
+    """
+    main_logger.info("Starting %s characters simulations...", path)
+
+    stage_table_name = f"{path}Stage"
+    view_name = path
+
+    with profile_phase("setup"):
+        sink = settings.sink
+        if sink is None:
+            sink = PostgresSink()
+
+        char_list = select_characters(char_list, settings.characters)
+        if not char_list:
+            main_logger.info("No %s characters are selected", path)
+            return
+
+        # Setup database tables
+        stage_table = open_stage_table(
+            sink, stage_table_name, char_list, settings.characters
+        )
+
+    with stage_table:
+        simulate(char_list, stage_table_name, sink, settings)
+
+    with profile_phase("view_creation"):
+        summarize(sink, view_name, stage_table_name, settings)
@@ -13,38 +13,13 @@
 #    limitations under the License.
 
 from hsr_simulation.character import Character
-from hsr_simulation.configure_logging import main_logger
-from hsr_simulation.postgre import generate_dmg_view_query
 from hsr_simulation.remembrance.algaea import Algaea
 from hsr_simulation.remembrance.remembrance_trailblazer import RemembranceTrailblazer
-from hsr_simulation.simulate_battles import start_simulations
-from hsr_simulation.utils import process_result_list
-from hsr_simulation.postgre import PostgresOperations
 
 
-def start_sim_remembrance(simulation_num: int, max_cycles: int) -> None:
+def get_remembrance_characters() -> list[Character]:
     """
-    Start simulations for Remembrance characters
-    :param simulation_num: Number of simulations
-    :param max_cycles: Maximum number of cycles to simulate
-    :return: None
+    Get the Remembrance characters to simulate
+    :return: New instance of each Remembrance character
     """
-    main_logger.info("Starting Remembrance characters simulations...")
-
-    db = PostgresOperations()
-
-    # Setup database tables
-    stage_table_name = "RemembranceStage"
-    view_name = "Remembrance"
-    db.drop_stage_table(stage_table_name)
-    db.drop_view(view_name)
-
-    # Remembrance characters list
-    remembrance_char_list: list[Character] = [RemembranceTrailblazer(), Algaea()]
-
-    for remembrance_char in remembrance_char_list:
-        dict_list = start_simulations(remembrance_char, max_cycles, simulation_num)
-        process_result_list(remembrance_char, dict_list, stage_table_name)
-
-    query = generate_dmg_view_query(view_name, stage_table_name)
-    db.create_view(view_name, query)
+    return [RemembranceTrailblazer(), Algaea()]
@@ -13,20 +13,76 @@
 #    limitations under the License.
 
 
+import io
 import os
+from contextlib import contextmanager
 from functools import wraps
-from typing import Callable
+from typing import Callable, Iterable, Iterator
 
 import pandas as pd
 import sqlalchemy
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import bindparam, create_engine, inspect, text
 import sqlalchemy.exc
 
 from hsr_simulation.configure_logging import main_logger
 
 load_dotenv()
 
+# Number of rows sent per COPY, which bounds the size of the CSV buffer
+COPY_CHUNK_ROWS = 100_000
+
+# Engines by connection URL, along with the ID of the process that created them.
+# Engines are reused across PostgresConnection instances within a process.
+_engines: dict[str, tuple[int, sqlalchemy.engine.Engine]] = {}
+
+
+def get_pool_settings() -> dict:
+    """Get connection pool settings from environment variables"""
+    return {
+        "pool_size": int(os.getenv("POSTGRES_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("POSTGRES_MAX_OVERFLOW", "10")),
+        "pool_pre_ping": os.getenv("POSTGRES_POOL_PRE_PING", "true").lower()
+        in ("1", "true", "yes"),
+    }
+
+
+def get_cached_engine(url: str) -> sqlalchemy.engine.Engine:
+    """
+    Get the process-wide engine for a connection URL, creating it on first use.
+    An engine inherited from the parent process through a fork is replaced,
+    without closing the parent's connections.
+    """
+    pid = os.getpid()
+    cached = _engines.get(url)
+    if cached is not None:
+        engine_pid, engine = cached
+        if engine_pid == pid:
+            return engine
+
+        main_logger.info("Rebuilding engine inherited from process %s...", engine_pid)
+        engine.dispose(close=False)
+
+    engine = create_engine(url, **get_pool_settings())
+    _engines[url] = (pid, engine)
+    return engine
+
+
+def dispose_engine(url: str) -> None:
+    """Dispose the cached engine for a connection URL, closing its pooled connections"""
+    cached = _engines.pop(url, None)
+    if cached is not None:
+        engine_pid, engine = cached
+        # only close connections that belong to this process
+        engine.dispose(close=engine_pid == os.getpid())
+
+
+def dispose_engines() -> None:
+    """Dispose every cached engine, e.g., at shutdown"""
+    main_logger.info("Disposing database engines...")
+    for url in list(_engines):
+        dispose_engine(url)
+
 
 def db_error_handler(func: Callable) -> Callable:
     """Decorator to handle database operation errors"""
@@ -43,7 +99,7 @@ def db_error_handler(func: Callable) -> Callable:
                 conn.rollback()
                 conn.close()
         except Exception as e:
-            main_logger.error(f"Unexpected error: {str(e)}")
+            main_logger.error("Unexpected error: %s", str(e))
             main_logger.error(e, exc_info=True)
             if conn is not None:
                 conn.rollback()
@@ -76,8 +132,12 @@ class PostgresConnection:
         )
 
     def get_engine(self) -> sqlalchemy.engine.Engine:
-        """Create and return a SQLAlchemy engine"""
-        return create_engine(self.url)
+        """Return the process-wide SQLAlchemy engine for this connection URL"""
+        return get_cached_engine(self.url)
+
+    def dispose(self) -> None:
+        """Dispose the engine for this connection URL"""
+        dispose_engine(self.url)
 
     @db_error_handler
     def execute_query(self, query: str) -> None:
@@ -92,33 +152,192 @@ class PostgresOperations(PostgresConnection):
 
     def __init__(self):
         super().__init__()
+        # Connections of the stage tables in upsert mode, which their loads go through
+        self.upsert_connections: dict[str, sqlalchemy.engine.Connection] = {}
 
     @db_error_handler
     def drop_stage_table(self, table_name: str) -> None:
         """Drop a stage table in the database"""
-        main_logger.info(f"Dropping table {table_name}...")
+        main_logger.info("Dropping table %s...", table_name)
         query = f'DROP TABLE IF EXISTS public."{table_name}" CASCADE;'
         self.execute_query(query)
 
     @db_error_handler
     def drop_view(self, view_name: str) -> None:
         """Drop a view in the database"""
-        main_logger.info(f"Dropping view {view_name}...")
+        main_logger.info("Dropping view %s...", view_name)
         query = f'DROP VIEW IF EXISTS public."{view_name}" CASCADE;'
         self.execute_query(query)
 
     @db_error_handler
     def create_view(self, view_name: str, query: str) -> None:
         """Create a view in the database"""
-        main_logger.info(f"Creating view {view_name}...")
+        main_logger.info("Creating view %s...", view_name)
         self.execute_query(query)
 
     @db_error_handler
-    def load_dataframe(self, df: pd.DataFrame, table_name: str) -> None:
-        """Load a DataFrame to a stage table"""
-        main_logger.info(f"Loading dataframe to {table_name}...")
+    def drop_materialized_view(self, view_name: str) -> None:
+        """
+        Drop a materialized view in the database.
+        Databases built before the summaries were materialized have a plain view of the same name,
+        which is dropped instead, since DROP MATERIALIZED VIEW fails on it.
+        """
+        main_logger.info("Dropping materialized view %s...", view_name)
+        with self.get_engine().begin() as conn:
+            relkind = conn.execute(
+                text(
+                    "SELECT c.relkind FROM pg_class c "
+                    "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                    "WHERE n.nspname = 'public' AND c.relname = :name"
+                ),
+                {"name": view_name},
+            ).scalar()
+            if relkind == "v":
+                main_logger.info("Dropping plain view %s...", view_name)
+                conn.execute(text(f'DROP VIEW public."{view_name}" CASCADE;'))
+            else:
+                conn.execute(
+                    text(
+                        f'DROP MATERIALIZED VIEW IF EXISTS public."{view_name}" CASCADE;'
+                    )
+                )
+
+    @db_error_handler
+    def create_materialized_view(self, view_name: str, query: str) -> None:
+        """Create a materialized view in the database"""
+        main_logger.info("Creating materialized view %s...", view_name)
+        self.execute_query(query)
+
+    def refresh_materialized_view(self, view_name: str) -> None:
+        """Refresh a materialized view without blocking its readers"""
+        main_logger.info("Refreshing materialized view %s...", view_name)
+        query = f'REFRESH MATERIALIZED VIEW CONCURRENTLY public."{view_name}";'
+        self.execute_query(query)
+
+    def get_column_names(self, table_name: str) -> list[str]:
+        """Get the column names of a table, or an empty list if it doesn't exist"""
+        with self.get_engine().connect() as conn:
+            inspector = inspect(conn)
+            if not inspector.has_table(table_name):
+                return []
+            return [column["name"] for column in inspector.get_columns(table_name)]
+
+    def materialized_view_exists(self, view_name: str) -> bool:
+        """Check whether a materialized view exists in the database"""
         with self.get_engine().connect() as conn:
-            df.to_sql(table_name, conn, if_exists="append", index=False)
+            return view_name in inspect(conn).get_materialized_view_names()
+
+    def load_dataframe(self, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Load a DataFrame to a stage table.
+        On PostgreSQL, the table is created with explicit column types if it doesn't exist,
+        and rows are streamed with COPY FROM STDIN.
+        Other databases fall back to DataFrame.to_sql.
+        In upsert mode, the DataFrame is loaded in the transaction of replace_characters.
+        Errors are raised rather than logged, so a failed load isn't mistaken for a loaded one.
+        """
+        main_logger.info("Loading dataframe to %s...", table_name)
+        upsert_conn = self.upsert_connections.get(table_name)
+        if upsert_conn is not None:
+            write_dataframe(upsert_conn, df, table_name)
+            return
+
+        with self.get_engine().begin() as conn:
+            write_dataframe(conn, df, table_name)
+
+    @contextmanager
+    def replace_characters(
+        self, table_name: str, characters: Iterable[str]
+    ) -> Iterator[None]:
+        """
+        Upsert mode: delete the rows of the characters from a stage table,
+        and load the DataFrames loaded to the table within the context, in one transaction.
+        The other characters' rows and the views of the table are left intact,
+        and readers keep seeing the old rows until the transaction commits.
+        Nothing is replaced if the context exits with an error, which is raised again.
+        """
+        characters = list(characters)
+        main_logger.info("Replacing rows of %s in %s...", characters, table_name)
+        with self.get_engine().begin() as conn:
+            delete_characters(conn, table_name, characters)
+            self.upsert_connections[table_name] = conn
+            try:
+                yield
+            finally:
+                del self.upsert_connections[table_name]
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a table or column name for PostgreSQL"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def get_postgres_type(dtype) -> str:
+    """Get the PostgreSQL column type for a pandas dtype"""
+    if pd.api.types.is_bool_dtype(dtype):
+        return "BOOLEAN"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER" if dtype.itemsize <= 4 else "BIGINT"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL" if dtype.itemsize <= 4 else "DOUBLE PRECISION"
+    return "TEXT"
+
+
+def generate_create_table_query(df: pd.DataFrame, table_name: str) -> str:
+    """Generate SQL query for creating a table with the DataFrame's columns"""
+    columns = ", ".join(
+        f"{quote_identifier(column)} {get_postgres_type(df[column].dtype)}"
+        for column in df.columns
+    )
+    return f'CREATE TABLE IF NOT EXISTS public."{table_name}" ({columns});'
+
+
+def copy_dataframe(
+    conn: sqlalchemy.engine.Connection,
+    df: pd.DataFrame,
+    table_name: str,
+    chunk_rows: int = COPY_CHUNK_ROWS,
+) -> None:
+    """Stream a DataFrame into a table with COPY FROM STDIN in CSV format"""
+    columns = ", ".join(quote_identifier(column) for column in df.columns)
+    query = f'COPY public."{table_name}" ({columns}) FROM STDIN WITH (FORMAT csv)'
+
+    cursor = conn.connection.cursor()
+    try:
+        for start in range(0, len(df), chunk_rows):
+            csv_buffer = io.StringIO()
+            df.iloc[start : start + chunk_rows].to_csv(
+                csv_buffer, index=False, header=False
+            )
+            csv_buffer.seek(0)
+            cursor.copy_expert(query, csv_buffer)
+    finally:
+        cursor.close()
+
+
+def write_dataframe(
+    conn: sqlalchemy.engine.Connection, df: pd.DataFrame, table_name: str
+) -> None:
+    """Write a DataFrame to a table, with COPY on PostgreSQL and DataFrame.to_sql otherwise"""
+    if conn.dialect.name != "postgresql":
+        df.to_sql(table_name, conn, if_exists="append", index=False)
+        return
+
+    conn.execute(text(generate_create_table_query(df, table_name)))
+    copy_dataframe(conn, df, table_name)
+
+
+def delete_characters(
+    conn: sqlalchemy.engine.Connection, table_name: str, characters: list[str]
+) -> None:
+    """Delete the rows of some characters from a table, if the table exists"""
+    if not characters or not inspect(conn).has_table(table_name):
+        return
+
+    query = text(
+        f'DELETE FROM {quote_identifier(table_name)} WHERE "Character" IN :characters'
+    ).bindparams(bindparam("characters", expanding=True))
+    conn.execute(query, {"characters": characters})
 
 
 def generate_dmg_view_query(view_name: str, stage_table_name: str) -> str:
@@ -141,6 +360,53 @@ def generate_dmg_view_query(view_name: str, stage_table_name: str) -> str:
     '''
 
 
+def generate_hit_count_expression(has_hit_count: bool) -> str:
+    """
+    Generate the SQL expression that counts the hits of a group of stage table rows.
+    :param has_hit_count: Whether the stage table has a HitCount column,
+                          i.e., its rows are battles' totals of a DMG Type, loaded with --aggregate-only.
+                          Rows without a HitCount, loaded from each hit, count as one hit.
+    :return: SQL expression.
+    """
+    if has_hit_count:
+        return 'SUM(COALESCE("HitCount", 1))'
+    return "COUNT(*)"
+
+
+def generate_dmg_summary_query(
+    view_name: str, stage_table_name: str, has_hit_count: bool = False
+) -> str:
+    """
+    Generate SQL query for a materialized view summarizing the damage of each Character and DMG_Type.
+    Damage is summed per round, then the rounds are summarized once,
+    so reading the view doesn't scan the stage table.
+    AvgDMG has the same meaning as in the damage view.
+    HitCount sums the HitCount column if the stage table has one, so it counts hits in aggregated tables too.
+    """
+    return f'''
+    CREATE MATERIALIZED VIEW public."{view_name}" AS
+    WITH DMGbyRound AS (
+        SELECT "Character",
+               "DMG_Type",
+               SUM("DMG") AS "RoundDMG",
+               {generate_hit_count_expression(has_hit_count)} AS "HitCount"
+        FROM public."{stage_table_name}"
+        GROUP BY "Character", "Simulate Round No.", "DMG_Type"
+    )
+    SELECT "Character",
+           "DMG_Type",
+           AVG("RoundDMG") AS "AvgDMG",
+           SUM("RoundDMG") AS "TotalDMG",
+           COUNT(*) AS "RoundCount",
+           SUM("HitCount") AS "HitCount",
+           VAR_SAMP("RoundDMG") AS "VarDMG"
+    FROM DMGbyRound
+    GROUP BY "Character", "DMG_Type"
+    ORDER BY "Character";
+    CREATE UNIQUE INDEX ON public."{view_name}" ("Character", "DMG_Type");
+    '''
+
+
 def load_df_to_stage_table(df: pd.DataFrame, stage_table_name: str) -> None:
     """Legacy function for loading DataFrame"""
     db = PostgresOperations()
@@ -0,0 +1,95 @@
+#    Copyright 2024 Sakan Nirattisaykul
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+import random
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator
+
+from hsr_simulation.configure_logging import (
+    configure_worker_logging,
+    get_log_queue,
+    main_logger,
+)
+
+
+def init_worker(log_queue, log_level: int) -> None:
+    """
+    Initialize a worker process.
+    Forked workers inherit the parent's global random state,
+    so it is reseeded to keep each worker on its own random stream.
+    Log records are sent to the parent process's log queue.
+    :param log_queue: Log queue of the parent process, or None if logging was not configured.
+    :param log_level: Log level of the parent process.
+    :return: None
+    """
+    random.seed()
+    configure_worker_logging(log_queue, log_level)
+
+
+def create_process_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool for running simulations.
+    :param workers: Number of worker processes.
+    :return: Process pool executor.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(get_log_queue(), main_logger.level),
+    )
+
+
+def run_bounded(
+    executor: ProcessPoolExecutor,
+    tasks: Iterable[tuple[Any, Callable, tuple]],
+    max_pending: int,
+) -> Iterator[tuple[Any, Any]]:
+    """
+    Submit tasks to a process pool, keeping at most max_pending of them in flight,
+    and yield their results.
+    Results of tasks with the same key are yielded in the order the tasks were submitted,
+    and results of tasks with different keys as they complete.
+    A result waiting for an earlier task with its key counts as in flight,
+    and tasks are only taken from the iterable when there is room,
+    so at most max_pending results are held in memory at once.
+    :param executor: Process pool executor.
+    :param tasks: Tasks as (key, function, args) tuples.
+    :param max_pending: Max number of submitted tasks whose results are not yet yielded.
+    :return: (key, result) of each task.
+    """
+    # futures of each key in submission order
+    queues: dict[Any, deque[Future]] = {}
+    for key, func, args in tasks:
+        while sum(len(queue) for queue in queues.values()) >= max_pending:
+            yield from _pop_completed(queues)
+        queues.setdefault(key, deque()).append(executor.submit(func, *args))
+
+    while queues:
+        yield from _pop_completed(queues)
+
+
+def _pop_completed(queues: dict[Any, deque[Future]]) -> Iterator[tuple[Any, Any]]:
+    """
+    Wait for the earliest pending task of at least one key,
+    then remove and yield the completed tasks at the front of each key's queue.
+    :param queues: Pending futures of each key in submission order.
+    :return: (key, result) of each completed task.
+    """
+    wait([queue[0] for queue in queues.values()], return_when=FIRST_COMPLETED)
+    for key in list(queues):
+        queue = queues[key]
+        while queue and queue[0].done():
+            yield key, queue.popleft().result()
+        if not queue:
+            del queues[key]
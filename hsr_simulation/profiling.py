@@ -0,0 +1,295 @@
+#    Copyright 2024 Sakan Nirattisaykul
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import cProfile
+import json
+import pstats
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, TypeVar
+
+from hsr_simulation.configure_logging import main_logger
+
+T = TypeVar("T")
+
+PHASES = ("setup", "battle_simulation", "transform", "load", "view_creation")
+
+_active_profiler: "PhaseProfiler | None" = None
+
+
+def get_phase_order(phase: str) -> int:
+    """
+    Get the position of a phase in a run, which orders the phases of the report.
+    :param phase: Phase name
+    :return: Index of the phase in PHASES, or after every phase if it isn't one of them
+    """
+    return PHASES.index(phase) if phase in PHASES else len(PHASES)
+
+
+class PhaseProfiler:
+    """
+    Record the wall time and call count of each phase of a run,
+    per Path and per character.
+    """
+
+    def __init__(self, cprofile_character: str | None = None):
+        """
+        :param cprofile_character: Name of a character whose processing is also run under cProfile
+        """
+        self.cprofile_character = cprofile_character
+        self.current_path: str | None = None
+        self.path_seconds: dict[str, float] = {}
+        self.records: dict[tuple[str | None, str | None, str], list[float]] = {}
+        self.cprofiles: dict[str, cProfile.Profile] = {}
+        # cProfile stats sent back by worker processes, per character
+        self.worker_stats: dict[str, list[dict]] = {}
+
+    def record(self, phase: str, character: str | None, seconds: float) -> None:
+        """
+        Add a call of a phase.
+        :param phase: Phase name, one of PHASES
+        :param character: Character name, or None for phases of the whole Path
+        :param seconds: Wall time of the call
+        :return: None
+        """
+        totals = self.records.setdefault((self.current_path, character, phase), [0, 0])
+        totals[0] += seconds
+        totals[1] += 1
+
+    def report(self) -> dict:
+        """
+        Build the report of the recorded phases.
+        Phases of each Path add up the phases of its characters.
+        :return: Report that can be serialized to JSON
+        """
+        paths: dict[str, dict] = {}
+        for (path, character, phase), (seconds, calls) in sorted(
+            self.records.items(), key=lambda item: get_phase_order(item[0][2])
+        ):
+            path_report = paths.setdefault(
+                str(path),
+                {
+                    "seconds": self.path_seconds.get(path),
+                    "phases": {},
+                    "characters": {},
+                },
+            )
+            path_phase = path_report["phases"].setdefault(
+                phase, {"seconds": 0.0, "calls": 0}
+            )
+            path_phase["seconds"] += seconds
+            path_phase["calls"] += calls
+            if character is not None:
+                path_report["characters"].setdefault(character, {})[phase] = {
+                    "seconds": seconds,
+                    "calls": calls,
+                }
+        return {"phases": list(PHASES), "paths": paths}
+
+    def write_report(self, report_path: Path) -> None:
+        """
+        Write the report as JSON, along with a pstats file for the character run under cProfile,
+        which adds up its stats in this process and in worker processes.
+        :param report_path: JSON file to write
+        :return: None
+        """
+        report = self.report()
+        report["cprofile"] = {}
+        for character in {**self.cprofiles, **self.worker_stats}:
+            stats = pstats.Stats()
+            if character in self.cprofiles:
+                stats.add(self.cprofiles[character])
+            for worker_stats in self.worker_stats.get(character, []):
+                stats.add(WorkerStats(worker_stats))
+
+            stats_path = report_path.with_name(f"{report_path.stem}_{character}.prof")
+            stats.dump_stats(stats_path)
+            report["cprofile"][character] = str(stats_path)
+
+        main_logger.info("Writing profile report to %s...", report_path)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def start_profiling(cprofile_character: str | None = None) -> PhaseProfiler:
+    """
+    Start recording phases of the run.
+    :param cprofile_character: Name of a character whose processing is also run under cProfile
+    :return: Profiler that records the phases
+    """
+    global _active_profiler
+    _active_profiler = PhaseProfiler(cprofile_character)
+    return _active_profiler
+
+
+def stop_profiling() -> None:
+    """Stop recording phases of the run"""
+    global _active_profiler
+    _active_profiler = None
+
+
+@contextmanager
+def profile_path(path: str) -> Iterator[None]:
+    """
+    Attribute the phases recorded inside the block to a Path, and time the whole Path.
+    Does nothing if profiling isn't started.
+    :param path: Path name
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        yield
+        return
+
+    profiler.current_path = path
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.path_seconds[path] = time.perf_counter() - start
+        profiler.current_path = None
+
+
+@contextmanager
+def profile_phase(phase: str, character: str | None = None) -> Iterator[None]:
+    """
+    Record the wall time of the block as a call of a phase.
+    Does nothing if profiling isn't started.
+    :param phase: Phase name, one of PHASES
+    :param character: Character name, or None for phases of the whole Path
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.record(phase, character, time.perf_counter() - start)
+
+
+def profile_iter(
+    iterable: Iterable[T], phase: str, get_character: Callable[[T], str]
+) -> Iterator[T]:
+    """
+    Record the wall time of getting each item of an iterable as a call of a phase,
+    e.g., the time spent simulating each chunk of battles.
+    Items are passed through unchanged if profiling isn't started.
+    :param iterable: Items to time
+    :param phase: Phase name, one of PHASES
+    :param get_character: Function that gets the name of the character an item belongs to
+    :return: The same items
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        yield from iterable
+        return
+
+    iterator = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        profiler.record(phase, get_character(item), time.perf_counter() - start)
+        yield item
+
+
+class WorkerStats:
+    """cProfile stats sent back by a worker process, in the form pstats.Stats loads"""
+
+    def __init__(self, stats: dict):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class ProfiledResult(NamedTuple):
+    """Result of a task run under cProfile in a worker process, along with its stats"""
+
+    result: Any
+    stats: dict
+
+
+def run_under_cprofile(func: Callable, *args) -> ProfiledResult:
+    """
+    Run a function under cProfile, e.g., in a worker process.
+    :param func: Function to run
+    :param args: Arguments of the function
+    :return: Result of the function along with its cProfile stats, which can be pickled
+    """
+    profile = cProfile.Profile()
+    result = profile.runcall(func, *args)
+    profile.create_stats()
+    return ProfiledResult(result, profile.stats)
+
+
+def profile_task(character: str, func: Callable, args: tuple) -> tuple[Callable, tuple]:
+    """
+    Wrap a task run in a worker process, so it runs under cProfile
+    if profiling is started for the character.
+    Its result has to be passed to collect_profiled_result.
+    :param character: Character name
+    :param func: Function of the task
+    :param args: Arguments of the function
+    :return: Function and arguments to submit
+    """
+    profiler = _active_profiler
+    if profiler is None or profiler.cprofile_character != character:
+        return func, args
+    return run_under_cprofile, (func, *args)
+
+
+def collect_profiled_result(character: str, result: Any) -> Any:
+    """
+    Keep the cProfile stats of a task wrapped by profile_task, if it ran under cProfile.
+    :param character: Character name
+    :param result: Result of the task
+    :return: Result of the wrapped function
+    """
+    if not isinstance(result, ProfiledResult):
+        return result
+
+    profiler = _active_profiler
+    if profiler is not None:
+        profiler.worker_stats.setdefault(character, []).append(result.stats)
+    return result.result
+
+
+@contextmanager
+def profile_character(character: str) -> Iterator[None]:
+    """
+    Run the block under cProfile if profiling is started for the character.
+    :param character: Character name
+    """
+    profiler = _active_profiler
+    if profiler is None or profiler.cprofile_character != character:
+        yield
+        return
+
+    main_logger.info("Running %s under cProfile...", character)
+    profile = profiler.cprofiles.setdefault(character, cProfile.Profile())
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+
+
+if __name__ == "__main__":
+    pass
@@ -14,10 +14,20 @@
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
+from hsr_simulation.counters import add_counters
 
 
 class Algaea(Character):
     # Constants for skill multipliers and break amounts
+    __slots__ = (
+        "garmentmaker",
+        "retained_speed_buff_stacks",
+        "seam_stitch_target",
+        "supreme_stance",
+        "supreme_stance_atk_boost",
+        "supreme_stance_turns_left",
+    )
+
     BASIC_ATK_MULTIPLIER: float = 1.0  # 100% ATK
     BASIC_ATK_BREAK_AMOUNT: int = 10
     BASIC_ATK_ENERGY_GAIN: int = 10
@@ -65,30 +75,10 @@ class Algaea(Character):
                 self.ult_energy * self.SPEEDING_SOL_ENERGY_THRESHOLD
             )
             main_logger.info(
-                f"{self.__class__.__name__} regenerated energy to 50% due to The Speeding Sol"
+                "%s regenerated energy to 50%% due to The Speeding Sol",
+                self.__class__.__name__,
             )
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.supreme_stance = False
-        self.seam_stitch_target = False
-        self.speed = self.default_speed
-        self.supreme_stance_turns_left = 0
-        self.supreme_stance_atk_boost = 0
-        self._apply_speeding_sol()  # Apply A6 trace at battle start
-        if self.garmentmaker:
-            self.garmentmaker.reset_character_data_for_each_battle()
-            # Apply retained speed buff stacks from Last Thread of Fate
-            if self.retained_speed_buff_stacks > 0:
-                self.garmentmaker.speed_buff_stacks = self.retained_speed_buff_stacks
-                self.garmentmaker._apply_speed_buff_without_increment()
-
     def _update_supreme_stance(self) -> None:
         """Update Supreme Stance state and ATK boost."""
         if self.supreme_stance and self.supreme_stance_turns_left > 0:
@@ -98,7 +88,9 @@ class Algaea(Character):
             ) + (self.garmentmaker.speed * self.MYOPIC_DOOM_GARMENTMAKER_SPD_MULTIPLIER)
             self.supreme_stance_turns_left -= 1
             main_logger.info(
-                f"{self.__class__.__name__} Supreme Stance turns left: {self.supreme_stance_turns_left}"
+                "%s Supreme Stance turns left: %s",
+                self.__class__.__name__,
+                self.supreme_stance_turns_left,
             )
 
             if self.supreme_stance_turns_left <= 0:
@@ -114,12 +106,15 @@ class Algaea(Character):
                 1, self.garmentmaker.speed_buff_stacks
             )
             main_logger.info(
-                f"{self.__class__.__name__} retained {self.retained_speed_buff_stacks} speed buff stack(s) from Last Thread of Fate"
+                "%s retained %s speed buff stack(s) from Last Thread of Fate",
+                self.__class__.__name__,
+                self.retained_speed_buff_stacks,
             )
 
             # Reset Garmentmaker's ATK to default before disappearing
             self.garmentmaker.atk = self.garmentmaker.default_atk
             self.garmentmaker.disappear()
+            self.collect_counters(self.garmentmaker)
             self.garmentmaker = None
         self.supreme_stance = False
         self.seam_stitch_target = False
@@ -128,12 +123,22 @@ class Algaea(Character):
         # Reset speed to default only when Supreme Stance ends
         self.speed = self.default_speed
 
+    def get_counters(self) -> dict[str, int]:
+        """
+        Get the counters of the battle's events so far, including Garmentmaker's.
+        :return: Counter value by counter name.
+        """
+        counters = super().get_counters()
+        if self.garmentmaker:
+            add_counters(counters, self.garmentmaker.get_counters())
+        return counters
+
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # enemy's turn
         self._simulate_enemy_weakness_broken()
@@ -162,7 +167,7 @@ class Algaea(Character):
 
     def _use_basic_atk(self) -> None:
         """Simulate basic attack damage."""
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(
             skill_multiplier=self.BASIC_ATK_MULTIPLIER,
             break_amount=self.BASIC_ATK_BREAK_AMOUNT,
@@ -184,7 +189,9 @@ class Algaea(Character):
 
     def _use_enhanced_basic_atk(self) -> None:
         """Simulate enhanced basic attack (Joint Attack) damage."""
-        main_logger.info(f"{self.__class__.__name__} is using enhanced basic attack...")
+        main_logger.info(
+            "%s is using enhanced basic attack...", self.__class__.__name__
+        )
         # Aglaea's damage
         dmg = self._calculate_damage(
             skill_multiplier=self.ENHANCED_BASIC_ATK_MULTIPLIER,
@@ -216,12 +223,13 @@ class Algaea(Character):
 
     def _use_skill(self) -> None:
         """Simulate skill - summon or heal Garmentmaker."""
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         if not self.garmentmaker:
             self.garmentmaker = Garmentmaker()
             self.garmentmaker.set_aglaea(self)
         else:
             # Restore Garmentmaker
+            self.collect_counters(self.garmentmaker)
             self.garmentmaker.reset_character_data_for_each_battle()
 
         self.take_action()
@@ -231,13 +239,14 @@ class Algaea(Character):
 
     def _use_ult(self) -> None:
         """Simulate ultimate - enter Supreme Stance and summon/heal Garmentmaker."""
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
 
         # Summon or reset Garmentmaker
         if not self.garmentmaker:
             self.garmentmaker = Garmentmaker()
             self.garmentmaker.set_aglaea(self)
         else:
+            self.collect_counters(self.garmentmaker)
             self.garmentmaker.reset_character_data_for_each_battle()
 
         # Enter Supreme Stance
@@ -280,6 +289,13 @@ class Algaea(Character):
 
 class Garmentmaker(Character):
     # Constants for skill multipliers and break amounts
+    __slots__ = (
+        "aglaea",
+        "remaining_action_value",
+        "seam_stitch_target",
+        "speed_buff_stacks",
+    )
+
     SKILL_MULTIPLIER: float = 1.1  # 110% ATK
     SKILL_BREAK_AMOUNT: int = 10
     SKILL_ENERGY_GAIN: int = 10
@@ -306,26 +322,14 @@ class Garmentmaker(Character):
             0  # Track remaining action value for multiple actions
         )
 
-    def reset_character_data_for_each_battle(self) -> None:
-        """
-        Reset character's stats, along with all battle-related data,
-        and the dictionary that store the character's actions' data.
-        :return: None
-        """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
-        super().reset_character_data_for_each_battle()
-        self.speed_buff_stacks = 0
-        self.seam_stitch_target = False
-        self.speed = self.default_speed  # Reset speed to base value
-        self.atk = self.default_atk  # Reset ATK to base value
-        self.remaining_action_value = 0
-
     def _apply_speed_buff_without_increment(self) -> None:
         """Apply speed buff from retained stacks without incrementing the stack count."""
         if self.speed_buff_stacks > 0:
             self.speed += self.SPEED_BUFF * self.speed_buff_stacks
             main_logger.info(
-                f"{self.__class__.__name__} applied {self.speed_buff_stacks} retained speed buff stack(s)"
+                "%s applied %s retained speed buff stack(s)",
+                self.__class__.__name__,
+                self.speed_buff_stacks,
             )
 
     def take_action(self) -> None:
@@ -333,7 +337,9 @@ class Garmentmaker(Character):
         Simulate taking actions. Always takes at least one action, then additional actions if speed allows.
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
+        # Garmentmaker takes its turns with Aglaea's, so the battle doesn't count them
+        self.action_count += 1
 
         # Reset stats for each action
         self.speed = self.default_speed
@@ -349,7 +355,9 @@ class Garmentmaker(Character):
             aglaea_action_value = self.aglaea.calculate_action_value(self.aglaea.speed)
             self.remaining_action_value = aglaea_action_value
             main_logger.info(
-                f"{self.__class__.__name__} received {aglaea_action_value} action value from Aglaea"
+                "%s received %s action value from Aglaea",
+                self.__class__.__name__,
+                aglaea_action_value,
             )
 
         # Always take at least one action
@@ -360,7 +368,9 @@ class Garmentmaker(Character):
         current_action_value = self.calculate_action_value(self.speed)
         self.remaining_action_value -= current_action_value
         main_logger.info(
-            f"{self.__class__.__name__} has {self.remaining_action_value} action value remaining after first action"
+            "%s has %s action value remaining after first action",
+            self.__class__.__name__,
+            self.remaining_action_value,
         )
 
         # Take additional actions if enough action value remains
@@ -371,12 +381,14 @@ class Garmentmaker(Character):
 
             self.remaining_action_value -= current_action_value
             main_logger.info(
-                f"{self.__class__.__name__} has {self.remaining_action_value} action value remaining"
+                "%s has %s action value remaining",
+                self.__class__.__name__,
+                self.remaining_action_value,
             )
 
     def _use_skill(self) -> None:
         """Simulate skill damage."""
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         dmg = self._calculate_damage(
             skill_multiplier=self.SKILL_MULTIPLIER,
             break_amount=self.SKILL_BREAK_AMOUNT,
@@ -391,19 +403,28 @@ class Garmentmaker(Character):
             # Recalculate speed from base speed plus all stacks
             self.speed = self.default_speed + (self.SPEED_BUFF * self.speed_buff_stacks)
             main_logger.info(
-                f"{self.__class__.__name__} gained speed buff stack {self.speed_buff_stacks}"
+                "%s gained speed buff stack %s",
+                self.__class__.__name__,
+                self.speed_buff_stacks,
             )
 
     def set_aglaea(self, aglaea: "Algaea") -> None:
-        """Set reference to Aglaea for energy regeneration."""
+        """
+        Set reference to Aglaea for energy regeneration, and share her random number generator.
+        The snapshot is taken again, so restoring Garmentmaker keeps the reference.
+        """
         self.aglaea = aglaea
+        self.rng = aglaea.rng
+        self.snapshot_state()
 
     def disappear(self) -> None:
         """Handle Garmentmaker disappearing and regenerating Aglaea's energy."""
         if self.aglaea:
             self.aglaea.current_ult_energy += self.ENERGY_REGEN_ON_DISAPPEAR
             main_logger.info(
-                f"{self.__class__.__name__} disappeared and regenerated {self.ENERGY_REGEN_ON_DISAPPEAR} energy for Aglaea"
+                "%s disappeared and regenerated %s energy for Aglaea",
+                self.__class__.__name__,
+                self.ENERGY_REGEN_ON_DISAPPEAR,
             )
 
     def _calculate_damage(self, skill_multiplier: float, break_amount: int) -> float:
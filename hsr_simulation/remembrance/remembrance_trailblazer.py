@@ -12,12 +12,14 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-import random
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
+from hsr_simulation.counters import add_counters
 
 
 class RemembranceTrailblazer(Character):
+    __slots__ = ("additional_true_dmg_multiplier", "mem", "mem_buff")
+
     TRUE_DMG_MULTIPLIER: float = 0.28
 
     ULT_MULTIPLIER: float = 2.4
@@ -44,18 +46,26 @@ class RemembranceTrailblazer(Character):
         and the dictionary that store the character's actions' data.
         :return: None
         """
-        main_logger.info(f"Resetting {self.__class__.__name__} data...")
+        main_logger.info("Resetting %s data...", self.__class__.__name__)
         super().reset_character_data_for_each_battle()
-        self.mem = None
-        self.mem_buff = 0
         self.additional_true_dmg_multiplier = self._apply_a6_trace()
 
+    def get_counters(self) -> dict[str, int]:
+        """
+        Get the counters of the battle's events so far, including Mem's.
+        :return: Counter value by counter name.
+        """
+        counters = super().get_counters()
+        if self.mem is not None:
+            add_counters(counters, self.mem.get_counters())
+        return counters
+
     def take_action(self) -> None:
         """
         Simulate taking actions.
         :return: None.
         """
-        main_logger.info(f"{self.__class__.__name__} is taking actions...")
+        main_logger.info("%s is taking actions...", self.__class__.__name__)
 
         # enemy's turn
         self._simulate_enemy_weakness_broken()
@@ -80,8 +90,10 @@ class RemembranceTrailblazer(Character):
 
         # Mem's turn
         if self.mem is not None:
+            # Mem takes its turns with Trailblazer's, so the battle doesn't count them
+            self.mem.action_count += 1
             if not self._mem_can_use_ult():
-                hit_num = random.randint(1, 4)
+                hit_num = self.rng.randint(1, 4)
                 if self.mem.mem_buff > 0:
                     dmg = self.mem._use_skill(hit_num)
                     self._apply_a4_trace()
@@ -98,7 +110,7 @@ class RemembranceTrailblazer(Character):
 
     def _use_basic_atk(self) -> None:
         """Simulate basic attack damage."""
-        main_logger.info(f"{self.__class__.__name__} is using basic attack...")
+        main_logger.info("%s is using basic attack...", self.__class__.__name__)
         dmg = self._calculate_damage(
             skill_multiplier=self.BASIC_ATK_MULTIPLIER,
             break_amount=self.BASIC_ATK_BREAK_AMOUNT,
@@ -122,9 +134,10 @@ class RemembranceTrailblazer(Character):
 
     def _use_skill(self) -> None:
         """Simulate skill damage."""
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
         if self.mem is None:
             self.mem = Mem(speed=130, ult_energy=100)
+            self.mem.rng = self.rng
             self._gain_charge_to_mem(self.A2_TRACE_CHARGE_GAIN)
 
             # apply Mem's talent
@@ -141,7 +154,7 @@ class RemembranceTrailblazer(Character):
 
     def _use_ult(self) -> None:
         """Simulate ultimate damage."""
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         self._gain_charge_to_mem(self.ULT_MEM_CHARGE_GAIN)  # 40% Charge
         dmg = self._calculate_damage(
             skill_multiplier=self.ULT_MULTIPLIER, break_amount=self.ULT_BREAK_AMOUNT
@@ -168,7 +181,7 @@ class RemembranceTrailblazer(Character):
         :param energy_gain: Energy gain from ability
         :return: None
         """
-        main_logger.info(f"{self.__class__.__name__} is using talent...")
+        main_logger.info("%s is using talent...", self.__class__.__name__)
         self.mem.ult_energy += energy_gain // 10
         if self.mem.ult_energy >= self.mem.MEM_CHARGE:
             self.mem_buff = self.mem._use_ult()
@@ -185,19 +198,19 @@ class RemembranceTrailblazer(Character):
 
     def _apply_a2_trace(self) -> None:
         """Simulate applying A2 Trace."""
-        main_logger.info(f"{self.__class__.__name__} is applying A2 Trace...")
+        main_logger.info("%s is applying A2 Trace...", self.__class__.__name__)
         self.char_action_value_for_action_forward.append(
             self.simulate_action_forward(0.3)
         )
 
     def _apply_a4_trace(self) -> None:
         """Simulate applying A4 Trace."""
-        main_logger.info(f"{self.__class__.__name__} is applying A4 Trace...")
+        main_logger.info("%s is applying A4 Trace...", self.__class__.__name__)
         self._gain_charge_to_mem(self.A4_TRACE_CHARGE_GAIN)
 
     def _apply_a6_trace(self) -> None:
         """Simulate applying A6 Trace."""
-        main_logger.info(f"{self.__class__.__name__} is applying A6 Trace...")
+        main_logger.info("%s is applying A6 Trace...", self.__class__.__name__)
         exceed_ult_energy = self.ult_energy - 100
         additional_true_dmg_multiplier = (exceed_ult_energy // 10) * 0.02
         return additional_true_dmg_multiplier
@@ -212,7 +225,7 @@ class RemembranceTrailblazer(Character):
         If Trailblazer already has Mem's buff, then give Mem's buff to Mem itself.
         """
         main_logger.info(
-            f"{self.__class__.__name__} is applying Mem's True Damage Buff..."
+            "%s is applying Mem's True Damage Buff...", self.__class__.__name__
         )
         if self.mem_buff <= 0:
             self.mem_buff = self.mem._use_ult()
@@ -224,6 +237,8 @@ class RemembranceTrailblazer(Character):
 
 
 class Mem(Character):
+    __slots__ = ("mem_buff",)
+
     SKILL_MULTIPLIER: float = 0.36
     SKILL_MULTIPLIER_FINAL_HIT: float = 0.9
     SKILL_BREAK_AMOUNT: int = 5
@@ -249,7 +264,7 @@ class Mem(Character):
         :param hit_num: Number of hits to simulate
         :return: Skill Damage
         """
-        main_logger.info(f"{self.__class__.__name__} is using skill...")
+        main_logger.info("%s is using skill...", self.__class__.__name__)
 
         dmg = 0
         for _ in range(hit_num):
@@ -271,7 +286,7 @@ class Mem(Character):
         :return: True Damage
         """
         main_logger.info(
-            f"{self.__class__.__name__} is simulating True Damage from skill..."
+            "%s is simulating True Damage from skill...", self.__class__.__name__
         )
 
         dmg = 0
@@ -286,6 +301,6 @@ class Mem(Character):
         Simulate Mem's Lemme! Help You!
         :return: 3 which means Mem's buff is active for 3 turns
         """
-        main_logger.info(f"{self.__class__.__name__} is using ultimate...")
+        main_logger.info("%s is using ultimate...", self.__class__.__name__)
         self.ult_energy = 0
         return self.MEM_BUFF_DURATION
@@ -0,0 +1,203 @@
+#    Copyright 2024 Sakan Nirattisaykul
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+import hashlib
+import json
+import os
+import shutil
+import sys
+import uuid
+from functools import cache
+from pathlib import Path
+from typing import Iterator
+
+from hsr_simulation.battle_record import BattleRecordBuffer
+from hsr_simulation.character import Character, get_state_slots
+from hsr_simulation.configure_logging import main_logger
+
+DEFAULT_CACHE_DIR = ".simulation_cache"
+
+# Bump when the layout of a cache entry changes, so old entries are not read
+CACHE_FORMAT_VERSION = 1
+
+# Modules that every character's results depend on, besides the character's own modules
+SIMULATION_MODULES = (
+    "hsr_simulation.action_timeline",
+    "hsr_simulation.battle_record",
+    "hsr_simulation.dmg_calculator",
+    "hsr_simulation.rng",
+    "hsr_simulation.simulate_battles",
+    "hsr_simulation.simulate_cycles",
+    "hsr_simulation.simulate_turns",
+)
+
+
+@cache
+def get_module_source_hash(module_name: str) -> str:
+    """
+    Hash the source file of an imported module.
+    :param module_name: Module name, e.g., hsr_simulation.hunt.seele
+    :return: SHA-256 hex digest of the module's source file
+    """
+    source_path = Path(sys.modules[module_name].__file__)
+    return hashlib.sha256(source_path.read_bytes()).hexdigest()
+
+
+def get_character_source_hashes(character: Character) -> dict[str, str]:
+    """
+    Hash the source of every module the character's results depend on:
+    the modules of the character's class and its base classes, and SIMULATION_MODULES.
+    :param character: Character to simulate
+    :return: Source hash by module name
+    """
+    module_names = {
+        cls.__module__
+        for cls in type(character).__mro__
+        if cls.__module__.startswith("hsr_simulation.")
+    }
+    module_names.update(SIMULATION_MODULES)
+    return {name: get_module_source_hash(name) for name in sorted(module_names)}
+
+
+def get_default_stats(character: Character) -> dict[str, float | int | bool]:
+    """
+    Get the character's default stats, i.e., every default_* attribute set by its __init__.
+    :param character: Character to simulate
+    :return: Default stat by attribute name
+    """
+    return {
+        name: getattr(character, name)
+        for name in sorted(set(get_state_slots(type(character))))
+        if name.startswith("default_") and hasattr(character, name)
+    }
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of each character's simulated battles.
+
+    An entry is keyed by the hash of the character's source, its default stats
+    and the simulation parameters, so an entry is only reused while none of them change.
+    Each entry is a directory with one .npz file per chunk of battles.
+    It is written to a temporary directory and renamed once every chunk is written,
+    so an interrupted run never leaves a partial entry behind.
+    """
+
+    def __init__(self, cache_dir: Path | str = DEFAULT_CACHE_DIR):
+        """
+        :param cache_dir: Directory of the cache entries
+        """
+        self.cache_dir = Path(cache_dir)
+        # entries being written, with their temporary directory and number of chunks written
+        self._pending: dict[str, tuple[Path, int]] = {}
+
+    @staticmethod
+    def get_key(
+        character: Character,
+        simulation_num: int,
+        max_cycles: int,
+        seed: int | None,
+        aggregate_only: bool = False,
+    ) -> str:
+        """
+        Get the key of a character's results.
+        :param character: Character to simulate
+        :param simulation_num: Number of battles to simulate
+        :param max_cycles: Max number of cycles to simulate
+        :param seed: Master seed of the run, or None for random battles
+        :param aggregate_only: Whether only each battle's total damage of each DMG Type is stored
+        :return: SHA-256 hex digest of everything the results depend on
+        """
+        key_data = {
+            "version": CACHE_FORMAT_VERSION,
+            "character": character.__class__.__name__,
+            "sources": get_character_source_hashes(character),
+            "stats": get_default_stats(character),
+            "simulation_num": simulation_num,
+            "max_cycles": max_cycles,
+            "seed": seed,
+            "aggregate_only": aggregate_only,
+        }
+        key_json = json.dumps(key_data, sort_keys=True, default=repr)
+        return hashlib.sha256(key_json.encode()).hexdigest()
+
+    def get_entry_dir(self, key: str) -> Path:
+        """
+        Get the directory of an entry.
+        :param key: Key of the entry
+        :return: Directory of the entry
+        """
+        return self.cache_dir / key
+
+    def has(self, key: str) -> bool:
+        """
+        Check whether an entry is cached.
+        :param key: Key of the entry
+        :return: Whether the entry exists
+        """
+        return self.get_entry_dir(key).is_dir()
+
+    def load(self, key: str) -> Iterator[BattleRecordBuffer]:
+        """
+        Load the chunks of an entry, one at a time.
+        :param key: Key of the entry
+        :return: Record buffer of each chunk, in the order they were written
+        """
+        main_logger.info("Loading cached results %s...", key)
+        for part_path in sorted(self.get_entry_dir(key).glob("part-*.npz")):
+            yield BattleRecordBuffer.load(part_path)
+
+    def write_part(self, key: str, record_buffer: BattleRecordBuffer) -> None:
+        """
+        Write a chunk of an entry to the entry's temporary directory.
+        :param key: Key of the entry
+        :param record_buffer: Record buffer of the chunk
+        :return: None
+        """
+        pending = self._pending.get(key)
+        if pending is None:
+            temp_dir = self.cache_dir / f".{key}.{uuid.uuid4().hex}.tmp"
+            temp_dir.mkdir(parents=True)
+            pending = (temp_dir, 0)
+
+        temp_dir, part_count = pending
+        record_buffer.save(temp_dir / f"part-{part_count:05d}.npz")
+        self._pending[key] = (temp_dir, part_count + 1)
+
+    def commit(self, key: str) -> None:
+        """
+        Make an entry whose chunks are all written available.
+        :param key: Key of the entry
+        :return: None
+        """
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            # nothing was simulated, e.g., no battles were requested
+            return
+
+        temp_dir, _ = pending
+        try:
+            os.rename(temp_dir, self.get_entry_dir(key))
+            main_logger.info("Cached results %s", key)
+        except OSError:
+            # another run cached the same entry first
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def discard_pending(self) -> None:
+        """
+        Remove the temporary directories of the entries that were not committed.
+        :return: None
+        """
+        for temp_dir, _ in self._pending.values():
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        self._pending.clear()
@@ -0,0 +1,435 @@
+#    Copyright 2024 Sakan Nirattisaykul
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import shutil
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import ContextManager, Iterable, Iterator
+
+import pandas as pd
+import sqlalchemy
+from sqlalchemy import inspect, text
+
+from hsr_simulation.configure_logging import main_logger
+from hsr_simulation.postgre import (
+    PostgresOperations,
+    delete_characters,
+    generate_dmg_summary_query,
+    generate_hit_count_expression,
+    get_cached_engine,
+    quote_identifier,
+)
+
+SINK_NAMES = ("postgres", "sqlite", "parquet", "arrow")
+DEFAULT_SQLITE_PATH = "simulation_results.db"
+DEFAULT_OUTPUT_DIR = "simulation_results"
+
+
+class ResultSink:
+    """
+    Base class for where simulation results are stored.
+    Results of a Path are written to a stage table, which is summarized into a view
+    once every character of the Path is simulated.
+    """
+
+    def reset(self, table_name: str) -> None:
+        """
+        Remove the results stored in a stage table by a previous run.
+        :param table_name: Stage table name
+        :return: None
+        """
+        raise NotImplementedError("reset method is not implemented")
+
+    def write(self, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Append results to a stage table.
+        :param df: Results with a Character column
+        :param table_name: Stage table name
+        :return: None
+        """
+        raise NotImplementedError("write method is not implemented")
+
+    def replace_characters(
+        self, table_name: str, characters: Iterable[str]
+    ) -> ContextManager[None]:
+        """
+        Replace the rows of some characters in a stage table, keeping the other characters' rows.
+        Rows written to the table within the context replace the characters' old rows,
+        and the old rows are kept if the context exits with an error.
+        :param table_name: Stage table name
+        :param characters: Names of the characters whose rows are replaced
+        :return: Context that the characters' new rows are written in
+        """
+        raise NotImplementedError("replace_characters method is not implemented")
+
+    def create_dmg_summary(self, view_name: str, stage_table_name: str) -> None:
+        """
+        Summarize the damage of each Character and DMG_Type in a stage table.
+        :param view_name: Name of the summary
+        :param stage_table_name: Stage table name
+        :return: None
+        """
+        raise NotImplementedError("create_dmg_summary method is not implemented")
+
+    def refresh_dmg_summary(self, view_name: str, stage_table_name: str) -> None:
+        """
+        Update a damage summary after rows of its stage table are replaced,
+        without dropping it. It is created if it doesn't exist.
+        :param view_name: Name of the summary
+        :param stage_table_name: Stage table name
+        :return: None
+        """
+        raise NotImplementedError("refresh_dmg_summary method is not implemented")
+
+    def create_ranking(
+        self, view_name: str, stage_table_name: str, order_by: str
+    ) -> None:
+        """
+        Rank the rows of a stage table by a column, in descending order.
+        :param view_name: Name of the ranking
+        :param stage_table_name: Stage table name
+        :param order_by: Column to rank by
+        :return: None
+        """
+        raise NotImplementedError("create_ranking method is not implemented")
+
+    def get_report_path(self, file_name: str) -> Path:
+        """
+        Get the path of a report written next to the results, e.g., a profile report.
+        Results in a database have no directory, so reports go to the working directory.
+        :param file_name: Report file name
+        :return: Report path
+        """
+        return Path(file_name)
+
+
+class PostgresSink(ResultSink):
+    """Store results in PostgreSQL, summarized into materialized views"""
+
+    def __init__(self, db: PostgresOperations | None = None):
+        self.db = db if db is not None else PostgresOperations()
+
+    def reset(self, table_name: str) -> None:
+        self.db.drop_stage_table(table_name)
+
+    def write(self, df: pd.DataFrame, table_name: str) -> None:
+        self.db.load_dataframe(df, table_name)
+
+    def replace_characters(
+        self, table_name: str, characters: Iterable[str]
+    ) -> ContextManager[None]:
+        return self.db.replace_characters(table_name, characters)
+
+    def create_dmg_summary(self, view_name: str, stage_table_name: str) -> None:
+        self.db.drop_materialized_view(view_name)
+        query = generate_dmg_summary_query(
+            view_name,
+            stage_table_name,
+            "HitCount" in self.db.get_column_names(stage_table_name),
+        )
+        self.db.create_materialized_view(view_name, query)
+
+    def refresh_dmg_summary(self, view_name: str, stage_table_name: str) -> None:
+        if self.db.materialized_view_exists(view_name):
+            self.db.refresh_materialized_view(view_name)
+        else:
+            self.create_dmg_summary(view_name, stage_table_name)
+
+    def create_ranking(
+        self, view_name: str, stage_table_name: str, order_by: str
+    ) -> None:
+        self.db.drop_view(view_name)
+        query = f'''
+        CREATE OR REPLACE VIEW public."{view_name}" AS
+        SELECT * FROM public."{stage_table_name}"
+        ORDER BY "{order_by}" DESC;
+        '''
+        self.db.create_view(view_name, query)
+
+
+def generate_sqlite_dmg_summary_query(
+    view_name: str, stage_table_name: str, has_hit_count: bool = False
+) -> str:
+    """
+    Generate SQL query for a SQLite view summarizing the damage of each Character and DMG_Type.
+    It has the same columns as the PostgreSQL damage summary, and counts hits the same way.
+    SQLite has no VAR_SAMP, so VarDMG is calculated in two passes,
+    from the round damage's deviations from the mean of its Character and DMG_Type.
+    """
+    return f"""
+    CREATE VIEW {quote_identifier(view_name)} AS
+    WITH DMGbyRound AS (
+        SELECT "Character",
+               "DMG_Type",
+               SUM("DMG") AS "RoundDMG",
+               {generate_hit_count_expression(has_hit_count)} AS "HitCount"
+        FROM {quote_identifier(stage_table_name)}
+        GROUP BY "Character", "Simulate Round No.", "DMG_Type"
+    ),
+    MeanDMG AS (
+        SELECT "Character",
+               "DMG_Type",
+               AVG("RoundDMG") AS "MeanDMG"
+        FROM DMGbyRound
+        GROUP BY "Character", "DMG_Type"
+    )
+    SELECT r."Character" AS "Character",
+           r."DMG_Type" AS "DMG_Type",
+           AVG(r."RoundDMG") AS "AvgDMG",
+           SUM(r."RoundDMG") AS "TotalDMG",
+           COUNT(*) AS "RoundCount",
+           SUM(r."HitCount") AS "HitCount",
+           CASE WHEN COUNT(*) > 1
+                THEN SUM((r."RoundDMG" - m."MeanDMG") * (r."RoundDMG" - m."MeanDMG"))
+                     / (COUNT(*) - 1)
+           END AS "VarDMG"
+    FROM DMGbyRound AS r
+    JOIN MeanDMG AS m
+      ON r."Character" = m."Character" AND r."DMG_Type" = m."DMG_Type"
+    GROUP BY r."Character", r."DMG_Type"
+    ORDER BY r."Character"
+    """
+
+
+class SQLiteSink(ResultSink):
+    """Store results in a local SQLite database, summarized into views"""
+
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH):
+        self.path = Path(path)
+        self.url = f"sqlite:///{path}"
+        # Connections of the stage tables whose characters are being replaced
+        self._upsert_connections: dict[str, sqlalchemy.engine.Connection] = {}
+
+    def get_report_path(self, file_name: str) -> Path:
+        return self.path.with_name(file_name)
+
+    def _execute(self, *queries: str) -> None:
+        """Execute SQL queries in one transaction"""
+        with get_cached_engine(self.url).begin() as conn:
+            for query in queries:
+                conn.execute(text(query))
+
+    def reset(self, table_name: str) -> None:
+        main_logger.info("Dropping table %s...", table_name)
+        self._execute(f"DROP TABLE IF EXISTS {quote_identifier(table_name)}")
+
+    def write(self, df: pd.DataFrame, table_name: str) -> None:
+        main_logger.info("Loading %s rows to table %s...", len(df), table_name)
+        upsert_conn = self._upsert_connections.get(table_name)
+        if upsert_conn is not None:
+            df.to_sql(table_name, upsert_conn, if_exists="append", index=False)
+            return
+
+        with get_cached_engine(self.url).begin() as conn:
+            df.to_sql(table_name, conn, if_exists="append", index=False)
+
+    @contextmanager
+    def replace_characters(
+        self, table_name: str, characters: Iterable[str]
+    ) -> Iterator[None]:
+        characters = list(characters)
+        main_logger.info("Replacing rows of %s in %s...", characters, table_name)
+        with get_cached_engine(self.url).begin() as conn:
+            delete_characters(conn, table_name, characters)
+            self._upsert_connections[table_name] = conn
+            try:
+                yield
+            finally:
+                del self._upsert_connections[table_name]
+
+    def create_dmg_summary(self, view_name: str, stage_table_name: str) -> None:
+        main_logger.info("Creating view %s...", view_name)
+        with get_cached_engine(self.url).connect() as conn:
+            inspector = inspect(conn)
+            has_hit_count = inspector.has_table(stage_table_name) and any(
+                column["name"] == "HitCount"
+                for column in inspector.get_columns(stage_table_name)
+            )
+        self._execute(
+            f"DROP VIEW IF EXISTS {quote_identifier(view_name)}",
+            generate_sqlite_dmg_summary_query(
+                view_name, stage_table_name, has_hit_count
+            ),
+        )
+
+    def refresh_dmg_summary(self, view_name: str, stage_table_name: str) -> None:
+        # SQLite views are computed when they are read, so only a missing view is created
+        with get_cached_engine(self.url).connect() as conn:
+            view_exists = view_name in inspect(conn).get_view_names()
+        if not view_exists:
+            self.create_dmg_summary(view_name, stage_table_name)
+
+    def create_ranking(
+        self, view_name: str, stage_table_name: str, order_by: str
+    ) -> None:
+        main_logger.info("Creating view %s...", view_name)
+        self._execute(
+            f"DROP VIEW IF EXISTS {quote_identifier(view_name)}",
+            f"CREATE VIEW {quote_identifier(view_name)} AS "
+            f"SELECT * FROM {quote_identifier(stage_table_name)} "
+            f"ORDER BY {quote_identifier(order_by)} DESC",
+        )
+
+
+def import_pyarrow():
+    """
+    Import pyarrow, which the Parquet and Arrow IPC sinks need.
+    :return: pyarrow module
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "The parquet and arrow sinks need pyarrow, install it with: pip install -r requirements.txt"
+        ) from e
+    return pyarrow
+
+
+class FileSink(ResultSink):
+    """
+    Base class for storing results in files, one directory per stage table.
+    Each write adds new files partitioned by character, so writes are append-only.
+    Files have no views, so summaries are left to whatever reads the files.
+    """
+
+    file_extension = ""
+
+    def __init__(self, output_dir: str = DEFAULT_OUTPUT_DIR):
+        self.pa = import_pyarrow()
+        self.output_dir = Path(output_dir)
+
+    def reset(self, table_name: str) -> None:
+        main_logger.info("Removing results of %s...", table_name)
+        shutil.rmtree(self.output_dir / table_name, ignore_errors=True)
+
+    def get_report_path(self, file_name: str) -> Path:
+        return self.output_dir / file_name
+
+    def write(self, df: pd.DataFrame, table_name: str) -> None:
+        for character, char_df in df.groupby("Character", observed=True):
+            partition_dir = self.output_dir / table_name / f"Character={character}"
+            partition_dir.mkdir(parents=True, exist_ok=True)
+            file_path = partition_dir / f"part-{uuid.uuid4().hex}{self.file_extension}"
+            main_logger.info("Writing %s rows to %s...", len(char_df), file_path)
+            table = self.pa.Table.from_pandas(
+                char_df.drop(columns="Character"), preserve_index=False
+            )
+            self._write_table(table, file_path)
+
+    @contextmanager
+    def replace_characters(
+        self, table_name: str, characters: Iterable[str]
+    ) -> Iterator[None]:
+        # Files have no transactions, so the characters' partitions are moved aside
+        # while the new ones are written, then removed, or moved back on error.
+        table_dir = self.output_dir / table_name
+        moved_dirs: dict[Path, Path] = {}
+        for character in characters:
+            partition_dir = table_dir / f"Character={character}"
+            if partition_dir.is_dir():
+                moved_dir = table_dir / f".{partition_dir.name}.{uuid.uuid4().hex}.old"
+                partition_dir.rename(moved_dir)
+                moved_dirs[partition_dir] = moved_dir
+
+        main_logger.info("Replacing partitions of %s...", table_name)
+        try:
+            yield
+        except BaseException:
+            for partition_dir, moved_dir in moved_dirs.items():
+                shutil.rmtree(partition_dir, ignore_errors=True)
+                moved_dir.rename(partition_dir)
+            raise
+
+        for moved_dir in moved_dirs.values():
+            shutil.rmtree(moved_dir, ignore_errors=True)
+
+    def _write_table(self, table, file_path: Path) -> None:
+        """
+        Write an Arrow table to a file.
+        :param table: pyarrow Table
+        :param file_path: File to write
+        :return: None
+        """
+        raise NotImplementedError("_write_table method is not implemented")
+
+    def create_dmg_summary(self, view_name: str, stage_table_name: str) -> None:
+        main_logger.info(
+            "%s results of %s are not summarized into %s",
+            self.__class__.__name__,
+            stage_table_name,
+            view_name,
+        )
+
+    def refresh_dmg_summary(self, view_name: str, stage_table_name: str) -> None:
+        self.create_dmg_summary(view_name, stage_table_name)
+
+    def create_ranking(
+        self, view_name: str, stage_table_name: str, order_by: str
+    ) -> None:
+        main_logger.info(
+            "%s results of %s are not ranked into %s",
+            self.__class__.__name__,
+            stage_table_name,
+            view_name,
+        )
+
+
+class ParquetSink(FileSink):
+    """Store results in a Parquet dataset partitioned by Path and character"""
+
+    file_extension = ".parquet"
+
+    def __init__(self, output_dir: str = DEFAULT_OUTPUT_DIR):
+        super().__init__(output_dir)
+        import pyarrow.parquet
+
+        self.pq = pyarrow.parquet
+
+    def _write_table(self, table, file_path: Path) -> None:
+        self.pq.write_table(table, file_path)
+
+
+class ArrowSink(FileSink):
+    """Store results in Arrow IPC files partitioned by Path and character"""
+
+    file_extension = ".arrow"
+
+    def _write_table(self, table, file_path: Path) -> None:
+        with self.pa.ipc.new_file(file_path, table.schema) as writer:
+            writer.write_table(table)
+
+
+def create_sink(sink_name: str = "postgres", output: str | None = None) -> ResultSink:
+    """
+    Create the sink that simulation results are stored in.
+    :param sink_name: One of postgres, sqlite, parquet and arrow
+    :param output: SQLite database file, or directory of Parquet and Arrow IPC files.
+                   Defaults to simulation_results.db or simulation_results.
+    :return: Result sink
+    """
+    main_logger.info("Creating %s result sink...", sink_name)
+    if sink_name == "postgres":
+        return PostgresSink()
+    if sink_name == "sqlite":
+        return SQLiteSink(output or DEFAULT_SQLITE_PATH)
+    if sink_name == "parquet":
+        return ParquetSink(output or DEFAULT_OUTPUT_DIR)
+    if sink_name == "arrow":
+        return ArrowSink(output or DEFAULT_OUTPUT_DIR)
+    raise ValueError(f"Unknown sink {sink_name}, expected one of {SINK_NAMES}")
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,146 @@
+#    Copyright 2024 Sakan Nirattisaykul
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+import random
+import zlib
+from bisect import bisect
+from itertools import accumulate, chain
+from typing import Iterator, Sequence, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+class BufferedRandom:
+    """
+    Random number source that draws uniforms from NumPy in blocks and hands them out one by one.
+    It has the random, choice, choices and randint methods of random.Random
+    that the characters use, all drawing from the buffered uniforms.
+    Blocks start small and double up to max_block_size,
+    since a battle only draws tens to hundreds of numbers.
+    """
+
+    FIRST_BLOCK_SIZE = 64
+    MAX_BLOCK_SIZE = 4096
+
+    def __init__(
+        self,
+        seed_sequence: np.random.SeedSequence | None = None,
+        max_block_size: int = MAX_BLOCK_SIZE,
+    ):
+        self.bit_generator = np.random.PCG64(seed_sequence)
+        self.max_block_size = max_block_size
+        self._init_cursor()
+
+    def _init_cursor(self) -> None:
+        """Start handing out uniforms from a new block."""
+        # the cursor is a C-level iterator, so a draw doesn't run any Python code
+        # apart from refilling a block
+        self._next_uniform = chain.from_iterable(self._blocks()).__next__
+        # bind the cursor on the instance too, so rng.random() skips the method call
+        self.random = self._next_uniform
+
+    def _blocks(self) -> Iterator[list[float]]:
+        """
+        Draw blocks of uniforms in [0, 1).
+        :return: Blocks of uniforms, doubling in size up to max_block_size.
+        """
+        generator = np.random.Generator(self.bit_generator)
+        block_size = min(self.FIRST_BLOCK_SIZE, self.max_block_size)
+        while True:
+            yield generator.random(block_size).tolist()
+            block_size = min(block_size * 2, self.max_block_size)
+
+    def random(self) -> float:
+        """
+        Draw a uniform in [0, 1) from the buffered blocks.
+        Each instance binds the block cursor as its random attribute,
+        so this method only runs when called through the class, e.g., from a subclass.
+        :return: Random float.
+        """
+        return self._next_uniform()
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """
+        Choose a random element from a non-empty sequence.
+        :param seq: Sequence to choose from.
+        :return: Random element.
+        """
+        return seq[int(self.random() * len(seq))]
+
+    def randint(self, a: int, b: int) -> int:
+        """
+        Draw a random integer in [a, b], including both end points.
+        :param a: Lowest integer.
+        :param b: Highest integer.
+        :return: Random integer.
+        """
+        return a + int(self.random() * (b - a + 1))
+
+    def choices(
+        self,
+        population: Sequence[T],
+        weights: Sequence[float] | None = None,
+        *,
+        k: int = 1,
+    ) -> list[T]:
+        """
+        Choose k elements from a population with replacement.
+        :param population: Sequence to choose from.
+        :param weights: Relative weights of the elements, or None for equal weights.
+        :param k: Number of elements to choose.
+        :return: List of random elements.
+        """
+        if weights is None:
+            return [self.choice(population) for _ in range(k)]
+
+        cum_weights = list(accumulate(weights))
+        total = cum_weights[-1]
+        return [
+            population[bisect(cum_weights, self.random() * total)] for _ in range(k)
+        ]
+
+    def __getstate__(self) -> dict:
+        # the cursor can't be pickled, so uniforms left in the current block are discarded
+        state = self.__dict__.copy()
+        del state["_next_uniform"]
+        del state["random"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._init_cursor()
+
+
+def create_battle_rng(
+    seed: int | None, character_name: str, battle_index: int
+) -> BufferedRandom:
+    """
+    Create the random number source of one battle.
+    With a seed, the source is derived from the seed, the character's name and the battle index,
+    so a battle's random stream doesn't depend on which process or chunk simulates it.
+    :param seed: Master seed of the simulation run, or None for a non-reproducible source.
+    :param character_name: Name of the simulated character.
+    :param battle_index: Simulation index of the battle.
+    :return: Random number source.
+    """
+    if seed is None:
+        # seeding from the global generator is cheaper than from the OS, and worker processes reseed it
+        return BufferedRandom(np.random.SeedSequence(random.getrandbits(128)))
+
+    return BufferedRandom(
+        np.random.SeedSequence(
+            seed, spawn_key=(zlib.crc32(character_name.encode()), battle_index)
+        )
+    )
@@ -0,0 +1,254 @@
+#    Copyright 2024 Sakan Nirattisaykul
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+from hsr_simulation.battle_record import BattleRecordBuffer
+from hsr_simulation.character import Character
+from hsr_simulation.configure_logging import main_logger
+from hsr_simulation.counters import run_counters
+from hsr_simulation.process_pool import create_process_pool, run_bounded
+from hsr_simulation.profiling import (
+    collect_profiled_result,
+    profile_character,
+    profile_iter,
+    profile_task,
+)
+from hsr_simulation.result_cache import ResultCache
+from hsr_simulation.result_sink import ResultSink
+from hsr_simulation.simulate_battles import (
+    DEFAULT_CHUNK_SIZE,
+    simulate_battles_to_buffer,
+    split_simulation_range,
+    stream_simulations_for_character,
+)
+from hsr_simulation.simulate_cycles import BattleSimulator
+from hsr_simulation.utils import process_result_list
+
+
+def process_record_buffer(
+    character: Character,
+    record_buffer: BattleRecordBuffer,
+    stage_table_name: str,
+    sink: ResultSink | None = None,
+    cache: ResultCache | None = None,
+    cache_key: str | None = None,
+) -> None:
+    """
+    Add a chunk of a character's battles to the run's counters,
+    write it to the character's cache entry, and load it to the stage table.
+    :param character: Character of the battles
+    :param record_buffer: Record buffer of the chunk
+    :param stage_table_name: Stage table name
+    :param sink: Where the results are stored, PostgreSQL if not provided
+    :param cache: Cache the chunk is written to, or None not to cache it
+    :param cache_key: Key of the character's cache entry
+    :return: None
+    """
+    run_counters.add(
+        character.__class__.__name__,
+        record_buffer.counters,
+        record_buffer.battle_count,
+    )
+    if cache is not None:
+        cache.write_part(cache_key, record_buffer)
+    process_result_list(character, record_buffer, stage_table_name, sink=sink)
+
+
+def reload_cached_characters(
+    char_list: list[Character],
+    simulation_num: int,
+    max_cycles: int,
+    stage_table_name: str,
+    aggregate_only: bool,
+    seed: int | None,
+    sink: ResultSink | None,
+    cache: ResultCache,
+) -> dict[Character, str]:
+    """
+    Load the cached results of the characters that have them to the stage table.
+    :param char_list: Characters to simulate
+    :param simulation_num: Number of battles to simulate for each character
+    :param max_cycles: Max number of cycles to simulate
+    :param stage_table_name: Stage table name
+    :param aggregate_only: Whether to load each battle's total damage of each DMG Type only
+    :param seed: Master seed of the run
+    :param sink: Where the results are stored, PostgreSQL if not provided
+    :param cache: Cache of the results
+    :return: Cache key of each character that still needs to be simulated
+    """
+    cache_keys: dict[Character, str] = {}
+    for character in char_list:
+        char_name = character.__class__.__name__
+        cache_key = cache.get_key(
+            character, simulation_num, max_cycles, seed, aggregate_only
+        )
+        if not cache.has(cache_key):
+            cache_keys[character] = cache_key
+            continue
+
+        main_logger.info("Reloading cached results of %s...", char_name)
+        with profile_character(char_name):
+            for record_buffer in cache.load(cache_key):
+                process_record_buffer(character, record_buffer, stage_table_name, sink)
+    return cache_keys
+
+
+def run_character_simulations(
+    char_list: list[Character],
+    simulation_num: int,
+    max_cycles: int,
+    stage_table_name: str,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    aggregate_only: bool = False,
+    seed: int | None = None,
+    sink: ResultSink | None = None,
+    cache: ResultCache | None = None,
+) -> None:
+    """
+    Simulate battles for every character in the list and load the results to the stage table.
+
+    Battles are simulated in chunks of at most chunk_size battles,
+    and each chunk is loaded to the stage table as soon as it is done,
+    so memory is bounded by the chunk size rather than the number of battles.
+
+    When there are at least as many characters as workers, the chunks of every character
+    run as tasks on one process pool, with at most two chunks per worker in flight.
+    Results are streamed back as they complete, each character's chunks in the order of their simulation indices,
+    and loaded to the stage table by this process only.
+    Otherwise, characters run one after another with their chunks spread across the workers.
+
+    With a seed, each battle draws from its own generator derived from the seed,
+    so the results don't depend on the number of workers or the chunk size.
+
+    With aggregate_only, only each battle's total damage of each DMG Type is loaded,
+    instead of the damage of every hit.
+
+    The counters of every chunk are added to run_counters.
+
+    With a cache and a seed, characters whose source, default stats and simulation parameters
+    haven't changed since they were cached are reloaded from the cache instead of simulated,
+    and the results of the other characters are cached once all their chunks are done.
+    Unseeded runs aren't cached, since their battles aren't reproducible.
+    :param char_list: Characters to simulate
+    :param simulation_num: Number of battles to simulate for each character
+    :param max_cycles: Max number of cycles to simulate
+    :param stage_table_name: Stage table name
+    :param workers: Number of worker processes
+    :param chunk_size: Max number of battles loaded to the stage table at once
+    :param aggregate_only: Whether to load each battle's total damage of each DMG Type only
+    :param seed: Master seed that makes the battles reproducible, or None for random battles
+    :param sink: Where the results are stored, PostgreSQL if not provided
+    :param cache: Cache of each character's results, or None to always simulate
+    :return: None
+    """
+    for character in char_list:
+        character.seed = seed
+
+    if cache is not None and seed is None:
+        main_logger.warning(
+            "Results aren't cached or reloaded without a seed, since the battles aren't reproducible"
+        )
+        cache = None
+
+    cache_keys: dict[Character, str] = {}
+    if cache is not None:
+        cache_keys = reload_cached_characters(
+            char_list,
+            simulation_num,
+            max_cycles,
+            stage_table_name,
+            aggregate_only,
+            seed,
+            sink,
+            cache,
+        )
+        char_list = list(cache_keys)
+
+    try:
+        if workers <= 1 or len(char_list) < workers:
+            for character in char_list:
+                char_name = character.__class__.__name__
+                with profile_character(char_name):
+                    record_buffers = stream_simulations_for_character(
+                        character,
+                        max_cycles,
+                        simulation_num,
+                        workers,
+                        chunk_size,
+                        aggregate_only,
+                    )
+                    for record_buffer in profile_iter(
+                        record_buffers,
+                        "battle_simulation",
+                        lambda _, name=char_name: name,
+                    ):
+                        process_record_buffer(
+                            character,
+                            record_buffer,
+                            stage_table_name,
+                            sink,
+                            cache,
+                            cache_keys.get(character),
+                        )
+                if cache is not None:
+                    cache.commit(cache_keys[character])
+            return
+
+        main_logger.info(
+            "Scheduling %s characters across %s workers...", len(char_list), workers
+        )
+        chunks = split_simulation_range(simulation_num, chunk_size)
+        tasks = (
+            (
+                character,
+                *profile_task(
+                    character.__class__.__name__,
+                    simulate_battles_to_buffer,
+                    (
+                        character,
+                        BattleSimulator.initialize_summon(character, None),
+                        max_cycles,
+                        chunk,
+                        aggregate_only,
+                    ),
+                ),
+            )
+            for character in char_list
+            for chunk in chunks
+        )
+        with create_process_pool(workers) as executor:
+            # the time spent waiting for a chunk counts towards the character of the chunk
+            results = profile_iter(
+                run_bounded(executor, tasks, workers * 2),
+                "battle_simulation",
+                lambda result: result[0].__class__.__name__,
+            )
+            for character, result in results:
+                record_buffer = collect_profiled_result(
+                    character.__class__.__name__, result
+                )
+                process_record_buffer(
+                    character,
+                    record_buffer,
+                    stage_table_name,
+                    sink,
+                    cache,
+                    cache_keys.get(character),
+                )
+        if cache is not None:
+            for cache_key in cache_keys.values():
+                cache.commit(cache_key)
+    finally:
+        if cache is not None:
+            # a character that failed part way through is simulated again next time
+            cache.discard_pending()
@@ -13,49 +13,220 @@
 #    limitations under the License.
 
 
-from typing import Any, List, Dict
-
-import numpy as np
+from typing import Any, Dict, Iterable, Iterator, List
 
+from hsr_simulation.battle_record import BattleRecordBuffer
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
+from hsr_simulation.process_pool import create_process_pool, run_bounded
+from hsr_simulation.profiling import collect_profiled_result, profile_task
 from hsr_simulation.simulate_cycles import (
+    BattleSimulator,
     simulate_cycles,
     simulate_cycles_for_character_with_summon,
 )
 
+# Number of battles simulated and flushed together when streaming results
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def simulate_battles_to_buffer(
+    character: Character,
+    summon: Character | None,
+    max_cycles: int,
+    sim_indices,
+    aggregate_only: bool = False,
+) -> BattleRecordBuffer:
+    """
+    Simulate battles, appending every battle's data to one record buffer.
+    :param character: Character to simulate
+    :param summon: Summon of the given character, or None if the character has no summon
+    :param max_cycles: Max number of cycles to simulate
+    :param sim_indices: Simulation indices of the battles
+    :param aggregate_only: Whether to record each battle's total damage of each DMG Type
+                           instead of the damage of every hit
+    :return: Record buffer containing the damage of every battle.
+    """
+    record_buffer = BattleRecordBuffer(aggregate=aggregate_only)
+    character.record_buffer = record_buffer
+    try:
+        # each battle's data is dropped once it is in the buffer, rather than collected
+        if summon is None:
+            for i in sim_indices:
+                simulate_cycles(character, max_cycles, int(i))
+        else:
+            for i in sim_indices:
+                simulate_cycles_for_character_with_summon(
+                    character, summon, max_cycles, int(i)
+                )
+    finally:
+        character.record_buffer = None
+
+    return record_buffer
+
+
+def split_simulation_range(simulation_num: int, chunk_size: int) -> list[range]:
+    """
+    Split simulation indices into contiguous ranges of at most chunk_size battles.
+    :param simulation_num: Number of battles to simulate
+    :param chunk_size: Max number of battles in a range
+    :return: Ranges of simulation indices in order.
+    """
+    chunk_size = max(chunk_size, 1)
+    return [
+        range(start, min(start + chunk_size, simulation_num))
+        for start in range(0, simulation_num, chunk_size)
+    ]
+
+
+def stream_simulations(
+    character: Character,
+    summon: Character | None,
+    max_cycles: int,
+    simulation_num: int,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    aggregate_only: bool = False,
+) -> Iterator[BattleRecordBuffer]:
+    """
+    Simulate battles for a character and the given summon in chunks, yielding a record buffer per chunk.
+    Each chunk can be loaded and dropped before the next ones are simulated,
+    so memory is bounded by the chunk size rather than the number of battles.
+    Chunks are yielded in the order of their simulation indices, with any number of workers,
+    and at most two chunks per worker are held at once.
+    :param character: Character to simulate
+    :param summon: Summon of the given character, or None if the character has no summon
+    :param max_cycles: Max number of cycles to simulate
+    :param simulation_num: Number of battles to simulate
+    :param workers: Number of worker processes. Battles run serially if it is 1.
+    :param chunk_size: Max number of battles in a chunk
+    :param aggregate_only: Whether to record each battle's total damage of each DMG Type
+                           instead of the damage of every hit
+    :return: Record buffer of each chunk of battles.
+    """
+    chunks = split_simulation_range(simulation_num, chunk_size)
+
+    if workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield simulate_battles_to_buffer(
+                character, summon, max_cycles, chunk, aggregate_only
+            )
+        return
+
+    char_name = character.__class__.__name__
+    # every chunk has the same key, so run_bounded yields them in order
+    tasks = (
+        (
+            char_name,
+            *profile_task(
+                char_name,
+                simulate_battles_to_buffer,
+                (character, summon, max_cycles, chunk, aggregate_only),
+            ),
+        )
+        for chunk in chunks
+    )
+    with create_process_pool(min(workers, len(chunks))) as executor:
+        for _, result in run_bounded(executor, tasks, workers * 2):
+            yield collect_profiled_result(char_name, result)
+
+
+def stream_simulations_for_character(
+    character: Character,
+    max_cycles: int,
+    simulation_num: int,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    aggregate_only: bool = False,
+) -> Iterator[BattleRecordBuffer]:
+    """
+    Simulate battles for a character in chunks, along with their summon if they have one,
+    yielding a record buffer per chunk in the order of their simulation indices.
+    :param character: Character to simulate
+    :param max_cycles: Max number of cycles to simulate
+    :param simulation_num: Number of battles to simulate
+    :param workers: Number of worker processes. Battles run serially if it is 1.
+    :param chunk_size: Max number of battles in a chunk
+    :param aggregate_only: Whether to record each battle's total damage of each DMG Type
+                           instead of the damage of every hit
+    :return: Record buffer of each chunk of battles.
+    """
+    main_logger.info(
+        "Streaming battle simulations for %s in chunks of %s...",
+        character.__class__.__name__,
+        chunk_size,
+    )
+
+    summon = BattleSimulator.initialize_summon(character, None)
+    yield from stream_simulations(
+        character,
+        summon,
+        max_cycles,
+        simulation_num,
+        workers,
+        chunk_size,
+        aggregate_only,
+    )
+
+
+def split_chunk_size(simulation_num: int, workers: int) -> int:
+    """
+    Get a chunk size that gives every worker a chunk, up to the default chunk size.
+    :param simulation_num: Number of battles to simulate
+    :param workers: Number of worker processes
+    :return: Max number of battles in a chunk.
+    """
+    return max(min(DEFAULT_CHUNK_SIZE, -(-simulation_num // max(workers, 1))), 1)
+
+
+def collect_battle_data(
+    record_buffers: Iterable[BattleRecordBuffer], simulation_num: int
+) -> List[Dict[str, List[Any]]]:
+    """
+    Collect the data of each battle from record buffers yielded in the order of their simulation indices.
+    :param record_buffers: Record buffer of each chunk of battles
+    :param simulation_num: Number of battles simulated
+    :return: A list of Character's action details as a dictionary, in the order of simulation indices.
+    """
+    return BattleRecordBuffer.concat(record_buffers).to_battle_data(
+        range(simulation_num)
+    )
+
 
 def start_simulations(
-    character: Character, max_cycles: int, simulation_num: int
+    character: Character, max_cycles: int, simulation_num: int, workers: int = 1
 ) -> List[Dict[str, List[Any]]]:
     """
     Start battle simulations.
     :param character: Character to simulate
     :param max_cycles: Max number of cycles to simulate
     :param simulation_num: Number of battles to simulate
+    :param workers: Number of worker processes. Battles run serially if it is 1.
     :return: A list of Character's action details as a dictionary.
     """
     main_logger.info(
-        f"Starting battle simulations for {character.__class__.__name__}..."
+        "Starting battle simulations for %s...", character.__class__.__name__
     )
 
-    if simulation_num <= 0:
-        return []
-
-    # Use NumPy to create an array of simulation indices
-    sim_indices = np.arange(simulation_num)
-
-    # Use NumPy's vectorize with specified output type
-    vectorized_simulate = np.vectorize(
-        lambda i: simulate_cycles(character, max_cycles, i), otypes=[object]
+    return collect_battle_data(
+        stream_simulations(
+            character,
+            None,
+            max_cycles,
+            simulation_num,
+            workers,
+            split_chunk_size(simulation_num, workers),
+        ),
+        simulation_num,
     )
-    result_list = vectorized_simulate(sim_indices)
-
-    return result_list.tolist()
 
 
 def start_simulations_for_char_with_summon(
-    character: Character, summon, max_cycles: int, simulation_num: int
+    character: Character,
+    summon,
+    max_cycles: int,
+    simulation_num: int,
+    workers: int = 1,
 ) -> List[Dict[str, List[Any]]]:
     """
     Start battle simulations for Character and their Summon.
@@ -63,25 +234,23 @@ def start_simulations_for_char_with_summon(
     :param summon: Summon of the given character
     :param max_cycles: Max number of cycles to simulate
     :param simulation_num: The Number of battles to simulate
+    :param workers: Number of worker processes. Battles run serially if it is 1.
     :return: A list of Character's action details as a dictionary.
     """
     main_logger.info(
-        f"Start battle simulations for {character.__class__.__name__} and {summon.__class__.__name__}..."
+        "Start battle simulations for %s and %s...",
+        character.__class__.__name__,
+        summon.__class__.__name__,
     )
 
-    if simulation_num <= 0:
-        return []
-
-    # Use NumPy to create an array of simulation indices
-    sim_indices = np.arange(simulation_num)
-
-    # Use NumPy's vectorize with specified output type
-    vectorized_simulate = np.vectorize(
-        lambda i: simulate_cycles_for_character_with_summon(
-            character, summon, max_cycles, i
+    return collect_battle_data(
+        stream_simulations(
+            character,
+            summon,
+            max_cycles,
+            simulation_num,
+            workers,
+            split_chunk_size(simulation_num, workers),
         ),
-        otypes=[object],
+        simulation_num,
     )
-    result_list = vectorized_simulate(sim_indices)
-
-    return result_list.tolist()
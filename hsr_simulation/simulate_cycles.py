@@ -11,66 +11,18 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import random
 from typing import Any, Dict, List
 
 
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
-from hsr_simulation.destruction.firefly import FireFly
-from hsr_simulation.destruction.xueyi import Xueyi
-from hsr_simulation.erudition.jingyuan import Jingyuan
-from hsr_simulation.erudition.rappa import Rappa
-from hsr_simulation.hunt.boothill import Boothill
-from hsr_simulation.hunt.march7th_hunt import March7thHunt
-from hsr_simulation.hunt.topaz import Topaz
-from hsr_simulation.nihility.acheron import Acheron
-from hsr_simulation.nihility.black_swan import BlackSwan
-from hsr_simulation.nihility.fugue import Fugue
-from hsr_simulation.nihility.jiaoqiu import Jiaoqiu
-from hsr_simulation.nihility.luka import Luka
+from hsr_simulation.rng import create_battle_rng
 from hsr_simulation.simulate_turns import (
     simulate_turns,
     simulate_turns_for_char_with_summon,
 )
 
 
-class CharacterStatsInitializer:
-    @staticmethod
-    def initialize_stats(character: Character) -> None:
-        """
-        Initialize character-specific stats based on character type.
-
-        This method sets up initial stats and effects for different characters based on their class type.
-        For example, it sets break effects for Boothill/Fugue, effect hit rates for Black Swan, etc.
-
-        :param character: The character instance to initialize stats for
-        :type character: Character
-        :return: None
-        :rtype: None
-        """
-        stats_handlers = {
-            (Boothill, Fugue): lambda c: c.set_break_effect(1, 3),
-            BlackSwan: lambda c: c.set_effect_hit_rate(0, 1.2),
-            Acheron: lambda c: c.random_nihility_teammate(),
-            March7thHunt: lambda c: c.set_shifu(),
-            Luka: lambda c: c.random_enemy_hp(),
-            Jiaoqiu: lambda c: c.set_effect_hit_rate(0, 1.4),
-            FireFly: lambda c: c.set_break_effect(1, 3.6),
-            Xueyi: lambda c: c.set_break_effect(1, 2.4),
-            Rappa: lambda c: setattr(c, "atk", random.choice([2400, 3200])),
-        }
-
-        for char_types, handler in stats_handlers.items():
-            if isinstance(char_types, tuple):
-                if any(isinstance(character, char_type) for char_type in char_types):
-                    handler(character)
-                    break
-            elif isinstance(character, char_types):
-                handler(character)
-                break
-
-
 class BattleSimulator:
     @staticmethod
     def calculate_cycles_action_value(max_cycles: int) -> int:
@@ -100,7 +52,61 @@ class BattleSimulator:
         :return: None
         :rtype: None
         """
-        character.data["Simulate Round No."] = [simulate_round for _ in range(row_num)]
+        character.data["Simulate Round No."] = [simulate_round] * row_num
+
+    @staticmethod
+    def record_battle_data(character: Character, simulate_round: int) -> None:
+        """
+        Record the battle's data.
+        It is appended to the character's record buffer along with the battle's counters
+        if the character has one, otherwise the "Simulate Round No." column of the character's data is filled.
+        When the record buffer aggregates, the character's total damage and number of hits
+        of each DMG Type are appended.
+
+        :param character: Character to record data for
+        :type character: Character
+        :param simulate_round: Current simulation round number
+        :type simulate_round: int
+        :return: None
+        :rtype: None
+        """
+        if character.dmg_totals is not None:
+            character.record_buffer.append_battle_totals(
+                character.dmg_totals,
+                character.dmg_type_hit_counts,
+                simulate_round,
+                character.get_counters(),
+            )
+        elif character.record_buffer is not None:
+            character.record_buffer.append_battle(
+                character.data["DMG"],
+                character.data["DMG_Type"],
+                simulate_round,
+                character.get_counters(),
+            )
+        else:
+            BattleSimulator.prepare_simulation_data(
+                character, simulate_round, len(character.data["DMG"])
+            )
+
+    @staticmethod
+    def start_battle(character: Character, simulate_round: int) -> None:
+        """
+        Give the character the random number generator of the battle, then reset the character.
+        It is the only reset of each battle, and it draws the battle's random starting state
+        from the battle's own generator, so the battle doesn't depend on the battles simulated before it.
+
+        :param character: Character to start the battle for
+        :type character: Character
+        :param simulate_round: Current simulation round number
+        :type simulate_round: int
+        :return: None
+        :rtype: None
+        """
+        character.rng = create_battle_rng(
+            character.seed, character.__class__.__name__, simulate_round
+        )
+        character.reset_character_data_for_each_battle()
 
     @staticmethod
     def simulate_regular_battle(
@@ -111,7 +117,7 @@ class BattleSimulator:
 
         This method simulates a battle for characters without summons. It:
         1. Calculates total action value based on cycles
-        2. Initializes character stats
+        2. Resets the character and initializes character stats
         3. Simulates turns
         4. Prepares and returns battle data
 
@@ -124,47 +130,42 @@ class BattleSimulator:
         :return: Dictionary containing battle simulation data
         :rtype: Dict[str, List[Any]]
         """
-        main_logger.info(f"Simulating turns for {character.__class__.__name__}...")
+        main_logger.info("Simulating turns for %s...", character.__class__.__name__)
 
         cycles_action_val = BattleSimulator.calculate_cycles_action_value(max_cycles)
-        main_logger.debug(f"Total cycles action value: {cycles_action_val}")
+        main_logger.debug("Total cycles action value: %s", cycles_action_val)
 
-        CharacterStatsInitializer.initialize_stats(character)
+        BattleSimulator.start_battle(character, simulate_round)
+        character.on_battle_init()
         character.start_battle()
 
         char_turn_count = simulate_turns(character, cycles_action_val)
         main_logger.debug(
-            f"Total number of {character.__class__.__name__} turns: {char_turn_count}"
+            "Total number of %s turns: %s",
+            character.__class__.__name__,
+            char_turn_count,
         )
 
-        BattleSimulator.prepare_simulation_data(
-            character, simulate_round, len(character.data["DMG"])
-        )
-        data_dict = character.data
-        character.reset_character_data_for_each_battle()
-
-        return data_dict
+        BattleSimulator.record_battle_data(character, simulate_round)
+        return character.data
 
     @staticmethod
-    def initialize_summon(character: Character, summon: Character) -> Character:
+    def initialize_summon(
+        character: Character, summon: Character | None
+    ) -> Character | None:
         """
-        Initialize summon based on character type.
+        Initialize the summon the character creates, if the character has one.
 
         :param character: Main character that summons
         :type character: Character
         :param summon: Summon character to initialize
         :type summon: Character
-        :return: Initialized summon character
-        :rtype: Character
+        :return: Initialized summon character, or the given summon if the character has none
+        :rtype: Character | None
         """
-        summon_initializers = {
-            Topaz: lambda c: c.summon_numby(c),
-            Jingyuan: lambda c: c.summon_lightning_lord(c),
-        }
-
-        for char_type, initializer in summon_initializers.items():
-            if isinstance(character, char_type):
-                return initializer(character)
+        created_summon = character.create_summon()
+        if created_summon is not None:
+            return created_summon
         return summon
 
     @staticmethod
@@ -176,7 +177,7 @@ class BattleSimulator:
 
         This method simulates a battle for characters with summons. It:
         1. Calculates total action value based on cycles
-        2. Initializes the summon
+        2. Resets the character and initializes the summon
         3. Simulates turns for both character and summon
         4. Prepares and returns battle data
 
@@ -192,33 +193,40 @@ class BattleSimulator:
         :rtype: Dict[str, List[Any]]
         """
         main_logger.info(
-            f"Simulating turns for {character.__class__.__name__} and {summon.__class__.__name__}..."
+            "Simulating turns for %s and %s...",
+            character.__class__.__name__,
+            summon.__class__.__name__,
         )
 
         cycles_action_val = BattleSimulator.calculate_cycles_action_value(max_cycles)
-        main_logger.debug(f"Total cycles action value: {cycles_action_val}")
+        main_logger.debug("Total cycles action value: %s", cycles_action_val)
 
+        BattleSimulator.start_battle(character, simulate_round)
+        character.on_battle_init()
         summon = BattleSimulator.initialize_summon(character, summon)
+        # the summon's random draws belong to the character's battle
+        summon.rng = character.rng
         character.start_battle()
 
         summon_turn_count, char_turn_count = simulate_turns_for_char_with_summon(
-            cycles_action_val, cycles_action_val, summon, False, character, False
+            cycles_action_val, summon, character
         )
 
         main_logger.debug(
-            f"Total number of {character.__class__.__name__} turns: {char_turn_count}"
+            "Total number of %s turns: %s",
+            character.__class__.__name__,
+            char_turn_count,
         )
         main_logger.debug(
-            f"Total number of {summon.__class__.__name__} turns: {summon_turn_count}"
-        )
-
-        BattleSimulator.prepare_simulation_data(
-            character, simulate_round, len(character.data["DMG"])
+            "Total number of %s turns: %s",
+            summon.__class__.__name__,
+            summon_turn_count,
         )
-        data_dict = character.data
-        character.reset_character_data_for_each_battle()
 
-        return data_dict
+        # the summon's events count towards the character
+        character.add_counters(summon)
+        BattleSimulator.record_battle_data(character, simulate_round)
+        return character.data
 
 
 def simulate_cycles(
@@ -12,6 +12,9 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+from functools import lru_cache
+
+from hsr_simulation.action_timeline import ActionTimeline
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 
@@ -26,17 +29,20 @@ def process_character_turn(character: Character, cycles_action_val: float) -> fl
     char_action_val = character.calculate_action_value(character.speed)
     cycles_action_val -= char_action_val
 
+    character.action_count += 1
     character.take_action()
 
     # simulate Action Forward
     main_logger.debug(
-        f"{character.__class__.__name__} current speed: {character.speed}"
+        "%s current speed: %s", character.__class__.__name__, character.speed
     )
     char_action_val_to_be_added: float = float(
         sum(character.char_action_value_for_action_forward)
     )
     main_logger.debug(
-        f"{character.__class__.__name__} action value to be added: {char_action_val_to_be_added}"
+        "%s action value to be added: %s",
+        character.__class__.__name__,
+        char_action_val_to_be_added,
     )
 
     # Ensure that the character action value to be added does not exceed
@@ -47,23 +53,94 @@ def process_character_turn(character: Character, cycles_action_val: float) -> fl
     return cycles_action_val
 
 
+@lru_cache(maxsize=256)
+def get_constant_speed_timeline(
+    action_value_base: float, speed: float, cycles_action_val: float
+) -> tuple[float, tuple[float, ...]]:
+    """
+    Get the turn timeline of a character whose speed doesn't change in battle,
+    and who doesn't get Action Forward.
+    It is cached, so it is calculated once and reused across battles.
+    :param action_value_base: Action value base of the character.
+    :param speed: Character's speed.
+    :param cycles_action_val: Cycles action value.
+    :return: Character's action value, and the cycles action value left after each turn.
+    """
+    char_action_val = action_value_base / speed
+    timeline = []
+    while cycles_action_val > 0 and cycles_action_val >= char_action_val:
+        cycles_action_val -= char_action_val
+        timeline.append(cycles_action_val)
+    return char_action_val, tuple(timeline)
+
+
+def simulate_constant_speed_turns(
+    character: Character, cycles_action_val: float
+) -> tuple[int, float, bool]:
+    """
+    Simulate the character's turns from the constant speed timeline,
+    until the character's speed changes or the character gets Action Forward.
+    :param character: Character to simulate.
+    :param cycles_action_val: Cycles action value.
+    :return: Character's turns, cycles action value left,
+    and whether the rest of the turns have to be simulated turn by turn.
+    """
+    speed = character.speed
+    char_action_val, timeline = get_constant_speed_timeline(
+        character.ACTION_VALUE_BASE, speed, cycles_action_val
+    )
+
+    char_turn_count: int = 0
+    for cycles_action_val_left in timeline:
+        character.char_action_value = char_action_val
+        character.action_count += 1
+        character.take_action()
+        cycles_action_val = cycles_action_val_left
+        char_turn_count += 1
+
+        if character.speed != speed or character.char_action_value_for_action_forward:
+            # simulate Action Forward the same way process_character_turn does
+            char_action_val_to_be_added: float = float(
+                sum(character.char_action_value_for_action_forward)
+            )
+            cycles_action_val += min(char_action_val_to_be_added, char_action_val)
+            return char_turn_count, cycles_action_val, True
+
+    return char_turn_count, cycles_action_val, False
+
+
 def simulate_turns(character: Character, cycles_action_val: float) -> int:
     """
-    Simulate the character's turns
+    Simulate the character's turns.
+    Turns are taken from the constant speed timeline,
+    until the character's speed changes or the character gets Action Forward.
     :param character: Character to simulate.
     :param cycles_action_val: Cycles action value.
     :return: Character's turns.
     """
-    main_logger.info(f"Simulate turns for {character.__class__.__name__}...")
+    main_logger.info("Simulate turns for %s...", character.__class__.__name__)
 
-    char_turn_count: int = 0
+    char_turn_count, cycles_action_val, timeline_changed = (
+        simulate_constant_speed_turns(character, cycles_action_val)
+    )
+    if not timeline_changed:
+        return char_turn_count
+
+    main_logger.debug(
+        "%s speed or action value changed, simulating the rest of the turns one by one...",
+        character.__class__.__name__,
+    )
     while cycles_action_val > 0:
         char_spd: float = character.speed
-        main_logger.debug(f"{character.__class__.__name__} current speed: {char_spd}")
+        main_logger.debug(
+            "%s current speed: %s", character.__class__.__name__, char_spd
+        )
 
         char_action_val = character.calculate_action_value(char_spd)
         main_logger.debug(
-            f"{character.__class__.__name__} current action value: {char_action_val}"
+            "%s current action value: %s",
+            character.__class__.__name__,
+            char_action_val,
         )
 
         if cycles_action_val < char_action_val:
@@ -76,90 +153,27 @@ def simulate_turns(character: Character, cycles_action_val: float) -> int:
 
 
 def simulate_turns_for_char_with_summon(
-    cycles_action_value_for_summon: float,
-    cycles_action_value_for_char: float,
-    summon: Character,
-    summon_end: bool,
-    character: Character,
-    character_end: bool,
+    cycles_action_val: float, summon: Character, character: Character
 ) -> tuple[int, int]:
     """
-    Simulate turns for Character and their summon.
-    :param cycles_action_value_for_summon: Cycles action value of Summon.
-    :param cycles_action_value_for_char: Cycles action value of Character.
+    Simulate turns for Character and their summon on a shared action timeline.
+    :param cycles_action_val: Cycles action value.
     :param summon: Summoned character
-    :param summon_end: Whether Summon's cycles end
     :param character: Character
-    :param character_end: Whether Character's cycles end
     :return: Summon and Character turn count
     """
     main_logger.info(
-        f"Simulating turns for {summon.__class__.__name__} and {character.__class__.__name__}..."
+        "Simulating turns for %s and %s...",
+        summon.__class__.__name__,
+        character.__class__.__name__,
     )
 
-    character_turn_count: int = 0
-    summon_turn_count: int = 0
-    while True:
-        if character_end and summon_end:
-            break
-        else:
-            if not character_end:
-                character_speed: float = character.speed
-                main_logger.debug(
-                    f"{character.__class__.__name__} speed: {character_speed}"
-                )
-                character_action_value = character.calculate_action_value(
-                    character_speed
-                )
-                main_logger.debug(
-                    f"{character.__class__.__name__} action value: {character_action_value}"
-                )
-
-                # calculate whether the Character has turns left
-                if cycles_action_value_for_char >= character_action_value:
-                    cycles_action_value_for_char = process_character_turn(
-                        character, cycles_action_value_for_char
-                    )
-                    character_turn_count += 1
-                else:
-                    character_end = True
-
-            if not summon_end:
-                main_logger.debug(f"{summon.__class__.__name__} speed: {summon.speed}")
-                summon_action_val: float = summon.calculate_action_value(summon.speed)
-                main_logger.debug(
-                    f"{summon.__class__.__name__} action value: {summon_action_val}"
-                )
-
-                # calculate whether Summon has turns left
-                if cycles_action_value_for_summon >= summon_action_val:
-                    cycles_action_value_for_summon -= summon_action_val
-                    summon_turn_count += 1
-
-                    summon.take_action()
-
-                    # simulate Action Forward
-                    main_logger.debug(
-                        f"{summon.__class__.__name__} current speed: {summon.speed}"
-                    )
-                    char_action_val_to_be_added: float = float(
-                        sum(summon.summon_action_value_for_action_forward)
-                    )
-                    main_logger.debug(
-                        f"{summon.__class__.__name__} action value to be added: {char_action_val_to_be_added}"
-                    )
-                    cycles_action_value_for_summon += char_action_val_to_be_added
-
-                    # ensure it Summon's cycles action value not exceed Character's current cycles action value
-                    cycles_action_value_for_summon: float = min(
-                        cycles_action_value_for_summon, cycles_action_value_for_char
-                    )
-
-                    # reset summon stats
-                    summon.reset_summon_stat_for_each_turn()
-                else:
-                    summon_end = True
-    return summon_turn_count, character_turn_count
+    timeline = ActionTimeline(cycles_action_val)
+    character_index = timeline.add_actor(character)
+    summon_index = timeline.add_actor(summon, is_summon=True)
+    turn_counts = timeline.run()
+
+    return turn_counts[summon_index], turn_counts[character_index]
 
 
 if __name__ == "__main__":
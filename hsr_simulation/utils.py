@@ -11,34 +11,53 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
+from contextlib import nullcontext
+from typing import ContextManager, TypeVar
 
+import numpy as np
 import pandas as pd
 
+from hsr_simulation.battle_record import BattleRecordBuffer
 from hsr_simulation.character import Character
 from hsr_simulation.configure_logging import main_logger
 from hsr_simulation.data_transformer import create_df_from_dict_list
 from hsr_simulation.postgre import load_df_to_stage_table
+from hsr_simulation.profiling import profile_phase
+from hsr_simulation.result_sink import ResultSink
+
+T = TypeVar("T")
 
 
 def process_result_list(
-    character: Character, dict_list: list, stage_table_name: str
+    character: Character,
+    dict_list: list | BattleRecordBuffer,
+    stage_table_name: str,
+    sink: ResultSink | None = None,
 ) -> None:
     """
     Process a list of results by extracting total damage, calculating the average damage,
     converting the results into a DataFrame, adding the character's name to the DataFrame,
     and loading the DataFrame into a specified stage table in a database.
     :param character: Character class
-    :param dict_list: A list of dictionary that contains action details of the given character.
+    :param dict_list: A list of dictionary that contains action details of the given character,
+                    or a record buffer.
     :param stage_table_name: Stage table name
+    :param sink: Where the results are stored, PostgreSQL if not provided
     :return: None
     """
-    main_logger.info(f"Processing result list of {character.__class__.__name__}...")
+    main_logger.info("Processing result list of %s...", character.__class__.__name__)
 
-    df: pd.DataFrame = create_df_from_dict_list(dict_list)
+    char_name = character.__class__.__name__
+    with profile_phase("transform", char_name):
+        df: pd.DataFrame = create_df_from_dict_list(dict_list)
 
-    add_char_name_to_df(character, df)
+        add_char_name_to_df(character, df)
 
-    load_df_to_stage_table(df, stage_table_name)
+    with profile_phase("load", char_name):
+        if sink is None:
+            load_df_to_stage_table(df, stage_table_name)
+        else:
+            sink.write(df, stage_table_name)
 
 
 def add_char_name_to_df(character: Character, df: pd.DataFrame) -> None:
@@ -49,6 +68,45 @@ def add_char_name_to_df(character: Character, df: pd.DataFrame) -> None:
     :return: None
     """
     main_logger.info(
-        f"Adding character name {character.__class__.__name__} to dataframe..."
+        "Adding character name %s to dataframe...", character.__class__.__name__
+    )
+    df["Character"] = pd.Categorical.from_codes(
+        np.zeros(len(df), dtype=np.int8), categories=[character.__class__.__name__]
+    )
+
+
+def select_characters(char_list: list[T], characters: list[str] | None) -> list[T]:
+    """
+    Select the characters to simulate by their class names
+    :param char_list: Characters of a Path
+    :param characters: Names of the selected characters, or None to select every character
+    :return: Selected characters, in the order of the Path
+    """
+    if characters is None:
+        return char_list
+    return [char for char in char_list if char.__class__.__name__ in characters]
+
+
+def open_stage_table(
+    sink: ResultSink,
+    stage_table_name: str,
+    char_list: list,
+    characters: list[str] | None,
+) -> ContextManager[None]:
+    """
+    Prepare a stage table for the results of the characters.
+    When every character is simulated, the stage table is reset.
+    When only selected characters are simulated, only their rows are replaced,
+    so the other characters' rows and the views of the stage table are left intact.
+    :param sink: Where the results are stored
+    :param stage_table_name: Stage table name
+    :param char_list: Characters to simulate
+    :param characters: Names of the selected characters, or None if every character is simulated
+    :return: Context that the results must be written in
+    """
+    if characters is None:
+        sink.reset(stage_table_name)
+        return nullcontext()
+    return sink.replace_characters(
+        stage_table_name, [char.__class__.__name__ for char in char_list]
     )
-    df["Character"] = f"{character.__class__.__name__}"
@@ -12,15 +12,59 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 import argparse
+import os
+from pathlib import Path
 from typing import List
 
-from hsr_simulation.path_main_func.destruction_main import start_sim_destruction
-from hsr_simulation.path_main_func.erudition_main import start_sim_erudition
-from hsr_simulation.path_main_func.harmony_main import start_sim_harmony
-from hsr_simulation.configure_logging import main_logger
-from hsr_simulation.path_main_func.remembrance_main import start_sim_remembrance
-from hsr_simulation.path_main_func.hunt_main import start_sim_hunt
-from hsr_simulation.path_main_func.nihility_main import start_sim_nihility
+from hsr_simulation.path_main_func.destruction_main import get_destruction_characters
+from hsr_simulation.path_main_func.erudition_main import get_erudition_characters
+from hsr_simulation.path_main_func.harmony_main import (
+    get_harmony_characters,
+    start_sim_harmony,
+)
+from hsr_simulation.counters import run_counters
+from hsr_simulation.configure_logging import (
+    LOG_FILE_ENV_VAR,
+    LOG_LEVEL_ENV_VAR,
+    LOG_LEVELS,
+    configure_logging,
+    main_logger,
+    shutdown_logging,
+)
+from hsr_simulation.path_main_func.remembrance_main import get_remembrance_characters
+from hsr_simulation.path_main_func.hunt_main import get_hunt_characters
+from hsr_simulation.path_main_func.path_simulation import (
+    SimulationSettings,
+    start_sim_path,
+)
+from hsr_simulation.path_main_func.nihility_main import get_nihility_characters
+from hsr_simulation.postgre import dispose_engines
+from hsr_simulation.profiling import profile_path, start_profiling, stop_profiling
+from hsr_simulation.result_cache import DEFAULT_CACHE_DIR, ResultCache
+from hsr_simulation.result_sink import (
+    DEFAULT_OUTPUT_DIR,
+    DEFAULT_SQLITE_PATH,
+    SINK_NAMES,
+    ResultSink,
+    create_sink,
+)
+from hsr_simulation.simulate_battles import DEFAULT_CHUNK_SIZE
+
+PROFILE_REPORT_NAME = "profile_report.json"
+COUNTERS_REPORT_NAME = "counters_summary.json"
+
+
+def get_character_names() -> set[str]:
+    """Get the names of every character that can be simulated, across all paths"""
+    char_lists = (
+        get_hunt_characters(),
+        get_nihility_characters(),
+        get_destruction_characters(),
+        get_erudition_characters(),
+        get_harmony_characters(),
+        get_remembrance_characters(),
+    )
+    return {char.__class__.__name__ for char_list in char_lists for char in char_list}
 
 
 def parse_args() -> argparse.Namespace:
@@ -39,6 +83,14 @@ def parse_args() -> argparse.Namespace:
         ],
         help="Specify which paths to simulate. If not provided, all paths will be simulated.",
     )
+    parser.add_argument(
+        "--characters",
+        type=str,
+        nargs="+",
+        help="Specify which characters to simulate by class name, e.g., Seele Kafka. "
+        "Only their rows are replaced in the stage tables, and the views are left intact. "
+        "If not provided, all characters of the paths will be simulated.",
+    )
     parser.add_argument(
         "--sim-count",
         type=int,
@@ -51,10 +103,124 @@ def parse_args() -> argparse.Namespace:
         default=10,
         help="Maximum number of cycles to simulate (default: 10)",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes to run simulations on (default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Number of battles loaded to the database at once, which bounds memory use "
+        f"(default: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--aggregate-only",
+        action="store_true",
+        help="Load each battle's total damage of each DMG type instead of the damage of every hit",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Master seed that makes the battles reproducible, "
+        "regardless of --workers and --chunk-size (default: random)",
+    )
+    parser.add_argument(
+        "--sink",
+        type=str,
+        choices=SINK_NAMES,
+        default="postgres",
+        help="Where the results are stored. parquet and arrow need pyarrow (default: postgres)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help=f"SQLite database file of the sqlite sink (default: {DEFAULT_SQLITE_PATH}), "
+        f"or directory of the parquet and arrow sinks (default: {DEFAULT_OUTPUT_DIR})",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reload the results of characters whose source, default stats, --sim-count, "
+        "--max-cycles, --seed and --aggregate-only haven't changed since they were cached, "
+        "instead of simulating them again. Requires --seed",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory of the cached results of --cache (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record the wall time and call count of each phase per path and character, "
+        f"and write them to {PROFILE_REPORT_NAME} next to the results",
+    )
+    parser.add_argument(
+        "--profile-character",
+        type=str,
+        default=None,
+        help="Also run a character, e.g., Seele, under cProfile, "
+        "including the battles it runs in worker processes",
+    )
+    parser.add_argument(
+        "--counters-file",
+        type=str,
+        default=None,
+        help="Prometheus text file that the counters of each character's actions, hits, CRITs, "
+        "Weakness Breaks, Toughness regenerations and Action Forwards are written to "
+        "after each path, e.g., for the node exporter's textfile collector",
+    )
+    parser.add_argument(
+        "--log-file",
+        type=str,
+        default=os.getenv(LOG_FILE_ENV_VAR),
+        help=f"Log file to write to, e.g., logs/main.log. No log file is written if not provided "
+        f"(default: ${LOG_FILE_ENV_VAR})",
+    )
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        choices=LOG_LEVELS,
+        default=os.getenv(LOG_LEVEL_ENV_VAR, "WARNING"),
+        help=f"Log level (default: ${LOG_LEVEL_ENV_VAR} or WARNING)",
+    )
+    args = parser.parse_args()
+    # argparse doesn't check a default against the choices
+    if args.log_level not in LOG_LEVELS:
+        parser.error(
+            f"invalid ${LOG_LEVEL_ENV_VAR}: {args.log_level} "
+            f"(choose from {', '.join(LOG_LEVELS)})"
+        )
+    if args.characters:
+        unknown_characters = sorted(set(args.characters) - get_character_names())
+        if unknown_characters:
+            parser.error(f"unknown characters: {', '.join(unknown_characters)}")
+    if args.cache and args.seed is None:
+        parser.error(
+            "--cache requires --seed, since unseeded battles aren't reproducible"
+        )
+    return args
 
 
-def run_simulations(paths: List[str], simulation_num: int, max_cycles: int) -> None:
+def run_simulations(
+    paths: List[str],
+    simulation_num: int,
+    max_cycles: int,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    aggregate_only: bool = False,
+    seed: int | None = None,
+    sink: ResultSink | None = None,
+    counters_path: Path | None = None,
+    cache: ResultCache | None = None,
+    characters: List[str] | None = None,
+) -> None:
     """Run damage simulations for specified character paths.
 
     This function executes damage simulations for the specified character paths using the given parameters.
@@ -65,34 +231,60 @@ def run_simulations(paths: List[str], simulation_num: int, max_cycles: int) -> N
                           'Erudition', and 'Harmony'.
         simulation_num (int): Number of battle simulations to run for each path.
         max_cycles (int): Maximum number of cycles to simulate in each battle.
+        workers (int): Number of worker processes. Each character's battles run as their own task,
+                       or are sharded across the workers when a path has fewer characters than workers.
+        chunk_size (int): Max number of battles loaded to the database at once.
+        aggregate_only (bool): Whether to load each battle's total damage of each DMG type
+                               instead of the damage of every hit.
+        seed (int | None): Master seed that makes the battles reproducible.
+        sink (ResultSink | None): Where the results are stored, PostgreSQL if not provided.
+        counters_path (Path | None): Prometheus text file that the run's counters are written to
+                                     after each path.
+        cache (ResultCache | None): Cache of each character's results, or None to always simulate.
+        characters (List[str] | None): Names of the characters to simulate, or None for every character.
+                                       Only their rows are replaced in the stage tables.
 
     Note:
-        - The Harmony path currently doesn't use simulation_num and max_cycles parameters
+        - The Harmony path only uses the sink and characters parameters, so it is never cached
         - If a path's simulation fails, an error will be logged but execution will continue for remaining paths
     """
-    path_to_func = {
-        "Hunt": start_sim_hunt,
-        "Nihility": start_sim_nihility,
-        "Destruction": start_sim_destruction,
-        "Erudition": start_sim_erudition,
-        "Harmony": lambda x,
-        y: start_sim_harmony(),  # Harmony doesn't take args currently
-        "Remembrance": start_sim_remembrance,
+    path_to_characters = {
+        "Hunt": get_hunt_characters,
+        "Nihility": get_nihility_characters,
+        "Destruction": get_destruction_characters,
+        "Erudition": get_erudition_characters,
+        "Remembrance": get_remembrance_characters,
     }
+    settings = SimulationSettings(
+        simulation_num,
+        max_cycles,
+        workers,
+        chunk_size,
+        aggregate_only,
+        seed,
+        sink,
+        cache,
+        characters,
+    )
 
     for path in paths:
         try:
-            main_logger.info(f"Starting simulation for {path} path...")
-            if path == "Harmony":
-                path_to_func[path](None, None)
-            else:
-                path_to_func[path](simulation_num, max_cycles)
+            main_logger.info("Starting simulation for %s path...", path)
+            with profile_path(path):
+                if path == "Harmony":
+                    start_sim_harmony(settings)
+                else:
+                    start_sim_path(path, path_to_characters[path](), settings)
         except Exception as e:
-            main_logger.error(f"Error in {path} simulation: {e}", exc_info=True)
+            main_logger.error("Error in %s simulation: %s", path, e, exc_info=True)
+
+        if counters_path is not None:
+            run_counters.write_prometheus(counters_path)
 
 
 if __name__ == "__main__":
     args = parse_args()
+    configure_logging(log_file=args.log_file, level=args.log_level)
 
     # If no paths specified, run all
     paths_to_run = (
@@ -101,8 +293,32 @@ if __name__ == "__main__":
         else ["Hunt", "Nihility", "Destruction", "Erudition", "Harmony", "Remembrance"]
     )
 
+    profiler = None
     try:
-        run_simulations(paths_to_run, args.sim_count, args.max_cycles)
+        sink = create_sink(args.sink, args.output)
+        if args.profile or args.profile_character:
+            profiler = start_profiling(args.profile_character)
+        run_simulations(
+            paths_to_run,
+            args.sim_count,
+            args.max_cycles,
+            args.workers,
+            args.chunk_size,
+            args.aggregate_only,
+            args.seed,
+            sink,
+            Path(args.counters_file) if args.counters_file else None,
+            ResultCache(args.cache_dir) if args.cache else None,
+            args.characters,
+        )
+        if run_counters.battles:
+            run_counters.write_summary(sink.get_report_path(COUNTERS_REPORT_NAME))
+        if profiler is not None:
+            profiler.write_report(sink.get_report_path(PROFILE_REPORT_NAME))
     except Exception as e:
         main_logger.error(e, exc_info=True)
         main_logger.error("Unexpected error occurred.")
+    finally:
+        stop_profiling()
+        dispose_engines()
+        shutdown_logging()
@@ -0,0 +1,135 @@
+from hsr_simulation.action_timeline import ActionTimeline
+from hsr_simulation.character import Character
+
+
+class RecordingCharacter(Character):
+    """Character that records the order of turns and can change its speed or get Action Forward."""
+
+    def __init__(self, name: str, turns: list[str], speed: float = 100):
+        super().__init__(speed=speed)
+        self.name = name
+        self.turns = turns
+        self.new_speed = None
+        self.action_forward_percent = 0
+        self.ally = None
+        self.ally_action_forward_percent = 0
+        self.ally_new_speed = None
+
+    def take_action(self) -> None:
+        self.turns.append(self.name)
+        self.char_action_value_for_action_forward = []
+        if self.ally_action_forward_percent:
+            self.ally.receive_action_forward(
+                self.ally.simulate_action_forward(self.ally_action_forward_percent)
+            )
+        if self.ally_new_speed is not None:
+            self.ally.speed = self.ally_new_speed
+            self.ally.mark_timeline_changed()
+        if self.new_speed is not None:
+            self.speed = self.new_speed
+        if self.action_forward_percent:
+            self.char_action_value_for_action_forward.append(
+                self.simulate_action_forward(self.action_forward_percent)
+            )
+
+
+def test_turn_counts_for_actors():
+    """Test that each actor gets turns according to its speed."""
+    turns = []
+    timeline = ActionTimeline(cycles_action_val=1000)
+    for name, speed in (("a", 100), ("b", 50), ("c", 200)):
+        timeline.add_actor(RecordingCharacter(name, turns, speed=speed))
+
+    assert timeline.run() == [10, 5, 20]
+
+
+def test_turn_order():
+    """Test that turns follow the action value, and ties keep the order actors were added in."""
+    turns = []
+    timeline = ActionTimeline(cycles_action_val=200)
+    timeline.add_actor(RecordingCharacter("slow", turns, speed=50))
+    timeline.add_actor(RecordingCharacter("fast", turns, speed=100))
+    timeline.run()
+
+    assert turns == ["fast", "slow", "fast"]
+
+
+def test_speed_change():
+    """Test that a speed change applies from the actor's next turn."""
+    turns = []
+    character = RecordingCharacter("a", turns, speed=100)
+    character.new_speed = 200
+    timeline = ActionTimeline(cycles_action_val=300)
+    timeline.add_actor(character)
+
+    # turns at action value 100, 150, 200, 250 and 300
+    assert timeline.run() == [5]
+
+
+def test_action_forward():
+    """Test that Action Forward brings the actor's next turn forward."""
+    turns = []
+    character = RecordingCharacter("a", turns, speed=100)
+    character.action_forward_percent = 0.5
+    timeline = ActionTimeline(cycles_action_val=300)
+    timeline.add_actor(character)
+
+    # turns at action value 100, 150, 200, 250 and 300
+    assert timeline.run() == [5]
+
+
+def test_no_turns_left():
+    """Test that no turn is taken when the cycles are shorter than the action value."""
+    timeline = ActionTimeline(cycles_action_val=50)
+    timeline.add_actor(RecordingCharacter("a", [], speed=100))
+
+    assert timeline.take_next_turn() is None
+    assert timeline.turn_counts == [0]
+
+
+def test_ally_action_forward():
+    """Test that Action Forward from an ally's turn brings the actor's next turn forward right away."""
+    turns = []
+    ally = RecordingCharacter("ally", turns, speed=50)
+    character = RecordingCharacter("a", turns, speed=100)
+    character.ally = ally
+    character.ally_action_forward_percent = 0.5
+    timeline = ActionTimeline(cycles_action_val=300)
+    timeline.add_actor(character)
+    timeline.add_actor(ally, is_summon=True)
+
+    # each of the character's turns brings the ally's next turn forward by 100 action value
+    assert timeline.run() == [3, 3]
+    assert turns == ["a", "ally", "a", "ally", "a", "ally"]
+
+
+def test_ally_speed_change():
+    """Test that a speed change from an ally's turn scales the rest of the way to the actor's next turn."""
+    turns = []
+    ally = RecordingCharacter("ally", turns, speed=50)
+    character = RecordingCharacter("a", turns, speed=100)
+    character.ally = ally
+    character.ally_new_speed = 100
+    timeline = ActionTimeline(cycles_action_val=300)
+    timeline.add_actor(character)
+    timeline.add_actor(ally)
+
+    # the ally's turn moves from action value 200 to 150, then comes every 100
+    assert timeline.run() == [3, 2]
+    assert turns == ["a", "ally", "a", "ally", "a"]
+
+
+def test_only_marked_actors_are_rescheduled():
+    """Test that only the actors marked as changed by the turn get their next turn moved."""
+    turns = []
+    ally = RecordingCharacter("ally", turns, speed=50)
+    character = RecordingCharacter("a", turns, speed=100)
+    timeline = ActionTimeline(cycles_action_val=300)
+    timeline.add_actor(character)
+    timeline.add_actor(ally)
+
+    # a speed change that isn't marked applies from the ally's own turn
+    ally.speed = 100
+    assert timeline.take_next_turn() is character
+    assert timeline.take_next_turn() is character
+    assert timeline.take_next_turn() is ally
@@ -0,0 +1,171 @@
+import pandas as pd
+import pytest
+
+from hsr_simulation.battle_record import BattleRecordBuffer
+from hsr_simulation.erudition.jingyuan import Jingyuan
+from hsr_simulation.hunt.topaz import Topaz
+from hsr_simulation.simulate_battles import (
+    simulate_battles_to_buffer,
+    stream_simulations_for_character,
+)
+
+
+def test_append_battle():
+    """Test appending battles fills every column"""
+    buffer = BattleRecordBuffer()
+
+    buffer.append_battle([100.0, 200.0], ["Skill", "Ultimate"], 0)
+    buffer.append_battle([300.0], ["Skill"], 1)
+
+    assert len(buffer) == 3
+    assert buffer.battle_count == 2
+    assert buffer.dmg[:3].tolist() == [100.0, 200.0, 300.0]
+    assert buffer.dmg_types == ["Skill", "Ultimate"]
+    assert buffer.dmg_type_code[:3].tolist() == [0, 1, 0]
+    assert buffer.simulate_round[:3].tolist() == [0, 0, 1]
+
+
+def test_buffer_grows_geometrically():
+    """Test the capacity at least doubles when the buffer is full"""
+    buffer = BattleRecordBuffer(capacity=2)
+
+    buffer.append_battle([1.0, 2.0], ["Skill", "Skill"], 0)
+    assert buffer.capacity == 2
+
+    buffer.append_battle([3.0], ["Skill"], 1)
+    assert buffer.capacity == 4
+    assert buffer.dmg[:3].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_concat_remaps_dmg_type_codes():
+    """Test concatenated buffers keep their order and DMG Types"""
+    first = BattleRecordBuffer()
+    first.append_battle([100.0], ["Skill"], 0)
+    second = BattleRecordBuffer()
+    second.append_battle([200.0, 300.0], ["Ultimate", "Skill"], 1)
+
+    result = BattleRecordBuffer.concat([first, second])
+
+    df = result.to_dataframe()
+    assert df["DMG"].tolist() == [100.0, 200.0, 300.0]
+    assert df["DMG_Type"].tolist() == ["Skill", "Ultimate", "Skill"]
+    assert df["Simulate Round No."].tolist() == [0, 1, 1]
+    assert result.battle_count == 2
+
+
+def test_to_battle_data_splits_battles():
+    """Test the rows are split into each battle's data, including battles without hits"""
+    buffer = BattleRecordBuffer()
+    buffer.append_battle([100.0, 200.0], ["Skill", "Ultimate"], 0)
+    buffer.append_battle([300.0], ["Skill"], 2)
+
+    battles = buffer.to_battle_data(range(3))
+
+    assert battles == [
+        {
+            "DMG": [100.0, 200.0],
+            "DMG_Type": ["Skill", "Ultimate"],
+            "Simulate Round No.": [0, 0],
+        },
+        {"DMG": [], "DMG_Type": [], "Simulate Round No.": []},
+        {"DMG": [300.0], "DMG_Type": ["Skill"], "Simulate Round No.": [2]},
+    ]
+
+
+def test_to_dataframe_empty():
+    """Test an empty buffer converts to an empty dataframe"""
+    df = BattleRecordBuffer().to_dataframe()
+
+    assert len(df) == 0
+    assert list(df.columns) == ["DMG", "DMG_Type", "Simulate Round No."]
+    assert isinstance(df["DMG_Type"].dtype, pd.CategoricalDtype)
+
+
+def test_summon_dmg_is_recorded():
+    """Test the damage of summons is recorded for the character that summons them"""
+    topaz_buffer = BattleRecordBuffer.concat(
+        stream_simulations_for_character(Topaz(), 5, 10)
+    )
+    jingyuan_buffer = BattleRecordBuffer.concat(
+        stream_simulations_for_character(Jingyuan(), 5, 10)
+    )
+
+    assert "Numby" in topaz_buffer.dmg_types
+    assert "Lightning Lord" in jingyuan_buffer.dmg_types
+    assert topaz_buffer.battle_count == 10
+    assert jingyuan_buffer.battle_count == 10
+
+
+def test_aggregate_buffer_sums_dmg_by_type():
+    """Test an aggregating buffer stores each battle's total damage of each DMG Type"""
+    buffer = BattleRecordBuffer(aggregate=True)
+
+    buffer.append_battle(
+        [100.0, 200.0, 50.0], ["Skill", "Ultimate", "Skill"], simulate_round=0
+    )
+    buffer.append_battle([300.0], ["Ultimate"], simulate_round=1)
+
+    df = buffer.to_dataframe()
+    assert df["DMG"].tolist() == [150.0, 200.0, 300.0]
+    assert df["DMG_Type"].tolist() == ["Skill", "Ultimate", "Ultimate"]
+    assert df["Simulate Round No."].tolist() == [0, 0, 1]
+    assert df["HitCount"].tolist() == [2, 1, 1]
+    assert buffer.battle_count == 2
+
+
+def test_sum_by_dmg_type_rejects_mismatched_columns():
+    """Test that damage and DMG Types of different lengths are not silently truncated"""
+    with pytest.raises(ValueError):
+        BattleRecordBuffer.sum_by_dmg_type([100.0, 200.0], ["Skill"])
+
+
+def test_aggregate_only_sums_hits_as_they_land():
+    """Test that an aggregating run sums each DMG Type during the battle instead of recording every hit"""
+    character = Topaz()
+    character.seed = 0
+    summon = character.summon_numby(character)
+
+    totals = simulate_battles_to_buffer(
+        character, summon, 5, range(1), aggregate_only=True
+    )
+
+    assert character.data["DMG"] == []
+    assert list(character.dmg_totals.values()) == totals.dmg[: len(totals)].tolist()
+    assert totals.counters["hit_count"] > len(totals)
+
+
+def test_aggregate_only_keeps_battle_totals():
+    """Test aggregated battles have the same total damage of each DMG Type"""
+    character = Topaz()
+    character.seed = 0
+    summon = character.summon_numby(character)
+    sim_indices = range(5)
+
+    hits = simulate_battles_to_buffer(character, summon, 5, sim_indices)
+    totals = simulate_battles_to_buffer(
+        character, summon, 5, sim_indices, aggregate_only=True
+    )
+
+    hits_df = hits.to_dataframe()
+    totals_df = totals.to_dataframe()
+    group_columns = ["Simulate Round No.", "DMG_Type"]
+    expected = hits_df.groupby(group_columns, observed=True)["DMG"].sum()
+    actual = totals_df.groupby(group_columns, observed=True)["DMG"].sum()
+    assert len(totals_df) == len(expected) < len(hits_df)
+    pd.testing.assert_series_equal(actual, expected)
+
+
+def test_save_and_load(tmp_path):
+    """Test that a loaded buffer has the saved battles, DMG Types and counters"""
+    buffer = BattleRecordBuffer(aggregate=True)
+    buffer.append_battle([10.0, 20.0], ["Skill", "Ultimate"], 1, {"hit_count": 2})
+    buffer.append_battle([5.0], ["Talent"], 2, {"hit_count": 1})
+
+    path = tmp_path / "part.npz"
+    buffer.save(path)
+    loaded = BattleRecordBuffer.load(path)
+
+    assert loaded.aggregate
+    assert loaded.battle_count == 2
+    assert loaded.counters["hit_count"] == 3
+    pd.testing.assert_frame_equal(loaded.to_dataframe(), buffer.to_dataframe())
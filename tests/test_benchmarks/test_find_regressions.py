@@ -0,0 +1,19 @@
+from benchmarks.bench_engine import find_regressions
+
+
+def test_find_regressions_over_threshold():
+    """Test that only throughputs lower than the baseline by more than the threshold are regressions"""
+    baseline = {"Seele": 100.0, "Kafka": 100.0, "Topaz": 100.0}
+    results = {"Seele": 85.0, "Kafka": 75.0, "Topaz": 150.0}
+
+    regressions = find_regressions(results, baseline, threshold=0.2)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("Kafka:")
+
+
+def test_find_regressions_ignores_new_and_removed_benchmarks():
+    """Test that benchmarks missing from the results or the baseline are not compared"""
+    regressions = find_regressions({"Seele": 1.0}, {"Kafka": 100.0}, threshold=0.2)
+
+    assert regressions == []
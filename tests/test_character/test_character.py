@@ -1,14 +1,16 @@
 from hsr_simulation.character import Character
 from hsr_simulation.nihility.kafka import Kafka
-from hsr_simulation.simulate_battles import start_simulations
+from hsr_simulation.battle_record import BattleRecordBuffer
+from hsr_simulation.simulate_battles import stream_simulations_for_character
 
 
 def test_character():
     character = Character()
-    dict_list = start_simulations(character, max_cycles=10, simulation_num=2)
-    print(dict_list)
+    record_buffer = BattleRecordBuffer.concat(
+        stream_simulations_for_character(character, max_cycles=10, simulation_num=2)
+    )
 
-    assert len(dict_list) > 0
+    assert len(record_buffer) > 0
     assert character.atk == 2000
     assert character.crit_rate == 0.5
     assert character.crit_dmg == 1.0
@@ -16,20 +18,18 @@ def test_character():
     assert character.ult_energy == 140
 
     # test whether Simulate Round No. is correct
-    for index, element in enumerate(dict_list):
-        if "Simulate Round No." in element:
-            for i in element["Simulate Round No."]:
-                if index == 0:
-                    assert i == 0
-                elif index == 1:
-                    assert i == 1
+    simulate_round = record_buffer.simulate_round[: record_buffer.size]
+    assert sorted(set(simulate_round)) == [0, 1]
+    assert (simulate_round[1:] >= simulate_round[:-1]).all()
 
 
 def test_subclass_character():
     character = Kafka()
-    dict_list = start_simulations(character, max_cycles=10, simulation_num=2)
+    record_buffer = BattleRecordBuffer.concat(
+        stream_simulations_for_character(character, max_cycles=10, simulation_num=2)
+    )
 
-    assert len(dict_list) > 0
+    assert len(record_buffer) > 0
     assert character.atk == 2000
     assert character.crit_rate == 0.5
     assert character.crit_dmg == 1.0
@@ -37,13 +37,9 @@ def test_subclass_character():
     assert character.ult_energy == 120
 
     # test whether Simulate Round No. is correct
-    for index, element in enumerate(dict_list):
-        if "Simulate Round No." in element:
-            for i in element["Simulate Round No."]:
-                if index == 0:
-                    assert i == 0
-                elif index == 1:
-                    assert i == 1
+    simulate_round = record_buffer.simulate_round[: record_buffer.size]
+    assert sorted(set(simulate_round)) == [0, 1]
+    assert (simulate_round[1:] >= simulate_round[:-1]).all()
 
 
 def test_character_initialization():
@@ -0,0 +1,81 @@
+from hsr_simulation.character import Character, get_state_slots
+from hsr_simulation.destruction.mydei import Mydei
+from hsr_simulation.erudition.qingque import Qingque
+from hsr_simulation.remembrance.algaea import Algaea, Garmentmaker
+from hsr_simulation.simulate_cycles import simulate_cycles
+
+
+def test_restore_state_after_battle_changes():
+    """Test that restoring goes back to the stats the character was initialized with."""
+    character = Mydei()
+    crit_rate = character.crit_rate
+
+    character.atk += 500
+    character.crit_rate += 0.2
+    character.charge = 100
+    character.data["DMG"].append(1000)
+    character.restore_state()
+
+    assert character.atk == character.default_atk
+    assert character.crit_rate == crit_rate
+    assert character.charge == 0
+    assert character.data["DMG"] == []
+
+
+def test_restore_state_copies_containers():
+    """Test that containers changed in a battle don't change the snapshot."""
+    character = Qingque()
+    character.hand.append(3)
+    character.restore_state()
+    character.hand.append(4)
+    character.restore_state()
+
+    assert character.hand == [0]
+
+
+def test_get_state_slots():
+    """Test that state slots include the subclass's slots but not the generator or action data."""
+    slots = get_state_slots(Qingque)
+
+    assert "hand" in slots
+    assert set(get_state_slots(Character)) <= set(slots)
+    assert "rng" not in slots
+    assert "data" not in slots
+
+
+def test_restore_state_keeps_garmentmaker_aglaea():
+    """Test that restoring Garmentmaker in a battle keeps its reference to Aglaea."""
+    aglaea = Algaea()
+    garmentmaker = Garmentmaker()
+    garmentmaker.set_aglaea(aglaea)
+
+    garmentmaker.reset_character_data_for_each_battle()
+
+    assert garmentmaker.aglaea is aglaea
+
+
+def test_aglaea_battles_after_restore_state():
+    """Test that Aglaea and Garmentmaker run full battles after their state is restored."""
+    aglaea = Algaea()
+    aglaea.seed = 1
+    aglaea.restore_state()
+
+    for simulate_round in range(3):
+        data = simulate_cycles(aglaea, 10, simulate_round)
+        assert data["DMG"]
+        assert "Garmentmaker" in "".join(data["DMG_Type"])
+
+
+def test_characters_have_no_instance_dict():
+    """Test that characters keep their state and run settings in slots only."""
+    for character in (Mydei(), Qingque(), Algaea(), Garmentmaker()):
+        assert not hasattr(character, "__dict__")
+
+
+def test_run_settings_are_kept_on_restore():
+    """Test that restoring the state keeps the run settings of the simulation run."""
+    character = Mydei()
+    character.seed = 3
+    character.restore_state()
+
+    assert character.seed == 3
@@ -29,12 +29,9 @@ def test_spd_topaz(index, speed, expected_char_turn_count, expected_summon_turn_
     max_cycles = 7
     cycles_action_val = 150 + ((max_cycles - 1) * 100)
 
-    topaz_end = False
-    numby_end = False
-
     # When:
     numby_turn_count, topaz_turn_count = simulate_turns_for_char_with_summon(
-        cycles_action_val, cycles_action_val, numby, numby_end, topaz, topaz_end
+        cycles_action_val, numby, topaz
     )
 
     # Then:
@@ -68,19 +65,9 @@ def test_spd_jingyuan(
     max_cycles = 7
     cycles_action_val = 150 + ((max_cycles - 1) * 100)
 
-    jingyuan_end = False
-    lightning_end = False
-
     # When:
     lightning_lord_turn_count, jingyuan_turn_count = (
-        simulate_turns_for_char_with_summon(
-            cycles_action_val,
-            cycles_action_val,
-            lightning_lord,
-            lightning_end,
-            jingyuan,
-            jingyuan_end,
-        )
+        simulate_turns_for_char_with_summon(cycles_action_val, lightning_lord, jingyuan)
     )
 
     print(lightning_lord.speed)
@@ -0,0 +1,74 @@
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+from hsr_simulation.configure_logging import (
+    configure_logging,
+    main_logger,
+    shutdown_logging,
+)
+from hsr_simulation.process_pool import create_process_pool
+
+
+def log_from_worker(message: str) -> None:
+    main_logger.info("Worker says %s", message)
+
+
+def test_import_does_not_create_log_file(tmp_path):
+    """Test importing the logging module doesn't create a log directory"""
+    subprocess.run(
+        [sys.executable, "-c", "import hsr_simulation.configure_logging"],
+        cwd=tmp_path,
+        env={"PYTHONPATH": str(Path(__file__).parents[2])},
+        check=True,
+    )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_configure_logging_with_workers(tmp_path):
+    """Test log records of worker processes reach the configured log file"""
+    log_file = tmp_path / "logs" / "main.log"
+
+    try:
+        configure_logging(log_file=str(log_file), level="INFO")
+        main_logger.info("Parent says %s", "hello")
+        with create_process_pool(2) as executor:
+            list(executor.map(log_from_worker, ["one", "two"]))
+    finally:
+        shutdown_logging()
+        main_logger.setLevel("WARNING")
+
+    log_text = log_file.read_text()
+    assert "Parent says hello" in log_text
+    assert "Worker says one" in log_text
+    assert "Worker says two" in log_text
+
+
+def test_configure_logging_without_log_file(tmp_path, monkeypatch):
+    """Test no log file is created when no log file is given"""
+    monkeypatch.chdir(tmp_path)
+
+    try:
+        configure_logging(level="INFO")
+        main_logger.info("Only on the terminal")
+    finally:
+        shutdown_logging()
+        main_logger.setLevel("WARNING")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_configure_logging_keeps_logger_methods():
+    """Test disabled levels are filtered by the logger's level, without replacing its methods"""
+    try:
+        configure_logging(level="WARNING")
+        assert "info" not in main_logger.__dict__
+        assert not main_logger.isEnabledFor(logging.INFO)
+
+        configure_logging(level="INFO")
+        assert main_logger.isEnabledFor(logging.INFO)
+    finally:
+        shutdown_logging()
+        main_logger.setLevel("WARNING")
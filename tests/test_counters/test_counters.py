@@ -0,0 +1,162 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from hsr_simulation.battle_record import BattleRecordBuffer
+from hsr_simulation.character import Character
+from hsr_simulation.counters import COUNTER_NAMES, RunCounters, run_counters
+from hsr_simulation.hunt.seele import Seele
+from hsr_simulation.hunt.topaz import Topaz
+from hsr_simulation.remembrance.algaea import Algaea, Garmentmaker
+from hsr_simulation.remembrance.remembrance_trailblazer import RemembranceTrailblazer
+from hsr_simulation.scheduler import run_character_simulations
+from hsr_simulation.simulate_battles import stream_simulations_for_character
+from hsr_simulation.simulate_cycles import BattleSimulator
+from hsr_simulation.simulate_turns import simulate_turns
+
+
+def test_counters_start_from_zero_in_each_battle():
+    """Test that the counters of one battle don't carry over to the next battle"""
+    character = Seele()
+    character.seed = 1
+    record_buffer = BattleRecordBuffer.concat(
+        stream_simulations_for_character(character, 2, 3)
+    )
+
+    counters = record_buffer.counters
+    assert counters["action_count"] > 0
+    assert counters["hit_count"] == len(record_buffer)
+    assert counters["crit_count"] <= counters["crit_roll_count"]
+
+    # the counters are reset when the next battle starts
+    BattleSimulator.start_battle(character, 3)
+    assert character.get_counters() == dict.fromkeys(COUNTER_NAMES, 0)
+
+
+def test_summon_counters_count_towards_character():
+    """Test that the hits of a summon are counted for the character that summons it"""
+    character = Topaz()
+    character.seed = 1
+    record_buffer = BattleRecordBuffer.concat(
+        stream_simulations_for_character(character, 1, 3)
+    )
+
+    assert record_buffer.counters["hit_count"] == len(record_buffer)
+    assert record_buffer.counters["action_forward_count"] > 0
+
+
+@patch("hsr_simulation.scheduler.process_result_list")
+def test_run_counters_add_every_chunk(mock_process_result_list):
+    """Test that the scheduler adds the counters of every chunk to the run's counters"""
+    run_counters.reset()
+    try:
+        run_character_simulations(
+            [Seele()],
+            simulation_num=5,
+            max_cycles=2,
+            stage_table_name="test_stage",
+            chunk_size=2,
+            seed=1,
+        )
+        summary = run_counters.summary()
+    finally:
+        run_counters.reset()
+
+    assert summary["Seele"]["battles"] == 5
+    hits = sum(len(call.args[1]) for call in mock_process_result_list.call_args_list)
+    assert summary["Seele"]["totals"]["hit_count"] == hits
+    assert summary["Seele"]["per_battle"]["hit_count"] == hits / 5
+
+
+def test_write_prometheus(tmp_path):
+    """Test that the counters are written as one counter metric per event"""
+    counters = RunCounters()
+    counters.add("Seele", {"hit_count": 3, "crit_count": 1}, battle_count=2)
+    counters.add("Seele", {"hit_count": 2}, battle_count=1)
+    counters.add("Topaz", {"hit_count": 4}, battle_count=1)
+
+    path = tmp_path / "metrics" / "hsr.prom"
+    counters.write_prometheus(path)
+    lines = path.read_text().splitlines()
+
+    assert "# TYPE hsr_simulation_hits_total counter" in lines
+    assert 'hsr_simulation_battles_total{character="Seele"} 3' in lines
+    assert 'hsr_simulation_hits_total{character="Seele"} 5' in lines
+    assert 'hsr_simulation_hits_total{character="Topaz"} 4' in lines
+    assert 'hsr_simulation_crits_total{character="Topaz"} 0' in lines
+    assert list(path.parent.iterdir()) == [path]
+
+
+@pytest.mark.parametrize("character_class", [Algaea, RemembranceTrailblazer])
+def test_remembrance_companion_counters_count_towards_character(character_class):
+    """Test that Garmentmaker's and Mem's CRIT rolls and turns are counted for their owner"""
+    character = character_class()
+    character.seed = 1
+    roll_crit = Character._roll_crit
+    garmentmaker_take_action = Garmentmaker.take_action
+    turn_counts = []
+
+    def count_turns(*args):
+        turn_count = simulate_turns(*args)
+        turn_counts.append(turn_count)
+        return turn_count
+
+    with (
+        patch.object(
+            Character,
+            "_roll_crit",
+            autospec=True,
+            side_effect=roll_crit,
+        ) as mock_roll_crit,
+        patch.object(
+            Garmentmaker,
+            "take_action",
+            autospec=True,
+            side_effect=garmentmaker_take_action,
+        ) as mock_garmentmaker_take_action,
+        patch("hsr_simulation.simulate_cycles.simulate_turns", side_effect=count_turns),
+    ):
+        record_buffer = BattleRecordBuffer.concat(
+            stream_simulations_for_character(character, 3, 10)
+        )
+
+    counters = record_buffer.counters
+    turns = sum(turn_counts)
+    assert counters["hit_count"] == len(record_buffer)
+    assert counters["crit_roll_count"] == sum(
+        can_crit
+        for _, can_crit in (call.args for call in mock_roll_crit.call_args_list)
+    )
+    if character_class is Algaea:
+        assert mock_garmentmaker_take_action.call_count > 0
+        assert (
+            counters["action_count"] == turns + mock_garmentmaker_take_action.call_count
+        )
+    else:
+        assert counters["action_count"] > turns
+
+
+def test_write_summary(tmp_path):
+    """Test that the summary is written as JSON"""
+    counters = RunCounters()
+    counters.add("Seele", {"hit_count": 3}, battle_count=2)
+
+    path = tmp_path / "counters_summary.json"
+    counters.write_summary(path)
+
+    assert json.loads(path.read_text())["Seele"]["per_battle"]["hit_count"] == 1.5
+
+
+def test_hits_that_cannot_crit_are_not_counted_as_crit_rolls():
+    """Test that only the hits that can CRIT count as CRIT rolls"""
+    character = Seele()
+    character.crit_rate = 1
+
+    character._calculate_damage(skill_multiplier=1, break_amount=0, can_crit=False)
+    assert character.crit_roll_count == 0
+    assert character.crit_count == 0
+
+    character._calculate_damage(skill_multiplier=1, break_amount=0)
+    assert character.crit_roll_count == 1
+    assert character.crit_count == 1
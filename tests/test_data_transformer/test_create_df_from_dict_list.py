@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 
+from hsr_simulation.battle_record import BattleRecordBuffer
 from hsr_simulation.data_transformer import create_df_from_dict_list
 
 
@@ -67,3 +68,35 @@ def test_create_df_with_nan_values():
     assert len(result_df) == 2
     assert pd.isna(result_df["DMG"].iloc[1])
     assert pd.isna(result_df["DMG_Type"].iloc[1])
+
+
+def test_create_df_has_categorical_dmg_type():
+    """Test DMG_Type is a categorical column"""
+    test_data = [
+        {
+            "DMG": [1000, 2000],
+            "DMG_Type": ["Skill", "Skill"],
+            "Simulate Round No.": [1, 1],
+        },
+        {"DMG": [3000], "DMG_Type": ["Ultimate"], "Simulate Round No.": [2]},
+    ]
+
+    result_df = create_df_from_dict_list(test_data)
+
+    assert isinstance(result_df["DMG_Type"].dtype, pd.CategoricalDtype)
+    assert sorted(result_df["DMG_Type"].cat.categories) == ["Skill", "Ultimate"]
+    assert result_df.index.tolist() == [0, 1, 2]
+
+
+def test_create_df_from_record_buffer():
+    """Test creating DataFrame from a record buffer"""
+    record_buffer = BattleRecordBuffer()
+    record_buffer.append_battle([1000.0, 2000.0], ["Skill", "Ultimate"], 0)
+    record_buffer.append_battle([3000.0], ["Skill"], 1)
+
+    result_df = create_df_from_dict_list(record_buffer)
+
+    assert list(result_df.columns) == ["DMG", "DMG_Type", "Simulate Round No."]
+    assert result_df["DMG"].tolist() == [1000, 2000, 3000]
+    assert result_df["DMG_Type"].tolist() == ["Skill", "Ultimate", "Skill"]
+    assert result_df["Simulate Round No."].tolist() == [0, 0, 1]
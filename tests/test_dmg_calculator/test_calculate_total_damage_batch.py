@@ -0,0 +1,111 @@
+import numpy as np
+
+from hsr_simulation.dmg_calculator import (
+    calculate_base_dmg,
+    calculate_def_multipliers,
+    calculate_dmg_multipliers,
+    calculate_res_multipliers,
+    calculate_total_damage,
+    calculate_total_damage_batch,
+    calculate_universal_dmg_reduction,
+)
+
+
+def test_calculate_total_damage_batch_matches_scalar():
+    """Test each hit of a batch has the same damage as the scalar functions give"""
+    rng = np.random.default_rng(0)
+    hit_num = 1000
+    skill_multiplier = rng.uniform(0.5, 4, hit_num)
+    atk = rng.uniform(1000, 4000, hit_num)
+    is_crit = rng.random(hit_num) < 0.5
+    dmg_multipliers_sum = rng.uniform(0, 1, hit_num)
+    dot_dmg_sum = rng.uniform(0, 0.5, hit_num)
+    res_pen_sum = rng.uniform(0, 0.3, hit_num)
+    def_reduction_sum = rng.uniform(0, 0.4, hit_num)
+    weakness_broken = rng.random(hit_num) < 0.5
+
+    result = calculate_total_damage_batch(
+        skill_multiplier=skill_multiplier,
+        atk=atk,
+        is_crit=is_crit,
+        crit_dmg=1.5,
+        dmg_multipliers_sum=dmg_multipliers_sum,
+        dot_dmg_sum=dot_dmg_sum,
+        res_pen_sum=res_pen_sum,
+        def_reduction_sum=def_reduction_sum,
+        weakness_broken=weakness_broken,
+    )
+
+    expected = [
+        calculate_total_damage(
+            base_dmg=calculate_base_dmg(
+                skill_multiplier=skill_multiplier[i], atk=atk[i]
+            ),
+            dmg_multipliers=calculate_dmg_multipliers(
+                crit_dmg=1.5 if is_crit[i] else 0,
+                dot_dmg=[dot_dmg_sum[i]],
+                dmg_multipliers=[dmg_multipliers_sum[i]],
+            ),
+            res_multipliers=calculate_res_multipliers([res_pen_sum[i]]),
+            dmg_reduction=calculate_universal_dmg_reduction(weakness_broken[i]),
+            def_reduction_multiplier=calculate_def_multipliers([def_reduction_sum[i]]),
+        )
+        for i in range(hit_num)
+    ]
+    assert result.shape == (hit_num,)
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+def test_calculate_total_damage_batch_defaults():
+    """Test a batch with default multipliers only applies the universal DMG reduction"""
+    result = calculate_total_damage_batch(
+        skill_multiplier=[1, 2], atk=2000, extra_multipliers_sum=0.5, extra_dmg=100
+    )
+
+    np.testing.assert_allclose(
+        result, [(1.5 * 2000 + 100) * 0.9, (2.5 * 2000 + 100) * 0.9]
+    )
+
+
+def test_calculate_total_damage_batch_crit():
+    """Test CRIT DMG is only applied to critical hits"""
+    result = calculate_total_damage_batch(
+        skill_multiplier=1,
+        atk=1000,
+        is_crit=[True, False],
+        crit_dmg=1.0,
+        weakness_broken=True,
+    )
+
+    np.testing.assert_allclose(result, [2000, 1000])
+
+
+def test_calculate_total_damage_batch_extra_dmg_matches_scalar():
+    """Test additional skill multipliers and flat damage give the same damage as the scalar functions"""
+    result = calculate_total_damage_batch(
+        skill_multiplier=[1.0, 2.0],
+        atk=[2000, 3000],
+        extra_multipliers_sum=[0.2, 0.5],
+        extra_dmg=[100, 0],
+        res_pen_sum=0.2,
+    )
+
+    expected = [
+        calculate_total_damage(
+            base_dmg=calculate_base_dmg(
+                skill_multiplier=skill_multiplier,
+                atk=atk,
+                extra_multipliers=[extra_multiplier],
+                extra_dmg=extra_dmg,
+            ),
+            dmg_multipliers=calculate_dmg_multipliers(),
+            res_multipliers=calculate_res_multipliers([0.2]),
+            dmg_reduction=calculate_universal_dmg_reduction(False),
+            def_reduction_multiplier=calculate_def_multipliers(),
+        )
+        for skill_multiplier, atk, extra_multiplier, extra_dmg in [
+            (1.0, 2000, 0.2, 100),
+            (2.0, 3000, 0.5, 0),
+        ]
+    ]
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
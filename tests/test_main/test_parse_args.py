@@ -0,0 +1,23 @@
+import pytest
+
+from hsr_simulation.configure_logging import LOG_LEVEL_ENV_VAR
+from main import parse_args
+
+
+def test_log_level_defaults_to_env_var(monkeypatch):
+    """Test the log level is taken from the environment variable if not given"""
+    monkeypatch.setattr("sys.argv", ["main.py"])
+    monkeypatch.setenv(LOG_LEVEL_ENV_VAR, "DEBUG")
+
+    assert parse_args().log_level == "DEBUG"
+
+
+def test_invalid_log_level_env_var_is_rejected(monkeypatch, capsys):
+    """Test an invalid log level from the environment variable is rejected like an invalid argument"""
+    monkeypatch.setattr("sys.argv", ["main.py"])
+    monkeypatch.setenv(LOG_LEVEL_ENV_VAR, "VERBOSE")
+
+    with pytest.raises(SystemExit):
+        parse_args()
+
+    assert f"invalid ${LOG_LEVEL_ENV_VAR}: VERBOSE" in capsys.readouterr().err
@@ -1,5 +1,6 @@
 from sqlalchemy.engine import Engine
-from hsr_simulation.postgre import PostgresConnection
+from hsr_simulation import postgre
+from hsr_simulation.postgre import PostgresConnection, dispose_engines
 
 
 def test_postgres_connection_url():
@@ -14,3 +15,48 @@ def test_get_engine():
     conn = PostgresConnection()
     engine = conn.get_engine()
     assert isinstance(engine, Engine)
+
+
+def test_get_engine_is_reused():
+    """Test the engine is shared across connections in the same process"""
+    first = PostgresConnection()
+    second = PostgresConnection()
+
+    assert first.get_engine() is second.get_engine()
+
+
+def test_get_engine_pool_settings(monkeypatch):
+    """Test pool settings are read from environment variables"""
+    monkeypatch.setenv("POSTGRES_POOL_SIZE", "3")
+    monkeypatch.setenv("POSTGRES_POOL_PRE_PING", "false")
+    conn = PostgresConnection()
+    conn.dispose()
+
+    engine = conn.get_engine()
+
+    assert engine.pool.size() == 3
+    assert engine.pool._pre_ping is False
+    conn.dispose()
+
+
+def test_get_engine_after_fork(monkeypatch):
+    """Test a child process rebuilds the engine it inherited"""
+    conn = PostgresConnection()
+    parent_engine = conn.get_engine()
+
+    monkeypatch.setattr(postgre.os, "getpid", lambda: -1)
+    child_engine = conn.get_engine()
+
+    assert child_engine is not parent_engine
+    assert conn.get_engine() is child_engine
+    conn.dispose()
+
+
+def test_dispose_engines():
+    """Test disposing engines creates a new engine on next use"""
+    conn = PostgresConnection()
+    engine = conn.get_engine()
+
+    dispose_engines()
+
+    assert conn.get_engine() is not engine
@@ -1,7 +1,18 @@
+import numpy as np
 import pytest
 import pandas as pd
-from sqlalchemy import text
-from hsr_simulation.postgre import PostgresOperations
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from hsr_simulation.postgre import (
+    PostgresOperations,
+    generate_dmg_summary_query,
+    generate_dmg_view_query,
+)
+from hsr_simulation.data_transformer import create_df_from_dict_list
+from hsr_simulation.hunt.boothill import Boothill
+from hsr_simulation.result_sink import PostgresSink
+from hsr_simulation.simulate_battles import simulate_battles_to_buffer
+from hsr_simulation.utils import add_char_name_to_df
 
 
 @pytest.fixture
@@ -19,13 +30,19 @@ def cleanup_tables(db):
     """Cleanup tables before and after each test"""
     # Cleanup before test
     db.execute_query("DROP TABLE IF EXISTS test_table CASCADE")
+    db.execute_query("DROP TABLE IF EXISTS test_totals_table CASCADE")
     db.execute_query("DROP VIEW IF EXISTS test_view CASCADE")
+    db.drop_materialized_view("test_summary")
+    db.drop_materialized_view("test_totals_summary")
 
     yield
 
     # Cleanup after test
     db.execute_query("DROP TABLE IF EXISTS test_table CASCADE")
+    db.execute_query("DROP TABLE IF EXISTS test_totals_table CASCADE")
     db.execute_query("DROP VIEW IF EXISTS test_view CASCADE")
+    db.drop_materialized_view("test_summary")
+    db.drop_materialized_view("test_totals_summary")
 
 
 def test_table_operations(db, sample_df):
@@ -109,3 +126,229 @@ def test_view_operations(db, sample_df):
 
     # Cleanup
     db.drop_stage_table(table_name)
+
+
+def test_load_dataframe_with_copy(db):
+    """Test loading a simulation result DataFrame through COPY"""
+    table_name = "test_table"
+    df = pd.DataFrame(
+        {
+            "DMG": np.array([1.5, np.nan], dtype=np.float64),
+            "DMG_Type": pd.Categorical(["Skill", "Ultimate"]),
+            "Simulate Round No.": np.array([0, 1], dtype=np.int32),
+        }
+    )
+
+    db.load_dataframe(df, table_name)
+    db.load_dataframe(df, table_name)
+
+    with db.get_engine().connect() as conn:
+        rows = (
+            conn.execute(text(f'SELECT * FROM "{table_name}" ORDER BY "DMG_Type"'))
+            .mappings()
+            .all()
+        )
+        assert len(rows) == 4
+        assert rows[0]["DMG"] == 1.5
+        assert rows[0]["DMG_Type"] == "Skill"
+        assert rows[2]["DMG"] is None
+        assert rows[2]["Simulate Round No."] == 1
+
+
+def test_load_dataframe_falls_back_to_to_sql(monkeypatch, sample_df, tmp_path):
+    """Test non-PostgreSQL engines are loaded with to_sql"""
+    sqlite_engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    sqlite_db = PostgresOperations()
+    monkeypatch.setattr(sqlite_db, "get_engine", lambda: sqlite_engine)
+
+    sqlite_db.load_dataframe(sample_df, "test_table")
+
+    with sqlite_engine.connect() as conn:
+        result = conn.execute(text('SELECT COUNT(*) FROM "test_table"')).scalar()
+        assert result == 2
+
+
+def test_materialized_view_operations(db):
+    """Test the damage summary is computed from the damage of each round"""
+    table_name = "test_table"
+    view_name = "test_summary"
+    df = pd.DataFrame(
+        {
+            "DMG": [100.0, 50.0, 300.0, 80.0],
+            "DMG_Type": ["Skill", "Skill", "Skill", "Ultimate"],
+            "Simulate Round No.": [0, 0, 1, 1],
+            "Character": ["Seele", "Seele", "Seele", "Seele"],
+        }
+    )
+    db.load_dataframe(df, table_name)
+
+    db.create_materialized_view(
+        view_name, generate_dmg_summary_query(view_name, table_name)
+    )
+
+    with db.get_engine().connect() as conn:
+        rows = (
+            conn.execute(text(f'SELECT * FROM "{view_name}" ORDER BY "DMG_Type"'))
+            .mappings()
+            .all()
+        )
+        assert len(rows) == 2
+        assert rows[0]["DMG_Type"] == "Skill"
+        assert rows[0]["AvgDMG"] == 225.0
+        assert rows[0]["TotalDMG"] == 450.0
+        assert rows[0]["RoundCount"] == 2
+        assert rows[0]["HitCount"] == 3
+        assert rows[0]["VarDMG"] == 11250.0
+        assert rows[1]["VarDMG"] is None
+
+    db.drop_materialized_view(view_name)
+
+    with db.get_engine().connect() as conn:
+        result = conn.execute(
+            text("SELECT EXISTS (SELECT FROM pg_matviews WHERE matviewname = :name)"),
+            {"name": view_name},
+        ).scalar()
+        assert not result
+
+
+def test_replace_characters(db):
+    """Test that upsert mode replaces only the selected characters' rows in one transaction"""
+    table_name = "test_table"
+    view_name = "test_summary"
+    df = pd.DataFrame(
+        {
+            "DMG": [100.0, 200.0, 300.0],
+            "DMG_Type": ["Skill", "Skill", "Skill"],
+            "Simulate Round No.": [0, 0, 0],
+            "Character": ["Seele", "Kafka", "Topaz"],
+        }
+    )
+    db.load_dataframe(df, table_name)
+    db.create_materialized_view(
+        view_name, generate_dmg_summary_query(view_name, table_name)
+    )
+
+    with db.replace_characters(table_name, ["Seele", "Kafka"]):
+        db.load_dataframe(df.iloc[[0]].assign(DMG=150.0), table_name)
+    db.refresh_materialized_view(view_name)
+
+    with pytest.raises(RuntimeError):
+        with db.replace_characters(table_name, ["Topaz"]):
+            db.load_dataframe(df.iloc[[2]].assign(DMG=0.0), table_name)
+            raise RuntimeError("simulation failed")
+
+    assert db.materialized_view_exists(view_name)
+    with db.get_engine().connect() as conn:
+        rows = conn.execute(
+            text(f'SELECT "Character", "TotalDMG" FROM "{view_name}" ORDER BY 1')
+        ).all()
+    assert [tuple(row) for row in rows] == [("Seele", 150.0), ("Topaz", 300.0)]
+
+
+def test_replace_characters_falls_back_to_to_sql(monkeypatch, sample_df, tmp_path):
+    """Test upsert mode on non-PostgreSQL engines"""
+    sqlite_engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    sqlite_db = PostgresOperations()
+    monkeypatch.setattr(sqlite_db, "get_engine", lambda: sqlite_engine)
+    sqlite_db.load_dataframe(sample_df, "test_table")
+
+    with sqlite_db.replace_characters("test_table", ["Test1"]):
+        sqlite_db.load_dataframe(sample_df.iloc[[0]].assign(DMG=150), "test_table")
+
+    with sqlite_engine.connect() as conn:
+        rows = conn.execute(
+            text('SELECT "Character", "DMG" FROM "test_table" ORDER BY 1')
+        ).all()
+    assert [tuple(row) for row in rows] == [("Test1", 150), ("Test2", 200)]
+
+
+def test_load_dataframe_raises_on_error(monkeypatch, sample_df, tmp_path):
+    """Test a failed load raises instead of being logged and ignored"""
+    sqlite_engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    sqlite_db = PostgresOperations()
+    monkeypatch.setattr(sqlite_db, "get_engine", lambda: sqlite_engine)
+    sqlite_db.load_dataframe(sample_df, "test_table")
+
+    with pytest.raises(OperationalError):
+        sqlite_db.load_dataframe(sample_df.assign(Extra=1), "test_table")
+
+
+def test_replace_characters_rolls_back_on_error(monkeypatch, sample_df, tmp_path):
+    """Test a failed load in upsert mode raises and keeps the old rows"""
+    sqlite_engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    sqlite_db = PostgresOperations()
+    monkeypatch.setattr(sqlite_db, "get_engine", lambda: sqlite_engine)
+    sqlite_db.load_dataframe(sample_df, "test_table")
+
+    with pytest.raises(OperationalError):
+        with sqlite_db.replace_characters("test_table", ["Test1"]):
+            sqlite_db.load_dataframe(sample_df.iloc[[0]].assign(Extra=1), "test_table")
+
+    with sqlite_engine.connect() as conn:
+        rows = conn.execute(
+            text('SELECT "Character", "DMG" FROM "test_table" ORDER BY 1')
+        ).all()
+    assert [tuple(row) for row in rows] == [("Test1", 100), ("Test2", 200)]
+
+
+def test_materialized_view_exists_raises_on_error(monkeypatch, tmp_path):
+    """Test the check raises instead of returning None when the database can't be read"""
+    unreachable_engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'test.db'}")
+    unreachable_db = PostgresOperations()
+    monkeypatch.setattr(unreachable_db, "get_engine", lambda: unreachable_engine)
+
+    with pytest.raises(OperationalError):
+        unreachable_db.materialized_view_exists("test_summary")
+
+
+def test_dmg_summary_replaces_plain_view(db):
+    """Test that a plain view left by the damage view of an older run is replaced by the summary"""
+    table_name = "test_table"
+    view_name = "test_summary"
+    df = pd.DataFrame(
+        {
+            "DMG": [100.0, 50.0],
+            "DMG_Type": ["Skill", "Skill"],
+            "Simulate Round No.": [0, 1],
+            "Character": ["Seele", "Seele"],
+        }
+    )
+    db.load_dataframe(df, table_name)
+    db.execute_query(generate_dmg_view_query(view_name, table_name))
+
+    PostgresSink(db).create_dmg_summary(view_name, table_name)
+
+    assert db.materialized_view_exists(view_name)
+    with db.get_engine().connect() as conn:
+        row = conn.execute(
+            text(f'SELECT "TotalDMG", "RoundCount" FROM "{view_name}"')
+        ).one()
+    assert tuple(row) == (150.0, 2)
+
+
+def test_aggregate_dmg_summary_matches_hits(db):
+    """Test that the summary of battle totals counts the hits, like the summary of every hit"""
+    sink = PostgresSink(db)
+    for aggregate_only, table_name, view_name in (
+        (False, "test_table", "test_summary"),
+        (True, "test_totals_table", "test_totals_summary"),
+    ):
+        character = Boothill()
+        character.seed = 11
+        df = create_df_from_dict_list(
+            simulate_battles_to_buffer(
+                character, None, 5, range(30), aggregate_only=aggregate_only
+            )
+        )
+        add_char_name_to_df(character, df)
+        sink.write(df, table_name)
+        sink.create_dmg_summary(view_name, table_name)
+
+    with db.get_engine().connect() as conn:
+        hits, totals = (
+            pd.read_sql(text(f'SELECT * FROM "{view_name}" ORDER BY "DMG_Type"'), conn)
+            for view_name in ("test_summary", "test_totals_summary")
+        )
+
+    assert (hits["HitCount"] > hits["RoundCount"]).any()
+    pd.testing.assert_frame_equal(totals, hits, check_exact=False, rtol=1e-9)
@@ -1,4 +1,11 @@
-from hsr_simulation.postgre import generate_dmg_view_query
+import numpy as np
+import pandas as pd
+
+from hsr_simulation.postgre import (
+    generate_create_table_query,
+    generate_dmg_summary_query,
+    generate_dmg_view_query,
+)
 
 
 def test_generate_dmg_view_query():
@@ -13,3 +20,42 @@ def test_generate_dmg_view_query():
     assert f'FROM public."{stage_table}"' in query
     assert 'GROUP BY "Character"' in query
     assert 'ORDER BY "Character"' in query
+
+
+def test_generate_create_table_query():
+    """Test table creation query uses numeric column types"""
+    df = pd.DataFrame(
+        {
+            "DMG": np.array([1.5], dtype=np.float64),
+            "DMG_Type": pd.Categorical(["Skill"]),
+            "Simulate Round No.": np.array([0], dtype=np.int32),
+            "Count": np.array([0], dtype=np.int64),
+            "Character": ["Seele"],
+        }
+    )
+
+    query = generate_create_table_query(df, "test_stage")
+
+    assert query == (
+        'CREATE TABLE IF NOT EXISTS public."test_stage" ('
+        '"DMG" DOUBLE PRECISION, "DMG_Type" TEXT, "Simulate Round No." INTEGER, '
+        '"Count" BIGINT, "Character" TEXT);'
+    )
+
+
+def test_generate_dmg_summary_query():
+    """Test damage summary materialized view query generation"""
+    view_name = "test_view"
+    stage_table = "test_stage"
+
+    query = generate_dmg_summary_query(view_name, stage_table)
+
+    assert f'CREATE MATERIALIZED VIEW public."{view_name}"' in query
+    assert f'FROM public."{stage_table}"' in query
+    assert 'GROUP BY "Character", "Simulate Round No.", "DMG_Type"' in query
+    for column in ("AvgDMG", "TotalDMG", "RoundCount", "HitCount", "VarDMG"):
+        assert f'AS "{column}"' in query
+    assert (
+        f'CREATE UNIQUE INDEX ON public."{view_name}" ("Character", "DMG_Type")'
+        in query
+    )
@@ -0,0 +1,46 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from hsr_simulation.process_pool import run_bounded
+
+
+def sleep_and_return(seconds: float, value: str) -> str:
+    time.sleep(seconds)
+    return value
+
+
+def test_run_bounded_keeps_order_of_each_key():
+    """Test tasks of the same key are yielded in submission order, even when a later one finishes first"""
+    tasks = [
+        ("Seele", sleep_and_return, (0.2, "Seele 0")),
+        ("Seele", sleep_and_return, (0.0, "Seele 1")),
+        ("Kafka", sleep_and_return, (0.0, "Kafka 0")),
+        ("Seele", sleep_and_return, (0.0, "Seele 2")),
+    ]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(run_bounded(executor, tasks, max_pending=4))
+
+    assert [value for key, value in results if key == "Seele"] == [
+        "Seele 0",
+        "Seele 1",
+        "Seele 2",
+    ]
+    # Kafka's task doesn't wait for Seele's slow one
+    assert results[0] == ("Kafka", "Kafka 0")
+
+
+def test_run_bounded_limits_pending_tasks():
+    """Test results waiting for an earlier task of their key count towards max_pending"""
+    submitted = []
+
+    def tasks():
+        for i in range(6):
+            submitted.append(i)
+            yield "Seele", sleep_and_return, (0.0, i)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for _, value in run_bounded(executor, tasks(), max_pending=2):
+            assert len(submitted) <= value + 2 + 1
+
+    assert submitted == list(range(6))
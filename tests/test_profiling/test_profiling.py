@@ -0,0 +1,105 @@
+import json
+import pstats
+from unittest.mock import patch
+
+import pytest
+
+from hsr_simulation.hunt.seele import Seele
+from hsr_simulation.hunt.topaz import Topaz
+from hsr_simulation.profiling import (
+    profile_path,
+    profile_phase,
+    start_profiling,
+    stop_profiling,
+)
+from hsr_simulation.scheduler import run_character_simulations
+
+
+def test_profile_phase_does_nothing_without_profiling():
+    """Test that phases aren't recorded unless profiling is started"""
+    profiler = start_profiling()
+    stop_profiling()
+
+    with profile_phase("setup"):
+        pass
+
+    assert profiler.records == {}
+
+
+def test_report_adds_up_characters_per_path():
+    """Test that the report has each character's phases and their totals per Path"""
+    profiler = start_profiling()
+    try:
+        with profile_path("Hunt"):
+            with profile_phase("setup"):
+                pass
+            for char_name in ("Seele", "Seele", "Topaz"):
+                with profile_phase("load", char_name):
+                    pass
+    finally:
+        stop_profiling()
+
+    report = profiler.report()["paths"]["Hunt"]
+
+    assert report["seconds"] > 0
+    assert list(report["phases"]) == ["setup", "load"]
+    assert report["phases"]["load"]["calls"] == 3
+    assert report["characters"]["Seele"]["load"]["calls"] == 2
+    assert report["characters"]["Topaz"]["load"]["calls"] == 1
+    assert "setup" not in report["characters"]["Seele"]
+
+
+@patch("hsr_simulation.scheduler.process_result_list")
+def test_profile_simulation_chunks(mock_process_result_list, tmp_path):
+    """Test that each simulated chunk is recorded, and the character is run under cProfile"""
+    profiler = start_profiling(cprofile_character="Seele")
+    try:
+        with profile_path("Hunt"):
+            run_character_simulations(
+                [Seele()],
+                simulation_num=5,
+                max_cycles=2,
+                stage_table_name="test_stage",
+                chunk_size=2,
+            )
+    finally:
+        stop_profiling()
+
+    report_path = tmp_path / "profile_report.json"
+    profiler.write_report(report_path)
+    report = json.loads(report_path.read_text())
+
+    seele = report["paths"]["Hunt"]["characters"]["Seele"]
+    assert seele["battle_simulation"]["calls"] == 3
+    assert (tmp_path / "profile_report_Seele.prof").exists()
+    assert report["cprofile"]["Seele"] == str(tmp_path / "profile_report_Seele.prof")
+
+
+@pytest.mark.parametrize("char_list", [[Seele()], [Seele(), Topaz()]])
+@patch("hsr_simulation.scheduler.process_result_list")
+def test_profile_character_in_worker_processes(
+    mock_process_result_list, tmp_path, char_list
+):
+    """Test that the battles the character runs in worker processes are in its cProfile stats"""
+    profiler = start_profiling(cprofile_character="Seele")
+    try:
+        with profile_path("Hunt"):
+            run_character_simulations(
+                char_list,
+                simulation_num=5,
+                max_cycles=2,
+                stage_table_name="test_stage",
+                workers=2,
+                chunk_size=2,
+            )
+    finally:
+        stop_profiling()
+
+    report_path = tmp_path / "profile_report.json"
+    profiler.write_report(report_path)
+    stats = pstats.Stats(str(tmp_path / "profile_report_Seele.prof")).stats
+
+    simulated_functions = {name for _, _, name in stats}
+    assert "simulate_battles_to_buffer" in simulated_functions
+    assert "take_action" in simulated_functions
+    assert list(json.loads(report_path.read_text())["cprofile"]) == ["Seele"]
@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import pytest
+
+from hsr_simulation.hunt.seele import Seele
+from hsr_simulation.result_cache import ResultCache
+from hsr_simulation.scheduler import run_character_simulations
+
+
+def test_key_covers_stats_and_simulation_parameters():
+    """Test that the key changes with the default stats and each simulation parameter"""
+    key = ResultCache.get_key(Seele(), 100, 10, seed=1)
+
+    assert ResultCache.get_key(Seele(), 100, 10, seed=1) == key
+    assert ResultCache.get_key(Seele(speed=200), 100, 10, seed=1) != key
+    assert ResultCache.get_key(Seele(), 200, 10, seed=1) != key
+    assert ResultCache.get_key(Seele(), 100, 5, seed=1) != key
+    assert ResultCache.get_key(Seele(), 100, 10, seed=2) != key
+    assert ResultCache.get_key(Seele(), 100, 10, seed=1, aggregate_only=True) != key
+
+
+def test_key_covers_character_source():
+    """Test that the key changes when the source of the character's module changes"""
+    key = ResultCache.get_key(Seele(), 100, 10, seed=1)
+
+    with patch(
+        "hsr_simulation.result_cache.get_module_source_hash",
+        side_effect=lambda name: "changed" if name.endswith("seele") else name,
+    ):
+        changed_key = ResultCache.get_key(Seele(), 100, 10, seed=1)
+
+    assert changed_key != key
+
+
+@patch("hsr_simulation.scheduler.process_result_list")
+def test_cached_character_is_reloaded_instead_of_simulated(
+    mock_process_result_list, tmp_path
+):
+    """Test that a second run loads the cached chunks instead of simulating them"""
+    cache = ResultCache(tmp_path)
+    run_character_simulations(
+        [Seele()], 5, 2, "test_stage", chunk_size=2, seed=1, cache=cache
+    )
+    simulated = [call.args[1] for call in mock_process_result_list.call_args_list]
+    mock_process_result_list.reset_mock()
+
+    with patch(
+        "hsr_simulation.scheduler.stream_simulations_for_character"
+    ) as mock_stream:
+        run_character_simulations(
+            [Seele()], 5, 2, "test_stage", chunk_size=2, seed=1, cache=cache
+        )
+
+    mock_stream.assert_not_called()
+    reloaded = [call.args[1] for call in mock_process_result_list.call_args_list]
+    assert [buffer.battle_count for buffer in reloaded] == [2, 2, 1]
+    for simulated_buffer, reloaded_buffer in zip(simulated, reloaded):
+        assert reloaded_buffer.to_dataframe().equals(simulated_buffer.to_dataframe())
+        assert reloaded_buffer.counters == simulated_buffer.counters
+
+
+@patch("hsr_simulation.scheduler.process_result_list", side_effect=RuntimeError("load"))
+def test_failed_character_is_not_cached(mock_process_result_list, tmp_path):
+    """Test that a character whose results failed to load leaves no cache entry behind"""
+    cache = ResultCache(tmp_path)
+    with pytest.raises(RuntimeError):
+        run_character_simulations(
+            [Seele()], 5, 2, "test_stage", chunk_size=2, seed=1, cache=cache
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@patch("hsr_simulation.scheduler.process_result_list")
+def test_unseeded_run_is_not_cached(mock_process_result_list, tmp_path):
+    """Test that a run without a seed is simulated every time and leaves no cache entry behind"""
+    cache = ResultCache(tmp_path)
+    for _ in range(2):
+        run_character_simulations(
+            [Seele()], 5, 2, "test_stage", chunk_size=2, cache=cache
+        )
+
+    assert mock_process_result_list.call_count == 6
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,235 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy import text
+
+from hsr_simulation.data_transformer import create_df_from_dict_list
+from hsr_simulation.hunt.boothill import Boothill
+from hsr_simulation.postgre import get_cached_engine
+from hsr_simulation.result_sink import (
+    ArrowSink,
+    ParquetSink,
+    SQLiteSink,
+    create_sink,
+)
+from hsr_simulation.simulate_battles import simulate_battles_to_buffer
+from hsr_simulation.utils import add_char_name_to_df
+
+
+@pytest.fixture
+def sample_df():
+    return pd.DataFrame(
+        {
+            "DMG": [100.0, 50.0, 300.0, 80.0],
+            "DMG_Type": ["Skill", "Skill", "Skill", "Ultimate"],
+            "Simulate Round No.": [0, 0, 1, 1],
+            "Character": pd.Categorical(["Seele"] * 4),
+        }
+    )
+
+
+@pytest.fixture
+def sqlite_sink(tmp_path):
+    return SQLiteSink(str(tmp_path / "results.db"))
+
+
+def read_rows(sink: SQLiteSink, query: str) -> list[dict]:
+    with get_cached_engine(sink.url).connect() as conn:
+        return [dict(row._mapping) for row in conn.execute(text(query))]
+
+
+def test_sqlite_sink_appends_and_resets(sqlite_sink, sample_df):
+    """Test that writes append to the stage table until it is reset"""
+    sqlite_sink.write(sample_df, "TestStage")
+    sqlite_sink.write(sample_df, "TestStage")
+    assert read_rows(sqlite_sink, 'SELECT COUNT(*) AS n FROM "TestStage"')[0]["n"] == 8
+
+    sqlite_sink.reset("TestStage")
+    sqlite_sink.write(sample_df, "TestStage")
+    assert read_rows(sqlite_sink, 'SELECT COUNT(*) AS n FROM "TestStage"')[0]["n"] == 4
+
+
+def test_sqlite_sink_dmg_summary(sqlite_sink, sample_df):
+    """Test that the SQLite summary has the same columns and values as the PostgreSQL one"""
+    sqlite_sink.write(sample_df, "TestStage")
+    sqlite_sink.create_dmg_summary("Test", "TestStage")
+    # creating it again replaces it
+    sqlite_sink.create_dmg_summary("Test", "TestStage")
+
+    rows = read_rows(sqlite_sink, 'SELECT * FROM "Test" ORDER BY "DMG_Type"')
+
+    assert rows[0] == {
+        "Character": "Seele",
+        "DMG_Type": "Skill",
+        "AvgDMG": 225.0,
+        "TotalDMG": 450.0,
+        "RoundCount": 2,
+        "HitCount": 3,
+        "VarDMG": 11250.0,
+    }
+    assert rows[1]["RoundCount"] == 1
+    assert rows[1]["VarDMG"] is None
+
+
+def test_sqlite_sink_dmg_variance_matches_pandas(sqlite_sink):
+    """Test that VarDMG is the sample variance of the round damage, even when it is tiny next to the damage"""
+    rng = np.random.default_rng(0)
+    round_dmg = 1e7 + rng.normal(0.0, 1e-3, size=1000)
+    df = pd.DataFrame(
+        {
+            "DMG": round_dmg,
+            "DMG_Type": "Skill",
+            "Simulate Round No.": np.arange(1000),
+            "Character": "Seele",
+        }
+    )
+    sqlite_sink.write(df, "TestStage")
+    sqlite_sink.create_dmg_summary("Test", "TestStage")
+
+    (row,) = read_rows(sqlite_sink, 'SELECT * FROM "Test"')
+
+    expected = pd.Series(round_dmg).var()
+    assert row["VarDMG"] >= 0
+    assert row["VarDMG"] == pytest.approx(expected, rel=1e-3)
+
+
+def simulate_stage_df(aggregate_only: bool) -> pd.DataFrame:
+    character = Boothill()
+    character.seed = 11
+    record_buffer = simulate_battles_to_buffer(
+        character, None, 5, range(30), aggregate_only=aggregate_only
+    )
+    df = create_df_from_dict_list(record_buffer)
+    add_char_name_to_df(character, df)
+    return df
+
+
+def test_sqlite_sink_aggregate_summary_matches_hits(sqlite_sink):
+    """Test that a summary of battle totals counts the hits, like the summary of every hit"""
+    sqlite_sink.write(simulate_stage_df(aggregate_only=False), "HitsStage")
+    sqlite_sink.write(simulate_stage_df(aggregate_only=True), "TotalsStage")
+    sqlite_sink.create_dmg_summary("Hits", "HitsStage")
+    sqlite_sink.create_dmg_summary("Totals", "TotalsStage")
+
+    query = 'SELECT * FROM "{}" ORDER BY "DMG_Type"'
+    hits = pd.DataFrame(read_rows(sqlite_sink, query.format("Hits")))
+    totals = pd.DataFrame(read_rows(sqlite_sink, query.format("Totals")))
+
+    assert (hits["HitCount"] > hits["RoundCount"]).any()
+    pd.testing.assert_frame_equal(totals, hits, check_exact=False, rtol=1e-9)
+
+
+def test_sqlite_sink_ranking(sqlite_sink):
+    """Test that the ranking orders the stage table by the column in descending order"""
+    df = pd.DataFrame(
+        {"Character": ["Asta", "Robin"], "PotentialDMGIncreased": [100.0, 300.0]}
+    )
+    sqlite_sink.write(df, "TestStage")
+    sqlite_sink.create_ranking("Test", "TestStage", "PotentialDMGIncreased")
+
+    rows = read_rows(sqlite_sink, 'SELECT "Character" FROM "Test"')
+
+    assert [row["Character"] for row in rows] == ["Robin", "Asta"]
+
+
+def create_stage_df(characters: list[str], dmg: float) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "DMG": [dmg] * len(characters),
+            "DMG_Type": ["Skill"] * len(characters),
+            "Simulate Round No.": [0] * len(characters),
+            "Character": characters,
+        }
+    )
+
+
+def test_sqlite_sink_replaces_selected_characters(sqlite_sink):
+    """Test that only the selected characters' rows are replaced, and the view is kept"""
+    sqlite_sink.write(create_stage_df(["Seele", "Kafka", "Topaz"], 1.0), "TestStage")
+    sqlite_sink.create_dmg_summary("Test", "TestStage")
+
+    with sqlite_sink.replace_characters("TestStage", ["Seele", "Kafka"]):
+        sqlite_sink.write(create_stage_df(["Seele"], 2.0), "TestStage")
+        sqlite_sink.write(create_stage_df(["Kafka"], 3.0), "TestStage")
+    sqlite_sink.refresh_dmg_summary("Test", "TestStage")
+
+    rows = read_rows(sqlite_sink, 'SELECT * FROM "Test" ORDER BY "Character"')
+    assert [(row["Character"], row["TotalDMG"]) for row in rows] == [
+        ("Kafka", 3.0),
+        ("Seele", 2.0),
+        ("Topaz", 1.0),
+    ]
+
+
+def test_sqlite_sink_keeps_rows_when_replacing_fails(sqlite_sink):
+    """Test that the old rows are kept if replacing the characters' rows fails part way"""
+    sqlite_sink.write(create_stage_df(["Seele", "Topaz"], 1.0), "TestStage")
+
+    with pytest.raises(RuntimeError):
+        with sqlite_sink.replace_characters("TestStage", ["Seele"]):
+            sqlite_sink.write(create_stage_df(["Seele"], 2.0), "TestStage")
+            raise RuntimeError("simulation failed")
+
+    rows = read_rows(sqlite_sink, 'SELECT * FROM "TestStage" ORDER BY "Character"')
+    assert [(row["Character"], row["DMG"]) for row in rows] == [
+        ("Seele", 1.0),
+        ("Topaz", 1.0),
+    ]
+
+
+def test_sqlite_sink_replaces_characters_of_new_table(sqlite_sink):
+    """Test that a stage table and its summary are created by the first replace"""
+    with sqlite_sink.replace_characters("TestStage", ["Seele"]):
+        sqlite_sink.write(create_stage_df(["Seele"], 2.0), "TestStage")
+    sqlite_sink.refresh_dmg_summary("Test", "TestStage")
+
+    rows = read_rows(sqlite_sink, 'SELECT * FROM "Test"')
+    assert [(row["Character"], row["TotalDMG"]) for row in rows] == [("Seele", 2.0)]
+
+
+def test_parquet_sink_replaces_selected_characters(tmp_path):
+    """Test that only the selected characters' partitions are replaced"""
+    sink = ParquetSink(str(tmp_path))
+    sink.write(create_stage_df(["Seele", "Topaz"], 1.0), "TestStage")
+
+    with sink.replace_characters("TestStage", ["Seele"]):
+        sink.write(create_stage_df(["Seele"], 2.0), "TestStage")
+
+    (seele_file,) = (tmp_path / "TestStage" / "Character=Seele").glob("*.parquet")
+    assert pq.read_table(seele_file).column("DMG").to_pylist() == [2.0]
+    assert len(list((tmp_path / "TestStage" / "Character=Topaz").glob("*"))) == 1
+    assert sorted(path.name for path in (tmp_path / "TestStage").iterdir()) == [
+        "Character=Seele",
+        "Character=Topaz",
+    ]
+
+
+def test_parquet_sink_partitions_by_character(tmp_path, sample_df):
+    """Test that each write adds a Parquet file in the character's partition"""
+    sink = ParquetSink(str(tmp_path))
+    sink.write(sample_df, "TestStage")
+    sink.write(sample_df, "TestStage")
+
+    files = sorted((tmp_path / "TestStage" / "Character=Seele").glob("*.parquet"))
+
+    assert len(files) == 2
+    assert pq.read_table(files[0]).num_rows == 4
+
+
+def test_arrow_sink_partitions_by_character(tmp_path, sample_df):
+    """Test that each write adds an Arrow IPC file in the character's partition"""
+    sink = ArrowSink(str(tmp_path))
+    sink.write(sample_df, "TestStage")
+
+    (file_path,) = (tmp_path / "TestStage" / "Character=Seele").glob("*.arrow")
+
+    assert pa.ipc.open_file(file_path).read_all().num_rows == 4
+
+
+def test_create_sink(tmp_path):
+    """Test that sinks are created by name"""
+    assert isinstance(create_sink("sqlite", str(tmp_path / "a.db")), SQLiteSink)
+    with pytest.raises(ValueError):
+        create_sink("csv")
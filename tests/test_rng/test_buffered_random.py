@@ -0,0 +1,66 @@
+import pickle
+from collections import Counter
+
+import numpy as np
+
+from hsr_simulation.rng import BufferedRandom
+
+
+def test_random_draws_uniforms_across_blocks():
+    """Test uniforms keep coming after the first blocks are used up"""
+    rng = BufferedRandom(np.random.SeedSequence(0), max_block_size=128)
+
+    draws = [rng.random() for _ in range(1000)]
+
+    assert all(0 <= draw < 1 for draw in draws)
+    assert len(set(draws)) == 1000
+
+
+def test_same_seed_gives_same_uniforms():
+    """Test two sources with the same seed draw the same uniforms"""
+    first = BufferedRandom(np.random.SeedSequence(0))
+    second = BufferedRandom(np.random.SeedSequence(0))
+
+    assert [first.random() for _ in range(200)] == [second.random() for _ in range(200)]
+
+
+def test_random_method_draws_from_the_same_stream():
+    """Test the random method draws the same uniforms as the instance's block cursor"""
+    method_rng = BufferedRandom(np.random.SeedSequence(0), max_block_size=128)
+    cursor_rng = BufferedRandom(np.random.SeedSequence(0), max_block_size=128)
+
+    assert [BufferedRandom.random(method_rng) for _ in range(500)] == [
+        cursor_rng.random() for _ in range(500)
+    ]
+
+
+def test_choice_and_randint_cover_their_range():
+    """Test choice and randint only return values in range, and return all of them"""
+    rng = BufferedRandom(np.random.SeedSequence(0))
+
+    choices = {rng.choice([2, 4]) for _ in range(200)}
+    ints = {rng.randint(1, 4) for _ in range(200)}
+
+    assert choices == {2, 4}
+    assert ints == {1, 2, 3, 4}
+
+
+def test_choices_follows_weights():
+    """Test weighted choices pick elements in proportion to their weights"""
+    rng = BufferedRandom(np.random.SeedSequence(0))
+
+    counts = Counter(rng.choices([90, 180], weights=[0.2, 0.8], k=10000))
+
+    assert set(counts) == {90, 180}
+    assert 0.75 < counts[180] / 10000 < 0.85
+    assert len(rng.choices([True, False])) == 1
+
+
+def test_pickled_source_keeps_drawing():
+    """Test a source can be sent to a worker process"""
+    rng = BufferedRandom(np.random.SeedSequence(0))
+    rng.random()
+
+    copied = pickle.loads(pickle.dumps(rng))
+
+    assert 0 <= copied.random() < 1
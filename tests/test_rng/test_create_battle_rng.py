@@ -0,0 +1,32 @@
+from hsr_simulation.rng import BufferedRandom, create_battle_rng
+
+
+def test_same_battle_gives_same_stream():
+    """Test a battle's generator only depends on the seed, character and battle index"""
+    first = create_battle_rng(42, "Seele", 7)
+    second = create_battle_rng(42, "Seele", 7)
+
+    assert [first.random() for _ in range(10)] == [second.random() for _ in range(10)]
+
+
+def test_different_battles_give_different_streams():
+    """Test generators differ between battles, characters and seeds"""
+    draws = {
+        tuple(rng.random() for _ in range(5))
+        for rng in (
+            create_battle_rng(42, "Seele", 0),
+            create_battle_rng(42, "Seele", 1),
+            create_battle_rng(42, "Kafka", 0),
+            create_battle_rng(43, "Seele", 0),
+        )
+    }
+
+    assert len(draws) == 4
+
+
+def test_no_seed_gives_random_generator():
+    """Test a generator is still created without a seed"""
+    rng = create_battle_rng(None, "Seele", 0)
+
+    assert isinstance(rng, BufferedRandom)
+    assert 0 <= rng.random() < 1
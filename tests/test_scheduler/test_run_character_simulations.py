@@ -0,0 +1,148 @@
+from unittest.mock import patch
+
+from hsr_simulation.character import Character
+from hsr_simulation.hunt.seele import Seele
+from hsr_simulation.hunt.topaz import Topaz
+from hsr_simulation.scheduler import run_character_simulations
+
+
+@patch("hsr_simulation.scheduler.process_result_list")
+def test_run_character_simulations_serial(mock_process_result_list):
+    """Test characters are simulated one after another with a single worker"""
+    char_list = [Seele(), Topaz()]
+
+    run_character_simulations(
+        char_list, simulation_num=3, max_cycles=2, stage_table_name="test_stage"
+    )
+
+    assert mock_process_result_list.call_count == 2
+    for call, character in zip(mock_process_result_list.call_args_list, char_list):
+        char_arg, record_buffer, stage_table_name = call.args
+        assert char_arg is character
+        assert record_buffer.battle_count == 3
+        assert stage_table_name == "test_stage"
+
+
+@patch("hsr_simulation.scheduler.process_result_list")
+def test_run_character_simulations_with_workers(mock_process_result_list):
+    """Test each character's results are loaded once by the parent process"""
+    char_list = [Character(), Seele(), Topaz()]
+
+    run_character_simulations(
+        char_list,
+        simulation_num=3,
+        max_cycles=2,
+        stage_table_name="test_stage",
+        workers=2,
+    )
+
+    assert mock_process_result_list.call_count == 3
+    loaded_chars = [call.args[0] for call in mock_process_result_list.call_args_list]
+    assert sorted(map(id, loaded_chars)) == sorted(map(id, char_list))
+    for call in mock_process_result_list.call_args_list:
+        record_buffer = call.args[1]
+        assert record_buffer.battle_count == 3
+        simulate_round = record_buffer.simulate_round[: record_buffer.size]
+        assert sorted(set(simulate_round)) == [0, 1, 2]
+        assert (simulate_round[1:] >= simulate_round[:-1]).all()
+
+
+@patch("hsr_simulation.scheduler.process_result_list")
+def test_run_character_simulations_in_chunks(mock_process_result_list):
+    """Test each character's battles are loaded chunk by chunk"""
+    character = Seele()
+
+    run_character_simulations(
+        [character],
+        simulation_num=5,
+        max_cycles=2,
+        stage_table_name="test_stage",
+        chunk_size=2,
+    )
+
+    assert mock_process_result_list.call_count == 3
+    battle_counts = [
+        call.args[1].battle_count for call in mock_process_result_list.call_args_list
+    ]
+    assert battle_counts == [2, 2, 1]
+    simulate_rounds = set()
+    for call in mock_process_result_list.call_args_list:
+        record_buffer = call.args[1]
+        simulate_rounds.update(record_buffer.simulate_round[: record_buffer.size])
+    assert sorted(simulate_rounds) == [0, 1, 2, 3, 4]
+
+
+@patch("hsr_simulation.scheduler.process_result_list")
+def test_run_character_simulations_in_chunks_with_workers(mock_process_result_list):
+    """Test chunks of every character are loaded once and in order when run on a process pool"""
+    char_list = [Character(), Seele()]
+
+    run_character_simulations(
+        char_list,
+        simulation_num=5,
+        max_cycles=2,
+        stage_table_name="test_stage",
+        workers=2,
+        chunk_size=2,
+    )
+
+    assert mock_process_result_list.call_count == 6
+    for character in char_list:
+        record_buffers = [
+            call.args[1]
+            for call in mock_process_result_list.call_args_list
+            if call.args[0] is character
+        ]
+        assert sum(buffer.battle_count for buffer in record_buffers) == 5
+        # each character's chunks are loaded in the order of their simulation indices
+        assert [int(buffer.simulate_round[0]) for buffer in record_buffers] == [
+            0,
+            2,
+            4,
+        ]
+        simulate_rounds = sorted(
+            round_no
+            for buffer in record_buffers
+            for round_no in buffer.simulate_round[: buffer.size]
+        )
+        assert sorted(set(simulate_rounds)) == [0, 1, 2, 3, 4]
+
+
+def _collect_loaded_rows(mock_process_result_list) -> dict[str, list[tuple]]:
+    """Collect the rows loaded for each character, sorted by round"""
+    rows: dict[str, list[tuple]] = {}
+    for call in mock_process_result_list.call_args_list:
+        character, record_buffer = call.args[0], call.args[1]
+        df = record_buffer.to_dataframe()
+        rows.setdefault(character.__class__.__name__, []).extend(
+            zip(df["Simulate Round No."], df["DMG_Type"].astype(str), df["DMG"])
+        )
+    return {name: sorted(char_rows) for name, char_rows in rows.items()}
+
+
+@patch("hsr_simulation.scheduler.process_result_list")
+def test_seeded_simulations_reproduce_across_workers(mock_process_result_list):
+    """Test a seeded run gives the same battles serially and across workers in chunks"""
+    run_character_simulations(
+        [Seele(), Topaz()],
+        simulation_num=6,
+        max_cycles=3,
+        stage_table_name="test_stage",
+        seed=42,
+    )
+    serial_rows = _collect_loaded_rows(mock_process_result_list)
+    mock_process_result_list.reset_mock()
+
+    run_character_simulations(
+        [Seele(), Topaz()],
+        simulation_num=6,
+        max_cycles=3,
+        stage_table_name="test_stage",
+        workers=2,
+        chunk_size=2,
+        seed=42,
+    )
+    sharded_rows = _collect_loaded_rows(mock_process_result_list)
+
+    assert serial_rows == sharded_rows
+    assert len(serial_rows["Seele"]) > 0
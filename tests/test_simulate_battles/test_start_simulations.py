@@ -1,6 +1,7 @@
 from unittest.mock import Mock, patch
 from hsr_simulation.simulate_battles import start_simulations
 from hsr_simulation.character import Character
+from hsr_simulation.simulate_cycles import simulate_cycles
 
 
 @patch("hsr_simulation.simulate_battles.simulate_cycles")
@@ -31,3 +32,33 @@ def test_start_simulations_zero_simulations(mock_simulate_cycles):
 
     assert len(result) == 0
     mock_simulate_cycles.assert_not_called()
+
+
+def test_start_simulations_with_workers():
+    """Test battles sharded across a process pool come back in order"""
+    character = Character()
+
+    result = start_simulations(
+        character=character, max_cycles=2, simulation_num=5, workers=2
+    )
+
+    assert len(result) == 5
+    for sim_index, battle in enumerate(result):
+        assert len(battle["DMG"]) == len(battle["Simulate Round No."])
+        assert all(round_no == sim_index for round_no in battle["Simulate Round No."])
+
+
+def test_start_simulations_matches_simulate_cycles():
+    """Test each battle's data is the same as simulating the battle on its own"""
+    character = Character()
+    character.seed = 7
+
+    result = start_simulations(
+        character=character, max_cycles=3, simulation_num=4, workers=2
+    )
+
+    for sim_index, battle in enumerate(result):
+        expected = simulate_cycles(character, 3, sim_index)
+        assert battle["DMG"] == expected["DMG"]
+        assert battle["DMG_Type"] == expected["DMG_Type"]
+        assert battle["Simulate Round No."] == expected["Simulate Round No."]
@@ -1,6 +1,7 @@
 from unittest.mock import Mock, patch
 from hsr_simulation.simulate_battles import start_simulations_for_char_with_summon
 from hsr_simulation.character import Character
+from hsr_simulation.hunt.topaz import Topaz
 
 
 @patch("hsr_simulation.simulate_battles.simulate_cycles_for_character_with_summon")
@@ -38,3 +39,18 @@ def test_start_simulations_with_summon_zero_simulations(mock_simulate_cycles):
 
     assert len(result) == 0
     mock_simulate_cycles.assert_not_called()
+
+
+def test_start_simulations_with_summon_with_workers():
+    """Test battles with summon sharded across a process pool come back in order"""
+    topaz = Topaz()
+    numby = topaz.summon_numby(topaz)
+
+    result = start_simulations_for_char_with_summon(
+        character=topaz, summon=numby, max_cycles=2, simulation_num=5, workers=2
+    )
+
+    assert len(result) == 5
+    for sim_index, battle in enumerate(result):
+        assert len(battle["DMG"]) > 0
+        assert all(round_no == sim_index for round_no in battle["Simulate Round No."])
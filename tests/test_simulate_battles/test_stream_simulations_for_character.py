@@ -0,0 +1,48 @@
+from unittest.mock import patch
+
+from hsr_simulation.battle_record import BattleRecordBuffer
+from hsr_simulation.hunt.seele import Seele
+from hsr_simulation.hunt.topaz import Topaz
+from hsr_simulation.simulate_battles import stream_simulations_for_character
+
+
+@patch("hsr_simulation.simulate_battles.simulate_cycles")
+def test_stream_simulations_in_chunks(mock_simulate_cycles):
+    """Test battles are simulated in chunks of simulation indices, in order"""
+    character = Seele()
+
+    record_buffers = list(
+        stream_simulations_for_character(character, 5, 5, chunk_size=2)
+    )
+
+    assert len(record_buffers) == 3
+    assert [call.args for call in mock_simulate_cycles.call_args_list] == [
+        (character, 5, i) for i in range(5)
+    ]
+
+
+@patch("hsr_simulation.simulate_battles.simulate_cycles")
+def test_stream_simulations_zero_simulations(mock_simulate_cycles):
+    """Test no chunk is yielded without battles to simulate"""
+    assert list(stream_simulations_for_character(Seele(), 5, 0)) == []
+    mock_simulate_cycles.assert_not_called()
+
+
+def test_stream_simulations_with_workers_keeps_order():
+    """Test chunks simulated across workers are yielded in the order of their simulation indices"""
+    serial_character = Topaz()
+    serial_character.seed = 7
+    serial = BattleRecordBuffer.concat(
+        stream_simulations_for_character(serial_character, 3, 9, chunk_size=2)
+    )
+
+    character = Topaz()
+    character.seed = 7
+    record_buffers = list(
+        stream_simulations_for_character(character, 3, 9, workers=3, chunk_size=2)
+    )
+
+    first_rounds = [int(buffer.simulate_round[0]) for buffer in record_buffers]
+    assert first_rounds == [0, 2, 4, 6, 8]
+    sharded = BattleRecordBuffer.concat(record_buffers)
+    assert sharded.to_dataframe().equals(serial.to_dataframe())
@@ -1,6 +1,8 @@
 import pytest
+from unittest.mock import patch
 from hsr_simulation.character import Character
 from hsr_simulation.simulate_cycles import (
+    BattleSimulator,
     simulate_cycles,
     simulate_cycles_for_character_with_summon,
 )
@@ -16,6 +18,8 @@ class MockCharacter(Character):
     def __init__(self):
         # Initialize with test data
         self.data = {"DMG": [], "DMG_Type": [], "Simulate Round No.": []}
+        self.dmg_totals = None
+        self.dmg_type_hit_counts = None
         # Basic character attributes
         self.speed = 100  # Changed to match typical character speed
         self.atk = 2000
@@ -40,6 +44,11 @@ class MockCharacter(Character):
         self.char_action_value_for_action_forward = []
         self.summon_action_value_for_action_forward = []  # Added for summon mechanics
         self.battle_start = True
+        self._init_counters()
+
+        # Run settings
+        self.record_buffer = None
+        self.seed = None
 
     def take_action(self) -> None:
         """Simulate taking an action during battle"""
@@ -277,5 +286,56 @@ def test_data_reset_between_battles():
     assert all(round_no == 2 for round_no in result2["Simulate Round No."])
 
 
+def test_on_battle_init_is_called_for_each_battle():
+    """Test that each battle calls the character's on_battle_init hook"""
+
+    class CountingCharacter(Character):
+        battle_inits = 0
+
+        def on_battle_init(self) -> None:
+            CountingCharacter.battle_inits += 1
+
+    character = CountingCharacter()
+    for simulate_round in range(3):
+        simulate_cycles(character, max_cycles=1, simulate_round=simulate_round)
+
+    assert CountingCharacter.battle_inits == 3
+
+
+def test_initialize_summon_uses_create_summon():
+    """Test that the summon comes from the character's create_summon hook"""
+    topaz = Topaz()
+    numby = BattleSimulator.initialize_summon(topaz, None)
+
+    assert numby is topaz.numby
+    assert BattleSimulator.initialize_summon(BlackSwan(), None) is None
+
+
+@pytest.mark.parametrize("character_class", [BlackSwan, Topaz])
+def test_character_is_reset_once_per_battle(character_class):
+    """Test that a character is only reset when each battle starts, not again when it ends"""
+    character = character_class()
+    summon = BattleSimulator.initialize_summon(character, None)
+    reset = character_class.reset_character_data_for_each_battle
+
+    with patch.object(
+        character_class,
+        "reset_character_data_for_each_battle",
+        autospec=True,
+        side_effect=reset,
+    ) as reset_mock:
+        for simulate_round in range(3):
+            if summon is None:
+                data = simulate_cycles(character, 2, simulate_round)
+            else:
+                data = simulate_cycles_for_character_with_summon(
+                    character, summon, 2, simulate_round
+                )
+            assert reset_mock.call_count == simulate_round + 1
+            # the character is left as the battle ended
+            assert data is character.data
+            assert character.action_count > 0
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,53 @@
+from hsr_simulation.character import Character
+from hsr_simulation.hunt.seele import Seele
+from hsr_simulation.rng import create_battle_rng
+from hsr_simulation.simulate_turns import (
+    get_constant_speed_timeline,
+    process_character_turn,
+    simulate_turns,
+)
+
+
+def simulate_turns_one_by_one(character: Character, cycles_action_val: float) -> int:
+    """Simulate turns one by one, the way simulate_turns did before the timeline."""
+    char_turn_count = 0
+    while cycles_action_val > 0:
+        if cycles_action_val < character.calculate_action_value(character.speed):
+            break
+        cycles_action_val = process_character_turn(character, cycles_action_val)
+        char_turn_count += 1
+    return char_turn_count
+
+
+def test_get_constant_speed_timeline():
+    """Test that the timeline has one entry per turn with the cycles action value left."""
+    char_action_val, timeline = get_constant_speed_timeline(10000, 100, 350)
+
+    assert char_action_val == 100
+    assert timeline == (250, 150, 50)
+
+
+def test_get_constant_speed_timeline_is_cached():
+    """Test that the timeline is calculated once for the same speed and cycles."""
+    get_constant_speed_timeline.cache_clear()
+    get_constant_speed_timeline(10000, 120, 750)
+    get_constant_speed_timeline(10000, 120, 750)
+
+    assert get_constant_speed_timeline.cache_info().hits == 1
+
+
+def test_simulate_turns_with_action_forward():
+    """Test that a character with Action Forward gets the same turns as simulating one by one."""
+    cycles_action_val = 150 + (9 * 100)
+    character = Seele()
+    expected = Seele()
+
+    for battle_index in range(5):
+        for char in (character, expected):
+            char.rng = create_battle_rng(0, "Seele", battle_index)
+            char.reset_character_data_for_each_battle()
+
+        turn_count = simulate_turns(character, cycles_action_val)
+
+        assert turn_count == simulate_turns_one_by_one(expected, cycles_action_val)
+        assert character.data == expected.data
@@ -1,21 +1,23 @@
 from hsr_simulation.erudition.jingyuan import Jingyuan
 from hsr_simulation.hunt.topaz import Topaz
-from hsr_simulation.simulate_battles import start_simulations_for_char_with_summon
+from hsr_simulation.battle_record import BattleRecordBuffer
+from hsr_simulation.simulate_battles import stream_simulations_for_character
 
 
 def test_subclass_topaz_and_numby():
     # Given:
     topaz = Topaz()
-    numby = topaz.summon_numby(topaz)
 
     # When:
-    dict_list = start_simulations_for_char_with_summon(
-        topaz, numby, max_cycles=10, simulation_num=2
+    record_buffer = BattleRecordBuffer.concat(
+        stream_simulations_for_character(topaz, max_cycles=10, simulation_num=2)
     )
+    # Numby the battles were simulated with
+    numby = topaz.numby
 
     # Then:
-    # Ensure the simulations returned a non-empty list
-    assert len(dict_list) > 0
+    # Ensure the simulations recorded damage
+    assert len(record_buffer) > 0
 
     # Validate Topaz's attributes
     assert topaz.atk == 2000
@@ -25,6 +27,7 @@ def test_subclass_topaz_and_numby():
     assert topaz.ult_energy == 130
 
     # Validate Numby's attributes
+    assert numby.topaz is topaz
     assert numby.atk == 2000
     assert numby.crit_rate == 0.5
     assert numby.crit_dmg == 1.0
@@ -32,34 +35,37 @@ def test_subclass_topaz_and_numby():
     assert numby.ult_energy == 0
 
     # Validate 'Simulate Round No.' correctness
-    for index, element in enumerate(dict_list):
-        if "Simulate Round No." in element:
-            for i in element["Simulate Round No."]:
-                assert i == index
+    simulate_round = record_buffer.simulate_round[: record_buffer.size]
+    assert sorted(set(simulate_round)) == [0, 1]
+    assert (simulate_round[1:] >= simulate_round[:-1]).all()
 
 
 def test_subclass_jingyuan_and_lighting_lord():
     # Given:
     jingyuan = Jingyuan()
-    lightning_lord = jingyuan.summon_lightning_lord(jingyuan)
 
     # When:
-    dict_list = start_simulations_for_char_with_summon(
-        jingyuan, lightning_lord, max_cycles=10, simulation_num=2
+    record_buffer = BattleRecordBuffer.concat(
+        stream_simulations_for_character(jingyuan, max_cycles=10, simulation_num=2)
     )
+    # Lightning Lord the battles were simulated with
+    lightning_lord = jingyuan.lightning_lord
 
     # Then:
-    # Ensure the simulations returned a non-empty list
-    assert len(dict_list) > 0
+    # Ensure the simulations recorded damage
+    assert len(record_buffer) > 0
 
-    # Validate Jing Yuan's attributes
+    # Validate Jing Yuan's attributes, which the next battle starts from
+    jingyuan.reset_character_data_for_each_battle()
     assert jingyuan.atk == 2000
     assert jingyuan.crit_rate == 0.5
     assert jingyuan.crit_dmg == 1.0
     assert jingyuan.speed == 99
     assert jingyuan.ult_energy == 130
 
-    # Validate Lightning Lord's attributes
+    # Validate Lightning Lord's attributes, which the next battle starts from
+    lightning_lord.reset_character_data_for_each_battle()
+    assert lightning_lord.jingyuan is jingyuan
     assert lightning_lord.atk == 2000
     assert lightning_lord.crit_rate == 0.5
     assert lightning_lord.crit_dmg == 1.0
@@ -67,7 +73,35 @@ def test_subclass_jingyuan_and_lighting_lord():
     assert lightning_lord.ult_energy == 0
 
     # Validate 'Simulate Round No.' correctness
-    for index, element in enumerate(dict_list):
-        if "Simulate Round No." in element:
-            for i in element["Simulate Round No."]:
-                assert i == index
+    simulate_round = record_buffer.simulate_round[: record_buffer.size]
+    assert sorted(set(simulate_round)) == [0, 1]
+    assert (simulate_round[1:] >= simulate_round[:-1]).all()
+
+
+def test_numby_dmg_is_recorded_for_topaz():
+    # Given:
+    topaz = Topaz()
+    numby = topaz.summon_numby(topaz)
+
+    # When:
+    numby.take_action()
+
+    # Then:
+    assert topaz.data["DMG_Type"] == ["Numby"]
+    assert topaz.data["DMG"][0] > 0
+    assert topaz.hit_count == 1
+    assert numby.data["DMG"] == []
+
+
+def test_lightning_lord_dmg_is_recorded_for_jingyuan():
+    # Given:
+    jingyuan = Jingyuan()
+    lightning_lord = jingyuan.summon_lightning_lord(jingyuan)
+
+    # When:
+    lightning_lord.take_action()
+
+    # Then:
+    hit_per_action = jingyuan.lighting_lord_hit_per_action
+    assert jingyuan.data["DMG_Type"] == ["Lightning Lord"] * hit_per_action
+    assert lightning_lord.data["DMG"] == []
@@ -40,3 +40,11 @@ def test_add_char_name_empty_df(mock_character):
 
     assert "Character" in empty_df.columns
     assert len(empty_df) == 0
+
+
+def test_add_char_name_is_categorical(mock_character, sample_df):
+    """Test the Character column is categorical"""
+    add_char_name_to_df(mock_character, sample_df)
+
+    assert isinstance(sample_df["Character"].dtype, pd.CategoricalDtype)
+    assert sample_df["Character"].cat.categories.tolist() == ["TestCharacter"]
@@ -50,3 +50,16 @@ def test_process_result_list_empty_list(mock_character):
 
         mock_create_df.assert_called_once_with([])
         mock_load_df.assert_called_once()
+
+
+def test_process_result_list_with_sink(mock_character):
+    """Test process_result_list writes to the given sink instead of PostgreSQL"""
+    sink = Mock()
+    dict_list = [{"DMG": [100], "DMG_Type": ["Skill"], "Simulate Round No.": [0]}]
+    with patch("hsr_simulation.utils.load_df_to_stage_table") as mock_load_df:
+        process_result_list(mock_character, dict_list, "test_table", sink=sink)
+
+        mock_load_df.assert_not_called()
+        df, table_name = sink.write.call_args.args
+        assert table_name == "test_table"
+        assert (df["Character"] == "TestCharacter").all()
@@ -0,0 +1,82 @@
+import pandas as pd
+from sqlalchemy import text
+
+from hsr_simulation.hunt.seele import Seele
+from hsr_simulation.hunt.topaz import Topaz
+from hsr_simulation.path_main_func.harmony_main import start_sim_harmony
+from hsr_simulation.path_main_func.hunt_main import get_hunt_characters
+from hsr_simulation.path_main_func.path_simulation import (
+    SimulationSettings,
+    start_sim_path,
+)
+from hsr_simulation.postgre import get_cached_engine
+from hsr_simulation.result_sink import SQLiteSink
+from hsr_simulation.utils import select_characters
+
+
+def read_character_rows(sink: SQLiteSink, table_name: str) -> dict[str, float]:
+    with get_cached_engine(sink.url).connect() as conn:
+        rows = conn.execute(
+            text(f'SELECT "Character", SUM("DMG") FROM "{table_name}" GROUP BY 1')
+        )
+        return dict(rows.all())
+
+
+def test_select_characters():
+    """Test that characters are selected by class name, in the order of the Path"""
+    char_list = [Seele(), Topaz()]
+
+    assert select_characters(char_list, None) == char_list
+    assert select_characters(char_list, ["Topaz", "Kafka"]) == [char_list[1]]
+    assert select_characters(char_list, ["Kafka"]) == []
+
+
+def test_start_sim_replaces_selected_characters_only(tmp_path):
+    """Test that simulating selected characters keeps the other characters' rows and the view"""
+    sink = SQLiteSink(str(tmp_path / "results.db"))
+    start_sim_path(
+        "Hunt", get_hunt_characters(), SimulationSettings(5, 2, seed=1, sink=sink)
+    )
+    before = read_character_rows(sink, "HuntStage")
+
+    start_sim_path(
+        "Hunt",
+        get_hunt_characters(),
+        SimulationSettings(5, 2, seed=2, sink=sink, characters=["Seele"]),
+    )
+    after = read_character_rows(sink, "HuntStage")
+
+    assert after.keys() == before.keys()
+    assert after["Seele"] != before["Seele"]
+    assert {name: dmg for name, dmg in after.items() if name != "Seele"} == {
+        name: dmg for name, dmg in before.items() if name != "Seele"
+    }
+    with get_cached_engine(sink.url).connect() as conn:
+        view_df = pd.read_sql(text('SELECT * FROM "Hunt"'), conn)
+    assert set(view_df["Character"]) == set(after)
+
+
+def test_start_sim_skips_path_without_selected_characters(tmp_path):
+    """Test that a Path without any of the selected characters is left untouched"""
+    sink = SQLiteSink(str(tmp_path / "results.db"))
+    start_sim_path(
+        "Hunt",
+        get_hunt_characters(),
+        SimulationSettings(5, 2, seed=1, sink=sink, characters=["Kafka"]),
+    )
+
+    assert not (tmp_path / "results.db").exists()
+
+
+def test_start_sim_harmony_replaces_selected_characters_only(tmp_path):
+    """Test that Harmony goes through start_sim_path, keeping the other characters' rows and the ranking"""
+    sink = SQLiteSink(str(tmp_path / "results.db"))
+    start_sim_harmony(SimulationSettings(5, 2, sink=sink))
+    start_sim_harmony(SimulationSettings(5, 2, sink=sink, characters=["Bronya"]))
+
+    with get_cached_engine(sink.url).connect() as conn:
+        stage_df = pd.read_sql(text('SELECT * FROM "HarmonyStage"'), conn)
+        view_df = pd.read_sql(text('SELECT * FROM "Harmony"'), conn)
+    assert len(stage_df) == 11
+    assert (stage_df["Character"] == "Bronya").sum() == 1
+    assert set(view_df["Character"]) == set(stage_df["Character"])